@@ -23,6 +23,28 @@ SET time_zone = "+00:00";
 
 -- --------------------------------------------------------
 
+--
+-- Štruktúra tabuľky pre tabuľku `EmailOutbox`
+--
+
+CREATE TABLE `EmailOutbox` (
+  `id` char(36) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `recipient` varchar(255) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `subject` varchar(255) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `body` text COLLATE utf8mb4_unicode_ci NOT NULL,
+  `status` enum('BUFFERED','PENDING','SENDING','SENT','DEAD','DIGESTED') COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'PENDING',
+  `attempts` int UNSIGNED NOT NULL DEFAULT '0',
+  `nextAttemptAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `lastError` text COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `createdAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `sentAt` datetime DEFAULT NULL,
+  `digestId` char(36) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `locale` char(2) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `broadcastId` char(36) COLLATE utf8mb4_unicode_ci DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Štruktúra tabuľky pre tabuľku `Feedbacks`
 --
@@ -35,6 +57,43 @@ CREATE TABLE `Feedbacks` (
 
 -- --------------------------------------------------------
 
+--
+-- Štruktúra tabuľky pre tabuľku `IdempotencyKeys`
+--
+
+CREATE TABLE `IdempotencyKeys` (
+  `userId` char(36) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `idemKey` varchar(255) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `requestHash` char(64) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `status` enum('IN_PROGRESS','COMPLETED') COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'IN_PROGRESS',
+  `responseStatus` smallint UNSIGNED DEFAULT NULL,
+  `responseBody` mediumtext COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `createdAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `expiresAt` datetime NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Štruktúra tabuľky pre tabuľku `Jobs`
+--
+
+CREATE TABLE `Jobs` (
+  `id` char(36) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `type` varchar(64) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `payload` mediumtext COLLATE utf8mb4_unicode_ci NOT NULL,
+  `priority` smallint NOT NULL DEFAULT '0',
+  `status` enum('PENDING','RUNNING','DONE','DEAD') COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'PENDING',
+  `attempts` int UNSIGNED NOT NULL DEFAULT '0',
+  `maxAttempts` int UNSIGNED NOT NULL DEFAULT '5',
+  `runAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `lastError` text COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `createdAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `finishedAt` datetime DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Štruktúra tabuľky pre tabuľku `Languages`
 --
@@ -46,6 +105,20 @@ CREATE TABLE `Languages` (
 
 -- --------------------------------------------------------
 
+--
+-- Štruktúra tabuľky pre tabuľku `ProjectMilestones`
+--
+
+CREATE TABLE `ProjectMilestones` (
+  `projectId` char(36) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `createdAt` datetime(6) DEFAULT NULL,
+  `assignedAt` datetime(6) DEFAULT NULL,
+  `completedAt` datetime(6) DEFAULT NULL,
+  `translatorId` char(36) COLLATE utf8mb4_unicode_ci DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Štruktúra tabuľky pre tabuľku `Projects`
 --
@@ -60,7 +133,44 @@ CREATE TABLE `Projects` (
   `originalFile` varchar(255) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
   `translatedFile` varchar(255) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
   `state` enum('CREATED','ASSIGNED','COMPLETED','APPROVED','REJECTED','CLOSED') CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'CREATED',
-  `createdAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP
+  `createdAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `updatedAt` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  `dueAt` datetime DEFAULT NULL,
+  `dueWarnedAt` datetime DEFAULT NULL,
+  `dueEscalatedAt` datetime DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Štruktúra tabuľky pre tabuľku `ProjectTransitions`
+--
+
+CREATE TABLE `ProjectTransitions` (
+  `id` bigint UNSIGNED NOT NULL,
+  `projectId` char(36) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `event` varchar(32) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `fromState` varchar(16) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `toState` varchar(16) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `actorId` char(36) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `occurredAt` datetime(6) NOT NULL,
+  `translatorId` char(36) COLLATE utf8mb4_unicode_ci DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Štruktúra tabuľky pre tabuľku `TurnaroundRollups`
+--
+
+CREATE TABLE `TurnaroundRollups` (
+  `dimension` enum('ALL','LANGUAGE','TRANSLATOR') COLLATE utf8mb4_unicode_ci NOT NULL,
+  `dimensionValue` varchar(36) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `stage` enum('ASSIGNMENT','TRANSLATION','REVIEW','TOTAL') COLLATE utf8mb4_unicode_ci NOT NULL,
+  `day` date NOT NULL,
+  `bucket` tinyint UNSIGNED NOT NULL,
+  `count` int UNSIGNED NOT NULL DEFAULT '0',
+  `sumSeconds` bigint UNSIGNED NOT NULL DEFAULT '0'
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- --------------------------------------------------------
@@ -75,7 +185,10 @@ CREATE TABLE `Users` (
   `email` varchar(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci NOT NULL,
   `password` varchar(255) COLLATE utf8mb4_unicode_ci NOT NULL,
   `role` enum('CUSTOMER','TRANSLATOR','ADMINISTRATOR') COLLATE utf8mb4_unicode_ci NOT NULL,
-  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP
+  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `sessionVersion` int UNSIGNED NOT NULL DEFAULT '0',
+  `notificationMode` enum('IMMEDIATE','DIGEST') COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'IMMEDIATE',
+  `locale` char(2) COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'en'
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 --
@@ -89,17 +202,47 @@ INSERT INTO `Users` (`id`, `name`, `email`, `password`, `role`, `created_at`) VA
 -- Kľúče pre exportované tabuľky
 --
 
+--
+-- Indexy pre tabuľku `EmailOutbox`
+--
+ALTER TABLE `EmailOutbox`
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `status_nextAttemptAt` (`status`,`nextAttemptAt`),
+  ADD KEY `status_recipient_createdAt` (`status`,`recipient`,`createdAt`),
+  ADD KEY `broadcastId_status` (`broadcastId`,`status`);
+
 --
 -- Indexy pre tabuľku `Feedbacks`
 --
 ALTER TABLE `Feedbacks`
   ADD PRIMARY KEY (`projectId`);
 
+--
+-- Indexy pre tabuľku `IdempotencyKeys`
+--
+ALTER TABLE `IdempotencyKeys`
+  ADD PRIMARY KEY (`userId`,`idemKey`),
+  ADD KEY `expiresAt` (`expiresAt`);
+
+--
+-- Indexy pre tabuľku `Jobs`
+--
+ALTER TABLE `Jobs`
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `status_priority_runAt` (`status`,`priority` DESC,`runAt`);
+
 --
 -- Indexy pre tabuľku `Languages`
 --
 ALTER TABLE `Languages`
-  ADD PRIMARY KEY (`user_id`,`language`);
+  ADD PRIMARY KEY (`user_id`,`language`),
+  ADD KEY `language_user_id` (`language`,`user_id`);
+
+--
+-- Indexy pre tabuľku `ProjectMilestones`
+--
+ALTER TABLE `ProjectMilestones`
+  ADD PRIMARY KEY (`projectId`);
 
 --
 -- Indexy pre tabuľku `Projects`
@@ -107,14 +250,45 @@ ALTER TABLE `Languages`
 ALTER TABLE `Projects`
   ADD PRIMARY KEY (`id`),
   ADD KEY `customerId` (`customerId`),
-  ADD KEY `translatorId` (`translatorId`);
+  ADD KEY `translatorId_state` (`translatorId`,`state`),
+  ADD KEY `state_createdAt` (`state`,`createdAt`),
+  ADD KEY `state_updatedAt` (`state`,`updatedAt`),
+  ADD KEY `state_dueAt` (`state`,`dueAt`),
+  ADD KEY `languageCode_state_createdAt` (`languageCode`,`state`,`createdAt`);
+
+--
+-- Indexy pre tabuľku `ProjectTransitions`
+--
+ALTER TABLE `ProjectTransitions`
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `projectId_id` (`projectId`,`id`),
+  ADD KEY `actorId_id` (`actorId`,`id`);
+
+--
+-- Indexy pre tabuľku `TurnaroundRollups`
+--
+ALTER TABLE `TurnaroundRollups`
+  ADD PRIMARY KEY (`dimension`,`dimensionValue`,`stage`,`day`,`bucket`),
+  ADD KEY `dimension_day` (`dimension`,`day`);
 
 --
 -- Indexy pre tabuľku `Users`
 --
 ALTER TABLE `Users`
   ADD PRIMARY KEY (`id`),
-  ADD UNIQUE KEY `emailAddress` (`email`);
+  ADD UNIQUE KEY `emailAddress` (`email`),
+  ADD KEY `role_created_at` (`role`,`created_at`),
+  ADD KEY `name` (`name`);
+
+--
+-- AUTO_INCREMENT pre exportované tabuľky
+--
+
+--
+-- AUTO_INCREMENT pre tabuľku `ProjectTransitions`
+--
+ALTER TABLE `ProjectTransitions`
+  MODIFY `id` bigint UNSIGNED NOT NULL AUTO_INCREMENT;
 
 --
 -- Obmedzenie pre exportované tabuľky
@@ -126,6 +300,12 @@ ALTER TABLE `Users`
 ALTER TABLE `Feedbacks`
   ADD CONSTRAINT `Feedbacks_ibfk_1` FOREIGN KEY (`projectId`) REFERENCES `Projects` (`id`) ON DELETE CASCADE ON UPDATE CASCADE;
 
+--
+-- Obmedzenie pre tabuľku `IdempotencyKeys`
+--
+ALTER TABLE `IdempotencyKeys`
+  ADD CONSTRAINT `IdempotencyKeys_ibfk_1` FOREIGN KEY (`userId`) REFERENCES `Users` (`id`) ON DELETE CASCADE ON UPDATE CASCADE;
+
 --
 -- Obmedzenie pre tabuľku `Languages`
 --
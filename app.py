@@ -1,6 +1,7 @@
 from flask import Flask
 from router import register_routes
 from models.db import db, create_db_connection
+from services.DeadlineWatcher import DeadlineWatcher
 import secrets
 import os
 
@@ -11,7 +12,8 @@ def create_app(config=None):
     Create and configure the Flask application instance.
     This factory function initializes a new Flask app, generates a secure
     secret key for session management, establishes a database connection,
-    and registers all application routes.
+    and registers all application routes. Outside of testing, the in-process deadline
+    watcher is started unless DEADLINE_WATCHER_ENABLED is 0.
     Returns:
         Flask: A fully configured Flask application ready to run.
     """
@@ -27,6 +29,9 @@ def create_app(config=None):
     
     register_routes(app)
 
+    if not app.testing and os.getenv("DEADLINE_WATCHER_ENABLED", "1") != "0":
+        DeadlineWatcher.start()
+
     print("[app.py] Flask application created and configured.", flush=True)
 
     return app
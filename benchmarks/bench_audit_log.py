@@ -0,0 +1,87 @@
+"""
+Benchmark the cost the audit log adds to a project transition: one INSERT per transition
+versus buffering in AuditLog.record and flushing in multi-row INSERTs.
+
+The database is replaced by a fake that sleeps for a configurable round-trip time per
+statement, so the numbers show what the transition path pays per event. Usage:
+
+    python benchmarks/bench_audit_log.py [--events 20000] [--threads 8] [--rtt-ms 0.5]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+from models.db import db
+from models.ProjectTransition import ProjectTransition
+from services.AuditLog import AuditLog
+from services.EventBus import ProjectClosed
+
+
+class FakeDatabase:
+    """Accepts every statement, paying `rtt` seconds per round trip on a shared connection."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def execute_many(self, query, params_seq):
+        with self._lock:
+            self.round_trips += 1
+            self.rows += len(params_seq)
+            time.sleep(self.rtt)
+            return len(params_seq)
+
+
+def run(threads: int, events: int, record) -> float:
+    per_thread = events // threads
+
+    def transitions(offset):
+        for i in range(per_thread):
+            record(ProjectClosed(f"p{offset + i}", "APPROVED", "CLOSED", actor_id="admin"))
+
+    workers = [threading.Thread(target=transitions, args=(n * per_thread,)) for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="simulated database round-trip time")
+    args = parser.parse_args()
+
+    fake = FakeDatabase(args.rtt_ms / 1000)
+    db.execute_many = fake.execute_many
+    events = args.events - args.events % args.threads
+
+    print(f"{events} transitions from {args.threads} threads, {args.rtt_ms} ms per round trip")
+
+    direct = run(args.threads, events, lambda e: ProjectTransition.insert_many(
+        [(e.project_id, type(e).__name__, e.from_state, e.to_state, e.actor_id, e.occurred_at, None)]
+    ))
+    direct_trips = fake.round_trips
+
+    fake.round_trips = fake.rows = 0
+    buffered = run(args.threads, events, AuditLog.record)
+    AuditLog.flush()
+    buffered_trips = fake.round_trips
+
+    for label, elapsed, trips in (("insert per transition", direct, direct_trips),
+                                  ("buffered AuditLog", buffered, buffered_trips)):
+        print(f"  {label:<22} {elapsed / events * 1e6:9.2f} us per transition  {trips:6d} round trips")
+    print(f"  rows written by the buffered log: {fake.rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmark job queue throughput (jobs/sec) against the number of worker processes.
+
+Each round queues --jobs jobs of a no-op handler that sleeps for --work-ms, starts the given
+number of worker processes and measures the time until every job is DONE. Workers run the real
+JobQueue.run_batch / Job.claim_batch code.
+
+Backends:
+  mysql   the configured database (DATABASE_* environment variables, schema from
+          _db_dump/pia_db.sql). Workers claim with FOR UPDATE SKIP LOCKED, so claims run in
+          parallel. Benchmark jobs are deleted before and after each round.
+  sqlite  a temporary SQLite file. SQLite has no row locks: the statements are translated to
+          SQLite syntax and every claim takes the database write lock (BEGIN IMMEDIATE), so
+          claims are serialized and only the handler work runs in parallel.
+
+Usage:
+
+    python benchmarks/bench_job_queue.py [--backend sqlite|mysql] [--jobs 2000] [--workers 1 2 4 8]
+                                         [--batch-size 20] [--work-ms 2]
+"""
+import argparse
+import multiprocessing
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+from models import db as db_module
+from models.Job import Job, JobStatus
+from services.JobQueue import JobQueue
+
+JOB_TYPE = "bench.noop"
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    payload TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'PENDING',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    maxAttempts INTEGER NOT NULL DEFAULT 5,
+    runAt TEXT NOT NULL DEFAULT (datetime('now')),
+    lastError TEXT,
+    createdAt TEXT NOT NULL DEFAULT (datetime('now')),
+    finishedAt TEXT
+);
+CREATE INDEX IF NOT EXISTS status_priority_runAt ON Jobs (status, priority DESC, runAt);
+"""
+
+
+class SQLiteDatabase:
+    """Runs the Job model's MySQL statements on SQLite, with the DatabaseConnector interface."""
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self._depth = 0
+
+    @staticmethod
+    def _translate(query: str) -> str:
+        query = query.replace("%s", "?").replace(" FOR UPDATE SKIP LOCKED", "")
+        query = re.sub(r"DATE_ADD\(NOW\(\), INTERVAL \? SECOND\)", "datetime('now', ? || ' seconds')", query)
+        return query.replace("NOW()", "datetime('now')")
+
+    def execute_query(self, query, params=None):
+        cursor = self.connection.execute(self._translate(query), params or ())
+        if query.strip().lower().startswith("select"):
+            return [dict(row) for row in cursor.fetchall()]
+        return cursor.rowcount
+
+    def execute_many(self, query, params_seq):
+        with self.transaction():
+            return self.connection.executemany(self._translate(query), params_seq).rowcount
+
+    @contextmanager
+    def transaction(self):
+        if self._depth == 0:
+            self.connection.execute("BEGIN IMMEDIATE")
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self.connection.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self.connection.execute("COMMIT")
+
+    def on_commit(self, callback):
+        callback()
+
+
+def use_backend(backend: str, path: str) -> None:
+    if backend == "sqlite":
+        fake = SQLiteDatabase(path)
+        for name in ("execute_query", "execute_many", "transaction", "on_commit"):
+            setattr(db_module.db, name, getattr(fake, name))
+
+
+def noop(payload: dict) -> None:
+    time.sleep(payload["work_ms"] / 1000)
+
+
+def worker(backend: str, path: str, batch_size: int, start) -> None:
+    use_backend(backend, path)
+    JobQueue.register(JOB_TYPE, noop)
+    start.wait()
+    while any(JobQueue.run_batch(batch_size, [JOB_TYPE]).values()):
+        pass
+
+
+def clear_jobs() -> None:
+    db_module.db.execute_query("DELETE FROM Jobs WHERE type = %s", (JOB_TYPE,))
+
+
+def run_round(backend: str, path: str, jobs: int, workers: int, batch_size: int, work_ms: float) -> float:
+    clear_jobs()
+    Job.enqueue_many([(JOB_TYPE, {"work_ms": work_ms}, i % 3, 0, 5) for i in range(jobs)])
+
+    context = multiprocessing.get_context("spawn")
+    start = context.Event()
+    processes = [context.Process(target=worker, args=(backend, path, batch_size, start)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    # Let the workers import and connect before the clock starts.
+    time.sleep(1.0)
+    began = time.perf_counter()
+    start.set()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - began
+
+    counts = db_module.db.execute_query(
+        "SELECT status, COUNT(*) AS count FROM Jobs WHERE type = %s GROUP BY status", (JOB_TYPE,)
+    )
+    done = sum(row["count"] for row in counts if row["status"] == JobStatus.DONE.value)
+    if done != jobs:
+        raise RuntimeError(f"Only {done} of {jobs} jobs finished: {counts}")
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--work-ms", type=float, default=2.0, help="simulated handler work per job")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench-job-queue-")
+    path = os.path.join(directory, "jobs.sqlite3")
+    if args.backend == "sqlite":
+        sqlite3.connect(path).executescript(SQLITE_SCHEMA)
+    use_backend(args.backend, path)
+
+    print(f"{args.backend}: {args.jobs} jobs, {args.work_ms} ms of work each, batches of {args.batch_size}")
+
+    try:
+        baseline = None
+        for workers in args.workers:
+            elapsed = run_round(args.backend, path, args.jobs, workers, args.batch_size, args.work_ms)
+            rate = args.jobs / elapsed
+            baseline = baseline or rate
+            print(f"  {workers:3d} workers  {elapsed:8.2f} s  {rate:9.1f} jobs/s  ({rate / baseline:.1f}x)")
+    finally:
+        clear_jobs()
+        if args.backend == "sqlite":
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark login password verification latency under concurrent load.
+
+Simulates concurrent logins by verifying a stored scrypt hash from many request threads
+at once, the way api_login does, and reports latency percentiles against a budget.
+The database is not involved. Usage:
+
+    python benchmarks/bench_password_hashing.py [--threads 1 8 32] [--logins 200] [--budget-ms 250]
+
+Tune PASSWORD_SCRYPT_N and PASSWORD_HASH_WORKERS through the environment.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services import AuthService as auth_module
+from services.AuthService import AuthService
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def timed_login(stored_hash: str) -> float:
+    start = time.perf_counter()
+    assert AuthService.verify_password("correct horse battery staple", stored_hash)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    args = parser.parse_args()
+
+    stored_hash = AuthService.hash_password("correct horse battery staple")
+    print(f"scrypt n={auth_module.PASSWORD_SCRYPT_N} r={auth_module.PASSWORD_SCRYPT_R} "
+          f"p={auth_module.PASSWORD_SCRYPT_P}, {auth_module.PASSWORD_HASH_WORKERS} hashing workers")
+    print(f"{'threads':>8} {'logins/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'budget':>8}")
+
+    for threads in args.threads:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            latencies = list(executor.map(timed_login, [stored_hash] * args.logins))
+            elapsed = time.perf_counter() - start
+
+        p99 = percentile(latencies, 99) * 1000
+        verdict = "ok" if p99 <= args.budget_ms else "OVER"
+        print(f"{threads:>8} {args.logins / elapsed:>10.1f} {statistics.median(latencies) * 1000:>8.1f} {p99:>8.1f} {verdict:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark submitting many documents as projects: one create_project call per file versus
+one create_projects batch for all files.
+
+The database is replaced by an in-memory fake that sleeps for a configurable round-trip time
+on every statement and commit, so the benchmark shows how the number of round trips, not the
+MySQL server, dominates intake time. Files are streamed into a temporary directory and
+notifications are rendered with the real templates. Usage:
+
+    python benchmarks/bench_project_intake.py [--files 100] [--languages 3] [--translators 5] [--rtt-ms 0.5]
+"""
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+from werkzeug.datastructures import FileStorage
+from models.db import db
+from services.ProjectService import ProjectService
+from services.TranslatorDirectory import TranslatorDirectory
+from services.UserService import UserService
+
+
+class FakeDatabase:
+    """Answers the intake queries from memory, paying `rtt` seconds per round trip."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self._depth = 0
+        self._callbacks = []
+
+    def _trip(self) -> None:
+        self.round_trips += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def execute_query(self, query, params=None):
+        self._trip()
+        q = " ".join(query.split()).lower()
+        if not q.startswith("select"):
+            return 1
+        if q.startswith("select id from users"):
+            return [{'id': uid} for uid in params]
+        if "from users" in q:
+            return [self._user(uid) for uid in params]
+        return []
+
+    def execute_many(self, query, params_seq):
+        self._trip()
+        return len(params_seq)
+
+    @contextmanager
+    def transaction(self):
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+        if self._depth == 0:
+            self._trip()
+            callbacks, self._callbacks = self._callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def on_commit(self, callback):
+        if self._depth:
+            self._callbacks.append(callback)
+        else:
+            callback()
+
+    @staticmethod
+    def _user(user_id: str) -> dict:
+        role = 'TRANSLATOR' if user_id.startswith('translator') else 'CUSTOMER'
+        return {'id': user_id, 'name': user_id, 'email': f"{user_id}@example.com", 'password': '',
+                'role': role, 'created_at': datetime.now(), 'notificationMode': 'IMMEDIATE', 'locale': 'en'}
+
+
+def make_files(count: int, size: int) -> list:
+    payload = b"Lorem ipsum dolor sit amet. " * (size // 28 + 1)
+    return [FileStorage(stream=io.BytesIO(payload[:size]), filename=f"doc-{i}.txt") for i in range(count)]
+
+
+def reset(fake: FakeDatabase, languages: list, translators: int) -> None:
+    fake.round_trips = 0
+    UserService.contacts.clear()
+    TranslatorDirectory._by_language = {
+        language: {f"translator-{language}-{i}" for i in range(translators)} for language in languages
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--languages", type=int, default=3)
+    parser.add_argument("--translators", type=int, default=5, help="translators per language")
+    parser.add_argument("--file-kb", type=int, default=64)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="simulated database round-trip time")
+    args = parser.parse_args()
+
+    fake = FakeDatabase(args.rtt_ms / 1000)
+    for name in ("execute_query", "execute_many", "transaction", "on_commit"):
+        setattr(db, name, getattr(fake, name))
+
+    storage = tempfile.mkdtemp(prefix="bench-project-intake-")
+    ProjectService.ORIGINAL_FILES_FOLDER = storage
+    languages = [f"l{i}" for i in range(args.languages)]
+
+    print(f"{args.files} files of {args.file_kb} KB, {args.languages} languages, "
+          f"{args.translators} translators each, {args.rtt_ms} ms per round trip")
+
+    try:
+        reset(fake, languages, args.translators)
+        files = make_files(args.files, args.file_kb * 1024)
+        start = time.perf_counter()
+        for i, source_file in enumerate(files):
+            ProjectService.create_project("customer-1", f"Doc {i}", "Bench", languages[i % len(languages)], source_file)
+        single = time.perf_counter() - start
+        single_trips = fake.round_trips
+
+        reset(fake, languages, args.translators)
+        files = make_files(args.files, args.file_kb * 1024)
+        start = time.perf_counter()
+        projects = ProjectService.create_projects("customer-1", "Bench", [
+            (f"Doc {i}", languages[i % len(languages)], source_file) for i, source_file in enumerate(files)
+        ])
+        batch = time.perf_counter() - start
+        batch_trips = fake.round_trips
+
+        per_translator = {}
+        for project in projects:
+            per_translator[project.translator_id] = per_translator.get(project.translator_id, 0) + 1
+
+        print(f"  {'one request per file':<24} {single * 1000:9.1f} ms  {single_trips:6d} round trips")
+        print(f"  {'one batch request':<24} {batch * 1000:9.1f} ms  {batch_trips:6d} round trips  ({single / batch:.1f}x faster)")
+        print(f"  batch projects per translator: min {min(per_translator.values())}, max {max(per_translator.values())}")
+    finally:
+        shutil.rmtree(storage, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark email delivery throughput: a new SMTP connection per message versus the pooled
+connections used by EmailService.
+
+Starts a local aiosmtpd sink (pip install aiosmtpd) that accepts and discards every message,
+optionally delaying each SMTP reply to simulate a remote server, then sends the same batch
+both ways from several threads. The database is not involved. Usage:
+
+    python benchmarks/bench_smtp_pool.py [--messages 500] [--threads 4] [--latency-ms 0 5]
+"""
+import argparse
+import asyncio
+import os
+import smtplib
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from bin.smtp_pool import SMTPConnectionPool
+
+try:
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.smtp import SMTP as AiosmtpdSMTP
+except ImportError:
+    sys.exit("This benchmark needs aiosmtpd: pip install aiosmtpd")
+
+
+class SlowSMTP(AiosmtpdSMTP):
+    """aiosmtpd server that waits `latency` seconds before every reply."""
+
+    latency = 0.0
+
+    async def push(self, status):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await super().push(status)
+
+
+class SinkHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+class SinkController(Controller):
+    def factory(self):
+        return SlowSMTP(self.handler, **self.SMTP_kwargs)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_message(i: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = "noreply@pia.local"
+    msg["To"] = f"user{i}@example.com"
+    msg["Subject"] = f"Benchmark message {i}"
+    msg.set_content("The translated file for your project has been uploaded and is now available.")
+    return msg
+
+
+def send_unpooled(port: int, msg: EmailMessage) -> None:
+    with smtplib.SMTP("127.0.0.1", port, timeout=15) as smtp:
+        smtp.send_message(msg)
+
+
+def run(label: str, send, messages: list, threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(send, messages))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<26} {elapsed:8.3f} s   {len(messages) / elapsed:9.1f} msg/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4, help="sending threads; also the pool size")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0.0, 5.0], help="delay before each SMTP reply")
+    args = parser.parse_args()
+
+    messages = [build_message(i) for i in range(args.messages)]
+
+    for latency_ms in args.latency_ms:
+        SlowSMTP.latency = latency_ms / 1000
+        handler = SinkHandler()
+        port = free_port()
+        controller = SinkController(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        try:
+            print(f"{args.messages} messages, {args.threads} threads, {latency_ms:g} ms per SMTP reply")
+            unpooled = run("connection per message", lambda msg: send_unpooled(port, msg), messages, args.threads)
+
+            pool = SMTPConnectionPool("127.0.0.1", port, size=args.threads, max_messages=10 ** 6)
+            pooled = run("pooled connections", pool.send, messages, args.threads)
+            pool.close()
+
+            print(f"  speedup {unpooled / pooled:.1f}x, connections opened by the pool: {pool.connections_opened}")
+            assert handler.received == 2 * args.messages, handler.received
+        finally:
+            controller.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark TranslatorRanking scoring for languages with thousands of translators.
+
+Statistics are generated synthetically so the benchmark measures the scoring itself,
+not the database. Usage:
+
+    python benchmarks/bench_translator_ranking.py [--sizes 1000 5000 20000] [--repeat 50]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.TranslatorRanking import TranslatorRanking
+
+
+def make_stats(size: int, rng: random.Random) -> tuple[list, dict]:
+    translator_ids = [f"translator-{i}" for i in range(size)]
+    stats = {}
+    for tid in translator_ids:
+        if rng.random() < 0.2:
+            continue  # translator without any history
+        approved = rng.randint(0, 200)
+        stats[tid] = {
+            'approved': approved,
+            'rejected': rng.randint(0, 40),
+            'backlog': rng.randint(0, 15),
+            'avg_turnaround': rng.uniform(600, 7 * 86400) if approved else None,
+        }
+    return translator_ids, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'translators':>12} {'mean ms':>10} {'best ms':>10} {'ranks/s':>10}")
+    for size in args.sizes:
+        translator_ids, stats = make_stats(size, rng)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            TranslatorRanking.rank(translator_ids, stats)
+            timings.append(time.perf_counter() - start)
+        mean = sum(timings) / len(timings)
+        print(f"{size:>12} {mean * 1000:>10.2f} {min(timings) * 1000:>10.2f} {1 / mean:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
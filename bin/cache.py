@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Thread-safe, bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Entries are evicted in least-recently-used order once `maxsize` is reached, and an
+    entry older than `ttl` seconds is treated as missing. Hit and miss counters are kept
+    so callers can report the cache's effectiveness.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """
+        Initialize an empty cache.
+
+        Parameters:
+            maxsize (int): Maximum number of entries kept before the least recently used is evicted.
+            ttl (float): Number of seconds an entry stays valid after it was stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for `key`, or `default` if it is missing or expired.
+        A hit marks the entry as most recently used.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value) -> None:
+        """Store `value` under `key`, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key) -> None:
+        """Remove `key` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Return the cache's counters.
+
+        Returns:
+            dict: 'hits', 'misses', 'hit_rate' (0.0 when unused), 'size' and 'maxsize'.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
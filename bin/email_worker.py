@@ -0,0 +1,49 @@
+"""
+Email delivery worker.
+
+Drains the EmailOutbox table: folds due notification digests (see EmailService.flush_digests),
+claims due messages in batches, sends them over SMTP and reschedules or dead-letters failures
+(see EmailService.deliver_pending). Several workers can run side by side. Usage:
+
+    python -m bin.email_worker [--once] [--batch-size 50] [--poll-seconds 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.EmailService import EmailService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="deliver one batch and exit")
+    parser.add_argument("--batch-size", type=int, default=EmailService.BATCH_SIZE)
+    parser.add_argument("--poll-seconds", type=float, default=float(os.getenv("EMAIL_WORKER_POLL_SECONDS", "5")))
+    args = parser.parse_args()
+
+    print(f"[email_worker.py] Email worker started (batch size {args.batch_size}).", flush=True)
+
+    while True:
+        try:
+            EmailService.flush_digests()
+            outcome = EmailService.deliver_pending(args.batch_size)
+        except (ValueError, ConnectionError) as e:
+            print(f"[email_worker.py] Delivery round failed: {e}", flush=True)
+            outcome = None
+
+        if outcome and any(outcome.values()):
+            print(f"[email_worker.py] Delivered {outcome['sent']}, retrying {outcome['retried']}, dead-lettered {outcome['dead']}, deferred {outcome['deferred']}.", flush=True)
+
+        if args.once:
+            break
+
+        # Keep draining while full batches are delivered; otherwise wait for new mail
+        # (or for the SMTP circuit breaker to close).
+        if not outcome or outcome['deferred'] or sum(outcome.values()) < args.batch_size:
+            time.sleep(args.poll_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Background job worker.
+
+Claims due jobs from the Jobs table in batches, highest priority first, and runs them with the
+handlers registered in JobQueue (see JobQueue.run_batch). Jobs whose worker died are requeued
+once their visibility timeout expires, and expired idempotency keys are purged along the way.
+Claims use SKIP LOCKED, so any number of workers can run side by side. Usage:
+
+    python -m bin.job_worker [--once] [--batch-size 20] [--poll-seconds 2] [--types projects.reassign_stalled ...]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.JobQueue import JobQueue
+from services.IdempotencyService import IdempotencyService
+import services.ProjectService  # noqa: F401  (registers the project job handlers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="run one batch and exit")
+    parser.add_argument("--batch-size", type=int, default=JobQueue.BATCH_SIZE)
+    parser.add_argument("--poll-seconds", type=float, default=float(os.getenv("JOB_WORKER_POLL_SECONDS", "2")))
+    parser.add_argument("--release-seconds", type=float, default=60, help="how often expired leases and idempotency keys are cleaned up")
+    parser.add_argument("--types", nargs="+", choices=JobQueue.registered_types(), help="only run these job types")
+    args = parser.parse_args()
+
+    print(f"[job_worker.py] Job worker started (batch size {args.batch_size}, types {', '.join(args.types or JobQueue.registered_types())}).", flush=True)
+
+    released_at = 0.0
+    while True:
+        try:
+            if time.monotonic() - released_at >= args.release_seconds:
+                released = JobQueue.release_expired()
+                released_at = time.monotonic()
+                if released:
+                    print(f"[job_worker.py] Requeued {released} jobs with expired leases.", flush=True)
+                IdempotencyService.purge_expired()
+
+            outcome = JobQueue.run_batch(args.batch_size, args.types)
+        except (ValueError, ConnectionError) as e:
+            print(f"[job_worker.py] Job round failed: {e}", flush=True)
+            outcome = None
+
+        if outcome and any(outcome.values()):
+            print(f"[job_worker.py] Done {outcome['done']}, retrying {outcome['retried']}, dead-lettered {outcome['dead']}.", flush=True)
+
+        if args.once:
+            break
+
+        # Keep draining while full batches are claimed; otherwise wait for new jobs.
+        if not outcome or sum(outcome.values()) < args.batch_size:
+            time.sleep(args.poll_seconds)
+
+
+if __name__ == "__main__":
+    main()
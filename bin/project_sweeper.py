@@ -0,0 +1,44 @@
+"""
+Stalled project sweeper.
+
+Periodically hands ASSIGNED and REJECTED projects that saw no progress within the SLA over to
+the next-best translator of their language (see ProjectService.reassign_stalled_projects).
+Sweeps lock projects with SKIP LOCKED, so several sweepers can run side by side. Usage:
+
+    python -m bin.project_sweeper [--once] [--interval-seconds 600] [--sla-hours 72] [--batch-size 100]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.ProjectService import ProjectService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="run one sweep and exit")
+    parser.add_argument("--interval-seconds", type=float, default=float(os.getenv("PROJECT_STALL_SWEEP_INTERVAL_SECONDS", "600")))
+    parser.add_argument("--sla-hours", type=float, default=ProjectService.STALL_SLA_SECONDS / 3600)
+    parser.add_argument("--batch-size", type=int, default=ProjectService.STALL_SWEEP_BATCH_SIZE)
+    args = parser.parse_args()
+
+    print(f"[project_sweeper.py] Sweeper started (SLA {args.sla_hours:g} h, every {args.interval_seconds:g} s).", flush=True)
+
+    while True:
+        try:
+            summary = ProjectService.reassign_stalled_projects(int(args.sla_hours * 3600), args.batch_size)
+            for item in summary['reassignments']:
+                print(f"[project_sweeper.py] Project {item['project_id']}: {item['from_translator_id']} -> {item['to_translator_id']}", flush=True)
+        except (ValueError, ConnectionError) as e:
+            print(f"[project_sweeper.py] Sweep failed: {e}", flush=True)
+
+        if args.once:
+            break
+
+        time.sleep(args.interval_seconds)
+
+
+if __name__ == "__main__":
+    main()
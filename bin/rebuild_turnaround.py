@@ -0,0 +1,41 @@
+"""
+Turnaround rollup backfill.
+
+Rebuilds the turnaround analytics (TurnaroundRollups and ProjectMilestones) from the
+ProjectTransitions audit log in one streaming pass (see TurnaroundAnalytics.rebuild). Run it
+once after deploying the analytics, or whenever the rollups need to be recomputed, preferably
+while the application is idle. Usage:
+
+    python -m bin.rebuild_turnaround [--batch-size 5000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.TurnaroundAnalytics import TurnaroundAnalytics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=TurnaroundAnalytics.REBUILD_BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    print(f"[rebuild_turnaround.py] Rebuilding turnaround rollups (batches of {args.batch_size}).", flush=True)
+
+    try:
+        processed = TurnaroundAnalytics.rebuild(
+            args.batch_size,
+            progress=lambda total: print(f"[rebuild_turnaround.py] {total} transitions processed.", flush=True)
+        )
+    except (ValueError, ConnectionError) as e:
+        print(f"[rebuild_turnaround.py] Rebuild failed: {e}", flush=True)
+        sys.exit(1)
+
+    print(f"[rebuild_turnaround.py] Rebuilt from {processed} transitions in {time.monotonic() - started:.1f} s.", flush=True)
+
+
+if __name__ == "__main__":
+    main()
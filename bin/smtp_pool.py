@@ -0,0 +1,207 @@
+import smtplib
+import threading
+import time
+from collections import deque
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of contacting the SMTP server while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for a remote dependency.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls are refused for
+    `reset_timeout` seconds. Then one trial call is let through (half-open): success closes the
+    circuit again, failure re-opens it for another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize a closed circuit.
+
+        Parameters:
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a trial call is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed now. In the half-open state only one caller gets True."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening (or re-opening) the circuit once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        """Seconds until the next trial call is allowed; 0.0 when the circuit is closed."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of long-lived SMTP connections.
+
+    At most `size` connections are open at once; callers beyond that wait for a free one.
+    A connection idle for longer than `noop_after` seconds is checked with NOOP before reuse
+    and replaced if the server dropped it, and connections are recycled after `max_messages`
+    messages. Connection-level failures (timeouts, resets, disconnects) discard the connection,
+    retry once on a fresh one and feed the circuit breaker; message-level rejections (e.g. a
+    refused recipient) leave the connection in the pool and are raised to the caller.
+    """
+
+    def __init__(self, host: str, port: int, size: int = 2, connect_timeout: float = 5.0,
+                 read_timeout: float = 15.0, noop_after: float = 30.0, max_messages: int = 100,
+                 breaker: CircuitBreaker = None):
+        """
+        Initialize an empty pool; connections are opened on demand.
+
+        Parameters:
+            host (str): SMTP server hostname.
+            port (int): SMTP server port.
+            size (int): Maximum number of open connections.
+            connect_timeout (float): Seconds allowed for the TCP connect and the server greeting.
+            read_timeout (float): Seconds allowed for each reply once connected.
+            noop_after (float): Idle seconds after which a connection is health-checked before reuse.
+            max_messages (int): Messages sent over one connection before it is replaced.
+            breaker (CircuitBreaker | None): Circuit breaker guarding the server. A default one is created when omitted.
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.noop_after = noop_after
+        self.max_messages = max_messages
+        self.breaker = breaker or CircuitBreaker()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle = deque()
+        self.connections_opened = 0
+
+    def send(self, msg) -> None:
+        """
+        Send an email.message.EmailMessage over a pooled connection.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            smtplib.SMTPException | OSError: If sending fails.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"SMTP circuit is open, retry in {self.breaker.retry_after():.0f}s.")
+
+        with self._slots:
+            for attempt in (1, 2):
+                try:
+                    entry = self._checkout()
+                except (smtplib.SMTPException, OSError):
+                    self.breaker.record_failure()
+                    raise
+
+                try:
+                    entry[0].send_message(msg)
+                except smtplib.SMTPException as e:
+                    # SMTPException derives from OSError, so server replies are told apart here.
+                    if not isinstance(e, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+                        self._checkin(entry)
+                        self.breaker.record_success()
+                        raise
+                    connection_error = e
+                except OSError as e:
+                    connection_error = e
+                else:
+                    entry[2] += 1
+                    self._checkin(entry)
+                    self.breaker.record_success()
+                    return
+
+                # The connection is unusable; a stale pooled connection is worth one retry.
+                self._discard(entry[0])
+                if attempt == 2:
+                    self.breaker.record_failure()
+                    raise connection_error
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for smtp, _, _ in idle:
+            self._discard(smtp)
+
+    def _checkout(self) -> list:
+        """Return a healthy `[smtp, last_used, sent]` entry, reusing an idle connection when possible."""
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return [self._connect(), time.monotonic(), 0]
+            if time.monotonic() - entry[1] < self.noop_after:
+                return entry
+            try:
+                if entry[0].noop()[0] == 250:
+                    return entry
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard(entry[0])
+
+    def _checkin(self, entry: list) -> None:
+        """Return a connection to the pool, or close it once it reached `max_messages`."""
+        if entry[2] >= self.max_messages:
+            self._discard(entry[0])
+            return
+        entry[1] = time.monotonic()
+        with self._lock:
+            self._idle.append(entry)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new connection using the connect timeout, then switch the socket to the read timeout."""
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.connect_timeout)
+        smtp.sock.settimeout(self.read_timeout)
+        with self._lock:
+            self.connections_opened += 1
+        return smtp
+
+    @staticmethod
+    def _discard(smtp: smtplib.SMTP) -> None:
+        """Close a connection, politely if the server still answers."""
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
@@ -0,0 +1,36 @@
+from datetime import date
+from flask import Blueprint, request, jsonify
+from services.TurnaroundAnalytics import TurnaroundAnalytics
+from services.AuthService import login_required_api, require_role
+
+analytics_bp = Blueprint('analytics_bp', __name__)
+
+
+@analytics_bp.route('/analytics/turnaround', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_turnaround():
+    """
+    API endpoint for administrators reporting how long projects spend in each stage
+    (ASSIGNMENT, TRANSLATION, REVIEW and TOTAL), answered from the turnaround rollups.
+    Query parameters:
+        group_by (str, optional): 'all' (default), 'language' or 'translator'.
+        from (str, optional): First day as YYYY-MM-DD; defaults to 30 days before `to`.
+        to (str, optional): Last day as YYYY-MM-DD; defaults to today.
+        value (str, optional): Only this language code or translator id.
+    Returns:
+        flask.Response:
+            - 200 OK: {'group_by', 'from', 'to', 'groups': [{'value', 'stages': {'<stage>': {'count',
+              'avg_seconds', 'p50_seconds', 'p90_seconds', 'p95_seconds'}}}]}
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    try:
+        day_from = date.fromisoformat(request.args['from']) if request.args.get('from') else None
+        day_to = date.fromisoformat(request.args['to']) if request.args.get('to') else None
+        result = TurnaroundAnalytics.get_turnaround(
+            request.args.get('group_by', 'all'), day_from, day_to, request.args.get('value') or None
+        )
+        return jsonify(result), 200
+    except ValueError as e:
+        print(f"[AnalyticsController.py] Error loading turnaround analytics: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
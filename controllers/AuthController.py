@@ -64,7 +64,7 @@ def api_login():
     user = AuthService.authenticate_user(name, password)
 
     if user:
-        session['user'] = { 'user_id': user.get('id'), 'name': user.get('name'), 'email': user.get('email'), 'role': user.get('role')}
+        session['user'] = { 'user_id': user.get('id'), 'name': user.get('name'), 'email': user.get('email'), 'role': user.get('role'), 'session_version': user.get('sessionVersion', 0)}
         return {'status': 'success', 'role': user.get('role')}, 200
     else:
         print(f"[AuthController.py] Authentication failed for user: {name}", flush=True)
@@ -100,7 +100,7 @@ def google_login():
         print(f"[AuthController.py] No local user found for email {email}, redirecting to registration.", flush=True)
         return redirect(url_for('auth_bp.register_page', name=name, email=email))
     
-    session['user'] = {'user_id': user.get('id'), 'name': user.get('name'), 'email': user.get('email'), 'role': user.get('role')}
+    session['user'] = {'user_id': user.get('id'), 'name': user.get('name'), 'email': user.get('email'), 'role': user.get('role'), 'session_version': user.get('sessionVersion', 0)}
     
     return redirect(url_for('app_bp.home'))
 
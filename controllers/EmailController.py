@@ -6,9 +6,9 @@ from services.AuthService import login_required_api, require_role
 
 email_bp = Blueprint('email_bp', __name__)
 
+@email_bp.route('/email/respond', methods=['POST'])
 @login_required_api
 @require_role('ADMINISTRATOR')
-@email_bp.route('/email/respond', methods=['POST'])
 def respond_to_feedback():
     """
     Admin sends a response message via email to either the customer or translator.
@@ -19,6 +19,7 @@ def respond_to_feedback():
       "subject": "...",
       "body": "..."
     }
+    The message is queued in the email outbox and delivered by the email worker.
     """
     data = request.get_json(silent=True) or {}
 
@@ -45,8 +46,8 @@ def respond_to_feedback():
         print(f"[EmailController.py] Project not found: {project_id}", flush=True)
         return jsonify({'error': 'Project not found'}), 404
 
-    project_customer_id = project.customer_id
-    project_translator_id = project.translator_id
+    project_customer_id = project['customer_id']
+    project_translator_id = project['translator_id']
 
     if recipient_user_id not in [project_customer_id, project_translator_id]:
         print(f"[EmailController.py] Recipient user ID {recipient_user_id} does not belong to project {project_id}", flush=True)
@@ -63,13 +64,81 @@ def respond_to_feedback():
         return jsonify({'error': 'Recipient has no email'}), 400
 
     try:
-        EmailService.send_email(recipient_email, subject, body)
-    except Exception as e:
-        print(f"[EmailController.py] Failed to send email to {recipient_email}: {e}", flush=True)
-        return jsonify({'error': f'Failed to send email: {str(e)}'}), 500
+        EmailService.queue_email(recipient_email, subject, body)
+    except ValueError as e:
+        print(f"[EmailController.py] Failed to queue email to {recipient_email}: {e}", flush=True)
+        return jsonify({'error': f'Failed to queue email: {str(e)}'}), 500
 
     return jsonify({
-        'status': 'Message sent',
+        'status': 'Message queued',
         'project_id': project_id,
         'recipient_user_id': recipient_user_id,
     }), 200
+
+
+@email_bp.route('/email/outbox', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_outbox_stats():
+    """
+    Report the email outbox backlog.
+    Returns:
+        Tuple[flask.Response, int]: JSON {"outbox": {"<status>": int, ...}} with a count for every outbox status
+        with HTTP 200.
+    """
+    return jsonify({'outbox': EmailService.get_outbox_stats()}), 200
+
+
+@email_bp.route('/email/broadcast', methods=['POST'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def broadcast():
+    """
+    Admin sends one message to a group of users.
+    Expected JSON, with recipients selected either by id:
+    {
+      "subject": "...",
+      "body": "...",
+      "user_ids": ["...", ...]
+    }
+    or by project participation:
+    {
+      "subject": "...",
+      "body": "...",
+      "role": "TRANSLATOR" | "CUSTOMER",
+      "project_state": "ASSIGNED",   (optional)
+      "language": "de"               (optional)
+    }
+    Messages are queued and delivered in the background at a limited rate.
+    Returns:
+        Tuple[flask.Response, int]: JSON {"broadcast_id": "...", "recipients": int} with HTTP 202,
+        or {"error": "<message>"} with HTTP 400 if the request is invalid.
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        result = EmailService.queue_broadcast(
+            data.get('subject'),
+            data.get('body'),
+            user_ids=data.get('user_ids'),
+            role=data.get('role'),
+            project_state=data.get('project_state'),
+            language=data.get('language'),
+        )
+    except ValueError as e:
+        print(f"[EmailController.py] Broadcast failed: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(result), 202
+
+
+@email_bp.route('/email/broadcast/<broadcast_id>', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_broadcast_status(broadcast_id):
+    """
+    Report how far a broadcast has been delivered.
+    Returns:
+        Tuple[flask.Response, int]: JSON {"broadcast_id": "...", "status": {"<status>": int, ...}} with HTTP 200.
+    """
+    return jsonify({'broadcast_id': broadcast_id, 'status': EmailService.get_broadcast_status(broadcast_id)}), 200
@@ -0,0 +1,40 @@
+from flask import Blueprint, jsonify
+from services.JobQueue import JobQueue
+from services.AuthService import login_required_api, require_role
+
+job_bp = Blueprint('job_bp', __name__)
+
+
+@job_bp.route('/jobs', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_job_stats():
+    """
+    Report the background job backlog.
+    Returns:
+        Tuple[flask.Response, int]: JSON {"status": {"<status>": int, ...}} with HTTP 200.
+    """
+    return jsonify({'status': JobQueue.get_stats()}), 200
+
+
+@job_bp.route('/jobs/<job_id>', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_job(job_id):
+    """
+    Report the state of one background job.
+    Parameters:
+        job_id (str): The id returned when the job was queued.
+    Returns:
+        flask.Response:
+            - 200 OK: {'id', 'type', 'status', 'priority', 'attempts', 'maxAttempts', 'runAt',
+              'lastError', 'createdAt', 'finishedAt'}
+            - 404 Not Found: {'error': 'Job not found'}
+    """
+    job = JobQueue.get_job(job_id)
+
+    if job is None:
+        print(f"[JobController.py] Job {job_id} not found.", flush=True)
+        return jsonify({'error': 'Job not found'}), 404
+
+    return jsonify(job), 200
@@ -1,7 +1,10 @@
+from datetime import datetime
 from flask import Blueprint, request, jsonify, send_file, session
 from models.Project import ProjectState
 from services.ProjectService import ProjectService
 from services.AuthService import login_required_api, require_role
+from services.IdempotencyService import idempotent
+from services.AuditLog import AuditLog
 
 proj_bp = Blueprint('proj_bp', __name__)
 
@@ -9,22 +12,41 @@ proj_bp = Blueprint('proj_bp', __name__)
 @proj_bp.route('/projects', methods=['POST'])
 @login_required_api
 @require_role('CUSTOMER')
+@idempotent
 def create_project():
     """
     The `create_project` function defines an API endpoint to create a new project with specified details
-    and handles exceptions during the process.
+    and handles exceptions during the process. When the `language` field is repeated, the source file
+    is stored once and one project is created per target language. A retry carrying the same
+    `Idempotency-Key` header is answered with the original response without creating the project again.
+    The optional `due_at` field sets an ISO 8601 deadline, e.g. 2026-05-01T17:00:00+02:00.
     :return: The `create_project` function returns a JSON response based on the outcome of creating a
-    new project.
+    new project; for several languages it is {'message', 'projects': [...]} with HTTP 201.
     """
 
     customer_id = request.form.get('customer_id') if 'customer_id' in request.form else session.get('user', {}).get('user_id')
     project_name = request.form.get('project_name')
     description = request.form.get('description')
-    target_language = request.form.get('language')
+    target_languages = request.form.getlist('language')
+    target_language = target_languages[0] if target_languages else None
     source_file = request.files.get('source_file')
 
     try:
-        project = ProjectService.create_project(customer_id, project_name, description, target_language, source_file)
+        due_at = _parse_due_at(request.form.get('due_at'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    if len(target_languages) > 1:
+        try:
+            projects = ProjectService.create_projects_for_languages(customer_id, project_name, description, target_languages, source_file, due_at)
+        except ValueError as e:
+            print(f"[ProjectController.py] Project creation failed: {e}", flush=True)
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify({'message': 'Projects created successfully.', 'projects': [_project_summary(p) for p in projects]}), 201
+
+    try:
+        project = ProjectService.create_project(customer_id, project_name, description, target_language, source_file, due_at)
 
         if not project:
             print(f"[ProjectController.py] Project creation failed.", flush=True)
@@ -40,13 +62,92 @@ def create_project():
         return jsonify({'error': str(e)}), 400
 
 
+def _parse_due_at(value):
+    """Parse an ISO 8601 deadline into a naive local datetime; empty means no deadline."""
+
+    if not value:
+        return None
+
+    try:
+        due_at = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError("due_at must be an ISO 8601 date and time.")
+
+    if due_at.tzinfo is not None:
+        due_at = due_at.astimezone().replace(tzinfo=None)
+
+    return due_at
+
+
+@proj_bp.route('/projects/batch', methods=['POST'])
+@login_required_api
+@require_role('CUSTOMER')
+@idempotent
+def create_projects_batch():
+    """
+    API endpoint to create one project per uploaded file in a single multipart request.
+    Form fields:
+        source_file (file, repeated): The documents to translate.
+        description (str): Description shared by all projects.
+        language (str, once or once per file): Target language of all files, or of each file in order.
+        project_name (str, optional, once or once per file): Name of each project in order. A single
+            name is used as a prefix together with the file name; without it the file name is used.
+    Returns:
+        flask.Response:
+            - 201 Created: {'projects': [{'id', 'name', 'language', 'state', 'translator_id'}, ...]}
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+
+    customer_id = session.get('user', {}).get('user_id')
+    files = request.files.getlist('source_file')
+    languages = request.form.getlist('language')
+    names = request.form.getlist('project_name')
+
+    if len(languages) not in (1, len(files)):
+        return jsonify({'error': 'Provide one language for all files or one per file.'}), 400
+
+    if len(names) not in (0, 1, len(files)):
+        return jsonify({'error': 'Provide one project name for all files or one per file.'}), 400
+
+    entries = []
+    for index, source_file in enumerate(files):
+        if len(names) == len(files):
+            name = names[index]
+        elif names:
+            name = f"{names[0]} - {source_file.filename}"
+        else:
+            name = source_file.filename
+        language = languages[index] if len(languages) == len(files) else languages[0]
+        entries.append((name, language, source_file))
+
+    try:
+        projects = ProjectService.create_projects(customer_id, request.form.get('description'), entries)
+    except ValueError as e:
+        print(f"[ProjectController.py] Batch project creation failed: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({'projects': [_project_summary(project) for project in projects]}), 201
+
+
+def _project_summary(project) -> dict:
+    """Describe a newly created project in a batch response."""
+    return {
+        'id': str(project.id),
+        'name': project.name,
+        'language': project.language,
+        'state': project.state.value,
+        'translator_id': project.translator_id,
+    }
+
+
 @proj_bp.route('/projects', methods=['GET'])
 @login_required_api
 @require_role('ADMINISTRATOR', 'TRANSLATOR')
 def get_all_projects():
     """
-    This Python function retrieves all projects using an API endpoint and returns them as JSON, handling
-    any ValueErrors that may occur.
+    This Python function retrieves projects using an API endpoint and returns them as JSON, handling
+    any ValueErrors that may occur. Optional query parameters `state`, `language`, `created_from` and
+    `created_to` (ISO 8601) are applied as filters in the database.
     :return: The function `get_all_projects()` is returning a JSON response containing either a list of
     projects under the key 'projects' with a status code of 200 if successful, or an error message under
     the key 'error' with a status code of 400 if an exception of type `ValueError` is caught during the
@@ -54,7 +155,12 @@ def get_all_projects():
     """
 
     try:
-        projects = ProjectService.get_all_projects()
+        projects = ProjectService.get_projects(
+            state=request.args.get('state'),
+            language=request.args.get('language'),
+            created_from=request.args.get('created_from'),
+            created_to=request.args.get('created_to'),
+        )
         return jsonify({'projects': projects}), 200
     except ValueError as e:
         print(f"[ProjectController.py] Error retrieving all projects: {e}", flush=True)
@@ -169,16 +275,17 @@ def update_project_status(project_id):
 def assign_translator(project_id):
     """API endpoint to assign a translator to a project.
     Consumes a JSON payload containing a 'translator_id' and delegates the assignment
-    to ProjectService. Responds with a success message on completion or an error
-    message if validation fails.
+    to ProjectService. When 'translator_id' is omitted, the best-ranked translator for
+    the project's language is assigned. Responds with a success message on completion
+    or an error message if validation fails.
     Parameters:
         project_id (int | str): Identifier of the project to update. Typically parsed from the URL path.
             Must reference an existing project.
     Request JSON:
-        translator_id (int | str): Identifier of the translator to assign.
+        translator_id (int | str, optional): Identifier of the translator to assign.
     Returns:
         flask.Response:
-            - 200 OK: {'message': 'Translator assigned successfully.'}
+            - 200 OK: {'message': 'Translator assigned successfully.', 'translator_id': '<id>'}
             - 400 Bad Request: {'error': '<validation error message>'}
     Raises:
         ValueError: Propagated from ProjectService.assign_translator_to_project when input
@@ -186,15 +293,228 @@ def assign_translator(project_id):
     Side Effects:
         Persists the translator assignment to the project via ProjectService.
     """
-    data = request.json
+    data = request.get_json(silent=True) or {}
     translator_id = data.get('translator_id')
 
     try:
-        ProjectService.assign_translator_to_project(project_id, translator_id)
-        return jsonify({'message': 'Translator assigned successfully.'}), 200
+        translator_id = ProjectService.assign_translator_to_project(project_id, translator_id, actor_id=session.get('user', {}).get('user_id'))
+        return jsonify({'message': 'Translator assigned successfully.', 'translator_id': translator_id}), 200
     except ValueError as e:
         print(f"[ProjectController.py] Error assigning translator to project {project_id}: {e}", flush=True)
         return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/projects/bulk/status', methods=['POST'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def bulk_update_status():
+    """
+    API endpoint for administrators to move many projects to the same state.
+    Request JSON:
+        project_ids (list[str]): Projects to update.
+        status (str): Target state; only CLOSED is supported.
+    Returns:
+        flask.Response:
+            - 200 OK: {'updated': int, 'results': [{'project_id': '<id>', 'ok': bool, 'error': '<reason>'}, ...]}
+              where 'error' is present only for projects that were not updated.
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        result = ProjectService.bulk_update_status(data.get('project_ids'), data.get('status'), actor_id=session.get('user', {}).get('user_id'))
+        return jsonify(result), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error in bulk status update: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/projects/bulk/assign', methods=['POST'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def bulk_assign_translator():
+    """
+    API endpoint for administrators to assign one translator to many projects.
+    Request JSON:
+        project_ids (list[str]): Projects to assign.
+        translator_id (str): The translator to assign.
+    Returns:
+        flask.Response:
+            - 200 OK: {'updated': int, 'results': [{'project_id': '<id>', 'ok': bool, 'error': '<reason>'}, ...]}
+              where 'error' is present only for projects that were not assigned.
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        result = ProjectService.bulk_assign_translator(data.get('project_ids'), data.get('translator_id'), actor_id=session.get('user', {}).get('user_id'))
+        return jsonify(result), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error in bulk translator assignment: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/projects/stalled', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_stalled_projects():
+    """
+    API endpoint for administrators listing ASSIGNED and REJECTED projects without progress past the SLA.
+    Query parameters:
+        sla_hours (float, optional): Allowed time without progress; defaults to PROJECT_STALL_SLA_HOURS.
+        limit (int, optional): Projects listed per state, oldest first (default 100).
+    Returns:
+        flask.Response:
+            - 200 OK: {'sla_seconds': int, 'states': {'<state>': {'count': int, 'projects': [...]}}}
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    try:
+        sla_hours = request.args.get('sla_hours', type=float)
+        result = ProjectService.get_stalled_report(
+            int(sla_hours * 3600) if sla_hours is not None else None,
+            min(request.args.get('limit', default=100, type=int), 1000)
+        )
+        return jsonify(result), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error loading stalled projects: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/projects/due-soon', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_due_soon_projects():
+    """
+    API endpoint for administrators listing open projects due within the next hours, overdue ones included.
+    Query parameters:
+        hours (float, optional): Look-ahead window (default 24).
+        limit (int, optional): Maximum number of projects, earliest deadline first (default 100).
+    Returns:
+        flask.Response:
+            - 200 OK: {'hours': float, 'due_before': str, 'projects': [...]}
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    try:
+        result = ProjectService.get_due_soon(
+            request.args.get('hours', default=24.0, type=float),
+            min(request.args.get('limit', default=100, type=int), 1000)
+        )
+        return jsonify(result), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error loading projects due soon: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/projects/stalled/reassign', methods=['POST'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def reassign_stalled_projects():
+    """
+    API endpoint for administrators to run a stalled-project sweep right away instead of waiting
+    for the scheduled one.
+    Request JSON (optional):
+        sla_hours (float): Allowed time without progress; defaults to PROJECT_STALL_SLA_HOURS.
+        background (bool): Queue the sweep for a job worker instead of waiting for it.
+    Returns:
+        flask.Response:
+            - 200 OK: {'scanned': int, 'reassigned': int, 'no_candidate': int, 'reassignments': [...]}
+            - 202 Accepted: {'job_id': str} when `background` is set; poll GET /api/jobs/<job_id>.
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        sla_hours = data.get('sla_hours')
+        if sla_hours is not None and (not isinstance(sla_hours, (int, float)) or isinstance(sla_hours, bool)):
+            raise ValueError("sla_hours must be a number.")
+        sla_seconds = int(sla_hours * 3600) if sla_hours is not None else None
+        if data.get('background'):
+            return jsonify({'job_id': ProjectService.queue_stalled_sweep(sla_seconds)}), 202
+        result = ProjectService.reassign_stalled_projects(sla_seconds)
+        return jsonify(result), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Stalled project sweep failed: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/project/<project_id>/transitions', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_project_transitions(project_id):
+    """
+    API endpoint for administrators listing who moved a project between states and when, newest first.
+    Query parameters:
+        limit (int, optional): Page size (default 100, at most 1000).
+        before_id (int, optional): `next_before_id` of the previous page.
+    Returns:
+        flask.Response:
+            - 200 OK: {'transitions': [{'id', 'projectId', 'event', 'fromState', 'toState', 'actorId',
+              'occurredAt'}, ...], 'next_before_id': int | None}
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    try:
+        transitions = AuditLog.get_project_history(
+            project_id, request.args.get('limit', default=100, type=int), request.args.get('before_id', type=int)
+        )
+        return jsonify(_transition_page(transitions)), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error loading transitions of project {project_id}: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+@proj_bp.route('/projects/transitions/actor/<actor_id>', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_actor_transitions(actor_id):
+    """
+    API endpoint for administrators listing the project transitions caused by one user, newest first.
+    Query parameters:
+        limit (int, optional): Page size (default 100, at most 1000).
+        before_id (int, optional): `next_before_id` of the previous page.
+    Returns:
+        flask.Response:
+            - 200 OK: {'transitions': [...], 'next_before_id': int | None}, as for project transitions.
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+    try:
+        transitions = AuditLog.get_actor_history(
+            actor_id, request.args.get('limit', default=100, type=int), request.args.get('before_id', type=int)
+        )
+        return jsonify(_transition_page(transitions)), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error loading transitions of user {actor_id}: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+
+def _transition_page(transitions: list) -> dict:
+    """Wrap a page of transitions together with the cursor of the next page."""
+
+    return {'transitions': transitions, 'next_before_id': transitions[-1]['id'] if transitions else None}
+
+
+@proj_bp.route('/project/<project_id>/candidates', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_translator_candidates(project_id):
+    """
+    API endpoint listing the translators who could be assigned to a project, best first.
+    Candidates speak the project's language and are ranked by approval rate, turnaround
+    and current backlog.
+    Parameters:
+        project_id (int | str): Identifier of the project.
+    Returns:
+        flask.Response:
+            - 200 OK: {'candidates': [{'id', 'name', 'email', 'score', 'approved', 'rejected',
+              'backlog', 'avg_turnaround'}, ...]}
+            - 400 Bad Request: {'error': '<validation error message>'}
+    """
+
+    try:
+        candidates = ProjectService.get_translator_candidates(project_id)
+        return jsonify({'candidates': candidates}), 200
+    except ValueError as e:
+        print(f"[ProjectController.py] Error ranking translators for project {project_id}: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
     
 
 @proj_bp.route('/project/<project_id>/accept', methods=['POST'])
@@ -221,7 +541,7 @@ def accept_translation(project_id):
     """API endpoint for customer to accept a translation."""
 
     try:
-        ProjectService.accept_translation(project_id)
+        ProjectService.accept_translation(project_id, actor_id=session.get('user', {}).get('user_id'))
         return jsonify({'message': 'Translation accepted successfully.'}), 200
     except ValueError as e:
         print(f"[ProjectController.py] Error accepting translation for project {project_id}: {e}", flush=True)
@@ -252,7 +572,7 @@ def reject_translation(project_id):
     feedback = request.json.get('feedback')
 
     try:
-        ProjectService.reject_translation(project_id, feedback)
+        ProjectService.reject_translation(project_id, feedback, actor_id=session.get('user', {}).get('user_id'))
         return jsonify({'message': 'Translation rejected successfully.'}), 200
     except ValueError as e:
         print(f"[ProjectController.py] Error rejecting translation for project {project_id}: {e}", flush=True)
@@ -281,7 +601,7 @@ def close_project(project_id):
             cannot be closed (e.g., invalid ID, project not found, or business rule violation).
     """
     try:
-        ProjectService.close_project(project_id)
+        ProjectService.close_project(project_id, actor_id=session.get('user', {}).get('user_id'))
         return jsonify({'message': 'Project closed successfully.'}), 200
     except ValueError as e:
         print(f"[ProjectController.py] Error closing project {project_id}: {e}", flush=True)
@@ -352,6 +672,7 @@ def download_translated_file(project_id):
 @proj_bp.route('/project/<project_id>/upload', methods=['POST'])
 @login_required_api
 @require_role('TRANSLATOR')
+@idempotent
 def upload_translated_file(project_id):
     """
     Handle uploading of a translated file for a specific project.
@@ -377,12 +698,13 @@ def upload_translated_file(project_id):
         Persists the uploaded translated file using ProjectService.save_translated_file.
     Notes:
         - Ensure the request includes 'translated_file' in request.files.
+        - Send an `Idempotency-Key` header to make retries safe; a retry replays the original response.
         - The ProjectService is responsible for validating file presence, type, and storage.
     """
     translated_file = request.files.get('translated_file')
 
     try:
-        ProjectService.save_translated_file(project_id, translated_file)
+        ProjectService.save_translated_file(project_id, translated_file, actor_id=session.get('user', {}).get('user_id'))
         return jsonify({'message': 'Translated file uploaded successfully.'}), 200
     except ValueError as e:
         print(f"[ProjectController.py] Error uploading translated file for project {project_id}: {e}", flush=True)
@@ -1,7 +1,9 @@
-from flask import Blueprint, redirect, render_template, request, jsonify, session, url_for
+import io
+from flask import Blueprint, redirect, render_template, request, jsonify, session, url_for, g
 from services.AuthService import AuthService, login_required_ui, login_required_api, require_role
 from services.UserService import UserService
 from services.ProjectService import ProjectService
+from services.UserImportService import UserImportService
 from bin.helper import get_supported_languages, MAX_FILE_SIZE_MB
 
 
@@ -46,6 +48,50 @@ def create_user():
         return jsonify({'error': str(e)}), 400
 
 
+@user_bp.route('/users/import', methods=['POST'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def import_users():
+    """
+    API endpoint to create many users from one upload.
+    The request body is read as a stream, either CSV (header row with name, email, password,
+    role and an optional languages column of codes separated by ';') or NDJSON (one JSON
+    object per line with the same fields as `POST /users`).
+
+    Query Parameters:
+        format (str, optional): "csv" or "ndjson". Defaults to the request's Content-Type
+            (text/csv, application/x-ndjson or application/jsonl).
+
+    Returns:
+        Tuple[flask.Response, int]: JSON {"total": int, "created": int, "failed": [{"row", "email", "error"}, ...]}
+        with HTTP 200 (rows that failed validation or insertion are listed in "failed"), or
+        {"error": "<message>"} with HTTP 400 if the format or CSV header is invalid.
+    """
+
+    import_format = request.args.get('format')
+    if not import_format:
+        content_type = request.mimetype
+        if content_type == 'text/csv':
+            import_format = 'csv'
+        elif content_type in ('application/x-ndjson', 'application/jsonl'):
+            import_format = 'ndjson'
+
+    if import_format not in UserImportService.FORMATS:
+        print(f"[UserController.py] Unsupported import format: {import_format}", flush=True)
+        return jsonify({'error': "Import format must be 'csv' or 'ndjson'."}), 400
+
+    stream = io.TextIOWrapper(request.stream, encoding='utf-8-sig', newline='')
+    parse = UserImportService.parse_csv if import_format == 'csv' else UserImportService.parse_ndjson
+
+    try:
+        summary = UserImportService.import_users(parse(stream))
+    except (ValueError, UnicodeDecodeError) as e:
+        print(f"[UserController.py] User import failed: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(summary), 200
+
+
 @user_bp.route('/users', methods=['GET'])
 @login_required_api
 @require_role('ADMINISTRATOR')
@@ -56,14 +102,137 @@ def get_all_users():
     This Flask API endpoint invokes the UserService to fetch all users and returns
     a JSON response in the format {"users": [...]}, along with an HTTP 200 status code.
 
+    Query Parameters:
+        role (str, optional): Only return users with this role (e.g. "TRANSLATOR").
+        page (int, optional): 1-based page number. When given, the response also contains
+            "page" and "per_page".
+        per_page (int, optional): Page size, defaults to 50.
+
+    Returns:
+        Tuple[flask.Response, int]: A JSON response containing the list of users and the HTTP status code,
+        or an error message with HTTP 400 if the filters are invalid.
+    """
+
+    filters = {}
+    if request.args.get('role'):
+        filters['role'] = request.args.get('role')
+
+    try:
+        if request.args.get('page') is not None:
+            filters['page'] = int(request.args.get('page'))
+            filters['per_page'] = int(request.args.get('per_page', 50))
+
+        users = UserService.get_all_users(**filters)
+    except ValueError as e:
+        print(f"[UserController.py] Invalid user listing parameters: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+    if 'page' in filters:
+        return jsonify({'users': users, 'page': filters['page'], 'per_page': filters['per_page']}), 200
+
+    return jsonify({'users': users}), 200
+
+
+@user_bp.route('/users/search', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def search_users():
+    """
+    Type-ahead search over users by name or email prefix.
+
+    Query Parameters:
+        q (str): The name or email prefix to search for.
+        role (str, optional): Only return users with this role (e.g. "TRANSLATOR").
+        limit (int, optional): Maximum number of results, defaults to 20.
+
     Returns:
-        Tuple[flask.Response, int]: A JSON response containing the list of users and the HTTP status code.
+        Tuple[flask.Response, int]: JSON {"users": [{"id", "name", "email", "role"}, ...]} with HTTP 200,
+        or {"error": "<message>"} with HTTP 400 if the parameters are invalid.
     """
 
-    users = UserService.get_all_users()
+    try:
+        users = UserService.search_users(
+            request.args.get('q', ''),
+            role=request.args.get('role') or None,
+            limit=int(request.args.get('limit', 20)),
+        )
+    except ValueError as e:
+        print(f"[UserController.py] User search failed: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
     return jsonify({'users': users}), 200
 
 
+@user_bp.route('/users/cache/stats', methods=['GET'])
+@login_required_api
+@require_role('ADMINISTRATOR')
+def get_user_cache_stats():
+    """
+    Report hit rates of the per-process user caches.
+
+    Returns:
+        Tuple[flask.Response, int]: JSON {"caches": {"validated_users": {...}, "contacts": {...}}}
+        where each entry has hits, misses, hit_rate, size and maxsize, and HTTP 200.
+    """
+
+    return jsonify({'caches': UserService.get_cache_stats()}), 200
+
+
+@user_bp.route('/users/me/notifications', methods=['GET'])
+@login_required_api
+def get_notification_preferences():
+    """
+    Return how and in which language the current user receives notification emails.
+
+    Returns:
+        Tuple[flask.Response, int]: JSON {"mode": "IMMEDIATE" | "DIGEST", "locale": "<code>"} with HTTP 200,
+        or {"error": "User not found"} with HTTP 404.
+    """
+
+    user = UserService.get_user_contact(session['user']['user_id'])
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    return jsonify({'mode': user.notification_mode.value, 'locale': user.locale}), 200
+
+
+@user_bp.route('/users/me/notifications', methods=['PUT'])
+@login_required_api
+def update_notification_preferences():
+    """
+    Update the current user's notification preferences.
+    Expects a JSON payload with at least one of:
+    - mode (str): "IMMEDIATE" or "DIGEST". In digest mode, notifications are collected and sent
+      as one email per digest window (EMAIL_DIGEST_WINDOW_SECONDS).
+    - locale (str): Language of the emails, one of the UI languages (e.g. "en", "sk").
+
+    Returns:
+        Tuple[flask.Response, int]: JSON with the updated fields and HTTP 200, or {"error": "<message>"}
+        with HTTP 400 if a value is invalid or nothing was given.
+    """
+
+    data = request.get_json(silent=True) or {}
+    mode = data.get('mode')
+    locale = data.get('locale')
+    user_id = session['user']['user_id']
+    updated = {}
+
+    try:
+        if mode is None and locale is None:
+            raise ValueError("Provide 'mode' and/or 'locale'.")
+        if mode is not None:
+            UserService.set_notification_mode(user_id, mode)
+            updated['mode'] = mode.strip().upper()
+        if locale is not None:
+            UserService.set_locale(user_id, locale)
+            updated['locale'] = locale.strip().lower()
+    except ValueError as e:
+        print(f"[UserController.py] Notification preference update failed: {e}", flush=True)
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(updated), 200
+
+
 @user_bp.route('/users/<name>', methods=['GET'])
 @login_required_api
 @require_role('ADMINISTRATOR')
@@ -99,8 +268,8 @@ def customer_page():
     """
     Render the customer dashboard and handle access control.
     This view function verifies the presence of an authenticated user in the
-    session, redirects to the login page if absent, and otherwise retrieves the
-    current user's data to fetch their associated projects. It then renders the
+    session, redirects to the login page if absent, and otherwise uses the current
+    user's record validated by `login_required_ui` to fetch their associated projects. It then renders the
     customer dashboard template with:
     - max_file_size_mb: Maximum upload size (in megabytes) permitted for files.
     - projects: List of projects relevant to the authenticated user (based on role).
@@ -115,7 +284,7 @@ def customer_page():
         print(f"[UserController.py] No user in session for customer page.", flush=True)
         return redirect(url_for('auth_bp.login_page'))
 
-    user_data = UserService.get_user_by_name(user_session['name'])
+    user_data = g.current_user
     
     projects = ProjectService.get_projects_by_user_id(user_data['id'], user_data['role'])
 
@@ -130,7 +299,7 @@ def translator_page():
     Render the translator dashboard or redirect to login if the user is not authenticated.
     This view:
     - Retrieves the current user session; if absent, redirects to the login page.
-    - Loads the full user record by username from the session.
+    - Uses the user record validated by `login_required_ui` (no extra user lookup).
     - Fetches projects associated with the user, respecting the user's role.
     - Performs feedback checks/updates on the retrieved projects.
     - Renders the translator dashboard template with the user's projects.
@@ -144,7 +313,7 @@ def translator_page():
         print(f"[UserController.py] No user in session for translator page.", flush=True)
         return redirect(url_for('auth_bp.login_page'))
     
-    user_data = UserService.get_user_by_name(user_session['name'])
+    user_data = g.current_user
     
     projects = ProjectService.get_projects_by_user_id(user_data['id'], user_data['role'])
 
@@ -162,13 +331,12 @@ def administrator_page():
     This view:
     - Checks for an authenticated user in the session; if absent, redirects to the login page.
     - Fetches all project states and prepends an 'all' option for filtering.
-    - Retrieves all projects and performs a feedback check/update via ProjectService.
-    - Applies an optional state-based filter when the 'state' query parameter is provided
-        and not equal to "ALL" (case-sensitive), comparing against each project's state.
+    - Retrieves the projects matching the optional state filter (filtered in the database)
+        and performs a feedback check/update via ProjectService.
     Query Parameters:
     - state (str | None): Optional state filter taken from the request query string.
-        If provided and not "ALL", projects are filtered to those whose state string
-        matches the given value.
+        If provided and not "ALL", only projects in that state are fetched. An unknown
+        value falls back to showing all projects.
     Returns:
     - A rendered HTML template ('pages/administrator.html') with:
         - projects (list[dict]): The (optionally filtered) list of projects.
@@ -189,11 +357,12 @@ def administrator_page():
 
     states = ['all'] + [state.name for state in ProjectService.get_all_project_states()]
 
-    projects = ProjectService.get_all_projects()
+    try:
+        projects = ProjectService.get_projects(state=selected_state)
+    except ValueError as e:
+        print(f"[UserController.py] Invalid state filter on administrator page: {e}", flush=True)
+        projects = ProjectService.get_projects()
 
     ProjectService.check_feedbacks(projects)
 
-    if selected_state and selected_state != "ALL":
-        projects = [p for p in projects if str(p.get("state")) == selected_state]
-
     return render_template('pages/administrator.html', projects=projects, states=states, selected_state=selected_state)
\ No newline at end of file
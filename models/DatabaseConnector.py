@@ -1,4 +1,6 @@
 import mysql.connector
+import threading
+from contextlib import contextmanager
 
 class DatabaseConnector:
     def __init__(self, host, user, password, database):
@@ -17,12 +19,18 @@ class DatabaseConnector:
             password (str): Stored password for database authentication.
             database (str): Stored target database name.
             connection (Optional[Any]): Database connection handle; initialized to None until connected.
+            _lock (threading.RLock): Serializes use of the shared connection between threads.
+            _transaction_depth (int): Nesting level of open `transaction()` blocks; 0 when none is open.
+            _commit_callbacks (list[Callable]): Callbacks registered with `on_commit` for the open transaction.
         """
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.connection = None
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._commit_callbacks = []
 
     def connect(self):
         """
@@ -77,7 +85,8 @@ class DatabaseConnector:
         This method ensures a connection is available, executes the given query with optional
         parameters, and handles result retrieval and transaction commits based on the query type.
         For SELECT queries, it returns a list of rows as dictionaries. For non-SELECT queries,
-        it commits the transaction and returns the number of affected rows. On error, it logs
+        it commits the transaction and returns the number of affected rows. Inside a
+        `transaction()` block the commit is deferred until the block ends. On error, it logs
         the exception and returns None. The cursor is always closed before exiting.
 
         Parameters:
@@ -93,19 +102,126 @@ class DatabaseConnector:
         Raises:
             None explicitly. Errors are caught, logged, and result in a None return value.
         """
-        if not self.connection:
-            self.connect()
-        cursor = self.connection.cursor(dictionary=True)
-        try:
-            cursor.execute(query, params)
-            if query.strip().lower().startswith("select"):
-                result = cursor.fetchall()
-                return result
+        with self._lock:
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params)
+                if query.strip().lower().startswith("select"):
+                    result = cursor.fetchall()
+                    return result
+                else:
+                    if self._transaction_depth == 0:
+                        self.connection.commit()
+                    return cursor.rowcount
+            except mysql.connector.Error as err:
+                print(f"[DatabaseConnector.py] Query execution error: {err}", flush=True)
+                return None
+            finally:
+                cursor.close()
+
+    def execute_many(self, query, params_seq):
+        """
+        Execute a non-SELECT SQL statement once for every parameter tuple in `params_seq`.
+
+        For INSERT statements the driver rewrites the batch into a single multi-row
+        `INSERT ... VALUES (...), (...), ...`, so a whole batch costs one round trip.
+        Like `execute_query`, the statement is committed immediately unless it runs inside
+        a `transaction()` block, and errors are logged and reported as None.
+
+        Parameters:
+            query (str): The SQL statement with placeholders for one row.
+            params_seq (list[tuple]): One parameter tuple per row.
+
+        Returns:
+            int | None: Number of rows affected, or None if an error occurs.
+        """
+        with self._lock:
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor()
+            try:
+                cursor.executemany(query, params_seq)
+                if self._transaction_depth == 0:
+                    self.connection.commit()
+                return cursor.rowcount
+            except mysql.connector.Error as err:
+                print(f"[DatabaseConnector.py] Batch execution error: {err}", flush=True)
+                return None
+            finally:
+                cursor.close()
+
+    def on_commit(self, callback):
+        """
+        Run `callback` once the current transaction has been committed.
+
+        Inside a `transaction()` block the callback is queued and called after the outermost
+        block commits, outside the connection lock; it is dropped if the transaction rolls back.
+        Outside a transaction there is nothing to wait for and the callback runs immediately.
+
+        Parameters:
+            callback (Callable[[], None]): Function to call without arguments.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._transaction_depth > 0:
+                self._commit_callbacks.append(callback)
+                return
+        callback()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of queries as a single database transaction.
+
+        Queries executed through `execute_query` inside the block are not committed
+        individually; the whole block is committed when it exits normally and rolled back
+        when it raises. Nested blocks join the outermost transaction. The connection lock is
+        held for the duration of the block, so other threads sharing this connector wait
+        instead of interleaving their statements with the transaction.
+
+        Note:
+        - Any implicit transaction left open by earlier SELECTs is committed first, so the
+          block starts with a fresh snapshot and sees rows committed by other sessions.
+        - `execute_query` still returns None on errors; callers should raise to trigger
+          the rollback.
+        - Callbacks registered with `on_commit` run after the commit, once the lock is released.
+
+        Raises:
+        - ConnectionError: If no database connection can be established.
+
+        Yields:
+        - DatabaseConnector: This connector instance.
+        """
+        with self._lock:
+            if not self.connection:
+                self.connect()
+            if not self.connection:
+                raise ConnectionError("Database connection is not available.")
+
+            outermost = self._transaction_depth == 0
+            if outermost and self.connection.in_transaction:
+                self.connection.commit()
+
+            self._transaction_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._transaction_depth -= 1
+                if outermost:
+                    self._commit_callbacks = []
+                    self.connection.rollback()
+                    print("[DatabaseConnector.py] Transaction rolled back.", flush=True)
+                raise
             else:
+                self._transaction_depth -= 1
+                if not outermost:
+                    return
+                callbacks, self._commit_callbacks = self._commit_callbacks, []
                 self.connection.commit()
-                return cursor.rowcount
-        except mysql.connector.Error as err:
-            print(f"[DatabaseConnector.py] Query execution error: {err}", flush=True)
-            return None
-        finally:
-            cursor.close()
\ No newline at end of file
+
+        for callback in callbacks:
+            callback()
\ No newline at end of file
@@ -0,0 +1,419 @@
+from enum import Enum
+from models.db import db
+import uuid
+
+
+class OutboxStatus(Enum):
+    BUFFERED = "BUFFERED"
+    PENDING = "PENDING"
+    SENDING = "SENDING"
+    SENT = "SENT"
+    DEAD = "DEAD"
+    DIGESTED = "DIGESTED"
+
+
+class EmailOutbox:
+    """
+    Persistent queue of outgoing emails.
+    Messages are inserted with the same connection as the state change that triggers them,
+    so an enqueue inside `db.transaction()` is committed or rolled back together with it.
+    Delivery workers claim due messages with `FOR UPDATE SKIP LOCKED`, so several workers
+    can drain the table concurrently without sending a message twice.
+    Notifications for recipients in digest mode are stored as BUFFERED and later folded into
+    a single digest message; the folded messages are marked DIGESTED and point to it via `digestId`.
+    Subjects longer than the column are shortened on insert, so a long project name in a
+    template never makes the enqueue, and the state change it belongs to, fail.
+    """
+
+    MAX_SUBJECT_LENGTH = 255
+
+
+    @staticmethod
+    def _fit_subject(subject: str) -> str:
+        """Shorten a subject to MAX_SUBJECT_LENGTH characters, marking the cut with an ellipsis."""
+
+        if subject is None or len(subject) <= EmailOutbox.MAX_SUBJECT_LENGTH:
+            return subject
+
+        return subject[:EmailOutbox.MAX_SUBJECT_LENGTH - 1] + "\u2026"
+
+    @staticmethod
+    def enqueue(recipient: str, subject: str, body: str, buffered: bool = False, locale: str = None) -> str:
+        """
+        Add a message to the outbox. It becomes due immediately unless it is buffered for a digest.
+        Parameters:
+            recipient (str): Recipient email address.
+            subject (str): Subject line.
+            body (str): Plain-text body.
+            buffered (bool): Hold the message for the recipient's next digest instead of sending it.
+            locale (str | None): Recipient locale, used to render the digest a buffered message ends up in.
+        Returns:
+            str: The id of the queued message.
+        Raises:
+            ValueError: If the message could not be inserted.
+        """
+
+        message_id = str(uuid.uuid4())
+
+        result = db.execute_query(
+            "INSERT INTO EmailOutbox (id, recipient, subject, body, status, locale) VALUES (%s, %s, %s, %s, %s, %s)",
+            (message_id, recipient, EmailOutbox._fit_subject(subject), body, (OutboxStatus.BUFFERED if buffered else OutboxStatus.PENDING).value, locale)
+        )
+
+        if not result:
+            print(f"[EmailOutbox.py] Failed to queue email to {recipient}", flush=True)
+            raise ValueError("Failed to queue email.")
+
+        return message_id
+
+
+    @staticmethod
+    def enqueue_many(messages: list, batch_size: int = 1000) -> list:
+        """
+        Add many messages to the outbox with multi-row INSERTs.
+        Parameters:
+            messages (list[tuple[str, str, str, bool, str | None]]): (recipient, subject, body,
+                buffered, locale) per message, with the same meaning as the arguments of `enqueue`.
+            batch_size (int): Rows per INSERT statement.
+        Returns:
+            list[str]: The ids of the queued messages, in the order of `messages`.
+        Raises:
+            ValueError: If an INSERT fails.
+        """
+
+        ids = []
+
+        for start in range(0, len(messages), batch_size):
+            rows = []
+            for recipient, subject, body, buffered, locale in messages[start:start + batch_size]:
+                message_id = str(uuid.uuid4())
+                ids.append(message_id)
+                rows.append((message_id, recipient, EmailOutbox._fit_subject(subject), body, (OutboxStatus.BUFFERED if buffered else OutboxStatus.PENDING).value, locale))
+
+            result = db.execute_many(
+                "INSERT INTO EmailOutbox (id, recipient, subject, body, status, locale) VALUES (%s, %s, %s, %s, %s, %s)",
+                rows
+            )
+            if result is None:
+                print(f"[EmailOutbox.py] Failed to queue {len(rows)} emails.", flush=True)
+                raise ValueError("Failed to queue emails.")
+
+        return ids
+
+
+    @staticmethod
+    def claim_batch(limit: int, lease_seconds: int) -> list:
+        """
+        Claim up to `limit` due messages for delivery.
+        Due messages are PENDING messages whose `nextAttemptAt` has passed, and SENDING messages
+        whose lease expired because their worker died mid-delivery. Rows locked by another worker
+        are skipped. Claimed messages are marked SENDING, their attempt counter is incremented and
+        they are leased for `lease_seconds`.
+        Parameters:
+            limit (int): Maximum number of messages to claim.
+            lease_seconds (int): How long the claim is held before another worker may retry it.
+        Returns:
+            list[dict]: Claimed messages with 'id', 'recipient', 'subject', 'body' and 'attempts'
+            (including the current attempt).
+        Raises:
+            ValueError: If the messages could not be claimed.
+        """
+
+        with db.transaction():
+            rows = db.execute_query(
+                "SELECT id, recipient, subject, body, attempts FROM EmailOutbox "
+                "WHERE status IN (%s, %s) AND nextAttemptAt <= NOW() "
+                "ORDER BY nextAttemptAt LIMIT %s FOR UPDATE SKIP LOCKED",
+                (OutboxStatus.PENDING.value, OutboxStatus.SENDING.value, limit)
+            )
+
+            if rows is None:
+                print(f"[EmailOutbox.py] Failed to select due emails.", flush=True)
+                raise ValueError("Failed to claim emails.")
+
+            if not rows:
+                return []
+
+            placeholders = ", ".join(["%s"] * len(rows))
+            result = db.execute_query(
+                "UPDATE EmailOutbox SET status = %s, attempts = attempts + 1, "
+                f"nextAttemptAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE id IN ({placeholders})",
+                (OutboxStatus.SENDING.value, lease_seconds, *[row['id'] for row in rows])
+            )
+
+            if result is None:
+                print(f"[EmailOutbox.py] Failed to lease {len(rows)} emails.", flush=True)
+                raise ValueError("Failed to claim emails.")
+
+        for row in rows:
+            row['attempts'] += 1
+
+        return rows
+
+
+    @staticmethod
+    def mark_sent(message_id: str) -> None:
+        """
+        Record a successful delivery.
+        Parameters:
+            message_id (str): The id of the delivered message.
+        """
+
+        db.execute_query(
+            "UPDATE EmailOutbox SET status = %s, sentAt = NOW(), lastError = NULL WHERE id = %s",
+            (OutboxStatus.SENT.value, message_id)
+        )
+
+
+    @staticmethod
+    def mark_failed(message_id: str, error: str, retry_in_seconds: int = None) -> None:
+        """
+        Record a failed delivery attempt.
+        Parameters:
+            message_id (str): The id of the message.
+            error (str): Description of the failure, kept in `lastError`.
+            retry_in_seconds (int | None): Delay before the next attempt. None dead-letters the
+                message: it is marked DEAD and no longer retried.
+        """
+
+        if retry_in_seconds is None:
+            db.execute_query(
+                "UPDATE EmailOutbox SET status = %s, lastError = %s WHERE id = %s",
+                (OutboxStatus.DEAD.value, error, message_id)
+            )
+            return
+
+        db.execute_query(
+            "UPDATE EmailOutbox SET status = %s, lastError = %s, nextAttemptAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE id = %s",
+            (OutboxStatus.PENDING.value, error, retry_in_seconds, message_id)
+        )
+
+
+    @staticmethod
+    def requeue_dead(message_id: str) -> bool:
+        """
+        Move a dead-lettered message back to the queue with a fresh attempt budget.
+        Parameters:
+            message_id (str): The id of the DEAD message.
+        Returns:
+            bool: True if the message was requeued, False if no DEAD message has this id.
+        """
+
+        result = db.execute_query(
+            "UPDATE EmailOutbox SET status = %s, attempts = 0, nextAttemptAt = NOW() WHERE id = %s AND status = %s",
+            (OutboxStatus.PENDING.value, message_id, OutboxStatus.DEAD.value)
+        )
+
+        return bool(result)
+
+
+    @staticmethod
+    def get_status_counts() -> dict:
+        """
+        Count outbox messages per status.
+        Returns:
+            dict[str, int]: Number of messages for every OutboxStatus value (0 when none).
+        """
+
+        result = db.execute_query("SELECT status, COUNT(*) AS count FROM EmailOutbox GROUP BY status")
+
+        counts = {status.value: 0 for status in OutboxStatus}
+        for row in result or []:
+            counts[row['status']] = row['count']
+
+        return counts
+
+
+    @staticmethod
+    def get_dead(limit: int = 100) -> list:
+        """
+        List dead-lettered messages, most recent first.
+        Parameters:
+            limit (int): Maximum number of messages to return.
+        Returns:
+            list[dict]: Messages with 'id', 'recipient', 'subject', 'attempts', 'lastError' and 'createdAt'.
+        """
+
+        result = db.execute_query(
+            "SELECT id, recipient, subject, attempts, lastError, createdAt FROM EmailOutbox "
+            "WHERE status = %s ORDER BY createdAt DESC LIMIT %s",
+            (OutboxStatus.DEAD.value, limit)
+        )
+
+        return result or []
+
+
+    @staticmethod
+    def release(message_ids: list, retry_in_seconds: int) -> None:
+        """
+        Hand claimed messages back to the queue without counting the attempt, e.g. when
+        delivery was not even tried because the SMTP server is known to be down.
+        Parameters:
+            message_ids (list[str]): Ids of messages claimed by this worker.
+            retry_in_seconds (int): Delay before the messages become due again.
+        """
+
+        if not message_ids:
+            return
+
+        placeholders = ", ".join(["%s"] * len(message_ids))
+        db.execute_query(
+            "UPDATE EmailOutbox SET status = %s, attempts = GREATEST(attempts, 1) - 1, "
+            f"nextAttemptAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE id IN ({placeholders})",
+            (OutboxStatus.PENDING.value, retry_in_seconds, *message_ids)
+        )
+
+
+    @staticmethod
+    def lock_due_digests(window_seconds: int, max_recipients: int) -> dict:
+        """
+        Lock the buffered messages of recipients whose digest is due.
+        A recipient's digest is due once their oldest buffered message is `window_seconds` old,
+        so each recipient gets at most one digest per window. Must be called inside
+        `db.transaction()`; rows locked by another worker are skipped.
+        Parameters:
+            window_seconds (int): Digest window length.
+            max_recipients (int): Maximum number of recipients handled per call.
+        Returns:
+            dict[str, list[dict]]: Buffered messages ('id', 'subject', 'body', 'createdAt', 'locale')
+            per recipient, oldest first.
+        Raises:
+            ValueError: If the lookup fails.
+        """
+
+        recipients = db.execute_query(
+            "SELECT recipient FROM EmailOutbox WHERE status = %s GROUP BY recipient "
+            "HAVING MIN(createdAt) <= DATE_SUB(NOW(), INTERVAL %s SECOND) LIMIT %s",
+            (OutboxStatus.BUFFERED.value, window_seconds, max_recipients)
+        )
+
+        if recipients is None:
+            print(f"[EmailOutbox.py] Failed to select due digests.", flush=True)
+            raise ValueError("Failed to select due digests.")
+
+        if not recipients:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(recipients))
+        rows = db.execute_query(
+            "SELECT id, recipient, subject, body, createdAt, locale FROM EmailOutbox "
+            f"WHERE status = %s AND recipient IN ({placeholders}) "
+            "ORDER BY recipient, createdAt FOR UPDATE SKIP LOCKED",
+            (OutboxStatus.BUFFERED.value, *[row['recipient'] for row in recipients])
+        )
+
+        if rows is None:
+            print(f"[EmailOutbox.py] Failed to lock buffered emails.", flush=True)
+            raise ValueError("Failed to select due digests.")
+
+        digests = {}
+        for row in rows:
+            digests.setdefault(row.pop('recipient'), []).append(row)
+
+        return digests
+
+
+    @staticmethod
+    def mark_digested(message_ids: list, digest_id: str) -> None:
+        """
+        Mark buffered messages as folded into the digest message `digest_id`.
+        Parameters:
+            message_ids (list[str]): Ids of the BUFFERED messages.
+            digest_id (str): Id of the digest message that replaces them.
+        Raises:
+            ValueError: If the update fails.
+        """
+
+        placeholders = ", ".join(["%s"] * len(message_ids))
+        result = db.execute_query(
+            f"UPDATE EmailOutbox SET status = %s, digestId = %s WHERE id IN ({placeholders})",
+            (OutboxStatus.DIGESTED.value, digest_id, *message_ids)
+        )
+
+        if result is None:
+            print(f"[EmailOutbox.py] Failed to mark {len(message_ids)} emails as digested.", flush=True)
+            raise ValueError("Failed to mark emails as digested.")
+
+
+    @staticmethod
+    def release_buffered(message_ids: list) -> None:
+        """
+        Queue buffered messages for delivery as they are, e.g. a digest of a single message.
+        Parameters:
+            message_ids (list[str]): Ids of the BUFFERED messages.
+        Raises:
+            ValueError: If the update fails.
+        """
+
+        placeholders = ", ".join(["%s"] * len(message_ids))
+        result = db.execute_query(
+            f"UPDATE EmailOutbox SET status = %s, nextAttemptAt = NOW() WHERE id IN ({placeholders})",
+            (OutboxStatus.PENDING.value, *message_ids)
+        )
+
+        if result is None:
+            print(f"[EmailOutbox.py] Failed to release {len(message_ids)} buffered emails.", flush=True)
+            raise ValueError("Failed to release buffered emails.")
+
+
+    @staticmethod
+    def enqueue_broadcast(broadcast_id: str, recipients: list, subject: str, body: str,
+                          rate_per_second: float, batch_size: int = 1000) -> int:
+        """
+        Queue the same message for many recipients with multi-row INSERTs.
+        Delivery is spread out by scheduling the n-th message `n / rate_per_second` seconds in the
+        future, so a large broadcast drains at a bounded rate and regular notifications, which are
+        due immediately, are not stuck behind it. Call inside `db.transaction()` so a broadcast is
+        queued completely or not at all.
+        Parameters:
+            broadcast_id (str): Id shared by all messages of the broadcast.
+            recipients (list[str]): Recipient email addresses, already deduplicated.
+            subject (str): Subject line.
+            body (str): Plain-text body.
+            rate_per_second (float): Messages per second the broadcast is scheduled at.
+            batch_size (int): Rows per INSERT statement.
+        Returns:
+            int: Number of queued messages.
+        Raises:
+            ValueError: If an INSERT fails.
+        """
+
+        subject = EmailOutbox._fit_subject(subject)
+
+        for start in range(0, len(recipients), batch_size):
+            rows = [
+                (str(uuid.uuid4()), recipient, subject, body, OutboxStatus.PENDING.value, int(index / rate_per_second), broadcast_id)
+                for index, recipient in enumerate(recipients[start:start + batch_size], start=start)
+            ]
+            result = db.execute_many(
+                "INSERT INTO EmailOutbox (id, recipient, subject, body, status, nextAttemptAt, broadcastId) "
+                "VALUES (%s, %s, %s, %s, %s, DATE_ADD(NOW(), INTERVAL %s SECOND), %s)",
+                rows
+            )
+            if result is None:
+                print(f"[EmailOutbox.py] Failed to queue broadcast {broadcast_id}.", flush=True)
+                raise ValueError("Failed to queue broadcast.")
+
+        return len(recipients)
+
+
+    @staticmethod
+    def get_broadcast_status(broadcast_id: str) -> dict:
+        """
+        Count the messages of a broadcast per status.
+        Parameters:
+            broadcast_id (str): The broadcast id.
+        Returns:
+            dict[str, int]: Number of messages per OutboxStatus value; all zero for unknown ids.
+        """
+
+        result = db.execute_query(
+            "SELECT status, COUNT(*) AS count FROM EmailOutbox WHERE broadcastId = %s GROUP BY status",
+            (broadcast_id,)
+        )
+
+        counts = {status.value: 0 for status in OutboxStatus}
+        for row in result or []:
+            counts[row['status']] = row['count']
+
+        return counts
@@ -0,0 +1,127 @@
+from enum import Enum
+from models.db import db
+
+
+class IdempotencyStatus(Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+
+class IdempotencyKey:
+    """
+    Client-supplied Idempotency-Key values and the responses recorded for them, scoped per user.
+    A key is reserved (IN_PROGRESS) by the first request carrying it; the primary key on
+    (userId, idemKey) guarantees only one concurrent request wins the reservation. When that
+    request finishes, its response is stored (COMPLETED) until `expiresAt`, so retries can be
+    answered from the table instead of being executed again.
+    """
+
+    @staticmethod
+    def reserve(user_id: str, key: str, request_hash: str, lock_seconds: int) -> bool:
+        """
+        Claim a key for a request about to be processed.
+        An expired record for the key is discarded first, so keys can be reused after their TTL
+        and reservations left behind by a crashed process lapse after `lock_seconds`.
+        Parameters:
+            user_id (str): The user sending the request.
+            key (str): The Idempotency-Key header value.
+            request_hash (str): Fingerprint of the request, see IdempotencyService.request_fingerprint.
+            lock_seconds (int): How long the reservation is held if it is never completed.
+        Returns:
+            bool: True if this request holds the key, False if another request already does.
+        Raises:
+            ValueError: If the reservation could not be stored.
+        """
+
+        with db.transaction():
+            db.execute_query(
+                "DELETE FROM IdempotencyKeys WHERE userId = %s AND idemKey = %s AND expiresAt < NOW()",
+                (user_id, key)
+            )
+            result = db.execute_query(
+                "INSERT IGNORE INTO IdempotencyKeys (userId, idemKey, requestHash, status, expiresAt) "
+                "VALUES (%s, %s, %s, %s, DATE_ADD(NOW(), INTERVAL %s SECOND))",
+                (user_id, key, request_hash, IdempotencyStatus.IN_PROGRESS.value, lock_seconds)
+            )
+
+        if result is None:
+            print(f"[IdempotencyKey.py] Failed to reserve idempotency key for user {user_id}.", flush=True)
+            raise ValueError("Failed to reserve idempotency key.")
+
+        return result == 1
+
+
+    @staticmethod
+    def get(user_id: str, key: str) -> dict:
+        """
+        Retrieve the live record of a key.
+        Parameters:
+            user_id (str): The user sending the request.
+            key (str): The Idempotency-Key header value.
+        Returns:
+            dict | None: 'requestHash', 'status', 'responseStatus' and 'responseBody', or None if
+            the key is unknown or expired.
+        """
+
+        result = db.execute_query(
+            "SELECT requestHash, status, responseStatus, responseBody FROM IdempotencyKeys "
+            "WHERE userId = %s AND idemKey = %s AND expiresAt >= NOW()",
+            (user_id, key)
+        )
+
+        return result[0] if result else None
+
+
+    @staticmethod
+    def complete(user_id: str, key: str, response_status: int, response_body: str, ttl_seconds: int) -> None:
+        """
+        Store the response of the request holding the key.
+        Parameters:
+            user_id (str): The user sending the request.
+            key (str): The Idempotency-Key header value.
+            response_status (int): HTTP status code of the response.
+            response_body (str): Response body to replay.
+            ttl_seconds (int): How long retries are answered with this response.
+        """
+
+        result = db.execute_query(
+            "UPDATE IdempotencyKeys SET status = %s, responseStatus = %s, responseBody = %s, "
+            "expiresAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE userId = %s AND idemKey = %s",
+            (IdempotencyStatus.COMPLETED.value, response_status, response_body, ttl_seconds, user_id, key)
+        )
+
+        if not result:
+            print(f"[IdempotencyKey.py] Failed to store response for idempotency key of user {user_id}.", flush=True)
+
+
+    @staticmethod
+    def release(user_id: str, key: str) -> None:
+        """
+        Drop an unfinished reservation so the request can be retried.
+        Parameters:
+            user_id (str): The user sending the request.
+            key (str): The Idempotency-Key header value.
+        """
+
+        db.execute_query(
+            "DELETE FROM IdempotencyKeys WHERE userId = %s AND idemKey = %s AND status = %s",
+            (user_id, key, IdempotencyStatus.IN_PROGRESS.value)
+        )
+
+
+    @staticmethod
+    def purge_expired(limit: int = 1000) -> int:
+        """
+        Delete expired keys, oldest first.
+        Parameters:
+            limit (int): Maximum number of rows deleted.
+        Returns:
+            int: Number of deleted keys.
+        """
+
+        result = db.execute_query(
+            "DELETE FROM IdempotencyKeys WHERE expiresAt < NOW() ORDER BY expiresAt LIMIT %s",
+            (limit,)
+        )
+
+        return result or 0
@@ -0,0 +1,251 @@
+from enum import Enum
+from models.db import db
+import json
+import uuid
+
+
+class JobStatus(Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    DEAD = "DEAD"
+
+
+class Job:
+    """
+    Persistent queue of background jobs.
+    A job is a type name plus a JSON payload. Jobs are inserted with the shared connection, so an
+    enqueue inside `db.transaction()` is committed or rolled back together with the change that
+    triggered it. Workers claim due jobs, highest priority first, with `FOR UPDATE SKIP LOCKED`,
+    so any number of workers can drain the table without running a job twice. A claimed job is
+    invisible to other workers until its visibility timeout (stored in `runAt`) expires; a worker
+    that dies mid-job leaves it to be reclaimed by `release_expired`.
+    """
+
+    @staticmethod
+    def enqueue(job_type: str, payload: dict = None, priority: int = 0, delay_seconds: int = 0, max_attempts: int = 5) -> str:
+        """
+        Add a job to the queue.
+        Parameters:
+            job_type (str): Name of the registered handler that runs the job.
+            payload (dict | None): JSON-serializable arguments for the handler.
+            priority (int): Higher values are claimed first.
+            delay_seconds (int): Seconds before the job becomes due.
+            max_attempts (int): Attempts before the job is dead-lettered.
+        Returns:
+            str: The id of the queued job.
+        Raises:
+            ValueError: If the job could not be inserted.
+        """
+
+        return Job.enqueue_many([(job_type, payload, priority, delay_seconds, max_attempts)])[0]
+
+
+    @staticmethod
+    def enqueue_many(jobs: list, batch_size: int = 1000) -> list:
+        """
+        Add many jobs with multi-row INSERTs.
+        Parameters:
+            jobs (list[tuple[str, dict | None, int, int, int]]): (job_type, payload, priority,
+                delay_seconds, max_attempts) per job, as for `enqueue`.
+            batch_size (int): Rows per INSERT statement.
+        Returns:
+            list[str]: The ids of the queued jobs, in the order of `jobs`.
+        Raises:
+            ValueError: If an INSERT fails.
+        """
+
+        ids = []
+
+        for start in range(0, len(jobs), batch_size):
+            rows = []
+            for job_type, payload, priority, delay_seconds, max_attempts in jobs[start:start + batch_size]:
+                job_id = str(uuid.uuid4())
+                ids.append(job_id)
+                rows.append((job_id, job_type, json.dumps(payload or {}), priority, JobStatus.PENDING.value, max_attempts, delay_seconds))
+
+            result = db.execute_many(
+                "INSERT INTO Jobs (id, type, payload, priority, status, maxAttempts, runAt) "
+                "VALUES (%s, %s, %s, %s, %s, %s, DATE_ADD(NOW(), INTERVAL %s SECOND))",
+                rows
+            )
+            if result is None:
+                print(f"[Job.py] Failed to queue {len(rows)} jobs.", flush=True)
+                raise ValueError("Failed to queue jobs.")
+
+        return ids
+
+
+    @staticmethod
+    def claim_batch(limit: int, visibility_timeout: int, job_types: list = None) -> list:
+        """
+        Claim up to `limit` due PENDING jobs, highest priority first, then oldest due first.
+        The scan follows the (status, priority DESC, runAt) index and skips rows locked by other
+        workers. Claimed jobs are marked RUNNING, their attempt counter is incremented and they
+        stay invisible to other workers for `visibility_timeout` seconds.
+        Parameters:
+            limit (int): Maximum number of jobs to claim.
+            visibility_timeout (int): Seconds a claimed job is reserved for this worker.
+            job_types (list[str] | None): Only claim jobs of these types.
+        Returns:
+            list[dict]: Claimed jobs with 'id', 'type', 'payload' (decoded), 'attempts' (including
+            the current attempt) and 'maxAttempts'.
+        Raises:
+            ValueError: If the jobs could not be claimed.
+        """
+
+        query = "SELECT id, type, payload, attempts, maxAttempts FROM Jobs WHERE status = %s AND runAt <= NOW()"
+        params = [JobStatus.PENDING.value]
+
+        if job_types:
+            query += f" AND type IN ({', '.join(['%s'] * len(job_types))})"
+            params.extend(job_types)
+
+        query += " ORDER BY priority DESC, runAt LIMIT %s FOR UPDATE SKIP LOCKED"
+        params.append(limit)
+
+        with db.transaction():
+            rows = db.execute_query(query, tuple(params))
+
+            if rows is None:
+                print(f"[Job.py] Failed to select due jobs.", flush=True)
+                raise ValueError("Failed to claim jobs.")
+
+            if not rows:
+                return []
+
+            placeholders = ", ".join(["%s"] * len(rows))
+            result = db.execute_query(
+                "UPDATE Jobs SET status = %s, attempts = attempts + 1, "
+                f"runAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE id IN ({placeholders})",
+                (JobStatus.RUNNING.value, visibility_timeout, *[row['id'] for row in rows])
+            )
+
+            if result is None:
+                print(f"[Job.py] Failed to lease {len(rows)} jobs.", flush=True)
+                raise ValueError("Failed to claim jobs.")
+
+        for row in rows:
+            row['attempts'] += 1
+            row['payload'] = json.loads(row['payload']) if row['payload'] else {}
+
+        return rows
+
+
+    @staticmethod
+    def mark_done(job_ids: list) -> None:
+        """
+        Record that jobs finished successfully, with one UPDATE.
+        Parameters:
+            job_ids (list[str]): The ids of the finished jobs.
+        """
+
+        if not job_ids:
+            return
+
+        placeholders = ", ".join(["%s"] * len(job_ids))
+        db.execute_query(
+            f"UPDATE Jobs SET status = %s, finishedAt = NOW(), lastError = NULL WHERE id IN ({placeholders})",
+            (JobStatus.DONE.value, *job_ids)
+        )
+
+
+    @staticmethod
+    def mark_failed(job_id: str, error: str, retry_in_seconds: int = None) -> None:
+        """
+        Record a failed attempt.
+        Parameters:
+            job_id (str): The id of the job.
+            error (str): Description of the failure, kept in `lastError`.
+            retry_in_seconds (int | None): Delay before the next attempt. None dead-letters the job.
+        """
+
+        if retry_in_seconds is None:
+            db.execute_query(
+                "UPDATE Jobs SET status = %s, lastError = %s, finishedAt = NOW() WHERE id = %s",
+                (JobStatus.DEAD.value, error, job_id)
+            )
+            return
+
+        db.execute_query(
+            "UPDATE Jobs SET status = %s, lastError = %s, runAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE id = %s",
+            (JobStatus.PENDING.value, error, retry_in_seconds, job_id)
+        )
+
+
+    @staticmethod
+    def extend_lease(job_id: str, visibility_timeout: int) -> bool:
+        """
+        Keep a long-running job invisible to other workers for another `visibility_timeout` seconds.
+        Parameters:
+            job_id (str): The id of the RUNNING job.
+            visibility_timeout (int): Seconds from now the job stays reserved.
+        Returns:
+            bool: False if the job is no longer RUNNING (e.g. its lease already expired and it was reclaimed).
+        """
+
+        result = db.execute_query(
+            "UPDATE Jobs SET runAt = DATE_ADD(NOW(), INTERVAL %s SECOND) WHERE id = %s AND status = %s",
+            (visibility_timeout, job_id, JobStatus.RUNNING.value)
+        )
+
+        return bool(result)
+
+
+    @staticmethod
+    def release_expired() -> int:
+        """
+        Return RUNNING jobs whose visibility timeout expired, because their worker died or hung,
+        to the queue. Jobs that used up their attempts are dead-lettered instead.
+        Returns:
+            int: Number of reclaimed jobs.
+        """
+
+        with db.transaction():
+            db.execute_query(
+                "UPDATE Jobs SET status = %s, lastError = %s, finishedAt = NOW() "
+                "WHERE status = %s AND runAt < NOW() AND attempts >= maxAttempts",
+                (JobStatus.DEAD.value, "Visibility timeout expired.", JobStatus.RUNNING.value)
+            )
+            result = db.execute_query(
+                "UPDATE Jobs SET status = %s, lastError = %s WHERE status = %s AND runAt < NOW()",
+                (JobStatus.PENDING.value, "Visibility timeout expired.", JobStatus.RUNNING.value)
+            )
+
+        return result or 0
+
+
+    @staticmethod
+    def get(job_id: str) -> dict:
+        """
+        Retrieve one job.
+        Parameters:
+            job_id (str): The id of the job.
+        Returns:
+            dict | None: The job with 'id', 'type', 'status', 'priority', 'attempts', 'maxAttempts',
+            'runAt', 'lastError', 'createdAt' and 'finishedAt', or None if it does not exist.
+        """
+
+        result = db.execute_query(
+            "SELECT id, type, status, priority, attempts, maxAttempts, runAt, lastError, createdAt, finishedAt FROM Jobs WHERE id = %s",
+            (job_id,)
+        )
+
+        return result[0] if result else None
+
+
+    @staticmethod
+    def get_status_counts() -> dict:
+        """
+        Count jobs per status.
+        Returns:
+            dict[str, int]: Number of jobs for every JobStatus value (0 when none).
+        """
+
+        result = db.execute_query("SELECT status, COUNT(*) AS count FROM Jobs GROUP BY status")
+
+        counts = {status.value: 0 for status in JobStatus}
+        for row in result or []:
+            counts[row['status']] = row['count']
+
+        return counts
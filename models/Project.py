@@ -35,6 +35,7 @@ class Project:
             state (ProjectState): Current state of the project; initialized to ProjectState.CREATED.
             created_at (datetime): Timestamp of when the project was created.
             feedback (Optional[str]): Feedback from the customer or reviewer; None if not provided.
+            due_at (Optional[datetime]): When the translation is due; None if the project has no deadline.
         """
         self.id = str(uuid.uuid4())
         self.customer_id = customer_id
@@ -47,10 +48,11 @@ class Project:
         self.feedback = None
         self.name = None
         self.description = None
+        self.due_at = None
 
 
     @staticmethod
-    def create_project(customer_id: str, project_name: str, description: str, language: str, original_file: bytes):
+    def create_project(customer_id: str, project_name: str, description: str, language: str, original_file: bytes, due_at: datetime = None):
         """
         Create and persist a new project record.
         This function initializes a Project instance using the provided customer ID,
@@ -62,6 +64,7 @@ class Project:
             description (str): Detailed description of the project's purpose or content.
             language (str): Language code (e.g., "en", "cs") indicating the source language of the original file.
             original_file (bytes): Raw bytes of the original file to be translated.
+            due_at (datetime | None): Deadline of the translation, if any.
         Returns:
             Project: The newly created Project instance with generated ID and timestamps.
         Raises:
@@ -71,10 +74,11 @@ class Project:
         project = Project(customer_id, None, language, original_file)
         project.name = project_name
         project.description = description
+        project.due_at = due_at
 
         result = db.execute_query(
-            "INSERT INTO Projects (id, name, description, customerId, translatorId, languageCode, originalFile, translatedFile, state, createdAt) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-            (str(project.id), project.name, project.description, str(customer_id), None, language, original_file, None, project.state.value, project.created_at)
+            "INSERT INTO Projects (id, name, description, customerId, translatorId, languageCode, originalFile, translatedFile, state, createdAt, dueAt) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            (str(project.id), project.name, project.description, str(customer_id), None, language, original_file, None, project.state.value, project.created_at, due_at)
         )
 
         if not result:
@@ -84,6 +88,47 @@ class Project:
         return project
     
 
+    @staticmethod
+    def create_many(customer_id: str, entries: list, due_at: datetime = None) -> list:
+        """
+        Create and persist many projects of one customer with a single multi-row INSERT.
+        Parameters:
+            customer_id (str): Identifier of the customer owning the projects.
+            entries (list[tuple[str, str, str, str]]): (project_name, description, language,
+                original_file) per project.
+            due_at (datetime | None): Deadline shared by the projects, if any.
+        Returns:
+            list[Project]: The new projects, in the order of `entries`.
+        Raises:
+            ValueError: If the projects could not be inserted into the database.
+        """
+
+        projects = []
+        for project_name, description, language, original_file in entries:
+            project = Project(customer_id, None, language, original_file)
+            project.name = project_name
+            project.description = description
+            project.due_at = due_at
+            projects.append(project)
+
+        if not projects:
+            return projects
+
+        result = db.execute_many(
+            "INSERT INTO Projects (id, name, description, customerId, translatorId, languageCode, originalFile, translatedFile, state, createdAt, dueAt) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            [
+                (str(p.id), p.name, p.description, str(customer_id), None, p.language, p.original_file, None, p.state.value, p.created_at, due_at)
+                for p in projects
+            ]
+        )
+
+        if not result:
+            print(f"[Project.py] Failed to create {len(projects)} projects for customer_id: {customer_id}", flush=True)
+            raise ValueError("Failed to create projects in the database.")
+
+        return projects
+
+
     @staticmethod
     def get_by_user_id(user_id: str, role: str) -> list:
         """
@@ -147,6 +192,315 @@ class Project:
         )
 
 
+    @staticmethod
+    def get_translator_stats(translator_ids: list) -> dict:
+        """
+        Aggregate per-translator project statistics in one query.
+        Parameters:
+            translator_ids (list[str]): Translator ids to aggregate statistics for.
+        Returns:
+            dict[str, dict]: Mapping of translator id to a dict with:
+                - 'approved' (int): Number of projects in the APPROVED state.
+                - 'rejected' (int): Number of projects in the REJECTED state.
+                - 'backlog' (int): Number of open projects (ASSIGNED or REJECTED).
+                - 'avg_turnaround' (float | None): Average seconds from creation to the last update
+                  of APPROVED projects, or None if the translator has none.
+            Translators without any projects are absent from the mapping.
+        """
+
+        if not translator_ids:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(translator_ids))
+        result = db.execute_query(
+            f"SELECT translatorId, "
+            f"SUM(state = %s) AS approved, "
+            f"SUM(state = %s) AS rejected, "
+            f"SUM(state IN (%s, %s)) AS backlog, "
+            f"AVG(CASE WHEN state = %s THEN TIMESTAMPDIFF(SECOND, createdAt, updatedAt) END) AS avg_turnaround "
+            f"FROM Projects WHERE translatorId IN ({placeholders}) "
+            f"GROUP BY translatorId",
+            (
+                ProjectState.APPROVED.value,
+                ProjectState.REJECTED.value,
+                ProjectState.ASSIGNED.value, ProjectState.REJECTED.value,
+                ProjectState.APPROVED.value,
+                *translator_ids,
+            )
+        )
+
+        stats = {}
+        for row in result or []:
+            avg_turnaround = row.get('avg_turnaround')
+            stats[row['translatorId']] = {
+                'approved': int(row.get('approved') or 0),
+                'rejected': int(row.get('rejected') or 0),
+                'backlog': int(row.get('backlog') or 0),
+                'avg_turnaround': float(avg_turnaround) if avg_turnaround is not None else None,
+            }
+
+        return stats
+
+
+    @staticmethod
+    def assign_best_translator(project_id: str, translator_ids: list, rank=None):
+        """
+        Atomically assign the best candidate translator to a project.
+        Inside one transaction, the candidates' Users rows are locked with SELECT ... FOR UPDATE
+        (in id order, to avoid deadlocks), their statistics are aggregated with a single query
+        and the project is assigned to the top-ranked candidate. Concurrent assignments for the
+        same candidates wait on the row locks and then see each other's committed assignments,
+        so simultaneous project creations on several nodes spread across translators.
+        Parameters:
+            project_id (str): The unique identifier of the project to assign.
+            translator_ids (list[str]): Candidate translator ids in order of preference.
+            rank (Callable[[list[str], dict], list[str]] | None): Orders the existing candidates
+                given their statistics from `get_translator_stats`, best first. Defaults to the
+                fewest open projects, with ties broken by the order of `translator_ids`.
+        Returns:
+            str | None: The id of the assigned translator, or None if none of the candidates exists.
+        Raises:
+            ValueError: If the project could not be updated.
+        """
+
+        if not translator_ids:
+            return None
+
+        placeholders = ", ".join(["%s"] * len(translator_ids))
+
+        with db.transaction():
+            locked = db.execute_query(
+                f"SELECT id FROM Users WHERE id IN ({placeholders}) ORDER BY id FOR UPDATE",
+                tuple(translator_ids)
+            )
+            if not locked:
+                print(f"[Project.py] None of the candidate translators exist for project ID: {project_id}", flush=True)
+                return None
+
+            locked_ids = {row['id'] for row in locked}
+            candidates = [tid for tid in translator_ids if tid in locked_ids]
+            stats = Project.get_translator_stats(candidates)
+
+            if rank:
+                translator_id = rank(candidates, stats)[0]
+            else:
+                translator_id = min(candidates, key=lambda tid: stats.get(tid, {}).get('backlog', 0))
+
+            result = db.execute_query(
+                "UPDATE Projects SET translatorId = %s, state = %s WHERE id = %s",
+                (translator_id, ProjectState.ASSIGNED.value, project_id)
+            )
+            if not result:
+                print(f"[Project.py] Failed to assign translator to project ID: {project_id}", flush=True)
+                raise ValueError("Failed to assign translator to the project.")
+
+        return translator_id
+
+
+    @staticmethod
+    def assign_best_translators_by_language(batches: list, rank=None) -> dict:
+        """
+        Atomically spread projects across candidate translators, for several languages at once.
+        Works like `assign_best_translator` for whole batches: the candidates of all batches are
+        locked with one SELECT ... FOR UPDATE and their statistics aggregated with one query. Each
+        project then goes to the top-ranked candidate of its batch and counts towards that
+        candidate's backlog before the next project is placed, so work is balanced across
+        translators, also for translators who appear in several batches. Each chosen
+        translator's projects are updated with one UPDATE.
+        Parameters:
+            batches (list[tuple[list[str], list[str]]]): (project_ids, translator_ids) per language,
+                with candidate translator ids in order of preference.
+            rank (Callable[[list[str], dict], list[str]] | None): Orders candidates given their
+                statistics, best first. Defaults to the fewest open projects.
+        Returns:
+            dict[str, str]: Project id -> assigned translator id. Projects whose batch has no
+            existing candidate are absent.
+        Raises:
+            ValueError: If the projects could not be updated.
+        """
+
+        all_candidates = sorted({tid for project_ids, translator_ids in batches if project_ids for tid in translator_ids})
+        if not all_candidates:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(all_candidates))
+
+        with db.transaction():
+            locked = db.execute_query(
+                f"SELECT id FROM Users WHERE id IN ({placeholders}) ORDER BY id FOR UPDATE",
+                tuple(all_candidates)
+            )
+            if not locked:
+                print(f"[Project.py] None of the {len(all_candidates)} candidate translators exist.", flush=True)
+                return {}
+
+            locked_ids = {row['id'] for row in locked}
+            stats = Project.get_translator_stats([tid for tid in all_candidates if tid in locked_ids])
+
+            assignments = {}
+            for project_ids, translator_ids in batches:
+                candidates = [tid for tid in translator_ids if tid in locked_ids]
+                if not candidates:
+                    continue
+
+                for project_id in project_ids:
+                    if rank:
+                        translator_id = rank(candidates, stats)[0]
+                    else:
+                        translator_id = min(candidates, key=lambda tid: stats.get(tid, {}).get('backlog', 0))
+                    assignments[project_id] = translator_id
+
+                    translator_stats = stats.setdefault(translator_id, {'approved': 0, 'rejected': 0, 'backlog': 0, 'avg_turnaround': None})
+                    translator_stats['backlog'] += 1
+
+            by_translator = {}
+            for project_id, translator_id in assignments.items():
+                by_translator.setdefault(translator_id, []).append(project_id)
+
+            for translator_id, assigned in by_translator.items():
+                Project.assign_translator_many(assigned, translator_id)
+
+        return assignments
+
+
+    @staticmethod
+    def lock_stalled(state: str, older_than_seconds: int, limit: int, after: tuple = None) -> list:
+        """
+        Lock the next batch of projects that have stayed in `state` for longer than `older_than_seconds`.
+        Walks the (state, updatedAt) index in (updatedAt, id) order, so each batch reads only the
+        stalled range, however large the table grows. Rows locked by a concurrent sweep on
+        another node are skipped. Must be called inside `db.transaction()`.
+        Parameters:
+            state (str): Project state to scan, e.g. 'ASSIGNED'.
+            older_than_seconds (int): Minimum time since the project's last update.
+            limit (int): Maximum number of projects to lock.
+            after (tuple[datetime, str] | None): (updatedAt, id) of the last project of the
+                previous batch; the scan continues after it.
+        Returns:
+            list[dict]: Rows with 'id', 'name', 'state', 'translatorId', 'languageCode' and 'updatedAt'.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        query = (
+            "SELECT id, name, state, translatorId, languageCode, updatedAt FROM Projects "
+            "WHERE state = %s AND updatedAt < NOW() - INTERVAL %s SECOND"
+        )
+        params = [state, older_than_seconds]
+
+        if after:
+            # The leading updatedAt >= bound lets MySQL start the index range scan at the cursor.
+            query += " AND updatedAt >= %s AND (updatedAt > %s OR id > %s)"
+            params.extend([after[0], after[0], after[1]])
+
+        query += " ORDER BY updatedAt, id LIMIT %s FOR UPDATE SKIP LOCKED"
+        params.append(limit)
+
+        result = db.execute_query(query, tuple(params))
+        if result is None:
+            print(f"[Project.py] Failed to scan stalled {state} projects.", flush=True)
+            raise ValueError("Failed to load stalled projects.")
+
+        return result
+
+
+    @staticmethod
+    def get_stalled(states: list, older_than_seconds: int, limit: int = 100) -> dict:
+        """
+        Summarize projects that have stayed in one of `states` for longer than `older_than_seconds`.
+        Parameters:
+            states (list[str]): Project states to report on.
+            older_than_seconds (int): Minimum time since the project's last update.
+            limit (int): Maximum number of projects listed per state, oldest first.
+        Returns:
+            dict[str, dict]: State -> {'count': int, 'projects': [{'id', 'name', 'translatorId',
+            'languageCode', 'updatedAt'}, ...]}.
+        Raises:
+            ValueError: If a query fails.
+        """
+
+        report = {}
+        for state in states:
+            counted = db.execute_query(
+                "SELECT COUNT(*) AS stalled FROM Projects WHERE state = %s AND updatedAt < NOW() - INTERVAL %s SECOND",
+                (state, older_than_seconds)
+            )
+            projects = db.execute_query(
+                "SELECT id, name, translatorId, languageCode, updatedAt FROM Projects "
+                "WHERE state = %s AND updatedAt < NOW() - INTERVAL %s SECOND ORDER BY updatedAt, id LIMIT %s",
+                (state, older_than_seconds, limit)
+            )
+            if counted is None or projects is None:
+                print(f"[Project.py] Failed to report stalled {state} projects.", flush=True)
+                raise ValueError("Failed to load stalled projects.")
+
+            report[state] = {'count': int(counted[0]['stalled']) if counted else 0, 'projects': projects}
+
+        return report
+
+
+    @staticmethod
+    def get_due_before(states: list, due_before: datetime, limit: int = 100, unescalated_only: bool = False) -> list:
+        """
+        List projects in the given states whose deadline is at or before `due_before`, earliest first.
+        Each state is one range scan of the (state, dueAt) index, so the cost depends on the
+        number of matching projects, not on the size of the table.
+        Parameters:
+            states (list[str]): Project states to include.
+            due_before (datetime): Latest deadline to include.
+            limit (int): Maximum number of projects.
+            unescalated_only (bool): Skip projects whose deadline was already escalated.
+        Returns:
+            list[dict]: Rows with 'id', 'name', 'state', 'customerId', 'translatorId', 'languageCode',
+            'dueAt', 'dueWarnedAt' and 'dueEscalatedAt'.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        placeholders = ", ".join(["%s"] * len(states))
+        escalated = " AND dueEscalatedAt IS NULL" if unescalated_only else ""
+        result = db.execute_query(
+            "SELECT id, name, state, customerId, translatorId, languageCode, dueAt, dueWarnedAt, dueEscalatedAt "
+            f"FROM Projects WHERE state IN ({placeholders}) AND dueAt <= %s{escalated} ORDER BY dueAt LIMIT %s",
+            (*states, due_before, limit)
+        )
+
+        if result is None:
+            print(f"[Project.py] Failed to load projects due before {due_before}.", flush=True)
+            raise ValueError("Failed to load projects due soon.")
+
+        return result
+
+
+    @staticmethod
+    def mark_deadline_alert(project_id: str, column: str, states: list) -> bool:
+        """
+        Record that a deadline alert was sent, unless one already was or the project is no longer open.
+        The conditional UPDATE lets exactly one process send each alert. `updatedAt` is left
+        unchanged, so an alert does not count as progress on the project.
+        Parameters:
+            project_id (str): The project.
+            column (str): 'dueWarnedAt' or 'dueEscalatedAt'.
+            states (list[str]): States in which the alert still applies.
+        Returns:
+            bool: True if this call recorded the alert.
+        Raises:
+            ValueError: If `column` is not an alert column.
+        """
+
+        if column not in ("dueWarnedAt", "dueEscalatedAt"):
+            raise ValueError(f"Unknown deadline alert column: {column}")
+
+        placeholders = ", ".join(["%s"] * len(states))
+        result = db.execute_query(
+            f"UPDATE Projects SET {column} = NOW(), updatedAt = updatedAt "
+            f"WHERE id = %s AND {column} IS NULL AND dueAt IS NOT NULL AND state IN ({placeholders})",
+            (project_id, *states)
+        )
+
+        return bool(result)
+
+
     @staticmethod
     def get_all() -> list:
         """Fetch all projects from the database.
@@ -167,6 +521,53 @@ class Project:
         return projects
 
 
+    @staticmethod
+    def get_filtered(state: str = None, language: str = None, created_from: datetime = None, created_to: datetime = None) -> list:
+        """
+        Fetch projects matching the given filters, newest first.
+        Every filter is optional and only the provided ones are added to the WHERE clause,
+        so the query can be served by the composite `(state, createdAt)` and
+        `(languageCode, state, createdAt)` indexes instead of scanning the whole table.
+        Parameters:
+            state (str | None): Exact project state value (e.g. "ASSIGNED").
+            language (str | None): Exact language code (e.g. "en").
+            created_from (datetime | None): Inclusive lower bound for createdAt.
+            created_to (datetime | None): Inclusive upper bound for createdAt.
+        Returns:
+            list[Project]: Projects matching all provided filters.
+        """
+
+        conditions = []
+        params = []
+
+        if state:
+            conditions.append("state = %s")
+            params.append(state)
+
+        if language:
+            conditions.append("languageCode = %s")
+            params.append(language)
+
+        if created_from:
+            conditions.append("createdAt >= %s")
+            params.append(created_from)
+
+        if created_to:
+            conditions.append("createdAt <= %s")
+            params.append(created_to)
+
+        query = "SELECT * FROM Projects"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY createdAt DESC"
+
+        result = db.execute_query(query, tuple(params))
+
+        projects = Project.from_result(result or [])
+
+        return projects
+
+
     @staticmethod
     def get_by_id(project_id: str) -> 'Project':
         """
@@ -221,6 +622,120 @@ class Project:
             raise ValueError("Failed to update project status.")
 
 
+    @staticmethod
+    def lock_many(project_ids: list) -> dict:
+        """
+        Lock many projects for a bulk update and return their current state in one query.
+        Must be called inside `db.transaction()`; the rows stay locked until it ends.
+        Parameters:
+            project_ids (list[str]): Ids of the projects to lock.
+        Returns:
+            dict[str, dict]: Project id -> {'id', 'name', 'state', 'customerId', 'translatorId',
+            'languageCode'}. Unknown ids are absent.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        if not project_ids:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        result = db.execute_query(
+            f"SELECT id, name, state, customerId, translatorId, languageCode FROM Projects "
+            f"WHERE id IN ({placeholders}) ORDER BY id FOR UPDATE",
+            tuple(project_ids)
+        )
+        if result is None:
+            print(f"[Project.py] Failed to lock {len(project_ids)} projects.", flush=True)
+            raise ValueError("Failed to load projects.")
+
+        return {row['id']: row for row in result}
+
+
+    @staticmethod
+    def get_many(project_ids: list) -> dict:
+        """
+        Load language and creation time of many projects in one query, without locking.
+        Parameters:
+            project_ids (list[str]): Ids of the projects.
+        Returns:
+            dict[str, dict]: Project id -> {'id', 'languageCode', 'createdAt'}.
+            Unknown ids are absent.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        if not project_ids:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        result = db.execute_query(
+            f"SELECT id, languageCode, createdAt FROM Projects WHERE id IN ({placeholders})",
+            tuple(project_ids)
+        )
+        if result is None:
+            print(f"[Project.py] Failed to load {len(project_ids)} projects.", flush=True)
+            raise ValueError("Failed to load projects.")
+
+        return {row['id']: row for row in result}
+
+
+    @staticmethod
+    def update_states(project_ids: list, state: str) -> int:
+        """
+        Set the state of many projects with a single UPDATE.
+        Parameters:
+            project_ids (list[str]): Ids of the projects to update.
+            state (str): New state value.
+        Returns:
+            int: Number of updated rows.
+        Raises:
+            ValueError: If the update fails.
+        """
+
+        if not project_ids:
+            return 0
+
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        result = db.execute_query(
+            f"UPDATE Projects SET state = %s WHERE id IN ({placeholders})",
+            (state, *project_ids)
+        )
+        if result is None:
+            print(f"[Project.py] Failed to update state of {len(project_ids)} projects.", flush=True)
+            raise ValueError("Failed to update project status.")
+
+        return result
+
+
+    @staticmethod
+    def assign_translator_many(project_ids: list, translator_id: str) -> int:
+        """
+        Assign one translator to many projects with a single UPDATE, setting them to ASSIGNED.
+        Parameters:
+            project_ids (list[str]): Ids of the projects to update.
+            translator_id (str): The translator to assign.
+        Returns:
+            int: Number of updated rows.
+        Raises:
+            ValueError: If the update fails.
+        """
+
+        if not project_ids:
+            return 0
+
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        result = db.execute_query(
+            f"UPDATE Projects SET translatorId = %s, state = %s WHERE id IN ({placeholders})",
+            (translator_id, ProjectState.ASSIGNED.value, *project_ids)
+        )
+        if result is None:
+            print(f"[Project.py] Failed to assign translator {translator_id} to {len(project_ids)} projects.", flush=True)
+            raise ValueError("Failed to assign translator.")
+
+        return result
+
+
     @staticmethod
     def get_state(project_id: str) -> ProjectState:
         """
@@ -455,6 +970,7 @@ class Project:
         - 'translatedFile': translated file reference/path (optional, set to None if missing)
         - 'state': project state; attempted to cast to ProjectState, defaults to ProjectState.CREATED on invalid value
         - 'createdAt': creation timestamp (optional)
+        - 'dueAt': deadline (optional)
         Parameters:
             result (Iterable[Mapping[str, Any]]): Iterable of rows (e.g., dicts) representing projects.
         Returns:
@@ -498,6 +1014,8 @@ class Project:
             if created_at is not None:
                 project.created_at = created_at
 
+            project.due_at = row.get('dueAt')
+
             projects.append(project)
 
         return projects
@@ -521,6 +1039,7 @@ class Project:
                 - 'language': Language code for the project.
                 - 'state': Current state of the project as a string.
                 - 'created_at': Timestamp when the project was created.
+                - 'due_at': Deadline of the project, or None.
         """
         return {
             'id': project.id,
@@ -530,5 +1049,6 @@ class Project:
             'translator_id': project.translator_id,
             'language': project.language,
             'state': project.state.value,
-            'created_at': project.created_at
+            'created_at': project.created_at,
+            'due_at': project.due_at
         }
\ No newline at end of file
@@ -0,0 +1,122 @@
+from models.db import db
+
+
+class ProjectTransition:
+    """
+    Append-only log of project lifecycle transitions.
+    Rows are only ever inserted; the auto-increment id orders them and serves as the cursor
+    of the per-project and per-actor history queries.
+    """
+
+    COLUMNS = "id, projectId, event, fromState, toState, actorId, occurredAt, translatorId"
+
+
+    @staticmethod
+    def insert_many(transitions: list, batch_size: int = 1000) -> int:
+        """
+        Append transitions with multi-row INSERTs.
+        Parameters:
+            transitions (list[tuple[str, str, str | None, str, str | None, datetime, str | None]]): (project_id,
+                event, from_state, to_state, actor_id, occurred_at, translator_id) per transition. The
+                translator is the one the event concerns, e.g. the assignee of TranslatorAssigned.
+            batch_size (int): Rows per INSERT statement.
+        Returns:
+            int: Number of inserted rows.
+        Raises:
+            ValueError: If an INSERT fails.
+        """
+
+        inserted = 0
+
+        for start in range(0, len(transitions), batch_size):
+            rows = transitions[start:start + batch_size]
+            result = db.execute_many(
+                "INSERT INTO ProjectTransitions (projectId, event, fromState, toState, actorId, occurredAt, translatorId) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                rows
+            )
+            if result is None:
+                print(f"[ProjectTransition.py] Failed to insert {len(rows)} transitions.", flush=True)
+                raise ValueError("Failed to record project transitions.")
+            inserted += len(rows)
+
+        return inserted
+
+
+    @staticmethod
+    def get_by_project(project_id: str, limit: int = 100, before_id: int = None) -> list:
+        """
+        Retrieve the transitions of one project, newest first.
+        Parameters:
+            project_id (str): The project.
+            limit (int): Maximum number of rows.
+            before_id (int | None): Only return rows older than this id (the last id of the previous page).
+        Returns:
+            list[dict]: Rows with 'id', 'projectId', 'event', 'fromState', 'toState', 'actorId', 'occurredAt'
+            and 'translatorId'.
+        """
+
+        return ProjectTransition._get_page("projectId", project_id, limit, before_id)
+
+
+    @staticmethod
+    def get_by_actor(actor_id: str, limit: int = 100, before_id: int = None) -> list:
+        """
+        Retrieve the transitions caused by one user, newest first.
+        Parameters:
+            actor_id (str): The user.
+            limit (int): Maximum number of rows.
+            before_id (int | None): Only return rows older than this id (the last id of the previous page).
+        Returns:
+            list[dict]: Rows as for `get_by_project`.
+        """
+
+        return ProjectTransition._get_page("actorId", actor_id, limit, before_id)
+
+
+    @staticmethod
+    def _get_page(column: str, value: str, limit: int, before_id: int) -> list:
+        """Read one page along the (<column>, id) index."""
+
+        query = f"SELECT {ProjectTransition.COLUMNS} FROM ProjectTransitions WHERE {column} = %s"
+        params = [value]
+
+        if before_id is not None:
+            query += " AND id < %s"
+            params.append(before_id)
+
+        query += " ORDER BY id DESC LIMIT %s"
+        params.append(limit)
+
+        result = db.execute_query(query, tuple(params))
+
+        if result is None:
+            print(f"[ProjectTransition.py] Failed to load transitions for {column} {value}.", flush=True)
+            raise ValueError("Failed to load project transitions.")
+
+        return result
+
+
+    @staticmethod
+    def get_after(after_id: int, limit: int) -> list:
+        """
+        Read the log in insertion order, one page at a time, for streaming passes over the history.
+        Parameters:
+            after_id (int): Only return rows with a larger id (0 for the start of the log).
+            limit (int): Maximum number of rows.
+        Returns:
+            list[dict]: Rows as for `get_by_project`, oldest first.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        result = db.execute_query(
+            f"SELECT {ProjectTransition.COLUMNS} FROM ProjectTransitions WHERE id > %s ORDER BY id LIMIT %s",
+            (after_id, limit)
+        )
+
+        if result is None:
+            print(f"[ProjectTransition.py] Failed to read transitions after id {after_id}.", flush=True)
+            raise ValueError("Failed to load project transitions.")
+
+        return result
@@ -0,0 +1,161 @@
+from enum import Enum
+from models.db import db
+
+
+class TurnaroundStage(Enum):
+    ASSIGNMENT = "ASSIGNMENT"    # CREATED -> ASSIGNED
+    TRANSLATION = "TRANSLATION"  # ASSIGNED -> COMPLETED
+    REVIEW = "REVIEW"            # COMPLETED -> APPROVED
+    TOTAL = "TOTAL"              # CREATED -> APPROVED
+
+
+class RollupDimension(Enum):
+    ALL = "ALL"
+    LANGUAGE = "LANGUAGE"
+    TRANSLATOR = "TRANSLATOR"
+
+
+class TurnaroundRollup:
+    """
+    Pre-aggregated turnaround times.
+    TurnaroundRollups holds one histogram per (dimension, value, stage, day): a count and a sum
+    of durations per logarithmic bucket, so averages and percentiles over any day range are
+    answered by summing a few rows. ProjectMilestones keeps, per project, when the stage that is
+    currently running started, so a duration can be computed as soon as the stage ends, and the
+    translator holding it, so the duration is credited to them.
+    """
+
+    @staticmethod
+    def lock_milestones(project_ids: list) -> dict:
+        """
+        Load and lock the milestones of many projects until the surrounding transaction ends.
+        Missing rows are created empty first, so concurrent folds of a new project also wait for
+        each other instead of both inserting. Call inside `db.transaction()`.
+        Parameters:
+            project_ids (list[str]): Ids of the projects.
+        Returns:
+            dict[str, dict]: Project id -> {'createdAt', 'assignedAt', 'completedAt', 'translatorId'}.
+        Raises:
+            ValueError: If a statement fails.
+        """
+
+        if not project_ids:
+            return {}
+
+        created = db.execute_many(
+            "INSERT IGNORE INTO ProjectMilestones (projectId) VALUES (%s)",
+            [(project_id,) for project_id in project_ids]
+        )
+        if created is None:
+            print(f"[TurnaroundRollup.py] Failed to create milestones of {len(project_ids)} projects.", flush=True)
+            raise ValueError("Failed to load project milestones.")
+
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        result = db.execute_query(
+            "SELECT projectId, createdAt, assignedAt, completedAt, translatorId FROM ProjectMilestones "
+            f"WHERE projectId IN ({placeholders}) FOR UPDATE",
+            tuple(project_ids)
+        )
+        if result is None:
+            print(f"[TurnaroundRollup.py] Failed to load milestones of {len(project_ids)} projects.", flush=True)
+            raise ValueError("Failed to load project milestones.")
+
+        return {row.pop('projectId'): row for row in result}
+
+
+    @staticmethod
+    def save_milestones(milestones: dict) -> None:
+        """
+        Insert or overwrite the milestones of many projects with one statement.
+        Parameters:
+            milestones (dict[str, dict]): Project id -> {'createdAt', 'assignedAt', 'completedAt', 'translatorId'}.
+        Raises:
+            ValueError: If the statement fails.
+        """
+
+        if not milestones:
+            return
+
+        result = db.execute_many(
+            "INSERT INTO ProjectMilestones (projectId, createdAt, assignedAt, completedAt, translatorId) VALUES (%s, %s, %s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE createdAt = VALUES(createdAt), assignedAt = VALUES(assignedAt), "
+            "completedAt = VALUES(completedAt), translatorId = VALUES(translatorId)",
+            [(project_id, m['createdAt'], m['assignedAt'], m['completedAt'], m['translatorId']) for project_id, m in milestones.items()]
+        )
+        if result is None:
+            print(f"[TurnaroundRollup.py] Failed to save milestones of {len(milestones)} projects.", flush=True)
+            raise ValueError("Failed to save project milestones.")
+
+
+    @staticmethod
+    def add_samples(samples: dict) -> None:
+        """
+        Add pre-aggregated samples to the rollups with one upsert.
+        Parameters:
+            samples (dict[tuple[str, str, str, date, int], list[int]]): (dimension, value, stage, day,
+                bucket) -> [count, sum_seconds].
+        Raises:
+            ValueError: If the statement fails.
+        """
+
+        if not samples:
+            return
+
+        result = db.execute_many(
+            "INSERT INTO TurnaroundRollups (dimension, dimensionValue, stage, day, bucket, count, sumSeconds) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE count = count + VALUES(count), sumSeconds = sumSeconds + VALUES(sumSeconds)",
+            [(*key, count, total) for key, (count, total) in samples.items()]
+        )
+        if result is None:
+            print(f"[TurnaroundRollup.py] Failed to add {len(samples)} rollup rows.", flush=True)
+            raise ValueError("Failed to update turnaround rollups.")
+
+
+    @staticmethod
+    def get_histograms(dimension: str, day_from, day_to, value: str = None) -> list:
+        """
+        Sum the histograms of a dimension over a day range.
+        Parameters:
+            dimension (str): RollupDimension value.
+            day_from (date): First day, inclusive.
+            day_to (date): Last day, inclusive.
+            value (str | None): Only this language or translator.
+        Returns:
+            list[dict]: Rows with 'dimensionValue', 'stage', 'bucket', 'count' and 'sumSeconds'.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        query = (
+            "SELECT dimensionValue, stage, bucket, SUM(count) AS count, SUM(sumSeconds) AS sumSeconds "
+            "FROM TurnaroundRollups WHERE dimension = %s AND day BETWEEN %s AND %s"
+        )
+        params = [dimension, day_from, day_to]
+
+        if value is not None:
+            query += " AND dimensionValue = %s"
+            params.append(value)
+
+        query += " GROUP BY dimensionValue, stage, bucket"
+
+        result = db.execute_query(query, tuple(params))
+        if result is None:
+            print(f"[TurnaroundRollup.py] Failed to load {dimension} rollups.", flush=True)
+            raise ValueError("Failed to load turnaround rollups.")
+
+        return result
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Delete all rollups and milestones before a rebuild.
+        Raises:
+            ValueError: If a statement fails.
+        """
+
+        for table in ("TurnaroundRollups", "ProjectMilestones"):
+            if db.execute_query(f"DELETE FROM {table}") is None:
+                print(f"[TurnaroundRollup.py] Failed to clear {table}.", flush=True)
+                raise ValueError("Failed to clear turnaround rollups.")
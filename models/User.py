@@ -45,6 +45,11 @@ class UserRole(Enum):
         raise ValueError(f"Unknown user role: {value}")
 
 
+class NotificationMode(Enum):
+    IMMEDIATE = "IMMEDIATE"
+    DIGEST = "DIGEST"
+
+
 class User:
 
     def __init__(self, name: str, email: str, role: UserRole):
@@ -62,6 +67,8 @@ class User:
             email (str): The user's email address.
             role (UserRole): The user's role within the system.
             created_at (datetime): UTC timestamp when the user was created.
+            notification_mode (NotificationMode): How notification emails are delivered to the user.
+            locale (str): Language code of the user's emails, e.g. 'en' or 'sk'.
             _languages (list): Internal list of associated languages for the user.
 
         Returns:
@@ -72,6 +79,8 @@ class User:
         self.email = email
         self.role = role
         self.created_at = datetime.utcnow()
+        self.notification_mode = NotificationMode.IMMEDIATE
+        self.locale = 'en'
         self._languages = []
 
 
@@ -158,15 +167,15 @@ class User:
         Parameters:
             name (str): The exact username to look up.
         Returns:
-            Optional[tuple]: A tuple containing (id, name, email, password, role, created_at)
-            for the matched user, or None if no user with the given name exists.
+            Optional[dict]: A row containing id, name, email, password, role, created_at and
+            sessionVersion for the matched user, or None if no user with the given name exists.
         Notes:
             - If multiple rows match the same name, only the first result is returned.
             - The query uses a parameterized statement to prevent SQL injection.
         """
         
         result = db.execute_query(
-            "SELECT id, name, email, password, role, created_at FROM Users WHERE name = %s",
+            "SELECT id, name, email, password, role, created_at, sessionVersion FROM Users WHERE name = %s",
             (name,)
         )
         
@@ -182,21 +191,60 @@ class User:
         Parameters:
             email (str): The exact email address to look up.
         Returns:
-            Optional[tuple]: A tuple containing (id, name, email, password, role, created_at)
-            for the matched user, or None if no user with the given email exists.
+            Optional[dict]: A row containing id, name, email, password, role, created_at and
+            sessionVersion for the matched user, or None if no user with the given email exists.
         Notes:
             - If multiple rows match the same email, only the first result is returned.
             - The query uses a parameterized statement to prevent SQL injection.
         """
         
         result = db.execute_query(
-            "SELECT id, name, email, password, role, created_at FROM Users WHERE email = %s",
+            "SELECT id, name, email, password, role, created_at, sessionVersion FROM Users WHERE email = %s",
             (email,)
         )
         
         return result[0] if result else None
 
 
+    @classmethod
+    def update_password(cls, user_id: str, hashed_password: str) -> None:
+        """
+        Replace the stored password hash of a user.
+        Parameters:
+            user_id (str): The unique identifier of the user.
+            hashed_password (str): The new, already hashed password.
+        Raises:
+            ValueError: If the database update fails.
+        """
+
+        result = db.execute_query(
+            "UPDATE Users SET password = %s WHERE id = %s",
+            (hashed_password, user_id)
+        )
+
+        if result is None:
+            print(f"[User.py] Failed to update password for user ID: {user_id}", flush=True)
+            raise ValueError("Failed to update password.")
+
+
+    @classmethod
+    def get_session_record(cls, user_id: str):
+        """
+        Retrieve the fields needed to validate a logged-in user's session.
+        Parameters:
+            user_id (str): The unique identifier of the user.
+        Returns:
+            Optional[dict]: A row with id, name, role and sessionVersion, or None if the user does not exist.
+        """
+
+        result = db.execute_query(
+            "SELECT id, name, role, sessionVersion FROM Users WHERE id = %s",
+            (user_id,)
+        )
+
+        return result[0] if result else None
+
+
     @property
     def languages(self):
         return self._languages
@@ -247,25 +295,68 @@ class User:
         return languages
     
     @classmethod
-    def get_all_users(cls):
+    def get_languages_for_users(cls, user_ids: list, batch_size: int = 1000) -> dict:
+        """
+        Retrieve the languages of many users with one query per `batch_size` users.
+        The lookup uses the `(user_id, language)` primary key of the Languages table.
+        Parameters:
+            user_ids (list[str]): The user ids whose languages should be loaded.
+            batch_size (int): Maximum number of ids bound into a single IN (...) list.
+        Returns:
+            dict[str, list[str]]: Mapping of user id to its languages. Users without
+            languages are absent from the mapping.
+        """
+
+        languages = {}
+        ids = [str(user_id) for user_id in user_ids]
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            placeholders = ", ".join(["%s"] * len(batch))
+            result = db.execute_query(
+                f"SELECT user_id, language FROM Languages WHERE user_id IN ({placeholders})",
+                tuple(batch)
+            )
+            for row in result or []:
+                languages.setdefault(row['user_id'], []).append(row['language'])
+
+        return languages
+
+
+    @classmethod
+    def get_all_users(cls, role: UserRole = None, limit: int = None, offset: int = 0):
         """
-        Retrieve all users from the database.
+        Retrieve all users from the database, optionally filtered by role and paginated.
         Executes a query to select user fields (id, name, email, role, created_at) from
         the Users table, constructs User instances from the results, and returns them
         as a list.
+        Parameters:
+            role (UserRole | None): Only return users with this role.
+            limit (int | None): Maximum number of users to return. None returns all users.
+            offset (int): Number of users to skip; only used together with `limit`.
         Returns:
-            list[User]: A list of User objects populated with database values.
+            list[User]: A list of User objects populated with database values, ordered by
+            creation time when paginated.
         Raises:
             DatabaseError: If the database query fails.
             ValueError: If a user's role string cannot be parsed into a UserRole.
         """
 
-        result = db.execute_query(
-            "SELECT id, name, email, role, created_at FROM Users"
-        )
+        query = "SELECT id, name, email, role, created_at FROM Users"
+        params = []
+
+        if role:
+            query += " WHERE role = %s"
+            params.append(role.value)
+
+        if limit is not None:
+            query += " ORDER BY created_at, id LIMIT %s OFFSET %s"
+            params.extend([limit, offset])
+
+        result = db.execute_query(query, tuple(params)) if params else db.execute_query(query)
 
         users = []
-        for row in result:
+        for row in result or []:
             user = cls(
                 name=row['name'],
                 email=row['email'],
@@ -284,8 +375,8 @@ class User:
         Retrieve a user by their unique identifier.
         This class method queries the database for a user record with the given ID. If a
         matching record is found, it instantiates and returns a User object populated
-        with the user's basic information (id, name, email, role, created_at). If no
-        record is found, it returns None.
+        with the user's basic information (id, name, email, role, created_at,
+        notification_mode, locale). If no record is found, it returns None.
         Parameters:
             user_id (str): The unique identifier of the user to retrieve.
         Returns:
@@ -293,7 +384,7 @@ class User:
         """
 
         result = db.execute_query(
-            "SELECT id, name, email, password, role, created_at FROM Users WHERE id = %s",
+            "SELECT id, name, email, password, role, created_at, notificationMode, locale FROM Users WHERE id = %s",
             (user_id,)
         )
 
@@ -301,7 +392,44 @@ class User:
             print(f"[User.py] No user found with ID: {user_id}", flush=True)
             return None
 
-        row = result[0]
+        return cls._contact_from_row(result[0])
+
+
+    @classmethod
+    def get_users_by_ids(cls, user_ids: list, batch_size: int = 1000) -> list:
+        """
+        Retrieve many users with the same fields as `get_user_by_id`, one query per `batch_size` ids.
+        Parameters:
+            user_ids (list[str]): The user ids to look up. Unknown ids are skipped.
+            batch_size (int): Maximum number of ids bound into a single IN (...) list.
+        Returns:
+            list[User]: The users found, in no particular order.
+        Raises:
+            ValueError: If a query fails.
+        """
+
+        users = []
+        ids = [str(user_id) for user_id in user_ids]
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            placeholders = ", ".join(["%s"] * len(batch))
+            result = db.execute_query(
+                f"SELECT id, name, email, password, role, created_at, notificationMode, locale FROM Users WHERE id IN ({placeholders})",
+                tuple(batch)
+            )
+            if result is None:
+                print(f"[User.py] Failed to load {len(batch)} users.", flush=True)
+                raise ValueError("Failed to load users.")
+            users.extend(cls._contact_from_row(row) for row in result)
+
+        return users
+
+
+    @classmethod
+    def _contact_from_row(cls, row: dict):
+        """Build a User from a row with the columns selected by `get_user_by_id`."""
+
         user = cls(
             name=row['name'],
             email=row['email'],
@@ -309,6 +437,10 @@ class User:
         )
         user.id = row['id']
         user.created_at = row['created_at']
+        if row.get('notificationMode'):
+            user.notification_mode = NotificationMode(row['notificationMode'])
+        if row.get('locale'):
+            user.locale = row['locale']
 
         return user
 
@@ -350,4 +482,297 @@ class User:
             translator.created_at = row['created_at']
             translators.append(translator)
 
-        return translators
\ No newline at end of file
+        return translators
+
+    @classmethod
+    def get_translator_languages(cls) -> list:
+        """
+        Retrieve every (language, translator id) pair for users with the TRANSLATOR role.
+        The query reads the Languages table through its `(language, user_id)` index and only
+        joins Users to filter by role, so it is cheap enough to run when rebuilding an
+        in-process language-to-translator map.
+        Returns:
+            list[dict]: Rows with `language` and `user_id` keys. Empty if none are found.
+        Raises:
+            ValueError: If the query fails, so a failure is not mistaken for "no translators".
+        """
+
+        result = db.execute_query(
+            "SELECT l.language, l.user_id FROM Languages l "
+            "JOIN Users u ON u.id = l.user_id "
+            "WHERE u.role = %s",
+            (UserRole.TRANSLATOR.value,)
+        )
+
+        if result is None:
+            print(f"[User.py] Failed to load translator languages.", flush=True)
+            raise ValueError("Failed to load translator languages.")
+
+        return result
+
+
+    @classmethod
+    def get_users_by_ids(cls, user_ids: list) -> list:
+        """
+        Retrieve several users by their unique identifiers in one query.
+        Parameters:
+            user_ids (list[str]): The user ids to look up.
+        Returns:
+            list[User]: The users found, in no particular order. Unknown ids are skipped.
+        Raises:
+            ValueError: If an invalid role value is encountered when converting to UserRole.
+        """
+
+        if not user_ids:
+            return []
+
+        placeholders = ", ".join(["%s"] * len(user_ids))
+        result = db.execute_query(
+            f"SELECT id, name, email, role, created_at FROM Users WHERE id IN ({placeholders})",
+            tuple(user_ids)
+        )
+
+        users = []
+        for row in result or []:
+            user = cls(
+                name=row['name'],
+                email=row['email'],
+                role=UserRole.from_string(row['role'])
+            )
+            user.id = row['id']
+            user.created_at = row['created_at']
+            users.append(user)
+
+        return users
+
+
+    @classmethod
+    def search_users(cls, prefix: str, role: UserRole = None, limit: int = 20) -> list:
+        """
+        Find users whose name or email starts with the given prefix.
+        Each branch of the UNION is an anchored `LIKE 'prefix%'` range scan over the `name`
+        index or the unique `email` index, stopped after `limit` rows, so type-ahead lookups
+        stay fast regardless of the table size. LIKE wildcards in the prefix are escaped.
+        Parameters:
+            prefix (str): The name or email prefix to match.
+            role (UserRole | None): Only return users with this role.
+            limit (int): Maximum number of users to return.
+        Returns:
+            list[User]: Matching users ordered by name.
+        Raises:
+            ValueError: If a user's role string cannot be parsed into a UserRole.
+        """
+
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        role_filter = " AND role = %s" if role else ""
+        role_params = (role.value,) if role else ()
+
+        result = db.execute_query(
+            "SELECT id, name, email, role, created_at FROM ("
+            f"(SELECT id, name, email, role, created_at FROM Users WHERE name LIKE %s{role_filter} ORDER BY name LIMIT %s) "
+            "UNION "
+            f"(SELECT id, name, email, role, created_at FROM Users WHERE email LIKE %s{role_filter} ORDER BY email LIMIT %s)"
+            ") AS matches ORDER BY name LIMIT %s",
+            (pattern, *role_params, limit, pattern, *role_params, limit, limit)
+        )
+
+        users = []
+        for row in result or []:
+            user = cls(
+                name=row['name'],
+                email=row['email'],
+                role=UserRole.from_string(row['role'])
+            )
+            user.id = row['id']
+            user.created_at = row['created_at']
+            users.append(user)
+
+        return users
+
+
+    @classmethod
+    def get_existing_emails(cls, emails: list) -> set:
+        """
+        Return which of the given email addresses are already registered.
+        Parameters:
+            emails (list[str]): Email addresses to check.
+        Returns:
+            set[str]: The subset of `emails` that belong to existing users.
+        Raises:
+            ValueError: If the lookup fails.
+        """
+
+        if not emails:
+            return set()
+
+        placeholders = ", ".join(["%s"] * len(emails))
+        result = db.execute_query(
+            f"SELECT email FROM Users WHERE email IN ({placeholders})",
+            tuple(emails)
+        )
+
+        if result is None:
+            print(f"[User.py] Failed to look up existing emails.", flush=True)
+            raise ValueError("Failed to look up existing emails.")
+
+        return {row['email'] for row in result}
+
+
+    @classmethod
+    def bulk_create(cls, records: list) -> list:
+        """
+        Insert many customers and translators with one multi-row INSERT for the users and one
+        for their languages. Callers are expected to validate the records first and to run this
+        inside `db.transaction()` so a failed batch leaves no partial rows behind.
+        Parameters:
+            records (list[tuple]): One `(name, email, hashed_password, role, languages)` tuple per
+                user, where `role` is a UserRole and `languages` a list of language codes
+                (ignored for customers).
+        Returns:
+            list[User]: The created users, in the order of `records`.
+        Raises:
+            ValueError: If either INSERT fails.
+        """
+
+        users = []
+        user_rows = []
+        language_rows = []
+
+        for name, email, hashed_password, role, languages in records:
+            user = cls(name, email, role)
+            if role == UserRole.TRANSLATOR:
+                user._languages = list(languages)
+                language_rows.extend((str(user.id), lang) for lang in user._languages)
+            users.append(user)
+            user_rows.append((str(user.id), user.name, user.email, hashed_password, user.role.value, user.created_at))
+
+        if not user_rows:
+            return []
+
+        if db.execute_many(
+            "INSERT INTO Users (id, name, email, password, role, created_at) VALUES (%s, %s, %s, %s, %s, %s)",
+            user_rows
+        ) is None:
+            print(f"[User.py] Failed to insert a batch of {len(user_rows)} users.", flush=True)
+            raise ValueError("Failed to insert users.")
+
+        if language_rows and db.execute_many(
+            "INSERT INTO Languages (user_id, language) VALUES (%s, %s)",
+            language_rows
+        ) is None:
+            print(f"[User.py] Failed to insert languages for a batch of {len(user_rows)} users.", flush=True)
+            raise ValueError("Failed to insert user languages.")
+
+        return users
+
+
+    @classmethod
+    def update_notification_mode(cls, user_id: str, mode: NotificationMode) -> None:
+        """
+        Store how notification emails are delivered to a user.
+        Parameters:
+            user_id (str): The unique ID of the user.
+            mode (NotificationMode): IMMEDIATE for one email per notification, DIGEST for
+                notifications coalesced into periodic digests.
+        Raises:
+            ValueError: If the update fails.
+        """
+
+        result = db.execute_query(
+            "UPDATE Users SET notificationMode = %s WHERE id = %s",
+            (mode.value, user_id)
+        )
+
+        if result is None:
+            print(f"[User.py] Failed to update notification mode for user ID: {user_id}", flush=True)
+            raise ValueError("Failed to update notification mode.")
+
+
+    @classmethod
+    def update_locale(cls, user_id: str, locale: str) -> None:
+        """
+        Store the language a user's emails are written in.
+        Parameters:
+            user_id (str): The unique ID of the user.
+            locale (str): Supported locale code, e.g. 'en' or 'sk'.
+        Raises:
+            ValueError: If the update fails.
+        """
+
+        result = db.execute_query(
+            "UPDATE Users SET locale = %s WHERE id = %s",
+            (locale, user_id)
+        )
+
+        if result is None:
+            print(f"[User.py] Failed to update locale for user ID: {user_id}", flush=True)
+            raise ValueError("Failed to update locale.")
+
+
+    @classmethod
+    def get_contacts_by_ids(cls, user_ids: list, batch_size: int = 1000) -> list:
+        """
+        Retrieve the email addresses of many users with one query per `batch_size` ids.
+        Parameters:
+            user_ids (list[str]): The user ids to look up. Unknown ids are skipped.
+            batch_size (int): Maximum number of ids bound into a single IN (...) list.
+        Returns:
+            list[dict]: One {'id', 'email'} row per user found.
+        """
+
+        contacts = []
+        ids = [str(user_id) for user_id in user_ids]
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            placeholders = ", ".join(["%s"] * len(batch))
+            result = db.execute_query(
+                f"SELECT id, email FROM Users WHERE id IN ({placeholders})",
+                tuple(batch)
+            )
+            contacts.extend(result or [])
+
+        return contacts
+
+
+    @classmethod
+    def get_project_participant_contacts(cls, role: UserRole, project_state: str = None, language: str = None) -> list:
+        """
+        Retrieve the email addresses of every translator or customer taking part in projects that
+        match the filters, in one set-based query. Each user appears once.
+        Parameters:
+            role (UserRole): TRANSLATOR for assigned translators, CUSTOMER for project owners.
+            project_state (str | None): Only projects in this state (e.g. 'ASSIGNED').
+            language (str | None): Only projects with this target language code.
+        Returns:
+            list[dict]: One {'id', 'email'} row per matching user.
+        Raises:
+            ValueError: If `role` is neither TRANSLATOR nor CUSTOMER, or the query fails.
+        """
+
+        columns = {UserRole.TRANSLATOR: "translatorId", UserRole.CUSTOMER: "customerId"}
+        if role not in columns:
+            print(f"[User.py] Invalid participant role provided: {role}", flush=True)
+            raise ValueError("Role must be either TRANSLATOR or CUSTOMER.")
+
+        conditions = []
+        params = []
+        if project_state:
+            conditions.append("p.state = %s")
+            params.append(project_state)
+        if language:
+            conditions.append("p.languageCode = %s")
+            params.append(language)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        result = db.execute_query(
+            "SELECT u.id, u.email FROM Users u WHERE u.id IN ("
+            f"SELECT p.{columns[role]} FROM Projects p{where})",
+            tuple(params)
+        )
+
+        if result is None:
+            print(f"[User.py] Failed to resolve project participants.", flush=True)
+            raise ValueError("Failed to resolve recipients.")
+
+        return result
@@ -2,6 +2,8 @@ from controllers.AuthController import auth_bp, google_bp
 from controllers.UserController import user_bp
 from controllers.ProjectController import proj_bp
 from controllers.EmailController import email_bp
+from controllers.JobController import job_bp
+from controllers.AnalyticsController import analytics_bp
 from flask import Blueprint, redirect, url_for, session
 
 
@@ -15,6 +17,8 @@ def register_routes(app):
     - Google login routes under `/login` (`google_bp`)
     - User-related API routes under `/api` (`user_bp`)
     - Project-related API routes under `/api` (`proj_bp`)
+    - Email and background job API routes under `/api` (`email_bp`, `job_bp`)
+    - Analytics API routes under `/api` (`analytics_bp`)
 
     Parameters:
         app (flask.Flask): The Flask application instance to register blueprints on.
@@ -28,6 +32,8 @@ def register_routes(app):
     app.register_blueprint(user_bp, url_prefix='/api')
     app.register_blueprint(proj_bp, url_prefix='/api')
     app.register_blueprint(email_bp, url_prefix='/api')
+    app.register_blueprint(job_bp, url_prefix='/api')
+    app.register_blueprint(analytics_bp, url_prefix='/api')
 
     print("[router.py] Blueprints registered.", flush=True)
 
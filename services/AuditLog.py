@@ -0,0 +1,190 @@
+import atexit
+import os
+import threading
+from collections import deque
+from models.ProjectTransition import ProjectTransition
+from services.EventBus import EventBus, ProjectEvent
+
+
+class AuditLog:
+    """
+    Records every project lifecycle transition (project, from, to, actor, time) in the
+    append-only ProjectTransitions table.
+    AuditLog subscribes to all ProjectEvents, so only committed transitions are recorded.
+    Recording an event only appends a tuple to an in-memory buffer. A background thread writes
+    the buffer with multi-row INSERTs once BATCH_SIZE events are waiting or every FLUSH_SECONDS,
+    and once more at interpreter exit. Rows that fail to insert stay buffered for the next
+    flush; beyond MAX_BUFFERED the oldest are dropped with a warning. Flush listeners receive
+    every written batch in log order, on the flusher thread (or at exit); the history queries
+    write the buffer themselves but leave the listeners to the flusher, so they stay cheap.
+    Configuration (environment variables):
+    - AUDIT_LOG_BATCH_SIZE: Events per flush (default 500).
+    - AUDIT_LOG_FLUSH_SECONDS: Maximum delay before buffered events are written (default 1).
+    - AUDIT_LOG_MAX_BUFFERED: Events kept while the database is unavailable (default 100000).
+    """
+
+    BATCH_SIZE = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500"))
+    FLUSH_SECONDS = float(os.getenv("AUDIT_LOG_FLUSH_SECONDS", "1"))
+    MAX_BUFFERED = int(os.getenv("AUDIT_LOG_MAX_BUFFERED", "100000"))
+    MAX_PAGE_SIZE = 1000
+
+    _buffer = deque()
+    _lock = threading.Lock()
+    _flush_lock = threading.Lock()
+    _wake = threading.Event()
+    _flusher = None
+    _listeners = []
+    _unnotified = deque()
+
+
+    @staticmethod
+    def record(event: ProjectEvent) -> None:
+        """
+        Buffer a transition for the next flush. Called by the EventBus after commit.
+        Parameters:
+            event (ProjectEvent): The transition.
+        """
+
+        row = (
+            str(event.project_id), type(event).__name__, event.from_state, event.to_state, event.actor_id, event.occurred_at,
+            getattr(event, 'translator_id', None)
+        )
+
+        with AuditLog._lock:
+            AuditLog._buffer.append(row)
+            pending = len(AuditLog._buffer)
+            if AuditLog._flusher is None:
+                AuditLog._flusher = threading.Thread(target=AuditLog._run_flusher, name="audit-log-flusher", daemon=True)
+                AuditLog._flusher.start()
+
+        if pending >= AuditLog.BATCH_SIZE:
+            AuditLog._wake.set()
+
+
+    @staticmethod
+    def add_flush_listener(listener) -> None:
+        """
+        Register a function called with each batch of transitions once it has been written.
+        Parameters:
+            listener (Callable[[list[tuple]], None]): Receives (project_id, event, from_state,
+                to_state, actor_id, occurred_at, translator_id) rows in log order. Exceptions are logged.
+        """
+
+        with AuditLog._lock:
+            AuditLog._listeners.append(listener)
+
+
+    @staticmethod
+    def flush(notify: bool = True) -> int:
+        """
+        Write all buffered transitions now.
+        Parameters:
+            notify (bool): Run the flush listeners on the written batches, and on batches written
+                earlier without them. With False the batches are handed to the flusher thread.
+        Returns:
+            int: Number of written transitions.
+        """
+
+        with AuditLog._flush_lock:
+            with AuditLog._lock:
+                rows = list(AuditLog._buffer)
+                AuditLog._buffer.clear()
+
+            written = 0
+            for start in range(0, len(rows), AuditLog.BATCH_SIZE):
+                batch = rows[start:start + AuditLog.BATCH_SIZE]
+                try:
+                    written += ProjectTransition.insert_many(batch, AuditLog.BATCH_SIZE)
+                    AuditLog._unnotified.append(batch)
+                except Exception as e:
+                    unwritten = rows[start:]
+                    with AuditLog._lock:
+                        AuditLog._buffer.extendleft(reversed(unwritten))
+                        overflow = len(AuditLog._buffer) - AuditLog.MAX_BUFFERED
+                        for _ in range(max(overflow, 0)):
+                            AuditLog._buffer.popleft()
+                    print(f"[AuditLog.py] Flush of {len(unwritten)} transitions failed, keeping them buffered: {e}", flush=True)
+                    if overflow > 0:
+                        print(f"[AuditLog.py] Audit buffer full, dropped the {overflow} oldest transitions.", flush=True)
+                    break
+
+            if not notify:
+                if AuditLog._unnotified:
+                    AuditLog._wake.set()
+                return written
+
+            while AuditLog._unnotified:
+                batch = AuditLog._unnotified.popleft()
+                for listener in list(AuditLog._listeners):
+                    try:
+                        listener(batch)
+                    except Exception as e:
+                        print(f"[AuditLog.py] Flush listener {getattr(listener, '__qualname__', listener)} failed: {e}", flush=True)
+
+            return written
+
+
+    @staticmethod
+    def _run_flusher() -> None:
+        """Flush on every BATCH_SIZE events or FLUSH_SECONDS, whichever comes first."""
+
+        while True:
+            AuditLog._wake.wait(AuditLog.FLUSH_SECONDS)
+            AuditLog._wake.clear()
+            AuditLog.flush()
+
+
+    @staticmethod
+    def get_project_history(project_id: str, limit: int = 100, before_id: int = None) -> list:
+        """
+        List the transitions of a project, newest first.
+        Events buffered in this process are written first, so a transition made by the
+        current request is already listed; flush listeners still run on the flusher thread.
+        Parameters:
+            project_id (str): The project.
+            limit (int): Page size, at most MAX_PAGE_SIZE.
+            before_id (int | None): Id of the last transition of the previous page.
+        Returns:
+            list[dict]: Transitions with 'id', 'projectId', 'event', 'fromState', 'toState', 'actorId',
+            'occurredAt' and 'translatorId'.
+        Raises:
+            ValueError: If the paging arguments are invalid or the query fails.
+        """
+
+        AuditLog._validate_page(limit, before_id)
+        AuditLog.flush(notify=False)
+        return ProjectTransition.get_by_project(project_id, limit, before_id)
+
+
+    @staticmethod
+    def get_actor_history(actor_id: str, limit: int = 100, before_id: int = None) -> list:
+        """
+        List the transitions caused by a user, newest first.
+        Parameters:
+            actor_id (str): The user.
+            limit (int): Page size, at most MAX_PAGE_SIZE.
+            before_id (int | None): Id of the last transition of the previous page.
+        Returns:
+            list[dict]: Transitions as for `get_project_history`.
+        Raises:
+            ValueError: If the paging arguments are invalid or the query fails.
+        """
+
+        AuditLog._validate_page(limit, before_id)
+        AuditLog.flush(notify=False)
+        return ProjectTransition.get_by_actor(actor_id, limit, before_id)
+
+
+    @staticmethod
+    def _validate_page(limit: int, before_id: int) -> None:
+        """Raise ValueError for paging arguments outside the allowed range."""
+
+        if not isinstance(limit, int) or not 1 <= limit <= AuditLog.MAX_PAGE_SIZE:
+            raise ValueError(f"Limit must be between 1 and {AuditLog.MAX_PAGE_SIZE}.")
+
+        if before_id is not None and (not isinstance(before_id, int) or before_id < 1):
+            raise ValueError("before_id must be a positive integer.")
+
+
+EventBus.subscribe(ProjectEvent, AuditLog.record)
+atexit.register(AuditLog.flush)
@@ -1,38 +1,186 @@
 from services.UserService import UserService
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import hashlib
-from flask import session, jsonify, redirect, url_for
+import hmac
+import os
+import secrets
+import threading
+from flask import session, jsonify, redirect, url_for, g
 from functools import wraps
 
 
+PASSWORD_HASH_SCHEME = "scrypt"
+PASSWORD_HASH_VERSION = "v1"
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+PASSWORD_SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+PASSWORD_SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_SALT_BYTES = 16
+PASSWORD_KEY_BYTES = 32
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    """Derive a scrypt key. Runs inside the hashing process pool, so it must stay module-level."""
+
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=128 * r * (n + p + 2) + 1024 * 1024,
+        dklen=PASSWORD_KEY_BYTES
+    )
+
+
 class AuthService:
 
+    _hash_pool = None
+    _hash_pool_lock = threading.Lock()
+
+    @staticmethod
+    def _get_hash_pool() -> ProcessPoolExecutor:
+        """Return the shared password hashing process pool, creating it on first use."""
+
+        with AuthService._hash_pool_lock:
+            if AuthService._hash_pool is None:
+                AuthService._hash_pool = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+                print(f"[AuthService.py] Started password hashing pool with {PASSWORD_HASH_WORKERS} workers.", flush=True)
+            return AuthService._hash_pool
+
+    @staticmethod
+    def _derive(jobs: list) -> list:
+        """
+        Run scrypt derivations in the hashing process pool so request threads are not blocked
+        on CPU-heavy work while holding the GIL. A broken pool (e.g. a killed worker) is
+        replaced once before giving up.
+        Args:
+            jobs (list[tuple]): (password, salt, n, r, p) argument tuples for `_scrypt`.
+        Returns:
+            list[bytes]: The derived keys, in the order of `jobs`.
+        """
+
+        for attempt in range(2):
+            pool = AuthService._get_hash_pool()
+            try:
+                return list(pool.map(_scrypt, *zip(*jobs))) if jobs else []
+            except BrokenProcessPool:
+                print("[AuthService.py] Password hashing pool is broken, restarting it.", flush=True)
+                with AuthService._hash_pool_lock:
+                    if AuthService._hash_pool is pool:
+                        AuthService._hash_pool = None
+                if attempt:
+                    raise
+
     @staticmethod
     def hash_password(password):
         """
-        Hash a plaintext password using SHA-256 and return the hexadecimal digest.
+        Hash a plaintext password with salted scrypt and return it in the versioned storage format.
 
-        Note:
-            This function performs a simple SHA-256 hash without a salt or key stretching.
-            For production use, consider a stronger, salted password hashing algorithm such
-            as bcrypt, scrypt, Argon2, or PBKDF2.
+        The result has the form `scrypt$v1$<n>$<r>$<p>$<salt hex>$<key hex>`, so the cost
+        parameters travel with each hash and can be raised later (PASSWORD_SCRYPT_N/R/P)
+        without invalidating stored passwords. The derivation runs in a bounded process pool
+        (PASSWORD_HASH_WORKERS processes).
 
         Args:
             password (str): The plaintext password to hash.
 
         Returns:
-            str: The SHA-256 hash of the password as a hexadecimal string.
+            str: The encoded scrypt hash.
+
+        Raises:
+            ValueError: If `password` is empty or not a string.
         """
 
-        return hashlib.sha256(password.encode()).hexdigest()
-    
+        return AuthService.hash_passwords([password])[0]
+
+    @staticmethod
+    def hash_passwords(passwords: list) -> list:
+        """
+        Hash many plaintext passwords in parallel in the hashing process pool.
+
+        Args:
+            passwords (list[str]): The plaintext passwords to hash.
+
+        Returns:
+            list[str]: The encoded hashes, in the order of `passwords`.
+
+        Raises:
+            ValueError: If any password is empty or not a string.
+        """
+
+        for password in passwords:
+            if not password or not isinstance(password, str):
+                print(f"[AuthService.py] Invalid password provided for hashing.", flush=True)
+                raise ValueError("Password must be a valid non-empty string.")
+
+        n, r, p = PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P
+        salts = [secrets.token_bytes(PASSWORD_SALT_BYTES) for _ in passwords]
+        keys = AuthService._derive([(password, salt, n, r, p) for password, salt in zip(passwords, salts)])
+
+        return [
+            "$".join([PASSWORD_HASH_SCHEME, PASSWORD_HASH_VERSION, str(n), str(r), str(p), salt.hex(), key.hex()])
+            for salt, key in zip(salts, keys)
+        ]
+
+    @staticmethod
+    def verify_password(password, stored_hash) -> bool:
+        """
+        Check a plaintext password against a stored hash.
+
+        Supports the versioned scrypt format produced by `hash_password` and legacy
+        unsalted SHA-256 hex digests.
+
+        Args:
+            password (str): The plaintext password to check.
+            stored_hash (str): The stored password hash.
+
+        Returns:
+            bool: True if the password matches; otherwise, False.
+        """
+
+        if not password or not isinstance(password, str) or not stored_hash:
+            return False
+
+        parts = stored_hash.split("$")
+        if len(parts) == 7 and parts[0] == PASSWORD_HASH_SCHEME and parts[1] == PASSWORD_HASH_VERSION:
+            try:
+                n, r, p = int(parts[2]), int(parts[3]), int(parts[4])
+                salt, expected = bytes.fromhex(parts[5]), bytes.fromhex(parts[6])
+            except ValueError:
+                print(f"[AuthService.py] Malformed password hash encountered.", flush=True)
+                return False
+            key = AuthService._derive([(password, salt, n, r, p)])[0]
+            return hmac.compare_digest(key, expected)
+
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, stored_hash)
+
+    @staticmethod
+    def needs_rehash(stored_hash) -> bool:
+        """
+        Tell whether a stored hash should be replaced with one using the current scheme and cost.
+
+        Args:
+            stored_hash (str): The stored password hash.
+
+        Returns:
+            bool: True for legacy SHA-256 hashes and scrypt hashes with outdated parameters.
+        """
+
+        current = [PASSWORD_HASH_SCHEME, PASSWORD_HASH_VERSION, str(PASSWORD_SCRYPT_N), str(PASSWORD_SCRYPT_R), str(PASSWORD_SCRYPT_P)]
+        return (stored_hash or "").split("$")[:5] != current
 
     @staticmethod
     def authenticate_user(name, password):
         """
         Authenticate a user by verifying the provided credentials.
-        This function hashes the given plaintext password and compares it against
-        the stored hashed password for the user identified by `name`. If the
-        credentials match, the user's data is returned; otherwise, `None` is returned.
+        This function verifies the given plaintext password against the stored hash for
+        the user identified by `name`. If the credentials match, the user's data is
+        returned; otherwise, `None` is returned. A stored legacy SHA-256 hash (or a scrypt
+        hash with outdated cost parameters) is transparently replaced with a fresh hash
+        after a successful login.
         Parameters:
             name (str): The unique username used to identify the user.
             password (str): The plaintext password to be authenticated.
@@ -40,19 +188,66 @@ class AuthService:
             dict | None: A dictionary containing the authenticated user's data if the
             credentials are valid; otherwise, None.
         Notes:
-            - Relies on AuthService.hash_password for password hashing.
+            - Relies on AuthService.verify_password for password checking.
             - Fetches user data via UserService.get_user_by_name.
         """
 
-        hashed_password = AuthService.hash_password(password)
-
         user_data = UserService.get_user_by_name(name)
 
-        if user_data and user_data.get('password') == hashed_password:
-            print(f"[AuthService.py] User authenticated: {name}", flush=True)
-            return user_data
+        if not user_data or not AuthService.verify_password(password, user_data.get('password')):
+            return None
 
-        return None
+        print(f"[AuthService.py] User authenticated: {name}", flush=True)
+
+        if AuthService.needs_rehash(user_data.get('password')):
+            try:
+                UserService.update_password(user_data['id'], AuthService.hash_password(password))
+                print(f"[AuthService.py] Upgraded password hash for user: {name}", flush=True)
+            except ValueError as e:
+                print(f"[AuthService.py] Failed to upgrade password hash for user {name}: {e}", flush=True)
+
+        return user_data
+
+
+    @staticmethod
+    def validate_session_user(user_session: dict):
+        """
+        Check that the user stored in the session still exists and that the session is current.
+        The user's session record is cached per process (UserService.validated_users) for a short
+        TTL, so most page views are validated without touching the Users table. A session is only
+        accepted when its `session_version` matches the user's current version. Nothing in the
+        application changes the version yet; incrementing Users.sessionVersion in the database
+        revokes a user's sessions once the cached entry expires, and a deleted user is rejected
+        after the same TTL.
+        Parameters:
+            user_session (dict): The session's user dict with 'user_id' and optionally 'session_version'.
+        Returns:
+            dict | None: The user's session record (id, name, role, sessionVersion) if the session
+            is valid; otherwise, None.
+        """
+
+        user_id = user_session.get('user_id')
+        if not user_id:
+            return None
+
+        version = user_session.get('session_version', 0)
+
+        cached = UserService.validated_users.get(user_id)
+        if cached is not None and cached['sessionVersion'] == version:
+            return cached
+
+        record = UserService.get_session_record(user_id)
+        if not record:
+            UserService.validated_users.pop(user_id)
+            return None
+
+        UserService.validated_users.set(user_id, record)
+
+        if record['sessionVersion'] != version:
+            print(f"[AuthService.py] Stale session version for user: {user_id}", flush=True)
+            return None
+
+        return record
 
 
 def login_required_api(f):
@@ -82,17 +277,19 @@ def login_required_ui(f):
     """
     Decorator for Flask view functions that enforces user authentication.
     This decorator checks the Flask session for a 'user' entry and verifies that the
-    user exists via UserService.get_user_by_name. If the user is not authenticated
-    or cannot be validated, the request is redirected to the 'auth_bp.login_page'.
+    user still exists and the session is current via AuthService.validate_session_user.
+    If the user is not authenticated or cannot be validated, the session user is removed
+    and the request is redirected to the 'auth_bp.login_page'. On success, the validated
+    session record is available to the view as `flask.g.current_user`.
     Parameters:
         f (Callable): The Flask view function to protect.
     Returns:
         Callable: A wrapped view function that either proceeds if the user is authenticated
         or redirects to the login page if not.
     Notes:
-        - Relies on a Flask session containing a 'user' dict with a 'name' key.
+        - Relies on a Flask session containing a 'user' dict with a 'user_id' key.
         - Requires the 'auth_bp.login_page' route for redirection.
-        - Depends on UserService.get_user_by_name to validate the user.
+        - Depends on AuthService.validate_session_user to validate the user.
     """
     @wraps(f)
     def wrapper(*args, **kwargs):
@@ -105,11 +302,14 @@ def login_required_ui(f):
             print(f"[AuthService.py] No user in session.", flush=True)
             return redirect(url_for('auth_bp.login_page'))
     
-        user_data = UserService.get_user_by_name(user_session['name'])
+        user_data = AuthService.validate_session_user(user_session)
         if not user_data:
-            print(f"[AuthService.py] User not found in session: {user_session['name']}", flush=True)
+            print(f"[AuthService.py] Session user could not be validated: {user_session.get('name')}", flush=True)
+            session.pop('user', None)
             return redirect(url_for('auth_bp.login_page'))
 
+        g.current_user = user_data
+
         return f(*args, **kwargs)
     return wrapper
 
@@ -0,0 +1,256 @@
+import heapq
+import itertools
+import os
+import threading
+from datetime import datetime, timedelta
+from models.Project import Project, ProjectState
+from models.User import UserRole, User
+from models.db import db
+from services.EventBus import EventBus, ProjectEvent, ProjectCreated
+from services.UserService import UserService
+from services.EmailService import EmailService
+
+WARNING = 'WARNING'
+ESCALATION = 'ESCALATION'
+
+# Alert kind -> (column recording that it was sent, email template).
+ALERTS = {
+    WARNING: ('dueWarnedAt', 'deadline_warning'),
+    ESCALATION: ('dueEscalatedAt', 'deadline_escalation'),
+}
+
+# States from which a project can never be due again.
+FINISHED_STATES = (ProjectState.APPROVED.value, ProjectState.CLOSED.value)
+
+
+class DeadlineWatcher:
+    """
+    Warns about approaching project deadlines without scanning the Projects table.
+    Deadlines are kept in a min-heap of alert times: the translator is warned WARNING_HOURS
+    before a project is due and the administrators are alerted ESCALATION_HOURS before, if the
+    project is still open (CREATED, ASSIGNED or REJECTED). A background thread sleeps until the
+    earliest alert, so tracking a deadline and firing an alert cost O(log n). Untracked
+    deadlines are dropped lazily when they reach the top of the heap.
+    New projects are tracked from ProjectCreated events. Every REFRESH_SECONDS the heap is also
+    topped up from the (state, dueAt) index with the deadlines of the next window, which picks
+    up projects created by other processes and after a restart. Each alert is recorded on the
+    project with a conditional UPDATE, so it is sent once even with several watchers running.
+    Configuration (environment variables):
+    - DEADLINE_WARNING_HOURS: Warning lead time (default 24).
+    - DEADLINE_ESCALATION_HOURS: Escalation lead time (default 2).
+    - DEADLINE_REFRESH_SECONDS: Interval of the index refresh (default 300).
+    """
+
+    WARNING_HOURS = float(os.getenv("DEADLINE_WARNING_HOURS", "24"))
+    ESCALATION_HOURS = float(os.getenv("DEADLINE_ESCALATION_HOURS", "2"))
+    REFRESH_SECONDS = float(os.getenv("DEADLINE_REFRESH_SECONDS", "300"))
+    REFRESH_LIMIT = 1000
+    OPEN_STATES = (ProjectState.CREATED.value, ProjectState.ASSIGNED.value, ProjectState.REJECTED.value)
+
+    _heap = []
+    _deadlines = {}
+    _sequence = itertools.count()
+    _lock = threading.Lock()
+    _wake = threading.Event()
+    _thread = None
+
+
+    @staticmethod
+    def start() -> None:
+        """Start the watcher thread; further calls do nothing."""
+
+        with DeadlineWatcher._lock:
+            if DeadlineWatcher._thread is not None:
+                return
+            DeadlineWatcher._thread = threading.Thread(target=DeadlineWatcher._run, name="deadline-watcher", daemon=True)
+            DeadlineWatcher._thread.start()
+
+        print(f"[DeadlineWatcher.py] Watching deadlines (warning {DeadlineWatcher.WARNING_HOURS:g} h, escalation {DeadlineWatcher.ESCALATION_HOURS:g} h before).", flush=True)
+
+
+    @staticmethod
+    def track(project_id: str, due_at: datetime, warned: bool = False, escalated: bool = False) -> None:
+        """
+        Schedule the alerts of a deadline, replacing any earlier deadline of the project.
+        Alerts whose time has already passed fire on the next wake-up.
+        Parameters:
+            project_id (str): The project.
+            due_at (datetime): Its deadline.
+            warned (bool): The warning was already sent.
+            escalated (bool): The escalation was already sent.
+        """
+
+        project_id = str(project_id)
+
+        with DeadlineWatcher._lock:
+            if escalated or DeadlineWatcher._deadlines.get(project_id) == due_at:
+                return
+
+            DeadlineWatcher._deadlines[project_id] = due_at
+            earliest = DeadlineWatcher._heap[0][0] if DeadlineWatcher._heap else None
+
+            if not warned:
+                DeadlineWatcher._push(due_at - timedelta(hours=DeadlineWatcher.WARNING_HOURS), project_id, WARNING, due_at)
+            DeadlineWatcher._push(due_at - timedelta(hours=DeadlineWatcher.ESCALATION_HOURS), project_id, ESCALATION, due_at)
+
+            wake = earliest is None or DeadlineWatcher._heap[0][0] < earliest
+
+        if wake:
+            DeadlineWatcher._wake.set()
+
+
+    @staticmethod
+    def untrack(project_id: str) -> None:
+        """Stop watching a project's deadline. Its heap entries are discarded when they come up."""
+
+        with DeadlineWatcher._lock:
+            DeadlineWatcher._deadlines.pop(str(project_id), None)
+
+
+    @staticmethod
+    def on_event(event: ProjectEvent) -> None:
+        """EventBus subscriber: track new deadlines and forget finished projects."""
+
+        if isinstance(event, ProjectCreated) and event.due_at is not None:
+            DeadlineWatcher.track(event.project_id, event.due_at)
+        elif event.to_state in FINISHED_STATES:
+            DeadlineWatcher.untrack(event.project_id)
+
+
+    @staticmethod
+    def _push(fire_at: datetime, project_id: str, kind: str, due_at: datetime) -> None:
+        """Add a heap entry; the caller holds the lock."""
+
+        heapq.heappush(DeadlineWatcher._heap, (fire_at, next(DeadlineWatcher._sequence), project_id, kind, due_at))
+
+
+    @staticmethod
+    def pop_due(now: datetime = None) -> list:
+        """
+        Remove and return the alerts whose time has come, skipping entries of untracked or moved deadlines.
+        Parameters:
+            now (datetime | None): Current time. Defaults to datetime.now().
+        Returns:
+            list[tuple[str, str, datetime]]: (project_id, kind, due_at) per alert, earliest first.
+        """
+
+        now = now or datetime.now()
+        due = []
+
+        with DeadlineWatcher._lock:
+            while DeadlineWatcher._heap and DeadlineWatcher._heap[0][0] <= now:
+                _, _, project_id, kind, due_at = heapq.heappop(DeadlineWatcher._heap)
+                if DeadlineWatcher._deadlines.get(project_id) != due_at:
+                    continue
+                if kind == ESCALATION:
+                    del DeadlineWatcher._deadlines[project_id]
+                due.append((project_id, kind, due_at))
+
+        return due
+
+
+    @staticmethod
+    def next_alert_at():
+        """Time of the earliest scheduled alert, or None if nothing is tracked."""
+
+        with DeadlineWatcher._lock:
+            return DeadlineWatcher._heap[0][0] if DeadlineWatcher._heap else None
+
+
+    @staticmethod
+    def refresh(now: datetime = None) -> int:
+        """
+        Track the open projects due before the end of the next refresh window, read from the
+        (state, dueAt) index.
+        Parameters:
+            now (datetime | None): Current time. Defaults to datetime.now().
+        Returns:
+            int: Number of projects read.
+        Raises:
+            ValueError: If the query fails.
+        """
+
+        now = now or datetime.now()
+        horizon = now + timedelta(hours=DeadlineWatcher.WARNING_HOURS, seconds=2 * DeadlineWatcher.REFRESH_SECONDS)
+        rows = Project.get_due_before(list(DeadlineWatcher.OPEN_STATES), horizon, DeadlineWatcher.REFRESH_LIMIT, unescalated_only=True)
+
+        for row in rows:
+            DeadlineWatcher.track(row['id'], row['dueAt'], warned=row['dueWarnedAt'] is not None, escalated=row['dueEscalatedAt'] is not None)
+
+        return len(rows)
+
+
+    @staticmethod
+    def fire(project_id: str, kind: str) -> bool:
+        """
+        Send one alert unless another watcher already did or the project is no longer open.
+        The warning goes to the assigned translator, or to the administrators while nobody is
+        assigned; the escalation always goes to the administrators.
+        Parameters:
+            project_id (str): The project.
+            kind (str): WARNING or ESCALATION.
+        Returns:
+            bool: True if the alert was sent.
+        Raises:
+            ValueError: If the alert could not be recorded or queued.
+        """
+
+        column, template = ALERTS[kind]
+
+        with db.transaction():
+            if not Project.mark_deadline_alert(project_id, column, list(DeadlineWatcher.OPEN_STATES)):
+                DeadlineWatcher.untrack(project_id)
+                return False
+
+            project = Project.get_by_id(project_id)
+            if project is None:
+                return False
+
+            context = {
+                'project_name': project.name,
+                'target_language': project.language,
+                'due_at': project.due_at.strftime("%Y-%m-%d %H:%M") if project.due_at else '',
+                'state': project.state.value,
+            }
+
+            if kind == WARNING and project.translator_id:
+                recipients = [project.translator_id]
+            else:
+                recipients = [admin.id for admin in User.get_all_users(role=UserRole.ADMINISTRATOR)]
+
+            contacts = UserService.get_user_contacts(recipients)
+            EmailService.notify_users(template, [(contacts[user_id], context) for user_id in recipients if user_id in contacts])
+
+        print(f"[DeadlineWatcher.py] Sent {kind.lower()} for project {project_id} due {context['due_at']} to {len(recipients)} recipients.", flush=True)
+        return True
+
+
+    @staticmethod
+    def _run() -> None:
+        """Sleep until the next alert or refresh, send what is due, repeat."""
+
+        next_refresh = datetime.now()
+
+        while True:
+            now = datetime.now()
+
+            if now >= next_refresh:
+                try:
+                    DeadlineWatcher.refresh(now)
+                except Exception as e:
+                    print(f"[DeadlineWatcher.py] Refresh failed: {e}", flush=True)
+                next_refresh = now + timedelta(seconds=DeadlineWatcher.REFRESH_SECONDS)
+
+            for project_id, kind, _ in DeadlineWatcher.pop_due(now):
+                try:
+                    DeadlineWatcher.fire(project_id, kind)
+                except Exception as e:
+                    DeadlineWatcher.untrack(project_id)
+                    print(f"[DeadlineWatcher.py] Failed to send {kind.lower()} for project {project_id}, retrying after the next refresh: {e}", flush=True)
+
+            wake_at = min(filter(None, [DeadlineWatcher.next_alert_at(), next_refresh]))
+            DeadlineWatcher._wake.wait(max((wake_at - datetime.now()).total_seconds(), 0))
+            DeadlineWatcher._wake.clear()
+
+
+EventBus.subscribe(ProjectEvent, DeadlineWatcher.on_event)
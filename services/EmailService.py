@@ -1,6 +1,15 @@
 import os
-import smtplib
+import random
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
+from models.db import db
+from models.EmailOutbox import EmailOutbox
+from models.User import User, UserRole, NotificationMode
+from models.Project import ProjectState
+from services.EmailTemplates import EmailTemplates
+from bin.smtp_pool import SMTPConnectionPool, CircuitBreaker, CircuitOpenError
 
 class EmailService:
     """
@@ -9,20 +18,83 @@ class EmailService:
     email.message.EmailMessage to send plain-text emails. It reads SMTP settings
     from environment variables and defaults to a MailHog-compatible local setup
     (no authentication or TLS).
+    Request handlers do not talk to SMTP themselves: they call `queue_email`, which stores
+    the message in the EmailOutbox table (inside the caller's transaction, if any), and the
+    delivery worker (`python -m bin.email_worker`) sends it with `deliver_pending`.
+    Notifications sent with `notify_user` are rendered from localized templates (see
+    EmailTemplates); for users in DIGEST mode they are buffered instead and coalesced by
+    `flush_digests` into one message per recipient and digest window.
     Environment variables:
     - SMTP_HOST: SMTP server hostname (default "localhost").
     - SMTP_PORT: SMTP server port (default 1025).
     - SMTP_FROM: Sender address for the From header (default "noreply@pia.local").
+    - SMTP_POOL_SIZE: Long-lived SMTP connections kept per process (default 2).
+    - SMTP_CONNECT_TIMEOUT / SMTP_READ_TIMEOUT: Socket timeouts in seconds (defaults 5 and 15).
+    - SMTP_NOOP_AFTER_SECONDS: Idle time after which a pooled connection is checked with NOOP (default 30).
+    - SMTP_MAX_MESSAGES_PER_CONNECTION: Messages sent before a connection is replaced (default 100).
+    - SMTP_BREAKER_FAILURES / SMTP_BREAKER_RESET_SECONDS: Consecutive connection failures that open
+      the circuit breaker, and how long it stays open (defaults 5 and 30).
+    - EMAIL_OUTBOX_BATCH_SIZE: Messages claimed per delivery round (default 50).
+    - EMAIL_MAX_ATTEMPTS: Delivery attempts before a message is dead-lettered (default 8).
+    - EMAIL_RETRY_BASE_SECONDS / EMAIL_RETRY_MAX_SECONDS: Exponential backoff between attempts
+      (defaults 30 and 3600).
+    - EMAIL_SEND_LEASE_SECONDS: How long a claimed message is reserved for its worker (default 300).
+    - EMAIL_DIGEST_WINDOW_SECONDS: Time a digest collects notifications before it is sent (default 3600).
+    - EMAIL_BROADCAST_RATE_PER_SECOND: Pace at which broadcast messages become due (default 10).
     Notes:
     - Designed for local development with MailHog; production usage should enable TLS and authentication.
-    - Exceptions from the underlying SMTP client are surfaced to the caller.
+    - Exceptions from the underlying SMTP client are surfaced to the caller of `send_email`.
     """
 
+    BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+    MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "8"))
+    RETRY_BASE_SECONDS = int(os.getenv("EMAIL_RETRY_BASE_SECONDS", "30"))
+    RETRY_MAX_SECONDS = int(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+    SEND_LEASE_SECONDS = int(os.getenv("EMAIL_SEND_LEASE_SECONDS", "300"))
+    DIGEST_WINDOW_SECONDS = int(os.getenv("EMAIL_DIGEST_WINDOW_SECONDS", "3600"))
+    DIGEST_RECIPIENTS_PER_ROUND = 100
+    BROADCAST_RATE_PER_SECOND = float(os.getenv("EMAIL_BROADCAST_RATE_PER_SECOND", "10"))
+    MAX_BROADCAST_IDS = 10000
+
+    _smtp_pool = None
+    _smtp_pool_lock = threading.Lock()
+
+
+    @staticmethod
+    def _get_smtp_pool() -> SMTPConnectionPool:
+        """Return the process-wide SMTP connection pool, creating it on first use."""
+
+        with EmailService._smtp_pool_lock:
+            if EmailService._smtp_pool is None:
+                EmailService._smtp_pool = SMTPConnectionPool(
+                    host=os.getenv("SMTP_HOST", "localhost"),
+                    port=int(os.getenv("SMTP_PORT", "1025")),
+                    size=int(os.getenv("SMTP_POOL_SIZE", "2")),
+                    connect_timeout=float(os.getenv("SMTP_CONNECT_TIMEOUT", "5")),
+                    read_timeout=float(os.getenv("SMTP_READ_TIMEOUT", "15")),
+                    noop_after=float(os.getenv("SMTP_NOOP_AFTER_SECONDS", "30")),
+                    max_messages=int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100")),
+                    breaker=CircuitBreaker(
+                        failure_threshold=int(os.getenv("SMTP_BREAKER_FAILURES", "5")),
+                        reset_timeout=float(os.getenv("SMTP_BREAKER_RESET_SECONDS", "30"))
+                    )
+                )
+            return EmailService._smtp_pool
+
 
     @staticmethod
     def send_email(email: str, subject: str, body: str) -> None:
-        host = os.getenv("SMTP_HOST", "localhost")
-        port = int(os.getenv("SMTP_PORT", "1025"))
+        """
+        Send a plain-text email right away over a pooled SMTP connection.
+        Parameters:
+            email (str): Recipient address.
+            subject (str): Subject line.
+            body (str): Plain-text body.
+        Raises:
+            CircuitOpenError: If recent connection failures opened the circuit breaker.
+            smtplib.SMTPException | OSError: If the server rejects the message or cannot be reached in time.
+        """
+
         from_addr = os.getenv("SMTP_FROM", "noreply@pia.local")
 
         msg = EmailMessage()
@@ -31,5 +103,304 @@ class EmailService:
         msg["Subject"] = subject
         msg.set_content(body)
 
-        with smtplib.SMTP(host, port) as smtp:
-            smtp.send_message(msg)
+        EmailService._get_smtp_pool().send(msg)
+
+
+    @staticmethod
+    def queue_email(email: str, subject: str, body: str, digest: bool = False) -> str:
+        """
+        Queue an email for background delivery.
+        Call inside `db.transaction()` together with the state change the email announces, so
+        the message is only sent if the change is committed.
+        Parameters:
+            email (str): Recipient address. Must be a non-empty string containing "@".
+            subject (str): Subject line.
+            body (str): Plain-text body.
+            digest (bool): Buffer the message for the recipient's next digest instead of sending it on its own.
+        Returns:
+            str: The id of the queued message.
+        Raises:
+            ValueError: If `email` is invalid or the message could not be stored.
+        """
+
+        if not email or not isinstance(email, str) or "@" not in email:
+            print(f"[EmailService.py] Invalid recipient provided: {email}", flush=True)
+            raise ValueError("Recipient email must be a valid non-empty string.")
+
+        return EmailOutbox.enqueue(email, subject, body, buffered=digest)
+
+
+    @staticmethod
+    def notify_user(user: User, template: str, **context) -> str:
+        """
+        Render a notification in the user's locale and queue it, honouring their notification
+        preference: users in DIGEST mode receive it in their next digest, everyone else right away.
+        Parameters:
+            user (User): The recipient, e.g. from `UserService.get_user_contact`.
+            template (str): Email template name, see `EmailTemplates`.
+            **context: Template variables.
+        Returns:
+            str: The id of the queued message.
+        Raises:
+            ValueError: If the user has no valid email or the message could not be stored.
+        """
+
+        locale = EmailTemplates.resolve_locale(user.locale)
+        subject, body = EmailTemplates.render(template, locale, **context)
+        digest = user.notification_mode == NotificationMode.DIGEST
+
+        if not digest:
+            return EmailService.queue_email(user.email, subject, body)
+
+        if not user.email or not isinstance(user.email, str) or "@" not in user.email:
+            print(f"[EmailService.py] Invalid recipient provided: {user.email}", flush=True)
+            raise ValueError("Recipient email must be a valid non-empty string.")
+
+        return EmailOutbox.enqueue(user.email, subject, body, buffered=True, locale=locale)
+
+
+    @staticmethod
+    def notify_users(template: str, notifications: list) -> int:
+        """
+        Queue the same kind of notification for many users at once, e.g. after a bulk update.
+        Messages are rendered in one `EmailTemplates.render_many` call and stored with multi-row
+        INSERTs, following each recipient's locale and notification mode like `notify_user`.
+        Recipients without a valid email address are skipped.
+        Parameters:
+            template (str): Email template name, see `EmailTemplates`.
+            notifications (list[tuple[User, dict]]): (recipient, template variables) per message.
+        Returns:
+            int: Number of queued messages.
+        Raises:
+            ValueError: If the messages could not be stored.
+        """
+
+        valid = []
+        for user, context in notifications:
+            if not user.email or not isinstance(user.email, str) or "@" not in user.email:
+                print(f"[EmailService.py] Skipping notification to invalid recipient: {user.email}", flush=True)
+                continue
+            valid.append((user, EmailTemplates.resolve_locale(user.locale), context))
+
+        if not valid:
+            return 0
+
+        rendered = EmailTemplates.render_many(template, [(locale, context) for _, locale, context in valid])
+
+        EmailOutbox.enqueue_many([
+            (user.email, subject, body, user.notification_mode == NotificationMode.DIGEST, locale)
+            for (user, locale, _), (subject, body) in zip(valid, rendered)
+        ])
+
+        return len(valid)
+
+
+    @staticmethod
+    def flush_digests(window_seconds: int = None) -> int:
+        """
+        Fold the buffered notifications of every recipient whose digest window has elapsed
+        into one digest message queued for delivery. All digests of a round are rendered in
+        one batch, each in the locale of the recipient's latest notification. A window holding
+        a single notification is sent as that notification.
+        Parameters:
+            window_seconds (int | None): Digest window length. Defaults to DIGEST_WINDOW_SECONDS.
+        Returns:
+            int: Number of recipients whose digest was queued.
+        Raises:
+            ValueError: If the buffered notifications could not be read or updated.
+        """
+
+        window = EmailService.DIGEST_WINDOW_SECONDS if window_seconds is None else window_seconds
+
+        with db.transaction():
+            digests = EmailOutbox.lock_due_digests(window, EmailService.DIGEST_RECIPIENTS_PER_ROUND)
+
+            singles = [messages[0]['id'] for messages in digests.values() if len(messages) == 1]
+            if singles:
+                EmailOutbox.release_buffered(singles)
+
+            batches = [(recipient, messages) for recipient, messages in digests.items() if len(messages) > 1]
+            rendered = EmailTemplates.render_many(
+                'digest',
+                [(messages[-1].get('locale'), {'messages': messages}) for _, messages in batches]
+            )
+
+            for (recipient, messages), (subject, body) in zip(batches, rendered):
+                digest_id = EmailOutbox.enqueue(recipient, subject, body)
+                EmailOutbox.mark_digested([message['id'] for message in messages], digest_id)
+
+        if digests:
+            print(f"[EmailService.py] Queued digests for {len(digests)} recipients.", flush=True)
+
+        return len(digests)
+
+
+    @staticmethod
+    def queue_broadcast(subject: str, body: str, user_ids: list = None, role: str = None,
+                        project_state: str = None, language: str = None) -> dict:
+        """
+        Queue one message for a whole group of users.
+        Recipients are either an explicit list of user ids, or every user with `role` taking part
+        in projects matching `project_state` and/or `language` (e.g. all translators on ASSIGNED
+        projects, or all customers with German projects). They are resolved with set-based
+        queries, deduplicated by email address and queued with multi-row INSERTs in one
+        transaction; the worker then delivers them at BROADCAST_RATE_PER_SECOND.
+        Parameters:
+            subject (str): Subject line. Must be non-empty.
+            body (str): Plain-text body. Must be non-empty.
+            user_ids (list[str] | None): Explicit recipients (at most MAX_BROADCAST_IDS).
+            role (str | None): 'TRANSLATOR' or 'CUSTOMER'; required when `user_ids` is not given.
+            project_state (str | None): Project state filter, e.g. 'ASSIGNED'.
+            language (str | None): Project target language filter, e.g. 'de'.
+        Returns:
+            dict: {'broadcast_id': str, 'recipients': int}.
+        Raises:
+            ValueError: If the message or the selection is invalid, or queuing fails.
+        """
+
+        if not subject or not isinstance(subject, str) or not subject.strip():
+            print(f"[EmailService.py] Invalid broadcast subject provided: {subject}", flush=True)
+            raise ValueError("Subject must be a valid non-empty string.")
+
+        if not body or not isinstance(body, str) or not body.strip():
+            print(f"[EmailService.py] Invalid broadcast body provided.", flush=True)
+            raise ValueError("Body must be a valid non-empty string.")
+
+        if user_ids is not None:
+            if role or project_state or language:
+                raise ValueError("Select recipients either by user_ids or by role and project filters, not both.")
+            if not isinstance(user_ids, list) or not user_ids or not all(isinstance(uid, str) and uid for uid in user_ids):
+                raise ValueError("user_ids must be a non-empty list of user ids.")
+            if len(user_ids) > EmailService.MAX_BROADCAST_IDS:
+                raise ValueError(f"At most {EmailService.MAX_BROADCAST_IDS} user ids can be given.")
+            contacts = User.get_contacts_by_ids(list(dict.fromkeys(user_ids)))
+        else:
+            if not role:
+                raise ValueError("Either user_ids or role is required.")
+            user_role = UserRole.from_string(role)
+            if project_state:
+                try:
+                    project_state = ProjectState[project_state.strip().upper()].value
+                except (KeyError, AttributeError):
+                    raise ValueError("Invalid project state.")
+            contacts = User.get_project_participant_contacts(user_role, project_state, language or None)
+
+        recipients = list(dict.fromkeys(
+            contact['email'] for contact in contacts if contact.get('email') and "@" in contact['email']
+        ))
+
+        broadcast_id = str(uuid.uuid4())
+        if recipients:
+            with db.transaction():
+                EmailOutbox.enqueue_broadcast(broadcast_id, recipients, subject.strip(), body.strip(), EmailService.BROADCAST_RATE_PER_SECOND)
+
+        print(f"[EmailService.py] Queued broadcast {broadcast_id} for {len(recipients)} recipients.", flush=True)
+
+        return {'broadcast_id': broadcast_id, 'recipients': len(recipients)}
+
+
+    @staticmethod
+    def get_broadcast_status(broadcast_id: str) -> dict:
+        """
+        Report the delivery progress of a broadcast.
+        Parameters:
+            broadcast_id (str): Id returned by `queue_broadcast`.
+        Returns:
+            dict[str, int]: Number of its messages per outbox status.
+        """
+
+        return EmailOutbox.get_broadcast_status(broadcast_id)
+
+
+    @staticmethod
+    def retry_delay(attempts: int) -> int:
+        """
+        Seconds to wait before the next delivery attempt.
+        The delay doubles with every failed attempt, starting at RETRY_BASE_SECONDS and capped at
+        RETRY_MAX_SECONDS, and is jittered down by up to half so messages that failed together
+        do not all retry at the same moment.
+        Parameters:
+            attempts (int): Number of attempts made so far (at least 1).
+        Returns:
+            int: The delay in seconds.
+        """
+
+        delay = min(EmailService.RETRY_BASE_SECONDS * 2 ** (attempts - 1), EmailService.RETRY_MAX_SECONDS)
+        return max(1, int(delay * random.uniform(0.5, 1.0)))
+
+
+    @staticmethod
+    def _try_send(message: dict):
+        """Send one outbox message. Returns None on success, otherwise the exception raised."""
+
+        try:
+            EmailService.send_email(message['recipient'], message['subject'], message['body'])
+        except Exception as e:
+            return e
+        return None
+
+
+    @staticmethod
+    def deliver_pending(batch_size: int = None) -> dict:
+        """
+        Claim one batch of due outbox messages and send them, using every pooled SMTP connection.
+        A failed message is rescheduled with `retry_delay`, or dead-lettered once it has been
+        attempted MAX_ATTEMPTS times. Messages refused because the SMTP circuit breaker is open
+        are released without using up an attempt.
+        Parameters:
+            batch_size (int | None): Maximum number of messages to claim. Defaults to BATCH_SIZE.
+        Returns:
+            dict: Counts of messages 'sent', 'retried', 'dead' and 'deferred' in this round.
+        Raises:
+            ValueError: If the batch could not be claimed.
+        """
+
+        pool = EmailService._get_smtp_pool()
+        outcome = {'sent': 0, 'retried': 0, 'dead': 0, 'deferred': 0}
+
+        if pool.breaker.state == 'open':
+            return outcome
+
+        messages = EmailOutbox.claim_batch(batch_size or EmailService.BATCH_SIZE, EmailService.SEND_LEASE_SECONDS)
+        if not messages:
+            return outcome
+
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            errors = list(executor.map(EmailService._try_send, messages))
+
+        deferred = []
+        for message, e in zip(messages, errors):
+            if e is None:
+                EmailOutbox.mark_sent(message['id'])
+                outcome['sent'] += 1
+            elif isinstance(e, CircuitOpenError):
+                deferred.append(message['id'])
+            else:
+                error = f"{type(e).__name__}: {e}"
+                if message['attempts'] >= EmailService.MAX_ATTEMPTS:
+                    print(f"[EmailService.py] Giving up on email {message['id']} after {message['attempts']} attempts: {error}", flush=True)
+                    EmailOutbox.mark_failed(message['id'], error)
+                    outcome['dead'] += 1
+                else:
+                    delay = EmailService.retry_delay(message['attempts'])
+                    print(f"[EmailService.py] Email {message['id']} failed, retrying in {delay}s: {error}", flush=True)
+                    EmailOutbox.mark_failed(message['id'], error, delay)
+                    outcome['retried'] += 1
+
+        if deferred:
+            print(f"[EmailService.py] SMTP circuit is open, deferring {len(deferred)} emails.", flush=True)
+            EmailOutbox.release(deferred, max(1, int(pool.breaker.retry_after())))
+            outcome['deferred'] = len(deferred)
+
+        return outcome
+
+
+    @staticmethod
+    def get_outbox_stats() -> dict:
+        """
+        Report the outbox backlog.
+        Returns:
+            dict[str, int]: Number of messages per status (BUFFERED, PENDING, SENDING, SENT, DEAD, DIGESTED).
+        """
+
+        return EmailOutbox.get_status_counts()
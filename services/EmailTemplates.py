@@ -0,0 +1,125 @@
+import os
+import tempfile
+import threading
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, StrictUndefined
+
+
+class EmailTemplates:
+    """
+    Localized plain-text email templates.
+    Every email has one Jinja template per locale in `templates/emails/<locale>/<name>.txt`
+    defining a `subject` and a `body` block. Locales are the UI language codes, i.e. the
+    names of the translation files in `static/json` ('en', 'sk'); unknown locales fall back
+    to DEFAULT_LOCALE. The Jinja environment is created once per process, compiled templates
+    are kept in memory, and their bytecode is cached on disk (EMAIL_TEMPLATE_CACHE_DIR) so
+    new processes skip compilation too.
+    """
+
+    TEMPLATES_FOLDER = os.path.join('templates', 'emails')
+    LOCALES_FOLDER = os.path.join('static', 'json')
+    DEFAULT_LOCALE = 'en'
+    CACHE_DIR = os.getenv("EMAIL_TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), 'pia-email-templates'))
+
+    _env = None
+    _env_lock = threading.Lock()
+    _locales = None
+
+
+    @staticmethod
+    def _get_env() -> Environment:
+        """Return the shared Jinja environment, creating it on first use."""
+
+        with EmailTemplates._env_lock:
+            if EmailTemplates._env is None:
+                os.makedirs(EmailTemplates.CACHE_DIR, exist_ok=True)
+                EmailTemplates._env = Environment(
+                    loader=FileSystemLoader(EmailTemplates.TEMPLATES_FOLDER),
+                    bytecode_cache=FileSystemBytecodeCache(EmailTemplates.CACHE_DIR),
+                    undefined=StrictUndefined,
+                    autoescape=False,
+                    auto_reload=False,
+                    cache_size=-1,
+                )
+            return EmailTemplates._env
+
+
+    @staticmethod
+    def supported_locales() -> set:
+        """
+        Return the supported locale codes, i.e. the names of the UI translation files.
+        Returns:
+            set[str]: Locale codes such as {'en', 'sk'}.
+        """
+
+        if EmailTemplates._locales is None:
+            EmailTemplates._locales = {
+                os.path.splitext(filename)[0]
+                for filename in os.listdir(EmailTemplates.LOCALES_FOLDER)
+                if filename.endswith('.json')
+            }
+        return EmailTemplates._locales
+
+
+    @staticmethod
+    def resolve_locale(locale: str) -> str:
+        """
+        Map a requested locale to a supported one.
+        Parameters:
+            locale (str | None): Requested locale code, e.g. 'sk' or 'SK'.
+        Returns:
+            str: The locale if supported, otherwise DEFAULT_LOCALE.
+        """
+
+        locale = (locale or '').strip().lower()
+        return locale if locale in EmailTemplates.supported_locales() else EmailTemplates.DEFAULT_LOCALE
+
+
+    @staticmethod
+    def render(name: str, locale: str = None, **context) -> tuple[str, str]:
+        """
+        Render one email.
+        Parameters:
+            name (str): Template name without extension, e.g. 'translation_accepted'.
+            locale (str | None): Recipient locale; unsupported values use DEFAULT_LOCALE.
+            **context: Template variables.
+        Returns:
+            tuple[str, str]: The rendered (subject, body).
+        Raises:
+            jinja2.TemplateNotFound: If no such template exists.
+            jinja2.UndefinedError: If the template uses a variable missing from `context`.
+        """
+
+        return EmailTemplates.render_many(name, [(locale, context)])[0]
+
+
+    @staticmethod
+    def render_many(name: str, items: list) -> list:
+        """
+        Render the same email for many recipients, e.g. when digests or broadcasts fan out.
+        Each locale's template is looked up once for the whole batch.
+        Parameters:
+            name (str): Template name without extension.
+            items (list[tuple[str | None, dict]]): One (locale, context) pair per message.
+        Returns:
+            list[tuple[str, str]]: (subject, body) per item, in the order of `items`.
+        Raises:
+            jinja2.TemplateNotFound: If the template does not exist for a requested locale.
+            jinja2.UndefinedError: If a context lacks a variable used by the template.
+        """
+
+        env = EmailTemplates._get_env()
+        templates = {}
+        rendered = []
+
+        for locale, context in items:
+            locale = EmailTemplates.resolve_locale(locale)
+            template = templates.get(locale)
+            if template is None:
+                template = templates[locale] = env.get_template(f"{locale}/{name}.txt")
+
+            ctx = template.new_context(context)
+            subject = "".join(template.blocks['subject'](ctx)).strip()
+            body = "".join(template.blocks['body'](ctx)).strip()
+            rendered.append((subject, body))
+
+        return rendered
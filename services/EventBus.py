@@ -0,0 +1,153 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from models.db import db
+
+
+@dataclass(frozen=True)
+class ProjectEvent:
+    """
+    Base class of project lifecycle events.
+    Attributes:
+        project_id (str): The project the event is about.
+        from_state (str | None): Project state before the transition, None for a new project.
+        to_state (str): Project state after the transition.
+        actor_id (str | None): User who caused the transition, None for system actions.
+        occurred_at (datetime): When the event was published.
+    """
+
+    project_id: str
+    from_state: str
+    to_state: str
+    actor_id: str = None
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class ProjectCreated(ProjectEvent):
+    customer_id: str = None
+    language: str = None
+    due_at: datetime = None
+
+
+@dataclass(frozen=True)
+class TranslatorAssigned(ProjectEvent):
+    translator_id: str = None
+
+
+@dataclass(frozen=True)
+class TranslationUploaded(ProjectEvent):
+    translator_id: str = None
+
+
+@dataclass(frozen=True)
+class ProjectApproved(ProjectEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class ProjectRejected(ProjectEvent):
+    feedback: str = None
+
+
+@dataclass(frozen=True)
+class ProjectClosed(ProjectEvent):
+    pass
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus for project lifecycle events.
+    Events published inside `db.transaction()` are delivered only after the transaction
+    commits and are dropped on rollback, so subscribers never see a change that did not
+    happen. Subscribers registered for a class also receive events of its subclasses, i.e.
+    subscribing to ProjectEvent receives every event. Synchronous subscribers run in the
+    publishing thread right after the commit; asynchronous ones run on a shared thread pool
+    (EVENT_BUS_WORKERS threads, default 4) and are meant for slow side effects that should
+    not delay the request. A failing subscriber is logged and does not affect the others.
+    """
+
+    WORKERS = int(os.getenv("EVENT_BUS_WORKERS", "4"))
+
+    _subscribers = []
+    _lock = threading.Lock()
+    _executor = None
+
+
+    @staticmethod
+    def subscribe(event_type: type, handler, asynchronous: bool = False) -> None:
+        """
+        Register a handler for an event class and its subclasses.
+        Parameters:
+            event_type (type[ProjectEvent]): Event class to listen to.
+            handler (Callable[[ProjectEvent], None]): Called with each matching event.
+            asynchronous (bool): Run the handler on the thread pool instead of the publishing thread.
+        Raises:
+            ValueError: If `event_type` is not a ProjectEvent class or `handler` is not callable.
+        """
+
+        if not isinstance(event_type, type) or not issubclass(event_type, ProjectEvent):
+            raise ValueError("Event type must be a ProjectEvent class.")
+
+        if not callable(handler):
+            raise ValueError("Handler must be callable.")
+
+        with EventBus._lock:
+            EventBus._subscribers = EventBus._subscribers + [(event_type, handler, asynchronous)]
+
+
+    @staticmethod
+    def unsubscribe(event_type: type, handler) -> None:
+        """Remove every registration of `handler` for `event_type`."""
+
+        with EventBus._lock:
+            EventBus._subscribers = [
+                entry for entry in EventBus._subscribers
+                if entry[0] is not event_type or entry[1] != handler
+            ]
+
+
+    @staticmethod
+    def publish(event: ProjectEvent) -> None:
+        """
+        Publish an event. Inside a transaction, delivery waits for the commit.
+        Parameters:
+            event (ProjectEvent): The event to deliver.
+        """
+
+        db.on_commit(lambda: EventBus._dispatch(event))
+
+
+    @staticmethod
+    def _dispatch(event: ProjectEvent) -> None:
+        """Deliver an event to its subscribers."""
+
+        for event_type, handler, asynchronous in EventBus._subscribers:
+            if not isinstance(event, event_type):
+                continue
+            if asynchronous:
+                EventBus._get_executor().submit(EventBus._call, handler, event)
+            else:
+                EventBus._call(handler, event)
+
+
+    @staticmethod
+    def _call(handler, event: ProjectEvent) -> None:
+        """Run one handler, logging instead of raising its errors."""
+
+        try:
+            handler(event)
+        except Exception as e:
+            print(f"[EventBus.py] Subscriber {getattr(handler, '__name__', handler)} failed on {type(event).__name__} for project {event.project_id}: {e}", flush=True)
+
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        """Return the shared thread pool for asynchronous subscribers, creating it on first use."""
+
+        with EventBus._lock:
+            if EventBus._executor is None:
+                EventBus._executor = ThreadPoolExecutor(max_workers=EventBus.WORKERS, thread_name_prefix="event-bus")
+            return EventBus._executor
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import time
+from functools import wraps
+from flask import Response, current_app, jsonify, request, session
+from models.IdempotencyKey import IdempotencyKey, IdempotencyStatus
+
+
+class IdempotencyService:
+    """
+    Idempotency-Key support for endpoints whose retries must not repeat their side effects.
+    The first request with a key runs and its response is recorded; a retry with the same key and
+    the same request is answered with the recorded response, and a concurrent duplicate waits for
+    the first request to finish instead of running alongside it. Configuration (environment variables):
+    - IDEMPOTENCY_TTL_SECONDS: How long a recorded response is replayed (default 86400).
+    - IDEMPOTENCY_LOCK_SECONDS: How long an unfinished request holds its key (default 300).
+    - IDEMPOTENCY_WAIT_SECONDS: How long a duplicate waits for the first request (default 30).
+    """
+
+    TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "300"))
+    WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "30"))
+    MAX_KEY_LENGTH = 255
+    HASH_CHUNK_SIZE = 64 * 1024
+
+
+    @staticmethod
+    def request_fingerprint(req) -> str:
+        """
+        Hash everything that defines the request, so a key reused for a different request is detected.
+        Uploaded files are hashed from their stream, which is rewound afterwards for the handler.
+        Parameters:
+            req (flask.Request): The incoming request.
+        Returns:
+            str: Hex SHA-256 of the method, path, query, form fields and uploaded files.
+        """
+
+        digest = hashlib.sha256()
+        digest.update(f"{req.method} {req.path}?{req.query_string.decode()}\n".encode())
+
+        for name in sorted(req.form):
+            for value in req.form.getlist(name):
+                digest.update(f"form:{name}={value}\n".encode())
+
+        for name in sorted(req.files):
+            for upload in req.files.getlist(name):
+                digest.update(f"file:{name}={upload.filename}\n".encode())
+                for chunk in iter(lambda: upload.stream.read(IdempotencyService.HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                upload.stream.seek(0)
+
+        if not req.files and not req.form:
+            digest.update(req.get_data())
+
+        return digest.hexdigest()
+
+
+    @staticmethod
+    def execute(user_id: str, key: str, request_hash: str, handler) -> tuple:
+        """
+        Run `handler` at most once per (user, key).
+        Responses below 500 are recorded and replayed for retries. Server errors and exceptions
+        release the key, so the client can retry the request.
+        Parameters:
+            user_id (str): The user sending the request.
+            key (str): The Idempotency-Key header value.
+            request_hash (str): Fingerprint of the request.
+            handler (Callable[[], tuple[str, int]]): Processes the request; returns (body, status).
+        Returns:
+            tuple[str, int, bool]: Response body, HTTP status and whether it was replayed.
+        Raises:
+            ValueError: If the key is invalid or the reservation could not be stored.
+        """
+
+        if not key or len(key) > IdempotencyService.MAX_KEY_LENGTH:
+            raise ValueError(f"Idempotency-Key must be 1 to {IdempotencyService.MAX_KEY_LENGTH} characters long.")
+
+        deadline = time.monotonic() + IdempotencyService.WAIT_SECONDS
+        delay = 0.05
+
+        while True:
+            if IdempotencyKey.reserve(user_id, key, request_hash, IdempotencyService.LOCK_SECONDS):
+                try:
+                    body, status = handler()
+                except Exception:
+                    IdempotencyKey.release(user_id, key)
+                    raise
+
+                if status >= 500:
+                    IdempotencyKey.release(user_id, key)
+                else:
+                    IdempotencyKey.complete(user_id, key, status, body, IdempotencyService.TTL_SECONDS)
+                return body, status, False
+
+            record = IdempotencyKey.get(user_id, key)
+
+            # The record expired between reserve and get: try to reserve it again.
+            if record is None:
+                continue
+
+            if record['requestHash'] != request_hash:
+                return '{"error": "Idempotency-Key was already used for a different request."}', 422, False
+
+            if record['status'] == IdempotencyStatus.COMPLETED.value:
+                return record['responseBody'], record['responseStatus'], True
+
+            if time.monotonic() >= deadline:
+                print(f"[IdempotencyService.py] Gave up waiting for the first request with key {key} of user {user_id}.", flush=True)
+                return '{"error": "A request with this Idempotency-Key is still being processed."}', 409, False
+
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+
+    @staticmethod
+    def purge_expired() -> int:
+        """
+        Delete keys whose responses are no longer replayed.
+        Returns:
+            int: Number of deleted keys.
+        """
+
+        return IdempotencyKey.purge_expired()
+
+
+def idempotent(f):
+    """
+    Decorator that honours the Idempotency-Key request header on a JSON API endpoint.
+    Requests without the header run as usual. Apply it below `login_required_api`, since keys
+    are scoped to the session user. Replayed responses carry an `Idempotent-Replayed: true` header.
+
+    Parameters:
+        f (Callable): The view function to wrap.
+
+    Returns:
+        Callable: The wrapped view function.
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get('Idempotency-Key')
+        if key is None:
+            return f(*args, **kwargs)
+
+        def handler():
+            response = current_app.make_response(f(*args, **kwargs))
+            return response.get_data(as_text=True), response.status_code
+
+        try:
+            body, status, replayed = IdempotencyService.execute(
+                session['user']['user_id'], key.strip(), IdempotencyService.request_fingerprint(request), handler
+            )
+        except ValueError as e:
+            print(f"[IdempotencyService.py] Idempotent request failed: {e}", flush=True)
+            return jsonify({'error': str(e)}), 400
+
+        response = Response(body, status=status, mimetype='application/json')
+        if replayed:
+            response.headers['Idempotent-Replayed'] = 'true'
+        return response
+    return wrapper
@@ -0,0 +1,212 @@
+import json
+import os
+import random
+import threading
+import time
+from models.Job import Job
+
+
+class JobQueue:
+    """
+    Background jobs backed by the Jobs table.
+    Services register a handler per job type with `register` and queue work with `enqueue`;
+    worker processes (`python -m bin.job_worker`) claim due jobs in batches and run them outside
+    the request thread. Queuing inside `db.transaction()` makes the job part of the transaction.
+    A failing job is retried with exponential backoff and dead-lettered after its attempts are
+    used up. Configuration (environment variables):
+    - JOB_MAX_ATTEMPTS: Default attempts per job (default 5).
+    - JOB_RETRY_BASE_SECONDS / JOB_RETRY_MAX_SECONDS: Backoff between attempts (default 10 / 3600).
+    - JOB_VISIBILITY_TIMEOUT_SECONDS: How long a claimed job is reserved for its worker (default 300).
+    - JOB_BATCH_SIZE: Jobs claimed per round (default 20).
+    """
+
+    MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+    RETRY_BASE_SECONDS = int(os.getenv("JOB_RETRY_BASE_SECONDS", "10"))
+    RETRY_MAX_SECONDS = int(os.getenv("JOB_RETRY_MAX_SECONDS", "3600"))
+    VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300"))
+    BATCH_SIZE = int(os.getenv("JOB_BATCH_SIZE", "20"))
+    MAX_TYPE_LENGTH = 64
+
+    _handlers = {}
+    _lock = threading.Lock()
+
+
+    @staticmethod
+    def register(job_type: str, handler=None):
+        """
+        Register the handler that runs jobs of `job_type`. Usable as a decorator.
+        Parameters:
+            job_type (str): Job type name, e.g. 'projects.reassign_stalled'.
+            handler (Callable[[dict], None] | None): Called with the job payload. Raising marks the
+                attempt as failed.
+        Returns:
+            The handler, or a decorator registering it when `handler` is omitted.
+        Raises:
+            ValueError: If `job_type` is invalid or already registered to another handler.
+        """
+
+        if not job_type or not isinstance(job_type, str) or len(job_type) > JobQueue.MAX_TYPE_LENGTH:
+            raise ValueError("Job type must be a non-empty string of at most 64 characters.")
+
+        if handler is None:
+            return lambda fn: JobQueue.register(job_type, fn)
+
+        with JobQueue._lock:
+            existing = JobQueue._handlers.get(job_type)
+            if existing is not None and existing is not handler:
+                raise ValueError(f"A handler for job type {job_type} is already registered.")
+            JobQueue._handlers[job_type] = handler
+
+        return handler
+
+
+    @staticmethod
+    def registered_types() -> list:
+        """Return the job types this process can run."""
+
+        return sorted(JobQueue._handlers)
+
+
+    @staticmethod
+    def enqueue(job_type: str, payload: dict = None, priority: int = 0, delay_seconds: int = 0, max_attempts: int = None) -> str:
+        """
+        Queue a job for a background worker.
+        Parameters:
+            job_type (str): Registered job type.
+            payload (dict | None): JSON-serializable handler arguments.
+            priority (int): Higher values run first (-32768..32767).
+            delay_seconds (int): Seconds before the job may run.
+            max_attempts (int | None): Attempts before the job is dead-lettered. Defaults to MAX_ATTEMPTS.
+        Returns:
+            str: The id of the queued job.
+        Raises:
+            ValueError: If the job type is unknown, an argument is invalid or the job could not be stored.
+        """
+
+        if job_type not in JobQueue._handlers:
+            print(f"[JobQueue.py] Unknown job type: {job_type}", flush=True)
+            raise ValueError(f"Unknown job type: {job_type}.")
+
+        if payload is not None and not isinstance(payload, dict):
+            raise ValueError("Job payload must be a dictionary.")
+
+        try:
+            json.dumps(payload or {})
+        except (TypeError, ValueError):
+            raise ValueError("Job payload must be JSON-serializable.")
+
+        if not isinstance(priority, int) or not -32768 <= priority <= 32767:
+            raise ValueError("Priority must be an integer between -32768 and 32767.")
+
+        if not isinstance(delay_seconds, int) or delay_seconds < 0:
+            raise ValueError("Delay must be a non-negative number of seconds.")
+
+        max_attempts = JobQueue.MAX_ATTEMPTS if max_attempts is None else max_attempts
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("Max attempts must be a positive integer.")
+
+        return Job.enqueue(job_type, payload, priority, delay_seconds, max_attempts)
+
+
+    @staticmethod
+    def retry_delay(attempts: int) -> int:
+        """
+        Seconds to wait before the next attempt: RETRY_BASE_SECONDS doubled per failed attempt,
+        capped at RETRY_MAX_SECONDS and jittered down by up to half.
+        Parameters:
+            attempts (int): Number of attempts made so far (at least 1).
+        Returns:
+            int: The delay in seconds.
+        """
+
+        delay = min(JobQueue.RETRY_BASE_SECONDS * 2 ** (attempts - 1), JobQueue.RETRY_MAX_SECONDS)
+        return max(1, int(delay * random.uniform(0.5, 1.0)))
+
+
+    @staticmethod
+    def run_batch(batch_size: int = None, job_types: list = None) -> dict:
+        """
+        Claim one batch of due jobs and run them in this thread.
+        Only job types registered in this process are claimed. Successful jobs are marked DONE
+        together with one UPDATE at the end of the batch; failures are rescheduled with
+        `retry_delay` or dead-lettered once the job's attempts are used up.
+        Parameters:
+            batch_size (int | None): Maximum number of jobs to claim. Defaults to BATCH_SIZE.
+            job_types (list[str] | None): Restrict the worker to these types. Defaults to all registered types.
+        Returns:
+            dict: Counts of jobs 'done', 'retried' and 'dead' in this round.
+        Raises:
+            ValueError: If the batch could not be claimed.
+        """
+
+        outcome = {'done': 0, 'retried': 0, 'dead': 0}
+        job_types = job_types or JobQueue.registered_types()
+        if not job_types:
+            return outcome
+
+        jobs = Job.claim_batch(batch_size or JobQueue.BATCH_SIZE, JobQueue.VISIBILITY_TIMEOUT_SECONDS, job_types)
+
+        done = []
+        for job in jobs:
+            started = time.monotonic()
+            try:
+                JobQueue._handlers[job['type']](job['payload'])
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                if job['attempts'] >= job['maxAttempts']:
+                    print(f"[JobQueue.py] Giving up on {job['type']} job {job['id']} after {job['attempts']} attempts: {error}", flush=True)
+                    Job.mark_failed(job['id'], error)
+                    outcome['dead'] += 1
+                else:
+                    delay = JobQueue.retry_delay(job['attempts'])
+                    print(f"[JobQueue.py] {job['type']} job {job['id']} failed, retrying in {delay}s: {error}", flush=True)
+                    Job.mark_failed(job['id'], error, delay)
+                    outcome['retried'] += 1
+                continue
+
+            done.append(job['id'])
+            if time.monotonic() - started > JobQueue.VISIBILITY_TIMEOUT_SECONDS / 2:
+                # Later jobs of the batch would otherwise outlive their reservation; mark progress now.
+                Job.mark_done(done)
+                outcome['done'] += len(done)
+                done = []
+
+        Job.mark_done(done)
+        outcome['done'] += len(done)
+
+        return outcome
+
+
+    @staticmethod
+    def release_expired() -> int:
+        """
+        Requeue jobs whose worker vanished before finishing them; see `Job.release_expired`.
+        Returns:
+            int: Number of reclaimed jobs.
+        """
+
+        return Job.release_expired()
+
+
+    @staticmethod
+    def get_job(job_id: str) -> dict:
+        """
+        Report the state of one job.
+        Parameters:
+            job_id (str): The id returned by `enqueue`.
+        Returns:
+            dict | None: The job, see `Job.get`, or None if it does not exist.
+        """
+
+        return Job.get(job_id)
+
+
+    @staticmethod
+    def get_stats() -> dict:
+        """
+        Report the job backlog.
+        Returns:
+            dict[str, int]: Number of jobs per status.
+        """
+
+        return Job.get_status_counts()
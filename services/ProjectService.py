@@ -1,9 +1,22 @@
 import os
+import uuid
+from datetime import datetime, timedelta
 from models.Project import Project, ProjectState
+from models.db import db
 from werkzeug.datastructures import FileStorage as _WSFileStorage
 from bin.helper import MAX_FILE_SIZE_MB
+from models.User import UserRole
 from services.UserService import UserService
 from services.EmailService import EmailService
+from services.TranslatorDirectory import TranslatorDirectory
+from services.TranslatorRanking import TranslatorRanking
+from services.JobQueue import JobQueue
+from services.EventBus import (
+    EventBus, ProjectCreated, TranslatorAssigned, TranslationUploaded,
+    ProjectApproved, ProjectRejected, ProjectClosed,
+)
+import services.AuditLog  # noqa: F401  (records every published transition)
+import services.TurnaroundAnalytics  # noqa: F401  (keeps turnaround rollups up to date)
 
 ALLOWED_TRANSITIONS = {
     ProjectState.ASSIGNED: [ProjectState.COMPLETED],
@@ -12,19 +25,43 @@ ALLOWED_TRANSITIONS = {
     ProjectState.APPROVED: [ProjectState.CLOSED],
 }
 
+REASSIGN_STALLED_JOB = 'projects.reassign_stalled'
+
+STATE_EVENTS = {
+    ProjectState.COMPLETED: TranslationUploaded,
+    ProjectState.APPROVED: ProjectApproved,
+    ProjectState.REJECTED: ProjectRejected,
+    ProjectState.CLOSED: ProjectClosed,
+}
+
+# Target states of bulk transitions and the notification sent to each project's translator.
+# Approving stays with the owning customer (see update_project_status), so admins can only close.
+BULK_TRANSITION_TEMPLATES = {
+    ProjectState.CLOSED: 'project_closed',
+}
+
 class ProjectService:
 
     PROJECTS_FOLDER = 'projects/'
     ORIGINAL_FILES_FOLDER = os.path.join(PROJECTS_FOLDER, 'original_files/')
     TRANSLATED_FILES_FOLDER = os.path.join(PROJECTS_FOLDER, 'translated_files/')
     FILENAME_SEPARATOR = '_'
+    MAX_BULK_PROJECTS = int(os.getenv("MAX_BULK_PROJECTS", "1000"))
+    MAX_BATCH_FILES = int(os.getenv("PROJECT_BATCH_MAX_FILES", "200"))
+    UPLOAD_CHUNK_SIZE = 64 * 1024
+    STALL_SLA_SECONDS = int(float(os.getenv("PROJECT_STALL_SLA_HOURS", "72")) * 3600)
+    STALL_SWEEP_BATCH_SIZE = int(os.getenv("PROJECT_STALL_SWEEP_BATCH_SIZE", "100"))
+    STALL_STATES = (ProjectState.ASSIGNED, ProjectState.REJECTED)
+    DEADLINE_STATES = (ProjectState.CREATED, ProjectState.ASSIGNED, ProjectState.REJECTED)
+    MAX_DUE_SOON_HOURS = 24 * 365
 
     os.makedirs(PROJECTS_FOLDER, exist_ok=True)
     os.makedirs(ORIGINAL_FILES_FOLDER, exist_ok=True)
     os.makedirs(TRANSLATED_FILES_FOLDER, exist_ok=True)
 
     @staticmethod
-    def create_project(customer_id: str, project_name: str, description: str, target_language: str, source_file: _WSFileStorage) -> Project:
+    def create_project(customer_id: str, project_name: str, description: str, target_language: str, source_file: _WSFileStorage,
+                       due_at: datetime = None) -> Project:
         """
         Create a new translation project for a customer, persist the uploaded source file,
         and attempt to auto-assign a translator based on the target language.
@@ -35,12 +72,13 @@ class ProjectService:
             target_language (str): Language code or name the project should be translated into. Must be a non-empty string.
             source_file (_WSFileStorage): Uploaded file object containing the source content to translate. Must be provided
                 and its size must not exceed MAX_FILE_SIZE_MB.
+            due_at (datetime | None): Optional deadline of the translation, in the future. Tracked by DeadlineWatcher.
         Returns:
-            Project: The newly created Project instance. If a translator is available for the target language,
-            the translator is assigned; otherwise, the project state is set to CLOSED.
+            Project: The newly created Project instance. If translators are available for the target language,
+            the best-ranked one (see TranslatorRanking) is assigned; otherwise, the project state is set to CLOSED.
         Raises:
             ValueError: If any of the required string parameters are missing/invalid, if the source_file is not provided,
-            or if the source_file exceeds the maximum allowed size.
+            if the source_file exceeds the maximum allowed size, or if due_at is not a future datetime.
         """
 
         if not customer_id or not isinstance(customer_id, str):
@@ -67,35 +105,306 @@ class ProjectService:
             print(f"[ProjectService.py] Source file exceeds maximum size: {source_file.content_length} bytes", flush=True)
             raise ValueError(f"Source file exceeds the maximum allowed size of {MAX_FILE_SIZE_MB} MB.")
 
+        ProjectService._validate_due_at(due_at)
+
+        # Resolved first, so a failed directory load leaves no unassigned project behind.
+        candidates = TranslatorDirectory.get_translator_ids(target_language)
+
         filename = str(customer_id) + ProjectService.FILENAME_SEPARATOR + source_file.filename
         file_path = os.path.join(ProjectService.ORIGINAL_FILES_FOLDER, filename)
 
         source_file.save(file_path)
 
-        project = Project.create_project(customer_id, project_name, description, target_language, filename)
+        project = Project.create_project(customer_id, project_name, description, target_language, filename, due_at)
+        with db.transaction():
+            EventBus.publish(ProjectCreated(
+                str(project.id), None, ProjectState.CREATED.value, actor_id=customer_id,
+                customer_id=customer_id, language=target_language, due_at=due_at
+            ))
+
+            translator_id = Project.assign_best_translator(project.id, candidates, TranslatorRanking.rank)
+            if translator_id:
+                print(f"[ProjectService.py] Assigned translator {translator_id} to project {project.id}", flush=True)
+                translator = UserService.get_user_contact(translator_id)
+                EventBus.publish(TranslatorAssigned(
+                    str(project.id), ProjectState.CREATED.value, ProjectState.ASSIGNED.value, translator_id=translator_id
+                ))
+
+                EmailService.notify_user(
+                    translator,
+                    'project_assigned',
+                    project_name=project_name,
+                    target_language=target_language
+                )
+            else:
+                print(f"[ProjectService.py] No translators available for language: {target_language}", flush=True)
+                project.update_state(project.id, ProjectState.CLOSED.value)
+                EventBus.publish(ProjectClosed(str(project.id), ProjectState.CREATED.value, ProjectState.CLOSED.value))
 
-        translators = UserService.get_translators_by_language(target_language)
-        if translators:
-            translator = translators[0]
-            print(f"[ProjectService.py] Assigning translator {translator.id} to project {project.id}", flush=True)
-            Project.assign_translator(project.id, translator.id)
+                EmailService.notify_user(
+                    UserService.get_user_contact(customer_id),
+                    'project_closed_no_translator',
+                    project_name=project_name,
+                    target_language=target_language
+                )
 
-            EmailService.send_email(
-                email=translator.email,
-                subject=f"New translation project assigned: {project_name}",
-                body=f"You have been assigned to translate the project '{project_name}' into {target_language}."
-            )
-        else:
-            print(f"[ProjectService.py] No translators available for language: {target_language}", flush=True)
-            project.update_state(project.id, ProjectState.CLOSED.value)
+        return project
 
-            EmailService.send_email(
-                email=UserService.get_user_by_id(customer_id).email,
-                subject=f"Project closed: {project_name}",
-                body=f"Your project '{project_name}' has been closed due to no available translators for the target language '{target_language}'."
-            )
+    @staticmethod
+    def create_projects(customer_id: str, description: str, entries: list) -> list:
+        """
+        Create many translation projects for a customer from one multipart request.
+        Every source file is streamed to storage in chunks, all projects are inserted with one
+        multi-row INSERT, and translators are resolved for all target languages together and
+        spread across each language's candidates (see `_assign_new_projects`). Projects of a
+        language nobody translates are closed. Notifications are queued in bulk. The intake is
+        all or nothing: if any file is invalid or the INSERT fails, no project is created and
+        the stored files are removed.
+        Parameters:
+            customer_id (str): Unique identifier of the customer creating the projects.
+            description (str): Description shared by all projects. Must be a non-empty string.
+            entries (list[tuple[str, str, _WSFileStorage]]): (project_name, target_language,
+                source_file) per project, at most MAX_BATCH_FILES.
+        Returns:
+            list[Project]: The created projects, in the order of `entries`, with their final
+            state and translator.
+        Raises:
+            ValueError: If any input is invalid, a file exceeds MAX_FILE_SIZE_MB, or the projects
+                could not be stored.
+        """
+
+        if not customer_id or not isinstance(customer_id, str):
+            print(f"[ProjectService.py] Invalid customer_id provided: {customer_id}", flush=True)
+            raise ValueError("Customer ID must be a valid non-empty string.")
+
+        if not description or not isinstance(description, str):
+            print(f"[ProjectService.py] Invalid description provided: {description}", flush=True)
+            raise ValueError("Description must be a valid non-empty string.")
+
+        if not entries:
+            raise ValueError("At least one source file is required.")
+
+        if len(entries) > ProjectService.MAX_BATCH_FILES:
+            raise ValueError(f"At most {ProjectService.MAX_BATCH_FILES} files can be submitted at once.")
+
+        filenames = set()
+        for project_name, target_language, source_file in entries:
+            if not project_name or not isinstance(project_name, str):
+                raise ValueError("Project name must be a valid non-empty string.")
+            if not target_language or not isinstance(target_language, str):
+                raise ValueError("Target language must be a valid non-empty string.")
+            if source_file is None or not source_file.filename:
+                raise ValueError("Source file is required.")
+            if source_file.filename in filenames:
+                raise ValueError(f"File {source_file.filename} is submitted more than once.")
+            filenames.add(source_file.filename)
+
+        stored = []
+        try:
+            records = []
+            for project_name, target_language, source_file in entries:
+                filename = ProjectService._upload_filename(customer_id, source_file.filename)
+                file_path = os.path.join(ProjectService.ORIGINAL_FILES_FOLDER, filename)
+                ProjectService._store_upload(source_file, file_path)
+                stored.append(file_path)
+                records.append((project_name, description, target_language, filename))
+
+            with db.transaction():
+                projects = Project.create_many(customer_id, records)
+                ProjectService._assign_new_projects(customer_id, projects)
+        except Exception:
+            ProjectService._remove_files(stored)
+            raise
+
+        return projects
+
+
+    @staticmethod
+    def create_projects_for_languages(customer_id: str, project_name: str, description: str,
+                                      target_languages: list, source_file: _WSFileStorage, due_at: datetime = None) -> list:
+        """
+        Create one project per target language from a single uploaded document.
+        The source file is stored once and every project references it. The projects are
+        inserted with one multi-row INSERT and assigned in the same transaction; the candidate
+        translators of all languages are resolved from the translator directory together and
+        locked and ranked with one query each (see `Project.assign_best_translators_by_language`).
+        Projects of a language nobody translates are closed.
+        Parameters:
+            customer_id (str): Unique identifier of the customer creating the projects.
+            project_name (str): Name shared by the projects. Must be a non-empty string.
+            description (str): Description shared by the projects. Must be a non-empty string.
+            target_languages (list[str]): Target language codes; duplicates are ignored.
+            source_file (_WSFileStorage): The document to translate, at most MAX_FILE_SIZE_MB.
+            due_at (datetime | None): Optional deadline shared by the projects, in the future.
+        Returns:
+            list[Project]: One project per distinct language, in request order, with its final
+            state and translator.
+        Raises:
+            ValueError: If any input is invalid, the file is too large, or the projects could not
+                be stored. Nothing is created in that case.
+        """
+
+        if not customer_id or not isinstance(customer_id, str):
+            print(f"[ProjectService.py] Invalid customer_id provided: {customer_id}", flush=True)
+            raise ValueError("Customer ID must be a valid non-empty string.")
+
+        if not project_name or not isinstance(project_name, str):
+            print(f"[ProjectService.py] Invalid project_name provided: {project_name}", flush=True)
+            raise ValueError("Project name must be a valid non-empty string.")
+
+        if not description or not isinstance(description, str):
+            print(f"[ProjectService.py] Invalid description provided: {description}", flush=True)
+            raise ValueError("Description must be a valid non-empty string.")
+
+        if not isinstance(target_languages, list) or not target_languages or not all(isinstance(lang, str) and lang for lang in target_languages):
+            print(f"[ProjectService.py] Invalid target_languages provided: {target_languages}", flush=True)
+            raise ValueError("Target languages must be a non-empty list of language codes.")
+
+        target_languages = list(dict.fromkeys(target_languages))
+        if len(target_languages) > ProjectService.MAX_BATCH_FILES:
+            raise ValueError(f"At most {ProjectService.MAX_BATCH_FILES} languages can be requested at once.")
+
+        if source_file is None or not source_file.filename:
+            print(f"[ProjectService.py] Source file is required.", flush=True)
+            raise ValueError("Source file is required.")
+
+        ProjectService._validate_due_at(due_at)
+
+        filename = ProjectService._upload_filename(customer_id, source_file.filename)
+        file_path = os.path.join(ProjectService.ORIGINAL_FILES_FOLDER, filename)
+
+        try:
+            ProjectService._store_upload(source_file, file_path)
+
+            with db.transaction():
+                projects = Project.create_many(customer_id, [
+                    (project_name, description, language, filename) for language in target_languages
+                ], due_at)
+                ProjectService._assign_new_projects(customer_id, projects)
+        except Exception:
+            ProjectService._remove_files([file_path])
+            raise
+
+        return projects
+
+
+    @staticmethod
+    def _assign_new_projects(customer_id: str, projects: list) -> None:
+        """
+        Assign freshly created projects to translators, balanced per language, close the ones
+        without candidates and queue the notifications. Runs inside the caller's transaction
+        and updates the given Project objects in place.
+        """
+
+        by_language = {}
+        for project in projects:
+            by_language.setdefault(project.language, []).append(project)
+
+        candidates = TranslatorDirectory.get_translator_ids_by_language(list(by_language))
+        assignments = Project.assign_best_translators_by_language(
+            [([p.id for p in language_projects], candidates[language]) for language, language_projects in by_language.items()],
+            TranslatorRanking.rank
+        )
+
+        assigned, unassigned = [], []
+        for project in projects:
+            EventBus.publish(ProjectCreated(
+                str(project.id), None, ProjectState.CREATED.value, actor_id=customer_id,
+                customer_id=customer_id, language=project.language, due_at=project.due_at
+            ))
+
+            translator_id = assignments.get(project.id)
+            if translator_id:
+                project.translator_id = translator_id
+                project.state = ProjectState.ASSIGNED
+                assigned.append(project)
+                EventBus.publish(TranslatorAssigned(
+                    str(project.id), ProjectState.CREATED.value, ProjectState.ASSIGNED.value, translator_id=translator_id
+                ))
+            else:
+                project.state = ProjectState.CLOSED
+                unassigned.append(project)
+                EventBus.publish(ProjectClosed(str(project.id), ProjectState.CREATED.value, ProjectState.CLOSED.value))
+
+        Project.update_states([p.id for p in unassigned], ProjectState.CLOSED.value)
+
+        contacts = UserService.get_user_contacts([p.translator_id for p in assigned] + ([customer_id] if unassigned else []))
+        EmailService.notify_users('project_assigned', [
+            (contacts[p.translator_id], {'project_name': p.name, 'target_language': p.language})
+            for p in assigned if p.translator_id in contacts
+        ])
+        if customer_id in contacts:
+            EmailService.notify_users('project_closed_no_translator', [
+                (contacts[customer_id], {'project_name': p.name, 'target_language': p.language})
+                for p in unassigned
+            ])
+
+        print(f"[ProjectService.py] Created {len(projects)} projects for customer {customer_id}: {len(assigned)} assigned, {len(unassigned)} closed.", flush=True)
+
+
+    @staticmethod
+    def _upload_filename(customer_id: str, filename: str) -> str:
+        """
+        Storage name of an uploaded source file, unique per upload so that a new intake never
+        overwrites, or on failure removes, a file an existing project references. The part after
+        the first FILENAME_SEPARATOR is still the name the customer uploaded.
+        """
+
+        return f"{customer_id}-{uuid.uuid4().hex}{ProjectService.FILENAME_SEPARATOR}{filename}"
+
+
+    @staticmethod
+    def _remove_files(file_paths: list) -> None:
+        """Delete stored uploads after a failed intake."""
+
+        for file_path in file_paths:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+    @staticmethod
+    def _store_upload(upload: _WSFileStorage, file_path: str) -> None:
+        """
+        Copy an uploaded file to `file_path` in UPLOAD_CHUNK_SIZE chunks, enforcing MAX_FILE_SIZE_MB
+        on the bytes actually received (multipart parts usually carry no length of their own).
+        Raises:
+            ValueError: If the file exceeds MAX_FILE_SIZE_MB; the partial file is removed.
+        """
+
+        limit = MAX_FILE_SIZE_MB * 1024 * 1024
+        written = 0
+
+        with open(file_path, 'wb') as target:
+            while True:
+                chunk = upload.stream.read(ProjectService.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > limit:
+                    break
+                target.write(chunk)
+
+        if written > limit:
+            os.remove(file_path)
+            print(f"[ProjectService.py] Source file {upload.filename} exceeds maximum size.", flush=True)
+            raise ValueError(f"Source file {upload.filename} exceeds the maximum allowed size of {MAX_FILE_SIZE_MB} MB.")
+
+
+    @staticmethod
+    def _validate_due_at(due_at) -> None:
+        """Raise ValueError unless `due_at` is None or a naive datetime in the future."""
+
+        if due_at is None:
+            return
+
+        if not isinstance(due_at, datetime) or due_at.tzinfo is not None:
+            print(f"[ProjectService.py] Invalid due_at provided: {due_at}", flush=True)
+            raise ValueError("Due date must be a local datetime.")
+
+        if due_at <= datetime.now():
+            print(f"[ProjectService.py] Due date in the past: {due_at}", flush=True)
+            raise ValueError("Due date must be in the future.")
 
-        return project
 
     @staticmethod
     def get_all_projects() -> list:
@@ -121,6 +430,59 @@ class ProjectService:
 
         return projects
 
+    @staticmethod
+    def get_projects(state: str = None, language: str = None, created_from=None, created_to=None) -> list:
+        """
+        Retrieve projects filtered in the database and return them as serializable dictionaries.
+        Parameters:
+            state (str | None): Project state name (case-insensitive). None, empty or "ALL" disables the filter.
+            language (str | None): Language code to filter by. None or empty disables the filter.
+            created_from (datetime | str | None): Inclusive lower bound for the creation time, as a
+                datetime or an ISO 8601 string.
+            created_to (datetime | str | None): Inclusive upper bound for the creation time, as a
+                datetime or an ISO 8601 string.
+        Returns:
+            list[dict]: Matching projects serialized via `Project.to_dict`.
+        Raises:
+            ValueError: If `state` is not a known project state or a date cannot be parsed.
+            ValueError: If `created_from` is later than `created_to`.
+        """
+
+        state_value = None
+        if state and state.upper() != "ALL":
+            try:
+                state_value = ProjectState[state.upper()].value
+            except KeyError:
+                print(f"[ProjectService.py] Unknown state filter provided: {state}", flush=True)
+                raise ValueError("Invalid state value.")
+
+        created_from = ProjectService._parse_datetime(created_from, "created_from")
+        created_to = ProjectService._parse_datetime(created_to, "created_to")
+
+        if created_from and created_to and created_from > created_to:
+            print(f"[ProjectService.py] Invalid date range: {created_from} > {created_to}", flush=True)
+            raise ValueError("created_from must not be later than created_to.")
+
+        projects = Project.get_filtered(state_value, language or None, created_from, created_to)
+
+        return [Project.to_dict(p) for p in projects]
+
+    @staticmethod
+    def _parse_datetime(value, field: str):
+        """Parse an optional datetime filter given as a datetime or ISO 8601 string."""
+
+        if value is None or value == "":
+            return None
+
+        if isinstance(value, datetime):
+            return value
+
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError:
+            print(f"[ProjectService.py] Invalid {field} provided: {value}", flush=True)
+            raise ValueError(f"{field} must be an ISO 8601 date or datetime.")
+
     @staticmethod
     def get_projects_by_user_id(user_id: str, role: str) -> list:
         """
@@ -246,21 +608,34 @@ class ProjectService:
             if role != "ADMINISTRATOR":
                 raise PermissionError("Only ADMINISTRATOR can close the project.")
 
-        Project.update_state(project_id, new_state.value)
+        if new_state == ProjectState.ASSIGNED:
+            # Reopening a rejected project hands it back to the translator who still holds it.
+            event = TranslatorAssigned(project_id, current_state.value, new_state.value, actor_id=user_id, translator_id=translator_id)
+        else:
+            event = STATE_EVENTS[new_state](project_id, current_state.value, new_state.value, actor_id=user_id)
+
+        with db.transaction():
+            Project.update_state(project_id, new_state.value)
+            EventBus.publish(event)
 
     @staticmethod
-    def assign_translator_to_project(project_id: str, translator_id: str) -> None:
+    def assign_translator_to_project(project_id: str, translator_id: str = None, actor_id: str = None) -> str:
         """
         Assign a translator to a project.
         This function validates the provided project and translator identifiers,
-        then delegates the assignment to the underlying Project model.
+        then delegates the assignment to the underlying Project model. When no translator
+        is given, the best-ranked translator for the project's language is assigned.
         Parameters:
             project_id (str): Unique identifier of the project to which the translator will be assigned.
-            translator_id (str): Unique identifier of the translator to assign.
+            translator_id (str | None): Unique identifier of the translator to assign, or None to pick
+                the top candidate from TranslatorRanking.
+            actor_id (str | None): User performing the assignment, recorded on the TranslatorAssigned event.
         Raises:
-            ValueError: If `project_id` or `translator_id` is missing, empty, or not a string.
+            ValueError: If `project_id` is missing, empty, or not a string.
+            ValueError: If `translator_id` is given but empty or not a string.
+            ValueError: If no translator is given and the project or a candidate translator cannot be found.
         Returns:
-            None
+            str: The id of the assigned translator.
         Example:
             assign_translator_to_project("proj_123", "trans_456")
         """
@@ -269,15 +644,395 @@ class ProjectService:
             print(f"[ProjectService.py] Invalid project_id provided: {project_id}", flush=True)
             raise ValueError("Project ID must be a valid non-empty string.")
 
+        if translator_id is None:
+            project = Project.get_by_id(project_id)
+            if not project:
+                raise ValueError("Project not found.")
+
+            candidates = TranslatorDirectory.get_translator_ids(project.language)
+            with db.transaction():
+                translator_id = Project.assign_best_translator(project_id, candidates, TranslatorRanking.rank)
+                if not translator_id:
+                    print(f"[ProjectService.py] No translators available for language: {project.language}", flush=True)
+                    raise ValueError("No translators available for the project language.")
+
+                EventBus.publish(TranslatorAssigned(
+                    project_id, project.state.value, ProjectState.ASSIGNED.value, actor_id=actor_id, translator_id=translator_id
+                ))
+
+            return translator_id
+
+        if not translator_id or not isinstance(translator_id, str):
+            print(f"[ProjectService.py] Invalid translator_id provided: {translator_id}", flush=True)
+            raise ValueError("Translator ID must be a valid non-empty string.")
+
+        with db.transaction():
+            current_state = Project.get_state(project_id)
+            Project.assign_translator(project_id, translator_id)
+            EventBus.publish(TranslatorAssigned(
+                project_id, current_state.value if current_state else None, ProjectState.ASSIGNED.value,
+                actor_id=actor_id, translator_id=translator_id
+            ))
+
+        return translator_id
+
+    @staticmethod
+    def bulk_update_status(project_ids: list, status: str, actor_id: str = None) -> dict:
+        """
+        Move many projects to the same state at once.
+        The projects are locked and checked against ALLOWED_TRANSITIONS with one query, every
+        eligible project is updated with one UPDATE, and the translators' notifications are queued
+        with multi-row INSERTs, all in a single transaction. Projects that cannot make the
+        transition are reported and left unchanged.
+        Parameters:
+            project_ids (list[str]): Projects to update (at most MAX_BULK_PROJECTS).
+            status (str): Target state; one of BULK_TRANSITION_TEMPLATES (CLOSED).
+            actor_id (str | None): The administrator performing the update, recorded on the events.
+        Returns:
+            dict: {'updated': int, 'results': [{'project_id': str, 'ok': bool, 'error'?: str}, ...]}
+            with one result per distinct project id, in request order.
+        Raises:
+            ValueError: If `project_ids` or `status` is invalid, or the update fails.
+        """
+
+        project_ids = ProjectService._validate_bulk_ids(project_ids)
+
+        try:
+            new_state = ProjectState[status.strip().upper()]
+        except (KeyError, AttributeError):
+            print(f"[ProjectService.py] Unknown status provided: {status}", flush=True)
+            raise ValueError("Invalid status value.")
+
+        if new_state not in BULK_TRANSITION_TEMPLATES:
+            raise ValueError(f"Bulk updates support only these states: {', '.join(s.value for s in BULK_TRANSITION_TEMPLATES)}.")
+
+        errors = {}
+        with db.transaction():
+            projects = Project.lock_many(project_ids)
+
+            eligible = []
+            for project_id in project_ids:
+                row = projects.get(project_id)
+                if row is None:
+                    errors[project_id] = "Project not found."
+                elif new_state not in ALLOWED_TRANSITIONS.get(ProjectState(row['state']), []):
+                    errors[project_id] = f"Invalid state transition from {row['state']}."
+                else:
+                    eligible.append(row)
+
+            Project.update_states([row['id'] for row in eligible], new_state.value)
+
+            for row in eligible:
+                EventBus.publish(STATE_EVENTS[new_state](row['id'], row['state'], new_state.value, actor_id=actor_id))
+
+            contacts = UserService.get_user_contacts([row['translatorId'] for row in eligible if row['translatorId']])
+            EmailService.notify_users(BULK_TRANSITION_TEMPLATES[new_state], [
+                (contacts[row['translatorId']], {'project_name': row['name']})
+                for row in eligible if row['translatorId'] in contacts
+            ])
+
+        print(f"[ProjectService.py] Bulk {new_state.value}: {len(eligible)} of {len(project_ids)} projects updated.", flush=True)
+
+        return ProjectService._bulk_results(project_ids, errors)
+
+
+    @staticmethod
+    def bulk_assign_translator(project_ids: list, translator_id: str, actor_id: str = None) -> dict:
+        """
+        Assign one translator to many projects at once, e.g. to move work off an unavailable translator.
+        The projects are locked and validated with one query, assigned with one UPDATE and the
+        translator's notifications are queued with multi-row INSERTs, all in a single transaction.
+        A project is eligible if it is CREATED or ASSIGNED, or ALLOWED_TRANSITIONS lets it return to
+        ASSIGNED, and the translator works with its target language.
+        Parameters:
+            project_ids (list[str]): Projects to assign (at most MAX_BULK_PROJECTS).
+            translator_id (str): The translator to assign.
+            actor_id (str | None): The administrator performing the assignment, recorded on the events.
+        Returns:
+            dict: {'updated': int, 'results': [{'project_id': str, 'ok': bool, 'error'?: str}, ...]}
+            with one result per distinct project id, in request order.
+        Raises:
+            ValueError: If the input is invalid, the translator does not exist, or the update fails.
+        """
+
+        project_ids = ProjectService._validate_bulk_ids(project_ids)
+
         if not translator_id or not isinstance(translator_id, str):
             print(f"[ProjectService.py] Invalid translator_id provided: {translator_id}", flush=True)
             raise ValueError("Translator ID must be a valid non-empty string.")
 
-        Project.assign_translator(project_id, translator_id)
+        translator = UserService.get_user_contact(translator_id)
+        if translator is None or translator.role != UserRole.TRANSLATOR:
+            raise ValueError("Translator not found.")
+
+        errors = {}
+        speaks = {}
+        with db.transaction():
+            projects = Project.lock_many(project_ids)
+
+            eligible = []
+            for project_id in project_ids:
+                row = projects.get(project_id)
+                if row is None:
+                    errors[project_id] = "Project not found."
+                    continue
+
+                state = ProjectState(row['state'])
+                if state not in (ProjectState.CREATED, ProjectState.ASSIGNED) and ProjectState.ASSIGNED not in ALLOWED_TRANSITIONS.get(state, []):
+                    errors[project_id] = f"Cannot assign a translator to a project in state {row['state']}."
+                    continue
+
+                if row['translatorId'] == translator_id and state == ProjectState.ASSIGNED:
+                    errors[project_id] = "Project is already assigned to this translator."
+                    continue
+
+                language = row['languageCode']
+                if language not in speaks:
+                    speaks[language] = translator_id in TranslatorDirectory.get_translator_ids(language)
+                if not speaks[language]:
+                    errors[project_id] = f"Translator does not work with language {language}."
+                    continue
+
+                eligible.append(row)
+
+            Project.assign_translator_many([row['id'] for row in eligible], translator_id)
+
+            for row in eligible:
+                EventBus.publish(TranslatorAssigned(
+                    row['id'], row['state'], ProjectState.ASSIGNED.value, actor_id=actor_id, translator_id=translator_id
+                ))
+
+            EmailService.notify_users('project_assigned', [
+                (translator, {'project_name': row['name'], 'target_language': row['languageCode']})
+                for row in eligible
+            ])
+
+        print(f"[ProjectService.py] Bulk assignment to {translator_id}: {len(eligible)} of {len(project_ids)} projects.", flush=True)
+
+        return ProjectService._bulk_results(project_ids, errors)
+
+
+    @staticmethod
+    def queue_stalled_sweep(sla_seconds: int = None) -> str:
+        """
+        Queue a stalled-project sweep for a job worker instead of running it in the request.
+        Parameters:
+            sla_seconds (int | None): Allowed time without progress. Defaults to STALL_SLA_SECONDS.
+        Returns:
+            str: The id of the queued job.
+        Raises:
+            ValueError: If `sla_seconds` is invalid or the job could not be queued.
+        """
+
+        if sla_seconds is not None and (not isinstance(sla_seconds, int) or sla_seconds < 0):
+            raise ValueError("SLA must be a non-negative number of seconds.")
+
+        # Sweeps lock with SKIP LOCKED, so a retried or duplicate sweep is harmless.
+        return JobQueue.enqueue(REASSIGN_STALLED_JOB, {'sla_seconds': sla_seconds}, priority=10, max_attempts=3)
+
+
+    @staticmethod
+    def reassign_stalled_projects(sla_seconds: int = None, batch_size: int = None) -> dict:
+        """
+        Hand projects that saw no progress within the SLA over to another translator.
+        ASSIGNED and REJECTED projects whose last update is older than `sla_seconds` are locked in
+        batches of `batch_size` (see `Project.lock_stalled`) and reassigned to the best-ranked
+        other translator of their language, balanced across the batch. Each batch is one
+        transaction covering the assignment, the lifecycle events and the notifications to the
+        new and the previous translator. Rows locked by a sweep on another node are skipped, so
+        sweeps may run on several nodes at once. A reassignment refreshes `updatedAt`, which
+        gives the new translator a full SLA period. Projects without another candidate keep
+        their translator and are counted as such.
+        Parameters:
+            sla_seconds (int | None): Allowed time without progress. Defaults to STALL_SLA_SECONDS.
+            batch_size (int | None): Projects per transaction. Defaults to STALL_SWEEP_BATCH_SIZE.
+        Returns:
+            dict: {'scanned': int, 'reassigned': int, 'no_candidate': int,
+            'reassignments': [{'project_id', 'from_translator_id', 'to_translator_id'}, ...]}.
+        Raises:
+            ValueError: If `sla_seconds` or `batch_size` is invalid, or a batch fails.
+        """
+
+        sla_seconds = ProjectService.STALL_SLA_SECONDS if sla_seconds is None else sla_seconds
+        batch_size = ProjectService.STALL_SWEEP_BATCH_SIZE if batch_size is None else batch_size
+
+        if not isinstance(sla_seconds, int) or sla_seconds < 0:
+            raise ValueError("SLA must be a non-negative number of seconds.")
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+
+        summary = {'scanned': 0, 'reassigned': 0, 'no_candidate': 0, 'reassignments': []}
+
+        for state in ProjectService.STALL_STATES:
+            after = None
+            while True:
+                with db.transaction():
+                    rows = Project.lock_stalled(state.value, sla_seconds, batch_size, after)
+                    if rows:
+                        after = (rows[-1]['updatedAt'], rows[-1]['id'])
+                        ProjectService._reassign_batch(rows, sla_seconds, summary)
+
+                if len(rows) < batch_size:
+                    break
+
+        print(f"[ProjectService.py] Stalled project sweep: {summary['reassigned']} of {summary['scanned']} reassigned, {summary['no_candidate']} without another candidate.", flush=True)
+
+        return summary
+
+
+    @staticmethod
+    def _reassign_batch(rows: list, sla_seconds: int, summary: dict) -> None:
+        """Reassign one locked batch of stalled projects, recording the outcome in `summary`."""
+
+        candidates = TranslatorDirectory.get_translator_ids_by_language(list({row['languageCode'] for row in rows}))
+
+        # Projects of the same language and translator share the same remaining candidates.
+        groups = {}
+        for row in rows:
+            groups.setdefault((row['languageCode'], row['translatorId']), []).append(row['id'])
+
+        assignments = Project.assign_best_translators_by_language([
+            (project_ids, [tid for tid in candidates[language] if tid != translator_id])
+            for (language, translator_id), project_ids in groups.items()
+        ], TranslatorRanking.rank)
+
+        reassigned = [row for row in rows if row['id'] in assignments]
+        for row in reassigned:
+            EventBus.publish(TranslatorAssigned(
+                row['id'], row['state'], ProjectState.ASSIGNED.value, translator_id=assignments[row['id']]
+            ))
+            summary['reassignments'].append({
+                'project_id': row['id'],
+                'from_translator_id': row['translatorId'],
+                'to_translator_id': assignments[row['id']],
+            })
+
+        contacts = UserService.get_user_contacts(
+            [assignments[row['id']] for row in reassigned] + [row['translatorId'] for row in reassigned if row['translatorId']]
+        )
+        EmailService.notify_users('project_assigned', [
+            (contacts[assignments[row['id']]], {'project_name': row['name'], 'target_language': row['languageCode']})
+            for row in reassigned if assignments[row['id']] in contacts
+        ])
+        EmailService.notify_users('project_reassigned', [
+            (contacts[row['translatorId']], {'project_name': row['name'], 'stalled_hours': round(sla_seconds / 3600)})
+            for row in reassigned if row['translatorId'] in contacts
+        ])
+
+        summary['scanned'] += len(rows)
+        summary['reassigned'] += len(reassigned)
+        summary['no_candidate'] += len(rows) - len(reassigned)
+
+
+    @staticmethod
+    def get_stalled_report(sla_seconds: int = None, limit: int = 100) -> dict:
+        """
+        Report the projects currently past the stall SLA, for administrators.
+        Parameters:
+            sla_seconds (int | None): Allowed time without progress. Defaults to STALL_SLA_SECONDS.
+            limit (int): Maximum number of projects listed per state, oldest first.
+        Returns:
+            dict: {'sla_seconds': int, 'states': {state: {'count': int, 'projects': [...]}}}.
+        Raises:
+            ValueError: If the report could not be loaded.
+        """
+
+        sla_seconds = ProjectService.STALL_SLA_SECONDS if sla_seconds is None else sla_seconds
+
+        states = Project.get_stalled([state.value for state in ProjectService.STALL_STATES], sla_seconds, limit)
+        for report in states.values():
+            for project in report['projects']:
+                if isinstance(project.get('updatedAt'), datetime):
+                    project['updatedAt'] = project['updatedAt'].isoformat()
+
+        return {'sla_seconds': sla_seconds, 'states': states}
+
+
+    @staticmethod
+    def get_due_soon(hours: float = 24, limit: int = 100) -> dict:
+        """
+        List open projects whose deadline falls within the next `hours`, including overdue ones,
+        earliest deadline first. Served from the (state, dueAt) index.
+        Parameters:
+            hours (float): Look-ahead window, at most MAX_DUE_SOON_HOURS.
+            limit (int): Maximum number of projects, 1 to 1000.
+        Returns:
+            dict: {'hours': float, 'due_before': str, 'projects': [...]} with ISO-formatted dates.
+        Raises:
+            ValueError: If an argument is invalid or the query fails.
+        """
+
+        if isinstance(hours, bool) or not isinstance(hours, (int, float)) or not 0 <= hours <= ProjectService.MAX_DUE_SOON_HOURS:
+            raise ValueError(f"Hours must be between 0 and {ProjectService.MAX_DUE_SOON_HOURS}.")
+
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= 1000:
+            raise ValueError("Limit must be between 1 and 1000.")
+
+        due_before = datetime.now() + timedelta(hours=hours)
+        projects = Project.get_due_before([state.value for state in ProjectService.DEADLINE_STATES], due_before, limit)
+
+        for project in projects:
+            for key in ('dueAt', 'dueWarnedAt', 'dueEscalatedAt'):
+                if isinstance(project.get(key), datetime):
+                    project[key] = project[key].isoformat()
+
+        return {'hours': hours, 'due_before': due_before.isoformat(), 'projects': projects}
+
+
+    @staticmethod
+    def _validate_bulk_ids(project_ids) -> list:
+        """Validate the project ids of a bulk request and return them deduplicated, in order."""
+
+        if not isinstance(project_ids, list) or not project_ids or not all(isinstance(pid, str) and pid for pid in project_ids):
+            print(f"[ProjectService.py] Invalid project_ids provided: {project_ids}", flush=True)
+            raise ValueError("project_ids must be a non-empty list of project ids.")
+
+        project_ids = list(dict.fromkeys(project_ids))
+        if len(project_ids) > ProjectService.MAX_BULK_PROJECTS:
+            raise ValueError(f"At most {ProjectService.MAX_BULK_PROJECTS} projects can be updated at once.")
+
+        return project_ids
+
+
+    @staticmethod
+    def _bulk_results(project_ids: list, errors: dict) -> dict:
+        """Build the per-project report of a bulk operation."""
+
+        results = [
+            {'project_id': project_id, 'ok': False, 'error': errors[project_id]} if project_id in errors
+            else {'project_id': project_id, 'ok': True}
+            for project_id in project_ids
+        ]
+
+        return {'updated': len(project_ids) - len(errors), 'results': results}
+
+
+    @staticmethod
+    def get_translator_candidates(project_id: str) -> list:
+        """
+        Rank the translators who could take over a project, best first.
+        Parameters:
+            project_id (str): Unique identifier of the project. Must be a non-empty string.
+        Returns:
+            list[dict]: Ranked candidates as returned by `UserService.rank_translators_by_language`.
+        Raises:
+            ValueError: If `project_id` is invalid or the project does not exist.
+        """
+
+        if not project_id or not isinstance(project_id, str):
+            print(f"[ProjectService.py] Invalid project_id provided: {project_id}", flush=True)
+            raise ValueError("Project ID must be a valid non-empty string.")
+
+        project = Project.get_by_id(project_id)
+        if not project:
+            raise ValueError("Project not found.")
+
+        return UserService.rank_translators_by_language(project.language)
 
 
     @staticmethod
-    def accept_translation(project_id: str) -> None:
+    def accept_translation(project_id: str, actor_id: str = None) -> None:
         """
         Accept the translation for a project by transitioning its state from COMPLETED to APPROVED.
         This function validates the provided project ID, ensures the project is currently
@@ -285,6 +1040,7 @@ class ProjectService:
         or the project is not in the correct state, a ValueError is raised.
         Args:
             project_id (str): The unique identifier of the project whose translation is being accepted.
+            actor_id (str | None): The accepting customer, recorded on the ProjectApproved event.
         Raises:
             ValueError: If `project_id` is empty, not a string, or if the project's state is not COMPLETED.
         Side Effects:
@@ -302,19 +1058,21 @@ class ProjectService:
             print(f"[ProjectService.py] Project {project_id} is not in COMPLETED state: {state}", flush=True)
             raise ValueError("Only projects in COMPLETED state can be accepted.")
 
-        Project.update_state(project_id, ProjectState.APPROVED.value)
+        with db.transaction():
+            Project.update_state(project_id, ProjectState.APPROVED.value)
+            EventBus.publish(ProjectApproved(project_id, state.value, ProjectState.APPROVED.value, actor_id=actor_id))
 
-        project = Project.get_by_id(project_id)
+            project = Project.get_by_id(project_id)
 
-        EmailService.send_email(
-            email=UserService.get_user_by_id(project.translator_id).email,
-            subject="Translation Accepted",
-            body=f"Your translation for project '{project.name}' has been accepted."
-        )
+            EmailService.notify_user(
+                UserService.get_user_contact(project.translator_id),
+                'translation_accepted',
+                project_name=project.name
+            )
 
 
     @staticmethod
-    def reject_translation(project_id: str, feedback: str) -> None:
+    def reject_translation(project_id: str, feedback: str, actor_id: str = None) -> None:
         """
         Reject a completed project's translation with reviewer feedback.
         Validates inputs, ensures the project is in the COMPLETED state, transitions it
@@ -322,6 +1080,7 @@ class ProjectService:
         Args:
             project_id (str): Unique identifier of the project whose translation is being rejected.
             feedback (str): Explanation or notes detailing the reason for rejection.
+            actor_id (str | None): The rejecting customer, recorded on the ProjectRejected event.
         Raises:
             ValueError: If `project_id` is empty or not a string.
             ValueError: If `feedback` is empty or not a string.
@@ -342,33 +1101,37 @@ class ProjectService:
             print(f"[ProjectService.py] Project {project_id} is not in COMPLETED state: {state}", flush=True)
             raise ValueError("Only projects in COMPLETED state can be rejected.")
 
-        Project.update_state(project_id, ProjectState.REJECTED.value)
-        # check if the feedback for the project already exists
-        try:
-            existing_feedback = Project.get_feedback(project_id)
-        except ValueError:
-            existing_feedback = None
+        with db.transaction():
+            Project.update_state(project_id, ProjectState.REJECTED.value)
+            EventBus.publish(ProjectRejected(project_id, state.value, ProjectState.REJECTED.value, actor_id=actor_id, feedback=feedback))
+            # check if the feedback for the project already exists
+            try:
+                existing_feedback = Project.get_feedback(project_id)
+            except ValueError:
+                existing_feedback = None
+
+            if existing_feedback:
+                Project.update_feedback(project_id, feedback)
+            else:
+                Project.save_feedback(project_id, feedback)
 
-        if existing_feedback:
-            Project.update_feedback(project_id, feedback)
-        else:
-            Project.save_feedback(project_id, feedback)
-        
-        project = Project.get_by_id(project_id)
+            project = Project.get_by_id(project_id)
 
-        EmailService.send_email(
-            email=UserService.get_user_by_id(project.translator_id).email,
-            subject="Translation Rejected",
-            body=f"Your translation for project '{project.name}' has been rejected. Feedback: {feedback}"
-        )
+            EmailService.notify_user(
+                UserService.get_user_contact(project.translator_id),
+                'translation_rejected',
+                project_name=project.name,
+                feedback=feedback
+            )
 
 
     @staticmethod
-    def close_project(project_id: str) -> None:
+    def close_project(project_id: str, actor_id: str = None) -> None:
         """
         Close a project by setting its state to CLOSED.
         Parameters:
             project_id (str): Unique identifier of the project to close.
+            actor_id (str | None): The closing administrator, recorded on the ProjectClosed event.
         Raises:
             ValueError: If `project_id` is empty or not a string.
             ValueError: If the project is already closed.
@@ -386,15 +1149,17 @@ class ProjectService:
             print(f"[ProjectService.py] Project {project_id} is already closed.", flush=True)
             raise ValueError("Project is already closed.")
 
-        Project.update_state(project_id, ProjectState.CLOSED.value)
+        with db.transaction():
+            Project.update_state(project_id, ProjectState.CLOSED.value)
+            EventBus.publish(ProjectClosed(project_id, state.value, ProjectState.CLOSED.value, actor_id=actor_id))
 
-        project = Project.get_by_id(project_id)
+            project = Project.get_by_id(project_id)
 
-        EmailService.send_email(
-            email=UserService.get_user_by_id(project.translator_id).email,
-            subject="Project Closed",
-            body=f"Your project '{project.name}' has been closed."
-        )
+            EmailService.notify_user(
+                UserService.get_user_contact(project.translator_id),
+                'project_closed',
+                project_name=project.name
+            )
 
 
     @staticmethod
@@ -465,7 +1230,7 @@ class ProjectService:
 
 
     @staticmethod
-    def save_translated_file(project_id: str, translated_file: _WSFileStorage) -> None:
+    def save_translated_file(project_id: str, translated_file: _WSFileStorage, actor_id: str = None) -> None:
         """
         Save a translated file for the specified project and update its state to COMPLETED.
         This function validates the input parameters, ensures the uploaded file does not exceed
@@ -475,6 +1240,7 @@ class ProjectService:
         Parameters:
             project_id (str): The unique identifier of the project. Must be a non-empty string.
             translated_file (_WSFileStorage): The uploaded file object containing the translated content.
+            actor_id (str | None): The uploading translator, recorded on the TranslationUploaded event.
         Raises:
             ValueError: If `project_id` is empty or not a string.
             ValueError: If `translated_file` is None.
@@ -510,14 +1276,18 @@ class ProjectService:
             print(f"[ProjectService.py] Project not found for project_id: {project_id}", flush=True)
             raise ValueError("Project not found.")
 
-        Project.save_translated_file(project_id, filename)
-        Project.update_state(project_id, ProjectState.COMPLETED.value)
-
-        EmailService.send_email(
-            email=UserService.get_user_by_id(project.customer_id).email,
-            subject=f"Translated file uploaded for project {project.name}",
-            body=f"The translated file for your project '{project.name}' has been uploaded and is now available."
-        )
+        with db.transaction():
+            Project.save_translated_file(project_id, filename)
+            Project.update_state(project_id, ProjectState.COMPLETED.value)
+            EventBus.publish(TranslationUploaded(
+                project_id, state.value, ProjectState.COMPLETED.value, actor_id=actor_id, translator_id=project.translator_id
+            ))
+
+            EmailService.notify_user(
+                UserService.get_user_contact(project.customer_id),
+                'translation_uploaded',
+                project_name=project.name
+            )
 
 
     @staticmethod
@@ -581,4 +1351,10 @@ class ProjectService:
         """
         """Retrieve all possible project states."""
 
-        return list(ProjectState)
\ No newline at end of file
+        return list(ProjectState)
+
+
+JobQueue.register(
+    REASSIGN_STALLED_JOB,
+    lambda payload: ProjectService.reassign_stalled_projects(payload.get('sla_seconds'), payload.get('batch_size'))
+)
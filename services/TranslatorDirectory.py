@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from models.User import User
+
+
+class TranslatorDirectory:
+    """
+    In-process map from language code to the ids of translators who speak it.
+    The map is loaded lazily with a single query on first use and kept up to date
+    when translators register or change their languages, so translator assignment
+    can resolve candidates without hitting the database. Other processes only learn
+    about changes made elsewhere when their copy is reloaded, which happens at most
+    TRANSLATOR_DIRECTORY_TTL seconds (default 300) after the last load. If a reload fails,
+    the previous map keeps serving and the next lookup tries again; a failed first load raises.
+    """
+
+    REFRESH_INTERVAL_SECONDS = int(os.getenv("TRANSLATOR_DIRECTORY_TTL", "300"))
+
+    _lock = threading.Lock()
+    _by_language = None
+    _loaded_at = 0.0
+
+
+    @classmethod
+    def get_translator_ids(cls, language_code: str) -> list:
+        """
+        Return the ids of translators proficient in the given language.
+        Parameters:
+            language_code (str): The language code (e.g. "en", "sk").
+        Returns:
+            list[str]: Translator ids in a stable (sorted) order. Empty if nobody speaks the language.
+        Raises:
+            ValueError: If the map could not be loaded.
+        """
+
+        with cls._lock:
+            cls._ensure_loaded()
+            return sorted(cls._by_language.get(language_code, ()))
+
+
+    @classmethod
+    def get_translator_ids_by_language(cls, language_codes: list) -> dict:
+        """
+        Return the ids of translators proficient in each of the given languages, resolved together
+        from one consistent snapshot of the map (loaded with a single query when needed).
+        Parameters:
+            language_codes (list[str]): The language codes.
+        Returns:
+            dict[str, list[str]]: Language code -> translator ids in a stable (sorted) order.
+        Raises:
+            ValueError: If the map could not be loaded.
+        """
+
+        with cls._lock:
+            cls._ensure_loaded()
+            return {code: sorted(cls._by_language.get(code, ())) for code in language_codes}
+
+
+    @classmethod
+    def register_translator(cls, translator_id: str, languages: list) -> None:
+        """
+        Add a translator to the map or replace their languages with the given ones.
+        Parameters:
+            translator_id (str): The translator's user id.
+            languages (list[str]): The full list of languages the translator now speaks.
+        """
+
+        translator_id = str(translator_id)
+
+        with cls._lock:
+            if cls._by_language is None:
+                # Nothing loaded yet; the next lookup reads the current state from the database.
+                return
+
+            cls._discard(translator_id)
+            for language in languages or []:
+                cls._by_language.setdefault(language, set()).add(translator_id)
+
+        print(f"[TranslatorDirectory.py] Registered translator {translator_id} for languages: {languages}", flush=True)
+
+
+    @classmethod
+    def remove_translator(cls, translator_id: str) -> None:
+        """
+        Remove a translator from every language in the map.
+        Parameters:
+            translator_id (str): The translator's user id.
+        """
+
+        with cls._lock:
+            if cls._by_language is not None:
+                cls._discard(str(translator_id))
+
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached map so that the next lookup reloads it from the database."""
+
+        with cls._lock:
+            cls._by_language = None
+            cls._loaded_at = 0.0
+
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        """
+        Load the map if it is missing or older than REFRESH_INTERVAL_SECONDS. Caller must hold the lock.
+        Raises:
+            ValueError: If the map has never been loaded and the query fails.
+        """
+
+        if cls._by_language is not None and time.monotonic() - cls._loaded_at < cls.REFRESH_INTERVAL_SECONDS:
+            return
+
+        try:
+            rows = User.get_translator_languages()
+        except ValueError as e:
+            if cls._by_language is None:
+                raise
+            print(f"[TranslatorDirectory.py] Reload failed, keeping the previous map: {e}", flush=True)
+            return
+
+        by_language = {}
+        for row in rows:
+            by_language.setdefault(row['language'], set()).add(str(row['user_id']))
+
+        cls._by_language = by_language
+        cls._loaded_at = time.monotonic()
+        print(f"[TranslatorDirectory.py] Loaded translators for {len(by_language)} languages.", flush=True)
+
+
+    @classmethod
+    def _discard(cls, translator_id: str) -> None:
+        """Remove a translator id from all language sets. Caller must hold the lock."""
+
+        for language in list(cls._by_language):
+            ids = cls._by_language[language]
+            ids.discard(translator_id)
+            if not ids:
+                del cls._by_language[language]
@@ -0,0 +1,137 @@
+import os
+import numpy as np
+from models.Project import Project
+
+
+class TranslatorRanking:
+    """
+    Rank candidate translators by quality, speed and current workload.
+    Each candidate gets a score computed with NumPy over the whole candidate set at once:
+
+        score = w_approval * approval_rate - w_turnaround * turnaround - w_backlog * backlog
+
+    where
+    - approval_rate is (approved + 1) / (approved + rejected + 2), so translators without
+      history start at a neutral 0.5 instead of 0 or 1,
+    - turnaround is the average APPROVED turnaround scaled to [0, 1] by the slowest candidate
+      (candidates without history get the average of the others),
+    - backlog is the number of open projects scaled to [0, 1) by the busiest candidate.
+    Weights are read from the environment:
+    - TRANSLATOR_RANK_WEIGHT_APPROVAL (default 1.0)
+    - TRANSLATOR_RANK_WEIGHT_TURNAROUND (default 0.5)
+    - TRANSLATOR_RANK_WEIGHT_BACKLOG (default 1.0)
+    """
+
+    WEIGHTS = {
+        'approval': float(os.getenv("TRANSLATOR_RANK_WEIGHT_APPROVAL", "1.0")),
+        'turnaround': float(os.getenv("TRANSLATOR_RANK_WEIGHT_TURNAROUND", "0.5")),
+        'backlog': float(os.getenv("TRANSLATOR_RANK_WEIGHT_BACKLOG", "1.0")),
+    }
+
+
+    @staticmethod
+    def score(translator_ids: list, stats: dict, weights: dict = None) -> np.ndarray:
+        """
+        Score candidate translators from their aggregated project statistics.
+        Parameters:
+            translator_ids (list[str]): Candidate translator ids.
+            stats (dict[str, dict]): Statistics per translator id as returned by
+                `Project.get_translator_stats`. Missing translators count as having no history.
+            weights (dict[str, float] | None): Overrides for the 'approval', 'turnaround' and
+                'backlog' weights. Defaults to `TranslatorRanking.WEIGHTS`.
+        Returns:
+            numpy.ndarray: One score per candidate, aligned with `translator_ids`; higher is better.
+        """
+
+        weights = {**TranslatorRanking.WEIGHTS, **(weights or {})}
+        count = len(translator_ids)
+        if count == 0:
+            return np.empty(0)
+
+        empty = {}
+        approved = np.fromiter((stats.get(tid, empty).get('approved', 0) for tid in translator_ids), dtype=float, count=count)
+        rejected = np.fromiter((stats.get(tid, empty).get('rejected', 0) for tid in translator_ids), dtype=float, count=count)
+        backlog = np.fromiter((stats.get(tid, empty).get('backlog', 0) for tid in translator_ids), dtype=float, count=count)
+        turnaround = np.fromiter(
+            (np.nan if stats.get(tid, empty).get('avg_turnaround') is None else stats[tid]['avg_turnaround'] for tid in translator_ids),
+            dtype=float,
+            count=count
+        )
+
+        approval_rate = (approved + 1.0) / (approved + rejected + 2.0)
+
+        known = ~np.isnan(turnaround)
+        if known.any():
+            turnaround[~known] = turnaround[known].mean()
+            slowest = turnaround.max()
+            turnaround_norm = turnaround / slowest if slowest > 0 else np.zeros(count)
+        else:
+            turnaround_norm = np.zeros(count)
+
+        backlog_norm = backlog / (backlog.max() + 1.0)
+
+        return (
+            weights['approval'] * approval_rate
+            - weights['turnaround'] * turnaround_norm
+            - weights['backlog'] * backlog_norm
+        )
+
+
+    @staticmethod
+    def rank(translator_ids: list, stats: dict = None, weights: dict = None) -> list:
+        """
+        Order candidate translators from best to worst.
+        Parameters:
+            translator_ids (list[str]): Candidate translator ids. Ties keep this order.
+            stats (dict[str, dict] | None): Pre-fetched statistics; fetched with one query
+                via `Project.get_translator_stats` when omitted.
+            weights (dict[str, float] | None): Weight overrides, see `score`.
+        Returns:
+            list[str]: The candidate ids, best first.
+        """
+
+        if not translator_ids:
+            return []
+
+        if stats is None:
+            stats = Project.get_translator_stats(translator_ids)
+
+        scores = TranslatorRanking.score(translator_ids, stats, weights)
+        order = np.argsort(-scores, kind='stable')
+
+        return [translator_ids[i] for i in order]
+
+
+    @staticmethod
+    def rank_with_scores(translator_ids: list, weights: dict = None) -> list:
+        """
+        Rank candidate translators and return their scores and statistics.
+        Parameters:
+            translator_ids (list[str]): Candidate translator ids.
+            weights (dict[str, float] | None): Weight overrides, see `score`.
+        Returns:
+            list[dict]: One entry per candidate, best first, with 'id', 'score', 'approved',
+            'rejected', 'backlog' and 'avg_turnaround' keys.
+        """
+
+        if not translator_ids:
+            return []
+
+        stats = Project.get_translator_stats(translator_ids)
+        scores = TranslatorRanking.score(translator_ids, stats, weights)
+        order = np.argsort(-scores, kind='stable')
+
+        ranked = []
+        for i in order:
+            tid = translator_ids[i]
+            tstats = stats.get(tid, {})
+            ranked.append({
+                'id': tid,
+                'score': float(scores[i]),
+                'approved': tstats.get('approved', 0),
+                'rejected': tstats.get('rejected', 0),
+                'backlog': tstats.get('backlog', 0),
+                'avg_turnaround': tstats.get('avg_turnaround'),
+            })
+
+        return ranked
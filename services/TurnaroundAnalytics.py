@@ -0,0 +1,252 @@
+import math
+from datetime import date, timedelta
+from models.Project import Project, ProjectState
+from models.ProjectTransition import ProjectTransition
+from models.TurnaroundRollup import TurnaroundRollup, TurnaroundStage, RollupDimension
+from models.db import db
+from services.AuditLog import AuditLog
+
+
+class TurnaroundAnalytics:
+    """
+    Turnaround times per stage (CREATED -> ASSIGNED -> COMPLETED -> APPROVED), per day, language
+    and translator, maintained incrementally from the audit log.
+    Every batch of transitions written by AuditLog is folded into the rollups: a stage ending
+    adds its duration to the histogram of the day it ended, for all projects, the project's
+    language and the translator who held it then, as recorded by the transitions themselves, so
+    later reassignments do not move history. The duration is measured from the latest start of
+    the stage, so reworked translations count from their reassignment. Histogram buckets are a quarter
+    power of two wide, so percentiles are accurate to about 10%; averages are exact.
+    `rebuild` recomputes everything from ProjectTransitions in one streaming pass.
+    """
+
+    BUCKETS_PER_DOUBLING = 4
+    MAX_BUCKET = 255
+    PERCENTILES = (50, 90, 95)
+    DEFAULT_DAYS = 30
+    MAX_DAYS = 366
+    REBUILD_BATCH_SIZE = 5000
+
+
+    @staticmethod
+    def bucket(seconds: float) -> int:
+        """
+        Histogram bucket of a duration.
+        Parameters:
+            seconds (float): The duration.
+        Returns:
+            int: floor(4 * log2(seconds)), clamped to 0..MAX_BUCKET.
+        """
+
+        if seconds < 1:
+            return 0
+
+        return min(int(math.log2(seconds) * TurnaroundAnalytics.BUCKETS_PER_DOUBLING), TurnaroundAnalytics.MAX_BUCKET)
+
+
+    @staticmethod
+    def bucket_seconds(bucket: int) -> float:
+        """Representative duration of a bucket: its geometric midpoint."""
+
+        return 2 ** ((bucket + 0.5) / TurnaroundAnalytics.BUCKETS_PER_DOUBLING)
+
+
+    @staticmethod
+    def apply(transitions: list) -> None:
+        """
+        Fold transitions into the rollups, in log order.
+        Costs five statements per batch regardless of its size: the milestones are created if
+        missing and locked, the projects are loaded once, and the updated milestones and the
+        aggregated samples are written with one upsert each, in one transaction. The milestone
+        locks serialize concurrent folds of the same project across processes.
+        Parameters:
+            transitions (list[tuple]): (project_id, event, from_state, to_state, actor_id, occurred_at,
+                translator_id) rows.
+        Raises:
+            ValueError: If a query fails.
+        """
+
+        if not transitions:
+            return
+
+        project_ids = list(dict.fromkeys(row[0] for row in transitions))
+
+        with db.transaction():
+            # Locked, so folds of the same project in other processes wait instead of overwriting.
+            milestones = TurnaroundRollup.lock_milestones(project_ids)
+            projects = Project.get_many(project_ids)
+            samples = {}
+            changed = set()
+
+            for project_id, _, from_state, to_state, actor_id, occurred_at, translator_id in transitions:
+                project = projects.get(project_id)
+                if project is None:
+                    continue
+
+                m = milestones.setdefault(project_id, {'createdAt': None, 'assignedAt': None, 'completedAt': None, 'translatorId': None})
+                created_at = m['createdAt'] or project['createdAt']
+                language = project['languageCode']
+
+                if to_state == ProjectState.CREATED.value:
+                    m['createdAt'] = occurred_at
+                    changed.add(project_id)
+
+                elif to_state == ProjectState.ASSIGNED.value:
+                    m['translatorId'] = translator_id or m['translatorId']
+                    if from_state == ProjectState.CREATED.value:
+                        TurnaroundAnalytics._sample(samples, language, m['translatorId'], TurnaroundStage.ASSIGNMENT, created_at, occurred_at)
+                    m['assignedAt'] = occurred_at
+                    changed.add(project_id)
+
+                elif to_state == ProjectState.COMPLETED.value:
+                    # The upload is made by the translator holding the project.
+                    m['translatorId'] = translator_id or actor_id or m['translatorId']
+                    TurnaroundAnalytics._sample(samples, language, m['translatorId'], TurnaroundStage.TRANSLATION, m['assignedAt'], occurred_at)
+                    m['completedAt'] = occurred_at
+                    changed.add(project_id)
+
+                elif to_state == ProjectState.APPROVED.value:
+                    TurnaroundAnalytics._sample(samples, language, m['translatorId'], TurnaroundStage.REVIEW, m['completedAt'], occurred_at)
+                    TurnaroundAnalytics._sample(samples, language, m['translatorId'], TurnaroundStage.TOTAL, created_at, occurred_at)
+
+            TurnaroundRollup.save_milestones({project_id: milestones[project_id] for project_id in changed})
+            TurnaroundRollup.add_samples(samples)
+
+
+    @staticmethod
+    def _sample(samples: dict, language: str, translator_id: str, stage: TurnaroundStage, started_at, ended_at) -> None:
+        """Add one stage duration to the per-batch aggregates of every dimension it belongs to."""
+
+        if started_at is None or ended_at < started_at:
+            return
+
+        seconds = (ended_at - started_at).total_seconds()
+        bucket = TurnaroundAnalytics.bucket(seconds)
+        day = ended_at.date()
+
+        dimensions = [(RollupDimension.ALL.value, ''), (RollupDimension.LANGUAGE.value, language)]
+        if translator_id:
+            dimensions.append((RollupDimension.TRANSLATOR.value, translator_id))
+
+        for dimension, value in dimensions:
+            aggregate = samples.setdefault((dimension, value, stage.value, day, bucket), [0, 0])
+            aggregate[0] += 1
+            aggregate[1] += int(seconds)
+
+
+    @staticmethod
+    def on_transitions_written(transitions: list) -> None:
+        """AuditLog flush listener keeping the rollups up to date."""
+
+        TurnaroundAnalytics.apply(transitions)
+
+
+    @staticmethod
+    def rebuild(batch_size: int = None, progress=None) -> int:
+        """
+        Recompute the rollups from the whole audit log in one streaming pass.
+        The log is read in id order, batch by batch, so memory use does not grow with history.
+        Transitions written by other processes while the rebuild runs may be counted twice or
+        not at all; run it while the application is idle or re-run it afterwards.
+        Parameters:
+            batch_size (int | None): Transitions per batch. Defaults to REBUILD_BATCH_SIZE.
+            progress (Callable[[int], None] | None): Called with the running total after each batch.
+        Returns:
+            int: Number of processed transitions.
+        Raises:
+            ValueError: If `batch_size` is invalid or a query fails.
+        """
+
+        batch_size = TurnaroundAnalytics.REBUILD_BATCH_SIZE if batch_size is None else batch_size
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+
+        AuditLog.flush()
+        TurnaroundRollup.clear()
+
+        processed, last_id = 0, 0
+        while True:
+            rows = ProjectTransition.get_after(last_id, batch_size)
+            if not rows:
+                break
+
+            TurnaroundAnalytics.apply([
+                (row['projectId'], row['event'], row['fromState'], row['toState'], row['actorId'], row['occurredAt'], row['translatorId'])
+                for row in rows
+            ])
+            processed += len(rows)
+            last_id = rows[-1]['id']
+            if progress:
+                progress(processed)
+
+        return processed
+
+
+    @staticmethod
+    def get_turnaround(group_by: str = 'all', day_from: date = None, day_to: date = None, value: str = None) -> dict:
+        """
+        Report count, average and percentiles of every stage from the rollups.
+        Parameters:
+            group_by (str): 'all', 'language' or 'translator'.
+            day_from (date | None): First day (by stage end), inclusive. Defaults to DEFAULT_DAYS ago.
+            day_to (date | None): Last day, inclusive. Defaults to today.
+            value (str | None): Only this language code or translator id.
+        Returns:
+            dict: {'group_by', 'from', 'to', 'groups': [{'value': str, 'stages': {'<stage>': {'count',
+            'avg_seconds', 'p50_seconds', 'p90_seconds', 'p95_seconds'}}}]}, groups sorted by value.
+        Raises:
+            ValueError: If an argument is invalid or the query fails.
+        """
+
+        try:
+            dimension = RollupDimension(str(group_by).upper())
+        except ValueError:
+            raise ValueError("group_by must be one of: all, language, translator.")
+
+        day_to = day_to or date.today()
+        day_from = day_from or day_to - timedelta(days=TurnaroundAnalytics.DEFAULT_DAYS - 1)
+
+        if day_from > day_to:
+            raise ValueError("'from' must not be after 'to'.")
+
+        if (day_to - day_from).days >= TurnaroundAnalytics.MAX_DAYS:
+            raise ValueError(f"The date range may span at most {TurnaroundAnalytics.MAX_DAYS} days.")
+
+        histograms = {}
+        for row in TurnaroundRollup.get_histograms(dimension.value, day_from, day_to, value):
+            stage = histograms.setdefault(row['dimensionValue'], {}).setdefault(row['stage'], {'buckets': {}, 'count': 0, 'sum': 0})
+            stage['buckets'][row['bucket']] = int(row['count'])
+            stage['count'] += int(row['count'])
+            stage['sum'] += int(row['sumSeconds'])
+
+        groups = []
+        for group_value in sorted(histograms):
+            stages = {}
+            for stage in TurnaroundStage:
+                histogram = histograms[group_value].get(stage.value)
+                if histogram:
+                    stages[stage.value] = TurnaroundAnalytics._summarize(histogram)
+            groups.append({'value': group_value, 'stages': stages})
+
+        return {'group_by': dimension.value.lower(), 'from': day_from.isoformat(), 'to': day_to.isoformat(), 'groups': groups}
+
+
+    @staticmethod
+    def _summarize(histogram: dict) -> dict:
+        """Count, exact average and bucket-estimated percentiles of one histogram."""
+
+        summary = {'count': histogram['count'], 'avg_seconds': round(histogram['sum'] / histogram['count'], 1)}
+        ordered = sorted(histogram['buckets'].items())
+
+        for percentile in TurnaroundAnalytics.PERCENTILES:
+            rank, seen = math.ceil(histogram['count'] * percentile / 100), 0
+            for bucket, count in ordered:
+                seen += count
+                if seen >= rank:
+                    summary[f"p{percentile}_seconds"] = round(TurnaroundAnalytics.bucket_seconds(bucket), 1)
+                    break
+
+        return summary
+
+
+AuditLog.add_flush_listener(TurnaroundAnalytics.on_transitions_written)
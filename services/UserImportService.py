@@ -0,0 +1,209 @@
+import csv
+import json
+import os
+import re
+from models.db import db
+from models.User import User, UserRole
+from services.AuthService import AuthService
+from services.UserService import UserService
+from services.TranslatorDirectory import TranslatorDirectory
+
+
+class UserImportService:
+    """
+    Bulk creation of users from CSV or NDJSON uploads.
+    Input is parsed lazily, one row at a time, and processed in chunks of CHUNK_SIZE rows
+    (USER_IMPORT_CHUNK_SIZE, default 500). For each chunk the rows are validated like
+    `UserService.create_user`, their passwords are hashed in parallel in the hashing process
+    pool, and the users and their languages are written with multi-row INSERTs inside one
+    transaction. A row that fails is reported with its row number and does not abort the import.
+    """
+
+    CHUNK_SIZE = int(os.getenv("USER_IMPORT_CHUNK_SIZE", "500"))
+    FORMATS = ('csv', 'ndjson')
+    CSV_COLUMNS = ('name', 'email', 'password', 'role')
+
+
+    @staticmethod
+    def parse_csv(stream):
+        """
+        Parse users from a CSV text stream with a header row.
+        Required columns are name, email, password and role; an optional languages column holds
+        language codes separated by ';', ',' or whitespace.
+        Parameters:
+            stream (io.TextIOBase): The text stream to read from.
+        Yields:
+            tuple[int, dict | None, str | None]: (row number, record, error). The row number counts
+            the header as row 1. Exactly one of record and error is set.
+        Raises:
+            ValueError: If the header row is missing or lacks a required column.
+        """
+
+        reader = csv.DictReader(stream)
+        missing = [column for column in UserImportService.CSV_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            print(f"[UserImportService.py] CSV header is missing columns: {missing}", flush=True)
+            raise ValueError(f"CSV header must contain the columns: {', '.join(UserImportService.CSV_COLUMNS)}.")
+
+        for record in reader:
+            if None in record:
+                yield reader.line_num, None, "Row has more fields than the header."
+                continue
+
+            languages = record.get('languages') or ""
+            yield reader.line_num, {
+                'name': (record.get('name') or "").strip(),
+                'email': (record.get('email') or "").strip(),
+                'password': record.get('password') or "",
+                'role': (record.get('role') or "").strip(),
+                'languages': [lang for lang in re.split(r"[;,\s]+", languages) if lang],
+            }, None
+
+
+    @staticmethod
+    def parse_ndjson(stream):
+        """
+        Parse users from a newline-delimited JSON text stream, one object per line.
+        Each object has the same fields as the JSON body of `POST /api/users`. Blank lines are skipped.
+        Parameters:
+            stream (io.TextIOBase): The text stream to read from.
+        Yields:
+            tuple[int, dict | None, str | None]: (line number, record, error). Exactly one of
+            record and error is set.
+        """
+
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"Invalid JSON: {e.msg}."
+                continue
+
+            if not isinstance(record, dict):
+                yield line_number, None, "Each line must be a JSON object."
+                continue
+
+            yield line_number, record, None
+
+
+    @staticmethod
+    def import_users(rows, chunk_size: int = None) -> dict:
+        """
+        Create users from parsed rows.
+        Parameters:
+            rows (Iterable[tuple[int, dict | None, str | None]]): Rows as yielded by `parse_csv`
+                or `parse_ndjson`.
+            chunk_size (int | None): Number of rows written per transaction. Defaults to CHUNK_SIZE.
+        Returns:
+            dict: {'total': int, 'created': int, 'failed': [{'row': int, 'email': str | None, 'error': str}, ...]}.
+        Raises:
+            ValueError: If `chunk_size` is not a positive integer.
+            ConnectionError: If the database is unavailable.
+        """
+
+        chunk_size = chunk_size or UserImportService.CHUNK_SIZE
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            print(f"[UserImportService.py] Invalid chunk size provided: {chunk_size}", flush=True)
+            raise ValueError("Chunk size must be a positive integer.")
+
+        summary = {'total': 0, 'created': 0, 'failed': []}
+        seen_emails = set()
+        chunk = []
+
+        for row in rows:
+            summary['total'] += 1
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                UserImportService._import_chunk(chunk, seen_emails, summary)
+                chunk = []
+
+        if chunk:
+            UserImportService._import_chunk(chunk, seen_emails, summary)
+
+        print(f"[UserImportService.py] Imported {summary['created']} of {summary['total']} users.", flush=True)
+
+        return summary
+
+
+    @staticmethod
+    def _import_chunk(chunk: list, seen_emails: set, summary: dict) -> None:
+        """
+        Validate, hash and insert one chunk of rows, recording the outcome in `summary`.
+        Emails seen earlier in the same import are rejected as duplicates.
+        """
+
+        failed = summary['failed']
+        valid = []
+
+        for row_number, record, error in chunk:
+            if error:
+                failed.append({'row': row_number, 'email': None, 'error': error})
+                continue
+
+            email = record.get('email')
+            languages = record.get('languages') or []
+            password = record.get('password')
+            try:
+                UserService.validate_user_fields(record.get('name'), email, record.get('role'), languages)
+                if not password or not isinstance(password, str):
+                    raise ValueError("Password must be a valid non-empty string.")
+                if email in seen_emails:
+                    raise ValueError("Email appears more than once in the import.")
+            except ValueError as e:
+                failed.append({'row': row_number, 'email': email if isinstance(email, str) else None, 'error': str(e)})
+                continue
+
+            seen_emails.add(email)
+            valid.append((row_number, record))
+
+        if not valid:
+            return
+
+        existing = User.get_existing_emails([record['email'] for _, record in valid])
+        if existing:
+            for row_number, record in valid:
+                if record['email'] in existing:
+                    failed.append({'row': row_number, 'email': record['email'], 'error': "Email is already registered."})
+            valid = [(row_number, record) for row_number, record in valid if record['email'] not in existing]
+            if not valid:
+                return
+
+        hashed_passwords = AuthService.hash_passwords([record['password'] for _, record in valid])
+
+        entries = [
+            (
+                row_number,
+                (
+                    record['name'],
+                    record['email'],
+                    hashed,
+                    UserRole.from_string(record['role']),
+                    record.get('languages') or [],
+                )
+            )
+            for (row_number, record), hashed in zip(valid, hashed_passwords)
+        ]
+
+        try:
+            with db.transaction():
+                created = User.bulk_create([values for _, values in entries])
+        except ValueError:
+            # One bad row (e.g. a concurrent duplicate email) fails the multi-row INSERT;
+            # retry row by row so only the offending rows are reported.
+            print(f"[UserImportService.py] Batch insert failed, retrying {len(entries)} rows individually.", flush=True)
+            created = []
+            for row_number, values in entries:
+                try:
+                    with db.transaction():
+                        created.extend(User.bulk_create([values]))
+                except ValueError as e:
+                    failed.append({'row': row_number, 'email': values[1], 'error': str(e)})
+
+        for user in created:
+            if user.role == UserRole.TRANSLATOR:
+                TranslatorDirectory.register_translator(str(user.id), user.languages)
+
+        summary['created'] += len(created)
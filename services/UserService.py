@@ -1,8 +1,27 @@
-from models.User import User
+import os
+from models.User import User, UserRole, NotificationMode
+from services.TranslatorDirectory import TranslatorDirectory
+from services.TranslatorRanking import TranslatorRanking
+from services.EmailTemplates import EmailTemplates
+from bin.cache import TTLCache
 
 
 class UserService:
 
+    MAX_PAGE_SIZE = 1000
+    MAX_SEARCH_RESULTS = 100
+
+    # Session records of recently validated users, keyed by user id (see AuthService.validate_session_user).
+    validated_users = TTLCache(
+        maxsize=int(os.getenv("VALIDATED_USER_CACHE_SIZE", "10000")),
+        ttl=float(os.getenv("VALIDATED_USER_CACHE_TTL", "60"))
+    )
+
+    # Contact records (User instances) of notification recipients, keyed by user id (see get_user_contact).
+    contacts = TTLCache(
+        maxsize=int(os.getenv("USER_CONTACT_CACHE_SIZE", "10000")),
+        ttl=float(os.getenv("USER_CONTACT_CACHE_TTL", "300"))
+    )
 
     @staticmethod
     def create_user(name, email, hashed_password, role, languages):
@@ -24,6 +43,38 @@ class UserService:
             ValueError: If 'email' is missing, not a string, or does not contain "@".
         """
 
+        UserService.validate_user_fields(name, email, role, languages)
+
+        if not hashed_password or not isinstance(hashed_password, str):
+            print(f"[UserService.py] Invalid hashed_password provided.", flush=True)
+            raise ValueError("Hashed password must be a valid non-empty string.")
+
+        user = User.create_customer(name, email, hashed_password) if role == 'CUSTOMER' else User.create_translator(name, email, hashed_password, languages)
+
+        if role == 'TRANSLATOR':
+            TranslatorDirectory.register_translator(str(user.id), languages)
+
+        return user
+
+    
+    @staticmethod
+    def validate_user_fields(name, email, role, languages) -> None:
+        """
+        Validate the fields of a user about to be created.
+        Shared by `create_user` and the bulk import so both accept exactly the same input.
+        Parameters:
+            name (str): Full name of the user. Must be a non-empty string.
+            email (str): Email address of the user. Must contain "@" and be non-empty.
+            role (str): The role of the user, either 'CUSTOMER' or 'TRANSLATOR'.
+            languages (list[str] | None): For translators, a non-empty list of language codes.
+                Ignored for customers.
+        Raises:
+            ValueError: If 'role' is not 'CUSTOMER' or 'TRANSLATOR'.
+            ValueError: If 'name' is missing or not a valid non-empty string.
+            ValueError: If 'email' is missing, not a string, or does not contain "@".
+            ValueError: If 'role' is 'TRANSLATOR' and 'languages' is not a non-empty list of strings.
+        """
+
         if role not in ['CUSTOMER', 'TRANSLATOR']:
             print(f"[UserService.py] Invalid role provided: {role}", flush=True)
             raise ValueError("Role must be either 'CUSTOMER' or 'TRANSLATOR'.")
@@ -32,23 +83,68 @@ class UserService:
             print(f"[UserService.py] Invalid name provided: {name}", flush=True)
             raise ValueError("Name must be a valid non-empty string.")
 
-        if not hashed_password or not isinstance(hashed_password, str):
-            print(f"[UserService.py] Invalid hashed_password provided.", flush=True)
-            raise ValueError("Hashed password must be a valid non-empty string.")
-
         if not email or not isinstance(email, str) or "@" not in email:
             print(f"[UserService.py] Invalid email provided: {email}", flush=True)
             raise ValueError("Email must be a valid non-empty string.")
-        
-        if role == 'TRANSLATOR' and (not languages or not isinstance(languages, list)) and len(languages) > 0:
+
+        if role == 'TRANSLATOR' and (
+            not languages or not isinstance(languages, list)
+            or not all(isinstance(lang, str) and lang for lang in languages)
+        ):
             print(f"[UserService.py] Invalid languages provided for TRANSLATOR: {languages}", flush=True)
             raise ValueError("Languages must be a valid list of language codes for TRANSLATOR role.")
 
-        user = User.create_customer(name, email, hashed_password) if role == 'CUSTOMER' else User.create_translator(name, email, hashed_password, languages)
 
-        return user
+    @staticmethod
+    def set_notification_mode(user_id: str, mode: str) -> None:
+        """
+        Choose how a user receives notification emails.
+        Parameters:
+            user_id (str): The unique ID of the user. Must be a non-empty string.
+            mode (str): 'IMMEDIATE' for one email per notification, or 'DIGEST' for notifications
+                coalesced into one email per digest window (case-insensitive).
+        Raises:
+            ValueError: If `user_id` or `mode` is invalid, or the preference could not be stored.
+        """
+
+        if not user_id or not isinstance(user_id, str):
+            print(f"[UserService.py] Invalid user_id provided: {user_id}", flush=True)
+            raise ValueError("User ID must be a valid non-empty string.")
+
+        try:
+            notification_mode = NotificationMode[mode.strip().upper()]
+        except (KeyError, AttributeError):
+            print(f"[UserService.py] Invalid notification mode provided: {mode}", flush=True)
+            raise ValueError("Notification mode must be either 'IMMEDIATE' or 'DIGEST'.")
+
+        User.update_notification_mode(user_id, notification_mode)
+        UserService.evict_contact(user_id)
+
+
+    @staticmethod
+    def set_locale(user_id: str, locale: str) -> None:
+        """
+        Choose the language of a user's notification emails.
+        Parameters:
+            user_id (str): The unique ID of the user. Must be a non-empty string.
+            locale (str): One of the supported UI language codes, e.g. 'en' or 'sk' (case-insensitive).
+        Raises:
+            ValueError: If `user_id` or `locale` is invalid, or the preference could not be stored.
+        """
+
+        if not user_id or not isinstance(user_id, str):
+            print(f"[UserService.py] Invalid user_id provided: {user_id}", flush=True)
+            raise ValueError("User ID must be a valid non-empty string.")
+
+        supported = EmailTemplates.supported_locales()
+        if not isinstance(locale, str) or locale.strip().lower() not in supported:
+            print(f"[UserService.py] Invalid locale provided: {locale}", flush=True)
+            raise ValueError(f"Locale must be one of: {', '.join(sorted(supported))}.")
+
+        User.update_locale(user_id, locale.strip().lower())
+        UserService.evict_contact(user_id)
+
 
-    
     @staticmethod
     def get_user_by_name(name):
         """
@@ -91,21 +187,78 @@ class UserService:
 
     
     @staticmethod
-    def get_all_users():
+    def get_all_users(role: str = None, page: int = None, per_page: int = 50):
         """
-        Retrieve all users and return their serialized representations.
+        Retrieve users and return their serialized representations.
+        Languages of all listed users are loaded in batched queries instead of one query per user.
+        Parameters:
+            role (str | None): Only return users with this role (e.g. 'TRANSLATOR'). None returns all roles.
+            page (int | None): 1-based page number. None returns all users.
+            per_page (int): Page size used when `page` is given. Must be between 1 and MAX_PAGE_SIZE.
         Returns:
             list[dict]: A list of dictionaries, each representing a user.
         Raises:
+            ValueError: If `role` is unknown or the pagination parameters are out of range.
             Exception: Propagates any unexpected errors from the underlying data access layer.
         """
 
-        users = User.get_all_users()
-        users_dict = [UserService.user_to_dict(user) for user in users]
+        user_role = UserRole.from_string(role) if role else None
+
+        limit = offset = None
+        if page is not None:
+            if not isinstance(page, int) or page < 1:
+                print(f"[UserService.py] Invalid page provided: {page}", flush=True)
+                raise ValueError("Page must be a positive integer.")
+            if not isinstance(per_page, int) or not 1 <= per_page <= UserService.MAX_PAGE_SIZE:
+                print(f"[UserService.py] Invalid per_page provided: {per_page}", flush=True)
+                raise ValueError(f"Page size must be between 1 and {UserService.MAX_PAGE_SIZE}.")
+            limit = per_page
+            offset = (page - 1) * per_page
+
+        if limit is not None:
+            users = User.get_all_users(user_role, limit, offset)
+        else:
+            users = User.get_all_users(user_role)
+
+        languages = User.get_languages_for_users([user.id for user in users])
+        users_dict = [UserService.user_to_dict(user, languages.get(str(user.id), [])) for user in users]
 
         return users_dict
 
 
+    @staticmethod
+    def search_users(prefix: str, role: str = None, limit: int = 20) -> list:
+        """
+        Type-ahead search for users whose name or email starts with a prefix.
+        Parameters:
+            prefix (str): The name or email prefix. Must be a non-empty string; surrounding
+                whitespace is ignored.
+            role (str | None): Only return users with this role (e.g. 'TRANSLATOR').
+            limit (int): Maximum number of results, between 1 and MAX_SEARCH_RESULTS.
+        Returns:
+            list[dict]: Matching users ordered by name, each with 'id', 'name', 'email' and 'role'.
+        Raises:
+            ValueError: If `prefix` is empty, `role` is unknown or `limit` is out of range.
+        """
+
+        if not prefix or not isinstance(prefix, str) or not prefix.strip():
+            print(f"[UserService.py] Invalid search prefix provided: {prefix}", flush=True)
+            raise ValueError("Search prefix must be a valid non-empty string.")
+
+        if not isinstance(limit, int) or not 1 <= limit <= UserService.MAX_SEARCH_RESULTS:
+            print(f"[UserService.py] Invalid search limit provided: {limit}", flush=True)
+            raise ValueError(f"Limit must be between 1 and {UserService.MAX_SEARCH_RESULTS}.")
+
+        user_role = UserRole.from_string(role) if role else None
+
+        users = User.search_users(prefix.strip(), user_role, limit)
+
+        return [
+            {'id': str(user.id), 'name': user.name, 'email': user.email, 'role': user.role.value}
+            for user in users
+        ]
+
+
     @staticmethod
     def get_user_by_id(user_id: str) -> User:
         """
@@ -127,6 +280,133 @@ class UserService:
         return user
 
 
+    @staticmethod
+    def get_user_contact(user_id: str) -> User:
+        """
+        Retrieve a user's contact record (id, name, email, role), served from a per-process cache.
+        Intended for notification paths that only need a recipient's email address; repeated
+        notifications to the same users do not query the database until the entry expires
+        (USER_CONTACT_CACHE_TTL seconds) or is evicted with `evict_contact`.
+        Parameters:
+            user_id (str): The unique ID of the user. Must be a non-empty string.
+        Returns:
+            User | None: The user instance, or None if no such user exists.
+        Raises:
+            ValueError: If `user_id` is not a valid non-empty string.
+        """
+
+        if not user_id or not isinstance(user_id, str):
+            print(f"[UserService.py] Invalid user_id provided: {user_id}", flush=True)
+            raise ValueError("User ID must be a valid non-empty string.")
+
+        user = UserService.contacts.get(user_id)
+        if user is not None:
+            return user
+
+        user = User.get_user_by_id(user_id)
+        if user is not None:
+            UserService.contacts.set(user_id, user)
+
+        return user
+
+
+    @staticmethod
+    def get_user_contacts(user_ids: list) -> dict:
+        """
+        Retrieve the contact records of many users, like `get_user_contact`.
+        Cached users are served from the cache and the rest are loaded with one query.
+        Parameters:
+            user_ids (list[str]): The user ids to look up.
+        Returns:
+            dict[str, User]: User id -> user, for every user that exists.
+        Raises:
+            ValueError: If the users could not be loaded.
+        """
+
+        users = {}
+        missing = []
+
+        for user_id in dict.fromkeys(user_ids):
+            user = UserService.contacts.get(user_id)
+            if user is not None:
+                users[user_id] = user
+            else:
+                missing.append(user_id)
+
+        if missing:
+            for user in User.get_users_by_ids(missing):
+                UserService.contacts.set(str(user.id), user)
+                users[str(user.id)] = user
+
+        return users
+
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """
+        Report the hit rates and sizes of this process's user caches.
+        Returns:
+            dict: Statistics for the 'validated_users' and 'contacts' caches as returned by `TTLCache.stats`.
+        """
+
+        return {
+            'validated_users': UserService.validated_users.stats(),
+            'contacts': UserService.contacts.stats(),
+        }
+
+
+    @staticmethod
+    def update_password(user_id: str, hashed_password: str) -> None:
+        """
+        Replace the stored password hash of a user.
+        Parameters:
+            user_id (str): The unique ID of the user. Must be a non-empty string.
+            hashed_password (str): The new, already hashed password. Must be a non-empty string.
+        Raises:
+            ValueError: If an argument is invalid or the update fails.
+        """
+
+        if not user_id or not isinstance(user_id, str):
+            print(f"[UserService.py] Invalid user_id provided: {user_id}", flush=True)
+            raise ValueError("User ID must be a valid non-empty string.")
+
+        if not hashed_password or not isinstance(hashed_password, str):
+            print(f"[UserService.py] Invalid hashed_password provided.", flush=True)
+            raise ValueError("Hashed password must be a valid non-empty string.")
+
+        User.update_password(user_id, hashed_password)
+
+
+    @staticmethod
+    def get_session_record(user_id: str):
+        """
+        Retrieve the fields needed to validate a logged-in user's session.
+        Parameters:
+            user_id (str): The unique ID of the user.
+        Returns:
+            dict | None: A row with id, name, role and sessionVersion, or None if the user does not exist.
+        """
+
+        if not user_id or not isinstance(user_id, str):
+            print(f"[UserService.py] Invalid user_id provided: {user_id}", flush=True)
+            return None
+
+        return User.get_session_record(user_id)
+
+
+    @staticmethod
+    def evict_contact(user_id: str) -> None:
+        """
+        Drop a user's contact record from this process's cache after their email address, locale
+        or notification preference changed, so the next notification reads it again. Sessions
+        are not affected.
+        Parameters:
+            user_id (str): The unique ID of the user.
+        """
+
+        UserService.contacts.pop(user_id)
+
+
     @staticmethod
     def get_translators_by_language(language_code: str) -> list:
         """
@@ -155,9 +435,40 @@ class UserService:
         translators = User.get_translators_by_language(language_code)
 
         return translators
+
+    @staticmethod
+    def rank_translators_by_language(language_code: str, exclude_ids: list = None) -> list:
+        """
+        Rank the translators proficient in a language from best to worst candidate.
+        Candidates come from the in-process TranslatorDirectory and are scored by
+        TranslatorRanking from their approval rate, turnaround and current backlog.
+        Parameters:
+            language_code (str): The language code to rank translators for. Must be a non-empty string.
+            exclude_ids (list[str] | None): Translator ids to leave out of the ranking.
+        Returns:
+            list[dict]: One entry per translator, best first, with 'id', 'name', 'email', 'score',
+            'approved', 'rejected', 'backlog' and 'avg_turnaround' keys.
+        Raises:
+            ValueError: If `language_code` is empty or not a string.
+        """
+
+        if not language_code or not isinstance(language_code, str):
+            print(f"[UserService.py] Invalid language_code provided: {language_code}", flush=True)
+            raise ValueError("Language code must be a valid non-empty string.")
+
+        excluded = set(exclude_ids or [])
+        candidates = [tid for tid in TranslatorDirectory.get_translator_ids(language_code) if tid not in excluded]
+
+        ranked = TranslatorRanking.rank_with_scores(candidates)
+        users = {str(user.id): user for user in User.get_users_by_ids([entry['id'] for entry in ranked])}
+
+        return [
+            {**entry, 'name': users[entry['id']].name, 'email': users[entry['id']].email}
+            for entry in ranked if entry['id'] in users
+        ]
     
     @staticmethod
-    def user_to_dict(user: User) -> dict:
+    def user_to_dict(user: User, languages: list = None) -> dict:
         """
         Convert a User domain instance into a serializable dictionary.
 
@@ -173,6 +484,8 @@ class UserService:
                 - role: enum with a .value string
                 - created_at: datetime with .isoformat()
                 - get_languages(): method returning a list of language codes or names
+            languages (list | None): Pre-loaded languages of the user. When None, they are
+                fetched with `user.get_languages()`.
 
         Returns:
             dict: A dictionary with keys:
@@ -194,5 +507,5 @@ class UserService:
             'email': user.email,
             'role': user.role.value,
             'created_at': user.created_at.isoformat(),
-            'languages': user.get_languages()
+            'languages': languages if languages is not None else user.get_languages()
         }
\ No newline at end of file
@@ -0,0 +1,131 @@
+import os
+import sys
+import threading
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.DatabaseConnector import DatabaseConnector
+from services.AuditLog import AuditLog
+from services.EventBus import EventBus, ProjectEvent, ProjectClosed, TranslatorAssigned
+
+
+@pytest.fixture(autouse=True)
+def buffer(monkeypatch):
+    buffer = deque()
+    monkeypatch.setattr(AuditLog, "_buffer", buffer)
+    monkeypatch.setattr(AuditLog, "_wake", threading.Event())
+    monkeypatch.setattr(AuditLog, "_unnotified", deque())
+    # Pretend the flusher thread is running so tests control every flush.
+    monkeypatch.setattr(AuditLog, "_flusher", object())
+    return buffer
+
+
+@patch("services.AuditLog.ProjectTransition.insert_many")
+def test_record_only_buffers(mock_insert, buffer):
+    event = ProjectClosed("p1", "APPROVED", "CLOSED", actor_id="a1")
+
+    AuditLog.record(event)
+
+    mock_insert.assert_not_called()
+    assert list(buffer) == [("p1", "ProjectClosed", "APPROVED", "CLOSED", "a1", event.occurred_at, None)]
+
+
+def test_record_keeps_assigned_translator(buffer):
+    AuditLog.record(TranslatorAssigned("p1", "CREATED", "ASSIGNED", actor_id="c1", translator_id="t1"))
+
+    assert buffer[0][6] == "t1"
+
+
+def test_full_batch_wakes_flusher():
+    with patch.object(AuditLog, "BATCH_SIZE", 2):
+        AuditLog.record(ProjectClosed("p1", "APPROVED", "CLOSED"))
+        assert not AuditLog._wake.is_set()
+        AuditLog.record(ProjectClosed("p2", "APPROVED", "CLOSED"))
+        assert AuditLog._wake.is_set()
+
+
+@patch("services.AuditLog.ProjectTransition.insert_many", side_effect=lambda rows, batch_size: len(rows))
+def test_flush_writes_buffer_in_batches(mock_insert, buffer):
+    for i in range(5):
+        AuditLog.record(TranslatorAssigned(f"p{i}", "CREATED", "ASSIGNED", translator_id="t1"))
+
+    with patch.object(AuditLog, "BATCH_SIZE", 2):
+        assert AuditLog.flush() == 5
+
+    assert [len(c.args[0]) for c in mock_insert.call_args_list] == [2, 2, 1]
+    assert not buffer
+
+
+@patch("services.AuditLog.ProjectTransition.insert_many")
+def test_failed_batch_stays_buffered_in_order(mock_insert, buffer):
+    mock_insert.side_effect = [2, ValueError("db down")]
+    for i in range(4):
+        AuditLog.record(ProjectClosed(f"p{i}", "APPROVED", "CLOSED"))
+
+    with patch.object(AuditLog, "BATCH_SIZE", 2):
+        assert AuditLog.flush() == 2
+
+    assert [row[0] for row in buffer] == ["p2", "p3"]
+
+
+@patch("services.AuditLog.ProjectTransition.insert_many", side_effect=ConnectionError("db down"))
+def test_overflow_drops_oldest_transitions(mock_insert, buffer):
+    for i in range(3):
+        AuditLog.record(ProjectClosed(f"p{i}", "APPROVED", "CLOSED"))
+
+    with patch.object(AuditLog, "MAX_BUFFERED", 2):
+        AuditLog.flush()
+
+    assert [row[0] for row in buffer] == ["p1", "p2"]
+
+
+def test_committed_transitions_are_recorded_through_event_bus(monkeypatch, buffer):
+    connector = DatabaseConnector("h", "u", "p", "d")
+    connector.connection = MagicMock(in_transaction=False)
+    monkeypatch.setattr("services.EventBus.db", connector)
+    monkeypatch.setattr(EventBus, "_subscribers", [])
+    EventBus.subscribe(ProjectEvent, AuditLog.record)
+
+    with connector.transaction():
+        EventBus.publish(ProjectClosed("p1", "APPROVED", "CLOSED", actor_id="a1"))
+        assert not buffer
+
+    assert [row[:5] for row in buffer] == [("p1", "ProjectClosed", "APPROVED", "CLOSED", "a1")]
+
+
+@patch("services.AuditLog.ProjectTransition.get_by_project", return_value=[])
+@patch("services.AuditLog.ProjectTransition.insert_many", side_effect=lambda rows, batch_size: len(rows))
+def test_history_flushes_pending_transitions_first(mock_insert, mock_get):
+    AuditLog.record(ProjectClosed("p1", "APPROVED", "CLOSED"))
+
+    AuditLog.get_project_history("p1", 10, before_id=5)
+
+    mock_insert.assert_called_once()
+    mock_get.assert_called_once_with("p1", 10, 5)
+
+
+@patch("services.AuditLog.ProjectTransition.get_by_project", return_value=[])
+@patch("services.AuditLog.ProjectTransition.insert_many", side_effect=lambda rows, batch_size: len(rows))
+def test_history_leaves_flush_listeners_to_flusher(mock_insert, mock_get, monkeypatch):
+    listener = MagicMock()
+    monkeypatch.setattr(AuditLog, "_listeners", [listener])
+    AuditLog.record(ProjectClosed("p1", "APPROVED", "CLOSED"))
+
+    AuditLog.get_project_history("p1", 10)
+
+    listener.assert_not_called()
+    assert AuditLog._wake.is_set()
+
+    AuditLog.record(ProjectClosed("p2", "APPROVED", "CLOSED"))
+    AuditLog.flush()
+
+    assert [[row[0] for row in call.args[0]] for call in listener.call_args_list] == [["p1"], ["p2"]]
+
+
+@pytest.mark.parametrize("limit, before_id", [(0, None), (1001, None), (10, 0)])
+def test_history_rejects_invalid_paging(limit, before_id):
+    with pytest.raises(ValueError):
+        AuditLog.get_actor_history("a1", limit, before_id)
@@ -0,0 +1,103 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.AuthService import AuthService
+from services.UserService import UserService
+
+
+RECORD = {"id": "u1", "name": "alice", "role": "CUSTOMER", "sessionVersion": 0}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    UserService.validated_users.clear()
+    yield
+    UserService.validated_users.clear()
+
+
+@patch("services.UserService.User.get_session_record", return_value=dict(RECORD))
+def test_validate_session_user_caches_record(mock_record):
+    session_user = {"user_id": "u1", "name": "alice", "session_version": 0}
+
+    assert AuthService.validate_session_user(session_user)["id"] == "u1"
+    assert AuthService.validate_session_user(session_user)["id"] == "u1"
+
+    mock_record.assert_called_once_with("u1")
+
+
+@patch("services.UserService.User.get_session_record", return_value=None)
+def test_validate_session_user_rejects_missing_user(mock_record):
+    assert AuthService.validate_session_user({"user_id": "u1", "session_version": 0}) is None
+
+
+@patch("services.UserService.User.get_session_record", return_value={**RECORD, "sessionVersion": 2})
+def test_validate_session_user_rejects_stale_version(mock_record):
+    assert AuthService.validate_session_user({"user_id": "u1", "session_version": 1}) is None
+    assert AuthService.validate_session_user({"user_id": "u1", "session_version": 2})["sessionVersion"] == 2
+
+    mock_record.assert_called_once()
+
+
+# ---------------------------
+# password hashing tests
+# ---------------------------
+
+def test_hash_password_uses_versioned_salted_format():
+    first = AuthService.hash_password("secret")
+    second = AuthService.hash_password("secret")
+
+    assert first.startswith("scrypt$v1$")
+    assert first != second
+    assert AuthService.verify_password("secret", first)
+    assert not AuthService.verify_password("wrong", first)
+    assert not AuthService.needs_rehash(first)
+
+
+def test_hash_passwords_hashes_in_order():
+    hashes = AuthService.hash_passwords(["a1", "b2", "c3"])
+
+    assert [AuthService.verify_password(pw, h) for pw, h in zip(["a1", "b2", "c3"], hashes)] == [True, True, True]
+
+
+def test_hash_password_rejects_empty_password():
+    with pytest.raises(ValueError):
+        AuthService.hash_password("")
+
+
+def test_verify_password_accepts_legacy_sha256():
+    legacy = "8c6976e5b5410415bde908bd4dee15dfb167a9c873fc4bb8a81f6f2ab448a918"
+
+    assert AuthService.verify_password("admin", legacy)
+    assert not AuthService.verify_password("other", legacy)
+    assert AuthService.needs_rehash(legacy)
+
+
+def test_verify_password_rejects_malformed_hash():
+    assert not AuthService.verify_password("secret", "scrypt$v1$x$8$1$zz$zz")
+
+
+@patch("services.AuthService.UserService.update_password")
+@patch("services.AuthService.UserService.get_user_by_name")
+def test_authenticate_user_upgrades_legacy_hash(mock_get, mock_update):
+    mock_get.return_value = {"id": "u1", "name": "Admin", "password": "8c6976e5b5410415bde908bd4dee15dfb167a9c873fc4bb8a81f6f2ab448a918"}
+
+    assert AuthService.authenticate_user("Admin", "admin")["id"] == "u1"
+
+    mock_update.assert_called_once()
+    user_id, new_hash = mock_update.call_args[0]
+    assert user_id == "u1"
+    assert AuthService.verify_password("admin", new_hash)
+
+
+@patch("services.AuthService.UserService.update_password")
+@patch("services.AuthService.UserService.get_user_by_name")
+def test_authenticate_user_wrong_password_does_not_rehash(mock_get, mock_update):
+    mock_get.return_value = {"id": "u1", "name": "Admin", "password": AuthService.hash_password("admin")}
+
+    assert AuthService.authenticate_user("Admin", "nope") is None
+    assert AuthService.authenticate_user("Admin", "admin")["id"] == "u1"
+    mock_update.assert_not_called()
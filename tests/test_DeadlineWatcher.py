@@ -0,0 +1,158 @@
+import itertools
+import os
+import sys
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.Project import Project, ProjectState
+from services.DeadlineWatcher import DeadlineWatcher, WARNING, ESCALATION
+from services.EventBus import ProjectCreated, ProjectClosed, TranslationUploaded
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+@pytest.fixture(autouse=True)
+def state(monkeypatch):
+    monkeypatch.setattr(DeadlineWatcher, "_heap", [])
+    monkeypatch.setattr(DeadlineWatcher, "_deadlines", {})
+    monkeypatch.setattr(DeadlineWatcher, "_sequence", itertools.count())
+    monkeypatch.setattr(DeadlineWatcher, "_wake", threading.Event())
+    monkeypatch.setattr(DeadlineWatcher, "WARNING_HOURS", 24)
+    monkeypatch.setattr(DeadlineWatcher, "ESCALATION_HOURS", 2)
+
+
+def test_track_schedules_warning_then_escalation():
+    due = NOW + timedelta(hours=30)
+    DeadlineWatcher.track("p1", due)
+
+    assert DeadlineWatcher.next_alert_at() == due - timedelta(hours=24)
+    assert DeadlineWatcher.pop_due(NOW) == []
+    assert DeadlineWatcher.pop_due(due - timedelta(hours=24)) == [("p1", WARNING, due)]
+    assert DeadlineWatcher.pop_due(due - timedelta(hours=2)) == [("p1", ESCALATION, due)]
+    assert DeadlineWatcher.next_alert_at() is None
+    assert DeadlineWatcher._deadlines == {}
+
+
+def test_pop_due_returns_alerts_in_time_order():
+    DeadlineWatcher.track("late", NOW + timedelta(hours=20))
+    DeadlineWatcher.track("early", NOW + timedelta(hours=10))
+
+    alerts = DeadlineWatcher.pop_due(NOW)
+
+    assert [(project_id, kind) for project_id, kind, _ in alerts] == [("early", WARNING), ("late", WARNING)]
+
+
+def test_untracked_and_moved_deadlines_are_skipped():
+    DeadlineWatcher.track("p1", NOW + timedelta(hours=1))
+    DeadlineWatcher.track("p2", NOW + timedelta(hours=1))
+    DeadlineWatcher.untrack("p1")
+    DeadlineWatcher.track("p2", NOW + timedelta(days=5))
+
+    assert DeadlineWatcher.pop_due(NOW + timedelta(hours=1)) == []
+
+
+def test_track_wakes_thread_only_for_earlier_alert():
+    DeadlineWatcher.track("p1", NOW + timedelta(hours=30))
+    DeadlineWatcher._wake.clear()
+
+    DeadlineWatcher.track("p2", NOW + timedelta(hours=40))
+    assert not DeadlineWatcher._wake.is_set()
+
+    DeadlineWatcher.track("p3", NOW + timedelta(hours=25))
+    assert DeadlineWatcher._wake.is_set()
+
+
+def test_track_skips_sent_alerts():
+    DeadlineWatcher.track("warned", NOW + timedelta(hours=1), warned=True)
+    DeadlineWatcher.track("escalated", NOW + timedelta(hours=1), warned=True, escalated=True)
+
+    assert [kind for _, kind, _ in DeadlineWatcher.pop_due(NOW + timedelta(hours=1))] == [ESCALATION]
+
+
+def test_on_event_tracks_new_deadlines_and_drops_finished_projects():
+    due = NOW + timedelta(hours=30)
+    DeadlineWatcher.on_event(ProjectCreated("p1", None, ProjectState.CREATED.value, due_at=due))
+    DeadlineWatcher.on_event(ProjectCreated("p2", None, ProjectState.CREATED.value))
+    DeadlineWatcher.on_event(TranslationUploaded("p1", ProjectState.ASSIGNED.value, ProjectState.COMPLETED.value))
+    assert DeadlineWatcher._deadlines == {"p1": due}
+
+    DeadlineWatcher.on_event(ProjectClosed("p1", ProjectState.APPROVED.value, ProjectState.CLOSED.value))
+    assert DeadlineWatcher._deadlines == {}
+
+
+@patch("services.DeadlineWatcher.Project.get_due_before")
+def test_refresh_tracks_unescalated_deadlines_from_index(mock_due):
+    due = NOW + timedelta(hours=3)
+    mock_due.return_value = [{"id": "p1", "dueAt": due, "dueWarnedAt": NOW, "dueEscalatedAt": None}]
+
+    assert DeadlineWatcher.refresh(NOW) == 1
+
+    states, horizon, limit = mock_due.call_args.args
+    assert states == ["CREATED", "ASSIGNED", "REJECTED"]
+    assert horizon > NOW + timedelta(hours=24)
+    assert mock_due.call_args.kwargs == {"unescalated_only": True}
+    assert DeadlineWatcher.pop_due(due) == [("p1", ESCALATION, due)]
+
+
+def _project(translator_id):
+    project = Project("c1", translator_id, "de", "c1_a.txt")
+    project.id = "p1"
+    project.name = "Manual"
+    project.state = ProjectState.ASSIGNED if translator_id else ProjectState.CREATED
+    project.due_at = datetime(2026, 3, 2, 9, 0)
+    return project
+
+
+@patch("services.DeadlineWatcher.db.transaction", return_value=nullcontext())
+@patch("services.DeadlineWatcher.EmailService.notify_users")
+@patch("services.DeadlineWatcher.UserService.get_user_contacts")
+@patch("services.DeadlineWatcher.Project.get_by_id")
+@patch("services.DeadlineWatcher.Project.mark_deadline_alert", return_value=True)
+def test_fire_warns_assigned_translator(mock_mark, mock_get, mock_contacts, mock_notify, mock_tx):
+    translator = MagicMock()
+    mock_get.return_value = _project("t1")
+    mock_contacts.return_value = {"t1": translator}
+
+    assert DeadlineWatcher.fire("p1", WARNING) is True
+
+    mock_mark.assert_called_once_with("p1", "dueWarnedAt", ["CREATED", "ASSIGNED", "REJECTED"])
+    template, notifications = mock_notify.call_args.args
+    assert template == "deadline_warning"
+    assert notifications == [(translator, {
+        "project_name": "Manual", "target_language": "de", "due_at": "2026-03-02 09:00", "state": "ASSIGNED",
+    })]
+
+
+@patch("services.DeadlineWatcher.db.transaction", return_value=nullcontext())
+@patch("services.DeadlineWatcher.EmailService.notify_users")
+@patch("services.DeadlineWatcher.UserService.get_user_contacts")
+@patch("services.DeadlineWatcher.User.get_all_users")
+@patch("services.DeadlineWatcher.Project.get_by_id")
+@patch("services.DeadlineWatcher.Project.mark_deadline_alert", return_value=True)
+def test_fire_escalates_to_administrators(mock_mark, mock_get, mock_admins, mock_contacts, mock_notify, mock_tx):
+    admin = MagicMock(id="a1")
+    mock_get.return_value = _project("t1")
+    mock_admins.return_value = [admin]
+    mock_contacts.return_value = {"a1": admin}
+
+    assert DeadlineWatcher.fire("p1", ESCALATION) is True
+
+    mock_contacts.assert_called_once_with(["a1"])
+    assert mock_notify.call_args.args[0] == "deadline_escalation"
+
+
+@patch("services.DeadlineWatcher.db.transaction", return_value=nullcontext())
+@patch("services.DeadlineWatcher.EmailService.notify_users")
+@patch("services.DeadlineWatcher.Project.mark_deadline_alert", return_value=False)
+def test_fire_skips_alert_sent_elsewhere(mock_mark, mock_notify, mock_tx):
+    DeadlineWatcher.track("p1", NOW + timedelta(hours=30))
+
+    assert DeadlineWatcher.fire("p1", WARNING) is False
+
+    mock_notify.assert_not_called()
+    assert "p1" not in DeadlineWatcher._deadlines
@@ -0,0 +1,118 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.EmailOutbox import EmailOutbox, OutboxStatus
+
+
+@patch("models.EmailOutbox.db.execute_query", return_value=1)
+def test_enqueue_inserts_pending_message(mock_query):
+    message_id = EmailOutbox.enqueue("a@x.com", "Subject", "Body")
+
+    args, kwargs = mock_query.call_args
+    assert args[0].startswith("INSERT INTO EmailOutbox")
+    assert args[1] == (message_id, "a@x.com", "Subject", "Body", OutboxStatus.PENDING.value, None)
+
+
+@patch("models.EmailOutbox.db.execute_many", return_value=2)
+def test_enqueue_many_shortens_long_subjects_to_column_size(mock_many):
+    EmailOutbox.enqueue_many([
+        ("a@x.com", "Project assigned: " + "x" * 300, "Body", False, "en"),
+        ("b@x.com", "Short", "Body", False, "en"),
+    ])
+
+    rows = mock_many.call_args.args[1]
+    assert len(rows[0][2]) == EmailOutbox.MAX_SUBJECT_LENGTH
+    assert rows[0][2].startswith("Project assigned: xxx") and rows[0][2].endswith("\u2026")
+    assert rows[1][2] == "Short"
+
+
+@patch("models.EmailOutbox.db.execute_query", return_value=None)
+def test_enqueue_raises_when_insert_fails(mock_query):
+    with pytest.raises(ValueError):
+        EmailOutbox.enqueue("a@x.com", "Subject", "Body")
+
+
+@patch("models.EmailOutbox.db")
+def test_claim_batch_skips_locked_rows_and_leases_claimed_ones(mock_db):
+    mock_db.execute_query.side_effect = [
+        [{"id": "m1", "recipient": "a@x.com", "subject": "S", "body": "B", "attempts": 0}],
+        1,
+    ]
+
+    messages = EmailOutbox.claim_batch(10, 300)
+
+    assert messages[0]["attempts"] == 1
+    mock_db.transaction.assert_called_once()
+    select_query, select_params = mock_db.execute_query.call_args_list[0][0]
+    assert "FOR UPDATE SKIP LOCKED" in select_query
+    assert select_params == ("PENDING", "SENDING", 10)
+    update_params = mock_db.execute_query.call_args_list[1][0][1]
+    assert update_params == ("SENDING", 300, "m1")
+
+
+@patch("models.EmailOutbox.db")
+def test_claim_batch_without_due_messages_skips_update(mock_db):
+    mock_db.execute_query.return_value = []
+
+    assert EmailOutbox.claim_batch(10, 300) == []
+    assert mock_db.execute_query.call_count == 1
+
+
+@patch("models.EmailOutbox.db.execute_query")
+def test_mark_failed_without_retry_dead_letters(mock_query):
+    EmailOutbox.mark_failed("m1", "boom")
+
+    assert mock_query.call_args[0][1] == ("DEAD", "boom", "m1")
+
+
+@patch("models.EmailOutbox.db.execute_query", return_value=[{"status": "PENDING", "count": 3}])
+def test_get_status_counts_fills_missing_statuses(mock_query):
+    assert EmailOutbox.get_status_counts() == {"BUFFERED": 0, "PENDING": 3, "SENDING": 0, "SENT": 0, "DEAD": 0, "DIGESTED": 0}
+
+
+@patch("models.EmailOutbox.db.execute_query", return_value=1)
+def test_enqueue_buffered_message_waits_for_digest(mock_query):
+    EmailOutbox.enqueue("a@x.com", "Subject", "Body", buffered=True)
+
+    assert mock_query.call_args[0][1][-2] == OutboxStatus.BUFFERED.value
+
+
+@patch("models.EmailOutbox.db.execute_query")
+def test_lock_due_digests_groups_locked_rows_by_recipient(mock_query):
+    mock_query.side_effect = [
+        [{"recipient": "a@x.com"}, {"recipient": "b@x.com"}],
+        [
+            {"id": "1", "recipient": "a@x.com", "subject": "S1", "body": "B1", "createdAt": None},
+            {"id": "2", "recipient": "a@x.com", "subject": "S2", "body": "B2", "createdAt": None},
+            {"id": "3", "recipient": "b@x.com", "subject": "S3", "body": "B3", "createdAt": None},
+        ],
+    ]
+
+    digests = EmailOutbox.lock_due_digests(3600, 100)
+
+    assert {r: [m["id"] for m in ms] for r, ms in digests.items()} == {"a@x.com": ["1", "2"], "b@x.com": ["3"]}
+    assert mock_query.call_args_list[0][0][1] == ("BUFFERED", 3600, 100)
+    assert "FOR UPDATE SKIP LOCKED" in mock_query.call_args_list[1][0][0]
+
+
+@patch("models.EmailOutbox.db.execute_many", return_value=2)
+def test_enqueue_broadcast_spreads_messages_over_time(mock_many):
+    recipients = ["a@x.com", "b@x.com", "c@x.com", "d@x.com", "e@x.com"]
+
+    assert EmailOutbox.enqueue_broadcast("b1", recipients, "S", "B", rate_per_second=2, batch_size=2) == 5
+
+    assert mock_many.call_count == 3
+    rows = [row for call in mock_many.call_args_list for row in call.args[1]]
+    assert [row[1] for row in rows] == recipients
+    assert [row[5] for row in rows] == [0, 0, 1, 1, 2]
+    assert all(row[6] == "b1" for row in rows)
+
+
+@patch("models.EmailOutbox.db.execute_many", return_value=None)
+def test_enqueue_broadcast_raises_when_insert_fails(mock_many):
+    with pytest.raises(ValueError):
+        EmailOutbox.enqueue_broadcast("b1", ["a@x.com"], "S", "B", rate_per_second=10)
@@ -0,0 +1,161 @@
+import os
+import smtplib
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from bin.smtp_pool import CircuitOpenError
+from datetime import datetime
+from contextlib import nullcontext
+from models.User import User, UserRole, NotificationMode
+from services.EmailService import EmailService
+
+
+def _message(message_id, attempts):
+    return {"id": message_id, "recipient": f"{message_id}@x.com", "subject": "S", "body": "B", "attempts": attempts}
+
+
+@patch("services.EmailService.EmailOutbox.enqueue", return_value="m1")
+def test_queue_email_stores_message_without_smtp(mock_enqueue):
+    with patch("bin.smtp_pool.smtplib.SMTP") as mock_smtp:
+        assert EmailService.queue_email("a@x.com", "Subject", "Body") == "m1"
+
+    mock_enqueue.assert_called_once_with("a@x.com", "Subject", "Body", buffered=False)
+    mock_smtp.assert_not_called()
+
+
+def test_queue_email_rejects_invalid_recipient():
+    with pytest.raises(ValueError):
+        EmailService.queue_email("", "Subject", "Body")
+
+
+@patch("services.EmailService.EmailOutbox")
+def test_deliver_pending_marks_sent_retried_and_dead(mock_outbox, monkeypatch):
+    monkeypatch.setattr(EmailService, "MAX_ATTEMPTS", 3)
+    mock_outbox.claim_batch.return_value = [_message("ok", 1), _message("retry", 2), _message("dead", 3)]
+
+    def send_email(email, subject, body):
+        if email != "ok@x.com":
+            raise smtplib.SMTPServerDisconnected("gone")
+
+    with patch.object(EmailService, "send_email", side_effect=send_email):
+        outcome = EmailService.deliver_pending(10)
+
+    assert outcome == {"sent": 1, "retried": 1, "dead": 1, "deferred": 0}
+    mock_outbox.claim_batch.assert_called_once_with(10, EmailService.SEND_LEASE_SECONDS)
+    mock_outbox.mark_sent.assert_called_once_with("ok")
+    failed = {call[0][0]: call[0][2:] for call in mock_outbox.mark_failed.call_args_list}
+    assert failed["dead"] == ()
+    assert len(failed["retry"]) == 1 and failed["retry"][0] > 0
+
+
+def test_retry_delay_grows_exponentially_and_is_capped(monkeypatch):
+    monkeypatch.setattr(EmailService, "RETRY_BASE_SECONDS", 10)
+    monkeypatch.setattr(EmailService, "RETRY_MAX_SECONDS", 100)
+
+    assert 5 <= EmailService.retry_delay(1) <= 10
+    assert 20 <= EmailService.retry_delay(3) <= 40
+    assert 50 <= EmailService.retry_delay(10) <= 100
+
+
+@patch("services.EmailService.EmailOutbox")
+def test_deliver_pending_releases_messages_refused_by_open_circuit(mock_outbox):
+    mock_outbox.claim_batch.return_value = [_message("m1", 1), _message("m2", 1)]
+
+    with patch.object(EmailService, "send_email", side_effect=CircuitOpenError("open")):
+        outcome = EmailService.deliver_pending(10)
+
+    assert outcome["deferred"] == 2
+    mock_outbox.release.assert_called_once()
+    assert mock_outbox.release.call_args[0][0] == ["m1", "m2"]
+    mock_outbox.mark_failed.assert_not_called()
+
+
+@patch("services.EmailService.EmailOutbox.enqueue", return_value="m1")
+def test_notify_user_buffers_for_digest_users(mock_enqueue):
+    user = User("Tom", "tom@x.com", UserRole.TRANSLATOR)
+    EmailService.notify_user(user, "translation_accepted", project_name="Manual")
+    user.notification_mode = NotificationMode.DIGEST
+    user.locale = "sk"
+    EmailService.notify_user(user, "translation_accepted", project_name="Manual")
+
+    immediate, buffered = mock_enqueue.call_args_list
+    assert immediate.args[1:] == ("Translation Accepted", "Your translation for project 'Manual' has been accepted.")
+    assert immediate.kwargs["buffered"] is False
+    assert buffered.args[1] == "Preklad prijatý"
+    assert buffered.kwargs == {"buffered": True, "locale": "sk"}
+
+
+@patch("services.EmailService.db.transaction", side_effect=lambda: nullcontext())
+@patch("services.EmailService.EmailOutbox")
+def test_flush_digests_coalesces_buffered_notifications(mock_outbox, mock_transaction):
+    created = datetime(2026, 1, 1, 12, 0)
+    mock_outbox.lock_due_digests.return_value = {
+        "busy@x.com": [
+            {"id": f"m{i}", "subject": f"Assigned {i}", "body": f"Project {i}", "createdAt": created}
+            for i in range(40)
+        ],
+        "quiet@x.com": [{"id": "q1", "subject": "Closed", "body": "Bye", "createdAt": created, "locale": "sk"}],
+    }
+    mock_outbox.enqueue.return_value = "digest1"
+
+    assert EmailService.flush_digests(600) == 2
+
+    mock_outbox.lock_due_digests.assert_called_once_with(600, EmailService.DIGEST_RECIPIENTS_PER_ROUND)
+    recipient, subject, body = mock_outbox.enqueue.call_args[0]
+    assert recipient == "busy@x.com"
+    assert "40 notifications" in subject
+    assert "[2026-01-01 12:00] Assigned 0" in body and "Project 39" in body
+    mock_outbox.mark_digested.assert_called_once_with([f"m{i}" for i in range(40)], "digest1")
+    mock_outbox.release_buffered.assert_called_once_with(["q1"])
+
+
+@patch("services.EmailService.db.transaction", return_value=nullcontext())
+@patch("services.EmailService.EmailOutbox.enqueue_broadcast", return_value=2)
+@patch("services.EmailService.User.get_project_participant_contacts")
+def test_queue_broadcast_deduplicates_resolved_recipients(mock_contacts, mock_enqueue, mock_tx):
+    mock_contacts.return_value = [
+        {"id": "c1", "email": "a@x.com"},
+        {"id": "c2", "email": "b@x.com"},
+        {"id": "c3", "email": "a@x.com"},
+    ]
+
+    result = EmailService.queue_broadcast("Subject", "Body", role="customer", language="de")
+
+    assert result["recipients"] == 2
+    mock_contacts.assert_called_once_with(UserRole.CUSTOMER, None, "de")
+    args = mock_enqueue.call_args.args
+    assert args[0] == result["broadcast_id"]
+    assert args[1] == ["a@x.com", "b@x.com"]
+
+
+def test_queue_broadcast_rejects_mixed_selection():
+    with pytest.raises(ValueError):
+        EmailService.queue_broadcast("Subject", "Body", user_ids=["u1"], role="TRANSLATOR")
+
+
+def test_queue_broadcast_rejects_unknown_project_state():
+    with pytest.raises(ValueError):
+        EmailService.queue_broadcast("Subject", "Body", role="TRANSLATOR", project_state="LOST")
+
+
+@patch("services.EmailService.EmailOutbox.enqueue_many")
+def test_notify_users_renders_batch_and_respects_modes(mock_enqueue_many):
+    immediate = User(name="A", email="a@x.com", role=UserRole.TRANSLATOR)
+    digest = User(name="B", email="b@x.com", role=UserRole.TRANSLATOR)
+    digest.notification_mode = NotificationMode.DIGEST
+    digest.locale = "sk"
+    invalid = User(name="C", email="", role=UserRole.TRANSLATOR)
+
+    queued = EmailService.notify_users("project_closed", [
+        (immediate, {"project_name": "P1"}),
+        (digest, {"project_name": "P2"}),
+        (invalid, {"project_name": "P3"}),
+    ])
+
+    assert queued == 2
+    messages = mock_enqueue_many.call_args.args[0]
+    assert [(m[0], m[3], m[4]) for m in messages] == [("a@x.com", False, "en"), ("b@x.com", True, "sk")]
+    assert "P1" in messages[0][2]
@@ -0,0 +1,53 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from jinja2 import UndefinedError
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.EmailTemplates import EmailTemplates
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture(autouse=True)
+def run_from_repo_root(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+
+def test_supported_locales_follow_ui_translation_files():
+    assert EmailTemplates.supported_locales() == {"en", "sk"}
+
+
+def test_every_template_exists_for_every_locale():
+    folder = os.path.join(ROOT, EmailTemplates.TEMPLATES_FOLDER)
+    names = {locale: sorted(os.listdir(os.path.join(folder, locale))) for locale in EmailTemplates.supported_locales()}
+
+    assert names["en"] == names["sk"]
+
+
+def test_render_uses_recipient_locale_and_falls_back_to_default():
+    assert EmailTemplates.render("translation_rejected", "sk", project_name="P", feedback="Typo") == (
+        "Preklad odmietnutý",
+        "Váš preklad projektu 'P' bol odmietnutý. Spätná väzba: Typo",
+    )
+    assert EmailTemplates.render("project_closed", "de", project_name="P") == (
+        "Project Closed",
+        "Your project 'P' has been closed.",
+    )
+
+
+def test_render_rejects_missing_variables():
+    with pytest.raises(UndefinedError):
+        EmailTemplates.render("translation_rejected", "en", project_name="P")
+
+
+def test_render_many_renders_each_item_in_its_locale():
+    messages = [{"subject": "S", "body": "B", "createdAt": datetime(2026, 1, 1)}] * 2
+
+    rendered = EmailTemplates.render_many("digest", [("en", {"messages": messages}), ("sk", {"messages": messages})])
+
+    assert rendered[0][0] == "Your PIA digest: 2 notifications"
+    assert rendered[1][0] == "Váš prehľad PIA: 2 upozornení"
+    assert rendered[0][1].count("[2026-01-01 00:00] S") == 2
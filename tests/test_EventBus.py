@@ -0,0 +1,91 @@
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.DatabaseConnector import DatabaseConnector
+from services.EventBus import EventBus, ProjectEvent, ProjectApproved, ProjectClosed
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    connector = DatabaseConnector("h", "u", "p", "d")
+    connector.connection = MagicMock(in_transaction=False)
+    monkeypatch.setattr("services.EventBus.db", connector)
+    monkeypatch.setattr(EventBus, "_subscribers", [])
+    return connector
+
+
+def test_events_are_delivered_after_commit(connector):
+    received = []
+    EventBus.subscribe(ProjectApproved, received.append)
+
+    with connector.transaction():
+        EventBus.publish(ProjectApproved("p1", "COMPLETED", "APPROVED", actor_id="c1"))
+        assert received == []
+        connector.connection.commit.assert_not_called()
+
+    assert [(e.project_id, e.from_state, e.to_state, e.actor_id) for e in received] == [("p1", "COMPLETED", "APPROVED", "c1")]
+
+
+def test_events_are_dropped_on_rollback(connector):
+    received = []
+    EventBus.subscribe(ProjectEvent, received.append)
+
+    with pytest.raises(ValueError):
+        with connector.transaction():
+            EventBus.publish(ProjectClosed("p1", "APPROVED", "CLOSED"))
+            raise ValueError("boom")
+
+    with connector.transaction():
+        pass
+
+    assert received == []
+
+
+def test_subscribers_receive_only_matching_event_types(connector):
+    approved, everything = [], []
+    EventBus.subscribe(ProjectApproved, approved.append)
+    EventBus.subscribe(ProjectEvent, everything.append)
+
+    EventBus.publish(ProjectClosed("p1", "APPROVED", "CLOSED"))
+
+    assert approved == []
+    assert len(everything) == 1
+
+
+def test_failing_subscriber_does_not_stop_others(connector):
+    received = []
+
+    def broken(event):
+        raise RuntimeError("subscriber bug")
+
+    EventBus.subscribe(ProjectClosed, broken)
+    EventBus.subscribe(ProjectClosed, received.append)
+
+    EventBus.publish(ProjectClosed("p1", "APPROVED", "CLOSED"))
+
+    assert len(received) == 1
+
+
+def test_asynchronous_subscriber_runs_on_pool_thread(connector):
+    done = threading.Event()
+    threads = []
+
+    def handler(event):
+        threads.append(threading.current_thread().name)
+        done.set()
+
+    EventBus.subscribe(ProjectClosed, handler, asynchronous=True)
+    EventBus.publish(ProjectClosed("p1", "APPROVED", "CLOSED"))
+
+    assert done.wait(5)
+    assert threads[0].startswith("event-bus")
+
+
+def test_subscribe_rejects_non_event_types(connector):
+    with pytest.raises(ValueError):
+        EventBus.subscribe(dict, print)
@@ -0,0 +1,51 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.IdempotencyKey import IdempotencyKey
+
+
+@patch("models.IdempotencyKey.db")
+def test_reserve_discards_expired_record_then_inserts(mock_db):
+    mock_db.execute_query.side_effect = [0, 1]
+
+    assert IdempotencyKey.reserve("u1", "k1", "hash", 300) is True
+    delete_query = mock_db.execute_query.call_args_list[0][0][0]
+    insert_query, insert_params = mock_db.execute_query.call_args_list[1][0]
+    assert delete_query.startswith("DELETE FROM IdempotencyKeys") and "expiresAt < NOW()" in delete_query
+    assert insert_query.startswith("INSERT IGNORE INTO IdempotencyKeys")
+    assert insert_params == ("u1", "k1", "hash", "IN_PROGRESS", 300)
+    mock_db.transaction.assert_called_once()
+
+
+@patch("models.IdempotencyKey.db")
+def test_reserve_reports_key_held_by_another_request(mock_db):
+    mock_db.execute_query.side_effect = [0, 0]
+
+    assert IdempotencyKey.reserve("u1", "k1", "hash", 300) is False
+
+
+@patch("models.IdempotencyKey.db")
+def test_reserve_raises_when_insert_fails(mock_db):
+    mock_db.execute_query.side_effect = [0, None]
+
+    with pytest.raises(ValueError):
+        IdempotencyKey.reserve("u1", "k1", "hash", 300)
+
+
+@patch("models.IdempotencyKey.db.execute_query", return_value=1)
+def test_complete_stores_response_with_ttl(mock_query):
+    IdempotencyKey.complete("u1", "k1", 201, '{"ok": true}', 86400)
+
+    assert mock_query.call_args[0][1] == ("COMPLETED", 201, '{"ok": true}', 86400, "u1", "k1")
+
+
+@patch("models.IdempotencyKey.db.execute_query", return_value=1)
+def test_release_only_drops_unfinished_reservation(mock_query):
+    IdempotencyKey.release("u1", "k1")
+
+    assert "status = %s" in mock_query.call_args[0][0]
+    assert mock_query.call_args[0][1] == ("u1", "k1", "IN_PROGRESS")
@@ -0,0 +1,156 @@
+import io
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, jsonify, request
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.IdempotencyService import IdempotencyService, idempotent
+
+
+class FakeKeys:
+    """In-memory stand-in for the IdempotencyKeys table."""
+
+    def __init__(self):
+        self.rows = {}
+        self.lock = threading.Lock()
+
+    def reserve(self, user_id, key, request_hash, lock_seconds):
+        with self.lock:
+            if (user_id, key) in self.rows:
+                return False
+            self.rows[(user_id, key)] = {"requestHash": request_hash, "status": "IN_PROGRESS",
+                                         "responseStatus": None, "responseBody": None}
+            return True
+
+    def get(self, user_id, key):
+        with self.lock:
+            row = self.rows.get((user_id, key))
+            return dict(row) if row else None
+
+    def complete(self, user_id, key, status, body, ttl_seconds):
+        with self.lock:
+            self.rows[(user_id, key)].update(status="COMPLETED", responseStatus=status, responseBody=body)
+
+    def release(self, user_id, key):
+        with self.lock:
+            self.rows.pop((user_id, key), None)
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    fake = FakeKeys()
+    for name in ("reserve", "get", "complete", "release"):
+        monkeypatch.setattr(f"services.IdempotencyService.IdempotencyKey.{name}", getattr(fake, name))
+    return fake
+
+
+def test_retry_replays_recorded_response_without_running_handler(keys):
+    calls = []
+
+    def handler():
+        calls.append(1)
+        return '{"id": "p1"}', 201
+
+    assert IdempotencyService.execute("u1", "k1", "h", handler) == ('{"id": "p1"}', 201, False)
+    assert IdempotencyService.execute("u1", "k1", "h", handler) == ('{"id": "p1"}', 201, True)
+    assert len(calls) == 1
+
+
+def test_key_reused_for_different_request_is_rejected(keys):
+    IdempotencyService.execute("u1", "k1", "h1", lambda: ("{}", 201))
+
+    assert IdempotencyService.execute("u1", "k1", "h2", lambda: ("{}", 201))[1] == 422
+
+
+def test_keys_are_scoped_per_user(keys):
+    IdempotencyService.execute("u1", "k1", "h", lambda: ("{}", 201))
+
+    assert IdempotencyService.execute("u2", "k1", "h", lambda: ("{}", 200)) == ("{}", 200, False)
+
+
+def test_server_errors_and_exceptions_release_the_key(keys):
+    IdempotencyService.execute("u1", "k1", "h", lambda: ("{}", 500))
+    assert keys.rows == {}
+
+    def broken():
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        IdempotencyService.execute("u1", "k1", "h", broken)
+    assert keys.rows == {}
+
+
+def test_concurrent_duplicate_waits_for_first_request(keys):
+    started, calls, results = threading.Event(), [], []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.3)
+        return '{"id": "p1"}', 201
+
+    first = threading.Thread(target=lambda: results.append(IdempotencyService.execute("u1", "k1", "h", slow)))
+    first.start()
+    started.wait(5)
+    second = IdempotencyService.execute("u1", "k1", "h", slow)
+    first.join()
+
+    assert len(calls) == 1
+    assert second == ('{"id": "p1"}', 201, True)
+
+
+def test_duplicate_gives_up_after_wait_limit(keys):
+    keys.reserve("u1", "k1", "h", 300)
+
+    with patch.object(IdempotencyService, "WAIT_SECONDS", 0.1):
+        assert IdempotencyService.execute("u1", "k1", "h", lambda: ("{}", 201))[1] == 409
+
+
+def test_rejects_overlong_key(keys):
+    with pytest.raises(ValueError):
+        IdempotencyService.execute("u1", "k" * 256, "h", lambda: ("{}", 201))
+
+
+@pytest.fixture
+def client(keys):
+    app = Flask(__name__)
+    app.secret_key = "test"
+    calls = []
+
+    @app.route("/upload", methods=["POST"])
+    @idempotent
+    def upload():
+        calls.append(request.files["file"].read())
+        return jsonify({"stored": len(calls)}), 201
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["user"] = {"user_id": "u1"}
+    client.calls = calls
+    return client
+
+
+def test_decorator_replays_upload_and_rewinds_file_for_handler(client):
+    def post(data=b"hello"):
+        return client.post("/upload", headers={"Idempotency-Key": "k1"},
+                           data={"file": (io.BytesIO(data), "a.txt")}, content_type="multipart/form-data")
+
+    first, retry = post(), post()
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.get_json() == {"stored": 1}
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert client.calls == [b"hello"]
+    assert post(b"other").status_code == 422
+
+
+def test_decorator_passes_through_requests_without_key(client):
+    for _ in range(2):
+        client.post("/upload", data={"file": (io.BytesIO(b"x"), "a.txt")}, content_type="multipart/form-data")
+
+    assert len(client.calls) == 2
@@ -0,0 +1,81 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.Job import Job, JobStatus
+
+
+@patch("models.Job.db.execute_many", return_value=2)
+def test_enqueue_many_inserts_all_jobs_in_one_statement(mock_many):
+    ids = Job.enqueue_many([("a", {"x": 1}, 5, 0, 3), ("b", None, 0, 60, 5)])
+
+    assert len(ids) == 2
+    query, rows = mock_many.call_args[0]
+    assert query.startswith("INSERT INTO Jobs")
+    assert rows == [
+        (ids[0], "a", '{"x": 1}', 5, "PENDING", 3, 0),
+        (ids[1], "b", "{}", 0, "PENDING", 5, 60),
+    ]
+
+
+@patch("models.Job.db.execute_many", return_value=None)
+def test_enqueue_raises_when_insert_fails(mock_many):
+    with pytest.raises(ValueError):
+        Job.enqueue("a")
+
+
+@patch("models.Job.db")
+def test_claim_batch_skips_locked_rows_and_leases_claimed_ones(mock_db):
+    mock_db.execute_query.side_effect = [
+        [{"id": "j1", "type": "a", "payload": '{"x": 1}', "attempts": 0, "maxAttempts": 5}],
+        1,
+    ]
+
+    jobs = Job.claim_batch(10, 300, ["a", "b"])
+
+    assert jobs == [{"id": "j1", "type": "a", "payload": {"x": 1}, "attempts": 1, "maxAttempts": 5}]
+    mock_db.transaction.assert_called_once()
+    select_query, select_params = mock_db.execute_query.call_args_list[0][0]
+    assert "ORDER BY priority DESC, runAt" in select_query
+    assert select_query.endswith("FOR UPDATE SKIP LOCKED")
+    assert select_params == ("PENDING", "a", "b", 10)
+    assert mock_db.execute_query.call_args_list[1][0][1] == ("RUNNING", 300, "j1")
+
+
+@patch("models.Job.db")
+def test_claim_batch_without_due_jobs_skips_update(mock_db):
+    mock_db.execute_query.return_value = []
+
+    assert Job.claim_batch(10, 300) == []
+    assert mock_db.execute_query.call_count == 1
+
+
+@patch("models.Job.db.execute_query")
+def test_mark_done_updates_all_jobs_at_once(mock_query):
+    Job.mark_done(["j1", "j2"])
+
+    assert mock_query.call_count == 1
+    assert mock_query.call_args[0][1] == ("DONE", "j1", "j2")
+
+
+@patch("models.Job.db.execute_query")
+def test_mark_failed_reschedules_or_dead_letters(mock_query):
+    Job.mark_failed("j1", "boom", 30)
+    assert mock_query.call_args[0][1] == ("PENDING", "boom", 30, "j1")
+
+    Job.mark_failed("j1", "boom")
+    assert mock_query.call_args[0][1] == ("DEAD", "boom", "j1")
+
+
+@patch("models.Job.db.execute_query", return_value=0)
+def test_extend_lease_reports_lost_job(mock_query):
+    assert Job.extend_lease("j1", 300) is False
+    assert mock_query.call_args[0][1] == (300, "j1", "RUNNING")
+
+
+@patch("models.Job.db.execute_query", return_value=[{"status": "DONE", "count": 7}])
+def test_get_status_counts_fills_missing_statuses(mock_query):
+    assert Job.get_status_counts() == {status.value: (7 if status is JobStatus.DONE else 0) for status in JobStatus}
@@ -0,0 +1,88 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.JobQueue import JobQueue
+
+
+@pytest.fixture(autouse=True)
+def handlers(monkeypatch):
+    monkeypatch.setattr(JobQueue, "_handlers", {})
+
+
+def _job(job_id, job_type="ok", attempts=1, max_attempts=3):
+    return {"id": job_id, "type": job_type, "payload": {"n": job_id}, "attempts": attempts, "maxAttempts": max_attempts}
+
+
+@patch("services.JobQueue.Job.enqueue", return_value="j1")
+def test_enqueue_validates_type_and_payload(mock_enqueue):
+    JobQueue.register("ok", lambda payload: None)
+
+    assert JobQueue.enqueue("ok", {"n": 1}, priority=5) == "j1"
+    mock_enqueue.assert_called_once_with("ok", {"n": 1}, 5, 0, JobQueue.MAX_ATTEMPTS)
+
+    with pytest.raises(ValueError):
+        JobQueue.enqueue("unknown")
+    with pytest.raises(ValueError):
+        JobQueue.enqueue("ok", {"when": object()})
+    with pytest.raises(ValueError):
+        JobQueue.enqueue("ok", delay_seconds=-1)
+
+
+def test_register_rejects_conflicting_handler():
+    JobQueue.register("ok", print)
+
+    with pytest.raises(ValueError):
+        JobQueue.register("ok", repr)
+
+
+def test_register_works_as_decorator():
+    @JobQueue.register("decorated")
+    def handler(payload):
+        pass
+
+    assert JobQueue._handlers["decorated"] is handler
+
+
+@patch("services.JobQueue.Job.mark_failed")
+@patch("services.JobQueue.Job.mark_done")
+@patch("services.JobQueue.Job.claim_batch")
+def test_run_batch_marks_successes_together_and_retries_failures(mock_claim, mock_done, mock_failed):
+    seen = []
+    JobQueue.register("ok", seen.append)
+
+    def broken(payload):
+        raise RuntimeError("boom")
+
+    JobQueue.register("broken", broken)
+    mock_claim.return_value = [
+        _job("j1"), _job("j2", "broken", attempts=1), _job("j3", "broken", attempts=3), _job("j4"),
+    ]
+
+    with patch.object(JobQueue, "retry_delay", return_value=42):
+        outcome = JobQueue.run_batch(10)
+
+    assert outcome == {"done": 2, "retried": 1, "dead": 1}
+    assert seen == [{"n": "j1"}, {"n": "j4"}]
+    mock_claim.assert_called_once_with(10, JobQueue.VISIBILITY_TIMEOUT_SECONDS, ["broken", "ok"])
+    mock_done.assert_called_once_with(["j1", "j4"])
+    assert [c.args for c in mock_failed.call_args_list] == [
+        ("j2", "RuntimeError: boom", 42),
+        ("j3", "RuntimeError: boom"),
+    ]
+
+
+@patch("services.JobQueue.Job.claim_batch")
+def test_run_batch_without_handlers_claims_nothing(mock_claim):
+    assert JobQueue.run_batch() == {"done": 0, "retried": 0, "dead": 0}
+    mock_claim.assert_not_called()
+
+
+def test_retry_delay_grows_and_is_capped():
+    with patch.object(JobQueue, "RETRY_BASE_SECONDS", 10), patch.object(JobQueue, "RETRY_MAX_SECONDS", 100):
+        assert 5 <= JobQueue.retry_delay(1) <= 10
+        assert 20 <= JobQueue.retry_delay(3) <= 40
+        assert 50 <= JobQueue.retry_delay(10) <= 100
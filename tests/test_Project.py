@@ -114,6 +114,88 @@ def test_assign_translator_invalid_translator_id(mock_execute):
         Project.assign_translator("proj123", None)
 
 
+# ---------------------------
+# get_translator_stats tests
+# ---------------------------
+
+@patch("models.Project.db.execute_query")
+def test_get_translator_stats_aggregates_in_one_query(mock_execute):
+    mock_execute.return_value = [
+        {"translatorId": "t1", "approved": 3, "rejected": 1, "backlog": 2, "avg_turnaround": 3600},
+        {"translatorId": "t2", "approved": 0, "rejected": 0, "backlog": 1, "avg_turnaround": None},
+    ]
+
+    result = Project.get_translator_stats(["t1", "t2"])
+
+    assert result == {
+        "t1": {"approved": 3, "rejected": 1, "backlog": 2, "avg_turnaround": 3600.0},
+        "t2": {"approved": 0, "rejected": 0, "backlog": 1, "avg_turnaround": None},
+    }
+    mock_execute.assert_called_once()
+    args, kwargs = mock_execute.call_args
+    assert "GROUP BY translatorId" in args[0]
+    assert args[1][-2:] == ("t1", "t2")
+
+
+@patch("models.Project.db.execute_query")
+def test_get_translator_stats_empty_input_skips_query(mock_execute):
+    assert Project.get_translator_stats([]) == {}
+    mock_execute.assert_not_called()
+
+
+# ---------------------------
+# assign_best_translator tests
+# ---------------------------
+
+@patch("models.Project.db")
+def test_assign_best_translator_defaults_to_fewest_open_projects(mock_db):
+    mock_db.execute_query.side_effect = [
+        [{"id": "t1"}, {"id": "t2"}, {"id": "t3"}],
+        [{"translatorId": "t1", "backlog": 4}, {"translatorId": "t2", "backlog": 1}],
+        1,
+    ]
+
+    result = Project.assign_best_translator("proj1", ["t1", "t2", "t3"])
+
+    assert result == "t3"
+    mock_db.transaction.assert_called_once()
+    lock_query = mock_db.execute_query.call_args_list[0][0][0]
+    assert "FOR UPDATE" in lock_query
+    update_args = mock_db.execute_query.call_args_list[2][0]
+    assert update_args[1] == ("t3", ProjectState.ASSIGNED.value, "proj1")
+
+
+@patch("models.Project.db")
+def test_assign_best_translator_uses_rank_on_existing_candidates(mock_db):
+    mock_db.execute_query.side_effect = [
+        [{"id": "t1"}, {"id": "t2"}],
+        [],
+        1,
+    ]
+    rank = MagicMock(return_value=["t2", "t1"])
+
+    result = Project.assign_best_translator("proj1", ["gone", "t1", "t2"], rank)
+
+    assert result == "t2"
+    rank.assert_called_once_with(["t1", "t2"], {})
+
+
+@patch("models.Project.db")
+def test_assign_best_translator_returns_none_without_candidates(mock_db):
+    mock_db.execute_query.return_value = []
+
+    assert Project.assign_best_translator("proj1", []) is None
+    assert Project.assign_best_translator("proj1", ["gone"]) is None
+
+
+@patch("models.Project.db")
+def test_assign_best_translator_failed_update_raises(mock_db):
+    mock_db.execute_query.side_effect = [[{"id": "t1"}], [], 0]
+
+    with pytest.raises(ValueError, match="Failed to assign translator"):
+        Project.assign_best_translator("proj1", ["t1"])
+
+
 # ---------------------------
 # get_all tests
 # ---------------------------
@@ -130,6 +212,36 @@ def test_get_all_uses_from_result(mock_execute):
     mock_from.assert_called_once_with(mock_execute.return_value)
 
 
+# ---------------------------
+# get_filtered tests
+# ---------------------------
+
+@patch("models.Project.db.execute_query")
+def test_get_filtered_without_filters_selects_all(mock_execute):
+    mock_execute.return_value = []
+
+    result = Project.get_filtered()
+
+    assert result == []
+    args, kwargs = mock_execute.call_args
+    assert "WHERE" not in args[0]
+    assert args[1] == ()
+
+
+@patch("models.Project.db.execute_query")
+def test_get_filtered_pushes_all_filters_into_sql(mock_execute):
+    mock_execute.return_value = [{"id": "p1", "state": "ASSIGNED", "languageCode": "en"}]
+    created_from = datetime(2026, 1, 1)
+    created_to = datetime(2026, 1, 31)
+
+    result = Project.get_filtered("ASSIGNED", "en", created_from, created_to)
+
+    assert [p.id for p in result] == ["p1"]
+    args, kwargs = mock_execute.call_args
+    assert "WHERE state = %s AND languageCode = %s AND createdAt >= %s AND createdAt <= %s" in args[0]
+    assert args[1] == ("ASSIGNED", "en", created_from, created_to)
+
+
 # ---------------------------
 # get_by_id tests
 # ---------------------------
@@ -426,3 +538,125 @@ def test_from_result_missing_and_invalid_values():
     assert p.translated_file is None
     assert p.state == ProjectState.CREATED
     assert isinstance(p.created_at, datetime)
+
+
+@patch("models.Project.db.execute_query")
+def test_lock_many_locks_all_rows_in_one_query(mock_execute):
+    mock_execute.return_value = [{"id": "p1", "state": "APPROVED"}, {"id": "p2", "state": "ASSIGNED"}]
+
+    projects = Project.lock_many(["p2", "p1"])
+
+    assert set(projects) == {"p1", "p2"}
+    query, params = mock_execute.call_args.args
+    assert query.endswith("FOR UPDATE")
+    assert params == ("p2", "p1")
+
+
+@patch("models.Project.db.execute_query", return_value=2)
+def test_update_states_uses_single_update(mock_execute):
+    assert Project.update_states(["p1", "p2"], "CLOSED") == 2
+
+    mock_execute.assert_called_once()
+    assert mock_execute.call_args.args[1] == ("CLOSED", "p1", "p2")
+
+
+@patch("models.Project.db.execute_query")
+def test_update_states_empty_input_skips_query(mock_execute):
+    assert Project.update_states([], "CLOSED") == 0
+    mock_execute.assert_not_called()
+
+
+@patch("models.Project.db.execute_many", return_value=2)
+def test_create_many_inserts_all_rows_in_one_statement(mock_many):
+    projects = Project.create_many("c1", [("A", "D", "de", "c1_a.txt"), ("B", "D", "fr", "c1_b.txt")])
+
+    assert [p.name for p in projects] == ["A", "B"]
+    mock_many.assert_called_once()
+    rows = mock_many.call_args.args[1]
+    assert [row[0] for row in rows] == [p.id for p in projects]
+
+
+@patch("models.Project.db")
+def test_assign_best_translators_by_language_spreads_batch_by_backlog(mock_db):
+    mock_db.execute_query.side_effect = [
+        [{"id": "t1"}, {"id": "t2"}],
+        [{"translatorId": "t1", "approved": 0, "rejected": 0, "backlog": 1, "avg_turnaround": None}],
+        2,
+        1,
+    ]
+
+    assignments = Project.assign_best_translators_by_language([(["p1", "p2", "p3", "p4"], ["t1", "t2"])])
+
+    assert sorted(assignments.values()).count("t2") == 2
+    assert sorted(assignments.values()).count("t1") == 2
+    assert assignments["p1"] == "t2"
+
+
+@patch("models.Project.db")
+def test_assign_best_translators_by_language_locks_all_candidates_once(mock_db):
+    mock_db.execute_query.side_effect = [
+        [{"id": "t1"}, {"id": "t2"}],
+        [],
+        1,
+        1,
+    ]
+
+    assignments = Project.assign_best_translators_by_language([
+        (["p-de"], ["t1", "t2"]),
+        (["p-fr"], ["t2"]),
+        (["p-xx"], []),
+    ])
+
+    assert assignments == {"p-de": "t1", "p-fr": "t2"}
+    lock_query, lock_params = mock_db.execute_query.call_args_list[0].args
+    assert "FOR UPDATE" in lock_query
+    assert lock_params == ("t1", "t2")
+
+
+@patch("models.Project.db.execute_query", return_value=[])
+def test_lock_stalled_scans_index_range_after_cursor(mock_execute):
+    cursor = (datetime(2026, 1, 1, 12, 0), "p9")
+
+    Project.lock_stalled("ASSIGNED", 3600, 50, after=cursor)
+
+    query, params = mock_execute.call_args.args
+    assert "WHERE state = %s AND updatedAt < NOW() - INTERVAL %s SECOND" in query
+    assert query.endswith("ORDER BY updatedAt, id LIMIT %s FOR UPDATE SKIP LOCKED")
+    assert params == ("ASSIGNED", 3600, cursor[0], cursor[0], "p9", 50)
+
+
+@patch("models.Project.db.execute_query", return_value=None)
+def test_lock_stalled_failure_raises(mock_execute):
+    with pytest.raises(ValueError):
+        Project.lock_stalled("ASSIGNED", 3600, 50)
+
+
+@patch("models.Project.db.execute_query", return_value=[])
+def test_get_due_before_uses_state_due_index(mock_execute):
+    due_before = datetime(2026, 1, 2, 12, 0)
+
+    Project.get_due_before(["CREATED", "ASSIGNED"], due_before, 20, unescalated_only=True)
+
+    query, params = mock_execute.call_args.args
+    assert "WHERE state IN (%s, %s) AND dueAt <= %s AND dueEscalatedAt IS NULL ORDER BY dueAt LIMIT %s" in query
+    assert params == ("CREATED", "ASSIGNED", due_before, 20)
+
+
+@patch("models.Project.db.execute_query", return_value=1)
+def test_mark_deadline_alert_is_conditional_and_keeps_updated_at(mock_execute):
+    assert Project.mark_deadline_alert("p1", "dueWarnedAt", ["ASSIGNED"]) is True
+
+    query, params = mock_execute.call_args.args
+    assert "SET dueWarnedAt = NOW(), updatedAt = updatedAt" in query
+    assert "dueWarnedAt IS NULL" in query
+    assert params == ("p1", "ASSIGNED")
+
+
+@patch("models.Project.db.execute_query", return_value=0)
+def test_mark_deadline_alert_returns_false_when_already_sent(mock_execute):
+    assert Project.mark_deadline_alert("p1", "dueEscalatedAt", ["ASSIGNED"]) is False
+
+
+def test_mark_deadline_alert_rejects_unknown_column():
+    with pytest.raises(ValueError):
+        Project.mark_deadline_alert("p1", "state", ["ASSIGNED"])
@@ -0,0 +1,285 @@
+import io
+import os
+import sys
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from werkzeug.datastructures import FileStorage
+from models.Project import Project, ProjectState
+from models.User import User, UserRole
+from services.ProjectService import ProjectService
+from services.EventBus import TranslatorAssigned
+
+
+def _row(project_id, state, translator_id="t1", language="de"):
+    return {"id": project_id, "name": f"Project {project_id}", "state": state,
+            "customerId": "c1", "translatorId": translator_id, "languageCode": language}
+
+
+def _translator(user_id="t1"):
+    user = User(name="T", email=f"{user_id}@x.com", role=UserRole.TRANSLATOR)
+    user.id = user_id
+    return user
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.EventBus.publish")
+@patch("services.ProjectService.EmailService.notify_users")
+@patch("services.ProjectService.UserService.get_user_contacts")
+@patch("services.ProjectService.Project.update_states")
+@patch("services.ProjectService.Project.lock_many")
+def test_bulk_update_status_applies_allowed_transitions_only(mock_lock, mock_update, mock_contacts, mock_notify, mock_publish, mock_tx):
+    mock_lock.return_value = {"p1": _row("p1", "APPROVED"), "p2": _row("p2", "ASSIGNED")}
+    mock_contacts.return_value = {"t1": _translator()}
+
+    result = ProjectService.bulk_update_status(["p1", "p2", "p3", "p1"], "closed", actor_id="a1")
+
+    assert result["updated"] == 1
+    assert result["results"] == [
+        {"project_id": "p1", "ok": True},
+        {"project_id": "p2", "ok": False, "error": "Invalid state transition from ASSIGNED."},
+        {"project_id": "p3", "ok": False, "error": "Project not found."},
+    ]
+    mock_lock.assert_called_once_with(["p1", "p2", "p3"])
+    mock_update.assert_called_once_with(["p1"], "CLOSED")
+    template, notifications = mock_notify.call_args.args
+    assert template == "project_closed"
+    assert [context for _, context in notifications] == [{"project_name": "Project p1"}]
+    event = mock_publish.call_args.args[0]
+    assert (event.project_id, event.from_state, event.to_state, event.actor_id) == ("p1", "APPROVED", "CLOSED", "a1")
+
+
+@pytest.mark.parametrize("status", ["COMPLETED", "APPROVED"])
+def test_bulk_update_status_rejects_unsupported_state(status):
+    with pytest.raises(ValueError):
+        ProjectService.bulk_update_status(["p1"], status)
+
+
+def test_bulk_update_status_rejects_too_many_projects():
+    with patch.object(ProjectService, "MAX_BULK_PROJECTS", 2):
+        with pytest.raises(ValueError):
+            ProjectService.bulk_update_status(["p1", "p2", "p3"], "CLOSED")
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.EventBus.publish")
+@patch("services.ProjectService.EmailService.notify_users")
+@patch("services.ProjectService.TranslatorDirectory.get_translator_ids")
+@patch("services.ProjectService.Project.assign_translator_many")
+@patch("services.ProjectService.Project.lock_many")
+@patch("services.ProjectService.UserService.get_user_contact")
+def test_bulk_assign_translator_checks_state_and_language(mock_contact, mock_lock, mock_assign, mock_directory, mock_notify, mock_publish, mock_tx):
+    mock_contact.return_value = _translator("t2")
+    mock_lock.return_value = {
+        "p1": _row("p1", "ASSIGNED"),
+        "p2": _row("p2", "APPROVED"),
+        "p3": _row("p3", "REJECTED", language="fr"),
+    }
+    mock_directory.side_effect = lambda language: ["t2"] if language == "de" else ["t9"]
+
+    result = ProjectService.bulk_assign_translator(["p1", "p2", "p3"], "t2")
+
+    assert [r["ok"] for r in result["results"]] == [True, False, False]
+    mock_assign.assert_called_once_with(["p1"], "t2")
+    assert mock_notify.call_args.args[0] == "project_assigned"
+    assert len(mock_notify.call_args.args[1]) == 1
+
+
+@patch("services.ProjectService.UserService.get_user_contact", return_value=None)
+def test_bulk_assign_translator_requires_existing_translator(mock_contact):
+    with pytest.raises(ValueError):
+        ProjectService.bulk_assign_translator(["p1"], "missing")
+
+
+def _upload(name, data=b"text"):
+    return FileStorage(stream=io.BytesIO(data), filename=name)
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.EventBus.publish")
+@patch("services.ProjectService.EmailService.notify_users")
+@patch("services.ProjectService.UserService.get_user_contacts")
+@patch("services.ProjectService.Project.update_states")
+@patch("services.ProjectService.Project.assign_best_translators_by_language")
+@patch("services.ProjectService.TranslatorDirectory.get_translator_ids_by_language")
+@patch("services.ProjectService.Project.create_many")
+def test_create_projects_resolves_translators_for_all_languages_at_once(mock_create, mock_directory, mock_assign, mock_update,
+                                                                mock_contacts, mock_notify, mock_publish, mock_tx, tmp_path, monkeypatch):
+    monkeypatch.setattr(ProjectService, "ORIGINAL_FILES_FOLDER", str(tmp_path))
+    mock_create.side_effect = lambda customer_id, records: [
+        Project(customer_id, None, language, filename) for _, _, language, filename in records
+    ]
+    mock_directory.side_effect = lambda languages: {language: ["t1", "t2"] if language == "de" else [] for language in languages}
+    mock_assign.side_effect = lambda batches, rank: {
+        pid: candidates[i % 2] for ids, candidates in batches if candidates for i, pid in enumerate(ids)
+    }
+    mock_contacts.return_value = {}
+
+    projects = ProjectService.create_projects("c1", "Docs", [
+        ("A", "de", _upload("a.txt")), ("B", "de", _upload("b.txt")), ("C", "xx", _upload("c.txt")),
+    ])
+
+    assert mock_create.call_count == 1
+    mock_directory.assert_called_once_with(["de", "xx"])
+    mock_assign.assert_called_once()
+    assert [p.translator_id for p in projects] == ["t1", "t2", None]
+    assert projects[2].state == ProjectState.CLOSED
+    mock_update.assert_called_once_with([projects[2].id], ProjectState.CLOSED.value)
+    stored = projects[0].original_file
+    assert stored.startswith("c1-") and stored.endswith("_a.txt")
+    assert (tmp_path / stored).read_bytes() == b"text"
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.Project.create_many", side_effect=ValueError("insert failed"))
+def test_create_projects_failure_keeps_files_of_existing_projects(mock_create, mock_tx, tmp_path, monkeypatch):
+    monkeypatch.setattr(ProjectService, "ORIGINAL_FILES_FOLDER", str(tmp_path))
+    (tmp_path / "c1_a.txt").write_bytes(b"existing")
+
+    with pytest.raises(ValueError):
+        ProjectService.create_projects("c1", "Docs", [("A", "de", _upload("a.txt"))])
+
+    assert [path.name for path in tmp_path.iterdir()] == ["c1_a.txt"]
+    assert (tmp_path / "c1_a.txt").read_bytes() == b"existing"
+
+
+def test_create_projects_rejects_oversized_file_and_cleans_up(tmp_path, monkeypatch):
+    monkeypatch.setattr(ProjectService, "ORIGINAL_FILES_FOLDER", str(tmp_path))
+    monkeypatch.setattr("services.ProjectService.MAX_FILE_SIZE_MB", 0)
+
+    with pytest.raises(ValueError):
+        ProjectService.create_projects("c1", "Docs", [("A", "de", _upload("a.txt"))])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_create_projects_rejects_duplicate_file_names():
+    with pytest.raises(ValueError):
+        ProjectService.create_projects("c1", "Docs", [("A", "de", _upload("a.txt")), ("B", "de", _upload("a.txt"))])
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.ProjectService._assign_new_projects")
+@patch("services.ProjectService.Project.create_many")
+def test_create_projects_for_languages_stores_source_once(mock_create, mock_assign, mock_tx, tmp_path, monkeypatch):
+    monkeypatch.setattr(ProjectService, "ORIGINAL_FILES_FOLDER", str(tmp_path))
+    mock_create.side_effect = lambda customer_id, records, due_at=None: [
+        Project(customer_id, None, language, filename) for _, _, language, filename in records
+    ]
+
+    projects = ProjectService.create_projects_for_languages("c1", "Manual", "Docs", ["de", "fr", "de", "sk"], _upload("manual.txt"))
+
+    assert [p.language for p in projects] == ["de", "fr", "sk"]
+    stored = {p.original_file for p in projects}
+    assert len(stored) == 1 and stored.pop().endswith("_manual.txt")
+    assert [path.name for path in tmp_path.iterdir()] == [projects[0].original_file]
+    mock_assign.assert_called_once_with("c1", projects)
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.Project.create_many", side_effect=ValueError("insert failed"))
+def test_create_projects_for_languages_removes_file_when_insert_fails(mock_create, mock_tx, tmp_path, monkeypatch):
+    monkeypatch.setattr(ProjectService, "ORIGINAL_FILES_FOLDER", str(tmp_path))
+    (tmp_path / "c1_manual.txt").write_bytes(b"existing")
+
+    with pytest.raises(ValueError):
+        ProjectService.create_projects_for_languages("c1", "Manual", "Docs", ["de", "fr"], _upload("manual.txt"))
+
+    assert [path.name for path in tmp_path.iterdir()] == ["c1_manual.txt"]
+    assert (tmp_path / "c1_manual.txt").read_bytes() == b"existing"
+
+
+def _stalled(project_id, translator_id, language="de", state="ASSIGNED"):
+    return {"id": project_id, "name": f"Project {project_id}", "state": state, "translatorId": translator_id,
+            "languageCode": language, "updatedAt": datetime(2026, 1, 1)}
+
+
+@patch("services.ProjectService.db.transaction", side_effect=lambda: nullcontext())
+@patch("services.ProjectService.EventBus.publish")
+@patch("services.ProjectService.EmailService.notify_users")
+@patch("services.ProjectService.UserService.get_user_contacts", return_value={})
+@patch("services.ProjectService.Project.assign_best_translators_by_language")
+@patch("services.ProjectService.TranslatorDirectory.get_translator_ids_by_language")
+@patch("services.ProjectService.Project.lock_stalled")
+def test_reassign_stalled_projects_excludes_current_translator(mock_lock, mock_directory, mock_assign, mock_contacts,
+                                                               mock_notify, mock_publish, mock_tx):
+    batches = {
+        "ASSIGNED": [[_stalled("p1", "t1"), _stalled("p2", "t2")], []],
+        "REJECTED": [[_stalled("p3", "t1", language="fr", state="REJECTED")]],
+    }
+    mock_lock.side_effect = lambda state, sla, limit, after: batches[state].pop(0)
+    mock_directory.return_value = {"de": ["t1", "t2", "t3"], "fr": ["t1"]}
+    mock_assign.side_effect = lambda groups, rank: {
+        pid: candidates[0] for pids, candidates in groups if candidates for pid in pids
+    }
+
+    summary = ProjectService.reassign_stalled_projects(sla_seconds=3600, batch_size=2)
+
+    assert summary["scanned"] == 3
+    assert summary["reassigned"] == 2
+    assert summary["no_candidate"] == 1
+    assert summary["reassignments"] == [
+        {"project_id": "p1", "from_translator_id": "t1", "to_translator_id": "t2"},
+        {"project_id": "p2", "from_translator_id": "t2", "to_translator_id": "t1"},
+    ]
+    second_call = mock_lock.call_args_list[1].args
+    assert second_call[3] == (datetime(2026, 1, 1), "p2")
+    assert mock_lock.call_count == 3
+
+
+def test_reassign_stalled_projects_rejects_invalid_batch_size():
+    with pytest.raises(ValueError):
+        ProjectService.reassign_stalled_projects(sla_seconds=3600, batch_size=0)
+
+
+@patch("services.ProjectService.JobQueue.enqueue", return_value="j1")
+def test_queue_stalled_sweep_enqueues_registered_job(mock_enqueue):
+    from services.JobQueue import JobQueue
+    from services.ProjectService import REASSIGN_STALLED_JOB
+
+    assert ProjectService.queue_stalled_sweep(3600) == "j1"
+    assert mock_enqueue.call_args.args[:2] == (REASSIGN_STALLED_JOB, {"sla_seconds": 3600})
+    assert REASSIGN_STALLED_JOB in JobQueue.registered_types()
+
+
+def test_create_project_rejects_past_due_date():
+    with pytest.raises(ValueError):
+        ProjectService.create_project("c1", "Manual", "Docs", "de", _upload("manual.txt"), datetime.now() - timedelta(hours=1))
+
+
+@patch("services.ProjectService.Project.get_due_before")
+def test_get_due_soon_reads_open_states_and_formats_dates(mock_due):
+    due = datetime(2026, 1, 2, 9, 30)
+    mock_due.return_value = [{"id": "p1", "dueAt": due, "dueWarnedAt": None, "dueEscalatedAt": None}]
+
+    report = ProjectService.get_due_soon(6, 10)
+
+    states, due_before, limit = mock_due.call_args.args
+    assert states == ["CREATED", "ASSIGNED", "REJECTED"]
+    assert limit == 10
+    assert report["projects"][0]["dueAt"] == due.isoformat()
+
+
+def test_get_due_soon_rejects_negative_window():
+    with pytest.raises(ValueError):
+        ProjectService.get_due_soon(-1)
+
+
+@patch("services.ProjectService.db.transaction", return_value=nullcontext())
+@patch("services.ProjectService.EventBus.publish")
+@patch("services.ProjectService.Project.update_state")
+@patch("services.ProjectService.Project.get_by_id")
+@patch("services.ProjectService.Project.get_state", return_value=ProjectState.REJECTED)
+def test_update_project_status_reassigns_rejected_project(mock_state, mock_get, mock_update, mock_publish, mock_tx):
+    mock_get.return_value = Project("c1", "t1", "de", "c1_a.txt")
+
+    ProjectService.update_project_status("p1", "assigned", {"id": "c1", "role": "CUSTOMER"})
+
+    mock_update.assert_called_once_with("p1", ProjectState.ASSIGNED.value)
+    event = mock_publish.call_args.args[0]
+    assert isinstance(event, TranslatorAssigned)
+    assert (event.from_state, event.to_state, event.translator_id, event.actor_id) == ("REJECTED", "ASSIGNED", "t1", "c1")
@@ -0,0 +1,51 @@
+import os
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.ProjectTransition import ProjectTransition
+
+
+def _rows(count):
+    return [(f"p{i}", "ProjectClosed", "APPROVED", "CLOSED", "a1", datetime(2026, 1, 1), None) for i in range(count)]
+
+
+@patch("models.ProjectTransition.db.execute_many", side_effect=lambda query, rows: len(rows))
+def test_insert_many_uses_multi_row_batches(mock_many):
+    assert ProjectTransition.insert_many(_rows(5), batch_size=2) == 5
+
+    assert [len(c.args[1]) for c in mock_many.call_args_list] == [2, 2, 1]
+    assert mock_many.call_args.args[0].startswith("INSERT INTO ProjectTransitions")
+
+
+@patch("models.ProjectTransition.db.execute_many", return_value=None)
+def test_insert_many_raises_when_insert_fails(mock_many):
+    with pytest.raises(ValueError):
+        ProjectTransition.insert_many(_rows(1))
+
+
+@patch("models.ProjectTransition.db.execute_query", return_value=[])
+def test_get_by_project_pages_along_index(mock_query):
+    ProjectTransition.get_by_project("p1", 50, before_id=900)
+
+    query, params = mock_query.call_args[0]
+    assert "WHERE projectId = %s AND id < %s ORDER BY id DESC LIMIT %s" in query
+    assert params == ("p1", 900, 50)
+
+
+@patch("models.ProjectTransition.db.execute_query", return_value=[])
+def test_get_by_actor_first_page(mock_query):
+    ProjectTransition.get_by_actor("a1", 10)
+
+    query, params = mock_query.call_args[0]
+    assert "WHERE actorId = %s ORDER BY id DESC LIMIT %s" in query
+    assert params == ("a1", 10)
+
+
+@patch("models.ProjectTransition.db.execute_query", return_value=None)
+def test_get_by_project_raises_when_query_fails(mock_query):
+    with pytest.raises(ValueError):
+        ProjectTransition.get_by_project("p1")
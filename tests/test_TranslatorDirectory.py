@@ -0,0 +1,93 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.TranslatorDirectory import TranslatorDirectory
+
+
+ROWS = [
+    {"language": "en", "user_id": "t2"},
+    {"language": "en", "user_id": "t1"},
+    {"language": "sk", "user_id": "t1"},
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_directory():
+    TranslatorDirectory.invalidate()
+    yield
+    TranslatorDirectory.invalidate()
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages", return_value=ROWS)
+def test_lookup_loads_once_and_serves_from_memory(mock_load):
+    assert TranslatorDirectory.get_translator_ids("en") == ["t1", "t2"]
+    assert TranslatorDirectory.get_translator_ids("sk") == ["t1"]
+    assert TranslatorDirectory.get_translator_ids("de") == []
+
+    mock_load.assert_called_once()
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages", return_value=ROWS)
+def test_register_translator_replaces_languages(mock_load):
+    TranslatorDirectory.get_translator_ids("en")
+
+    TranslatorDirectory.register_translator("t1", ["de"])
+
+    assert TranslatorDirectory.get_translator_ids("en") == ["t2"]
+    assert TranslatorDirectory.get_translator_ids("sk") == []
+    assert TranslatorDirectory.get_translator_ids("de") == ["t1"]
+    mock_load.assert_called_once()
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages", return_value=ROWS)
+def test_remove_translator(mock_load):
+    TranslatorDirectory.get_translator_ids("en")
+
+    TranslatorDirectory.remove_translator("t2")
+
+    assert TranslatorDirectory.get_translator_ids("en") == ["t1"]
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages", return_value=ROWS)
+def test_reloads_after_refresh_interval(mock_load, monkeypatch):
+    TranslatorDirectory.get_translator_ids("en")
+    monkeypatch.setattr(TranslatorDirectory, "REFRESH_INTERVAL_SECONDS", 0)
+
+    TranslatorDirectory.get_translator_ids("en")
+
+    assert mock_load.call_count == 2
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages", return_value=ROWS)
+def test_lookup_by_language_resolves_all_languages_from_one_load(mock_load):
+    assert TranslatorDirectory.get_translator_ids_by_language(["en", "sk", "de"]) == {
+        "en": ["t1", "t2"],
+        "sk": ["t1"],
+        "de": [],
+    }
+
+    mock_load.assert_called_once()
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages", side_effect=ValueError("db down"))
+def test_failed_first_load_raises_instead_of_caching_empty_map(mock_load):
+    with pytest.raises(ValueError):
+        TranslatorDirectory.get_translator_ids("en")
+
+    assert TranslatorDirectory._by_language is None
+
+
+@patch("services.TranslatorDirectory.User.get_translator_languages")
+def test_failed_reload_keeps_previous_map(mock_load, monkeypatch):
+    mock_load.return_value = ROWS
+    TranslatorDirectory.get_translator_ids("en")
+    monkeypatch.setattr(TranslatorDirectory, "_loaded_at", float("-inf"))
+    mock_load.side_effect = ValueError("db down")
+
+    assert TranslatorDirectory.get_translator_ids("en") == ["t1", "t2"]
+    assert TranslatorDirectory.get_translator_ids("sk") == ["t1"]
+    assert mock_load.call_count == 3
@@ -0,0 +1,59 @@
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.TranslatorRanking import TranslatorRanking
+
+
+def test_rank_prefers_higher_approval_rate():
+    stats = {
+        "t1": {"approved": 1, "rejected": 5, "backlog": 0, "avg_turnaround": None},
+        "t2": {"approved": 9, "rejected": 1, "backlog": 0, "avg_turnaround": None},
+    }
+
+    assert TranslatorRanking.rank(["t1", "t2"], stats) == ["t2", "t1"]
+
+
+def test_rank_penalizes_backlog_and_slow_turnaround():
+    stats = {
+        "busy": {"approved": 5, "rejected": 0, "backlog": 10, "avg_turnaround": 3600.0},
+        "slow": {"approved": 5, "rejected": 0, "backlog": 0, "avg_turnaround": 36000.0},
+        "fast": {"approved": 5, "rejected": 0, "backlog": 0, "avg_turnaround": 3600.0},
+    }
+
+    assert TranslatorRanking.rank(["busy", "slow", "fast"], stats)[0] == "fast"
+
+
+def test_rank_keeps_candidate_order_on_ties():
+    assert TranslatorRanking.rank(["a", "b", "c"], {}) == ["a", "b", "c"]
+
+
+def test_weights_can_be_overridden():
+    stats = {
+        "quality": {"approved": 10, "rejected": 0, "backlog": 5, "avg_turnaround": None},
+        "idle": {"approved": 0, "rejected": 0, "backlog": 0, "avg_turnaround": None},
+    }
+
+    assert TranslatorRanking.rank(["quality", "idle"], stats, {"backlog": 0.0})[0] == "quality"
+    assert TranslatorRanking.rank(["quality", "idle"], stats, {"approval": 0.0})[0] == "idle"
+
+
+@patch("services.TranslatorRanking.Project.get_translator_stats")
+def test_rank_fetches_stats_once_when_not_given(mock_stats):
+    mock_stats.return_value = {"t2": {"approved": 3, "rejected": 0, "backlog": 0, "avg_turnaround": 60.0}}
+
+    assert TranslatorRanking.rank(["t1", "t2"]) == ["t2", "t1"]
+    mock_stats.assert_called_once_with(["t1", "t2"])
+
+
+@patch("services.TranslatorRanking.Project.get_translator_stats")
+def test_rank_with_scores_returns_stats_best_first(mock_stats):
+    mock_stats.return_value = {"t2": {"approved": 3, "rejected": 0, "backlog": 0, "avg_turnaround": 60.0}}
+
+    ranked = TranslatorRanking.rank_with_scores(["t1", "t2"])
+
+    assert [entry["id"] for entry in ranked] == ["t2", "t1"]
+    assert ranked[0]["approved"] == 3
+    assert ranked[1]["avg_turnaround"] is None
+    assert ranked[0]["score"] > ranked[1]["score"]
@@ -0,0 +1,135 @@
+import os
+import sys
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from services.TurnaroundAnalytics import TurnaroundAnalytics
+
+T0 = datetime(2026, 3, 1, 9, 0)
+
+
+def _project(project_id="p1", language="de"):
+    return {"id": project_id, "languageCode": language, "createdAt": T0}
+
+
+@pytest.fixture
+def store():
+    """Patches the rollup tables with dictionaries."""
+
+    state = {"milestones": {}, "samples": {}}
+
+    def add_samples(samples):
+        for key, (count, total) in samples.items():
+            current = state["samples"].setdefault(key, [0, 0])
+            current[0] += count
+            current[1] += total
+
+    with patch("services.TurnaroundAnalytics.db.transaction", side_effect=lambda: nullcontext()), \
+         patch("services.TurnaroundAnalytics.TurnaroundRollup.lock_milestones",
+               side_effect=lambda ids: {i: dict(state["milestones"][i]) for i in ids if i in state["milestones"]}), \
+         patch("services.TurnaroundAnalytics.TurnaroundRollup.save_milestones", side_effect=state["milestones"].update), \
+         patch("services.TurnaroundAnalytics.TurnaroundRollup.add_samples", side_effect=add_samples), \
+         patch("services.TurnaroundAnalytics.Project.get_many", side_effect=lambda ids: {i: _project(i) for i in ids}):
+        yield state
+
+
+def _row(to_state, from_state, minutes, project_id="p1", actor=None, translator=None):
+    if to_state == "ASSIGNED" and translator is None:
+        translator = "t1"
+    return (project_id, "Event", from_state, to_state, actor, T0 + timedelta(minutes=minutes), translator)
+
+
+def _seconds(store, dimension, value, stage):
+    return sum(total for (d, v, s, _, _), (_, total) in store["samples"].items() if (d, v, s) == (dimension, value, stage))
+
+
+def test_apply_measures_each_stage_across_batches(store):
+    TurnaroundAnalytics.apply([_row("CREATED", None, 0), _row("ASSIGNED", "CREATED", 10)])
+    TurnaroundAnalytics.apply([_row("COMPLETED", "ASSIGNED", 70)])
+    TurnaroundAnalytics.apply([_row("APPROVED", "COMPLETED", 100)])
+
+    assert _seconds(store, "ALL", "", "ASSIGNMENT") == 600
+    assert _seconds(store, "LANGUAGE", "de", "TRANSLATION") == 3600
+    assert _seconds(store, "TRANSLATOR", "t1", "REVIEW") == 1800
+    assert _seconds(store, "ALL", "", "TOTAL") == 6000
+
+
+def test_samples_are_credited_to_translator_holding_the_stage(store):
+    TurnaroundAnalytics.apply([_row("CREATED", None, 0), _row("ASSIGNED", "CREATED", 10, translator="t1")])
+    TurnaroundAnalytics.apply([_row("ASSIGNED", "ASSIGNED", 20, translator="t2")])
+    TurnaroundAnalytics.apply([_row("COMPLETED", "ASSIGNED", 80, actor="t2")])
+    TurnaroundAnalytics.apply([_row("APPROVED", "COMPLETED", 100)])
+
+    assert _seconds(store, "TRANSLATOR", "t1", "ASSIGNMENT") == 600
+    assert _seconds(store, "TRANSLATOR", "t1", "TRANSLATION") == 0
+    assert _seconds(store, "TRANSLATOR", "t2", "TRANSLATION") == 3600
+    assert _seconds(store, "TRANSLATOR", "t2", "REVIEW") == 1200
+    assert store["milestones"]["p1"]["translatorId"] == "t2"
+
+
+def test_rework_counts_translation_from_reassignment(store):
+    TurnaroundAnalytics.apply([
+        _row("CREATED", None, 0), _row("ASSIGNED", "CREATED", 0), _row("COMPLETED", "ASSIGNED", 60),
+        _row("REJECTED", "COMPLETED", 90), _row("ASSIGNED", "REJECTED", 120), _row("COMPLETED", "ASSIGNED", 150),
+    ])
+
+    translations = sum(count for (d, _, s, _, _), (count, _) in store["samples"].items() if (d, s) == ("ALL", "TRANSLATION"))
+    assert translations == 2
+    assert _seconds(store, "ALL", "", "TRANSLATION") == 3600 + 1800
+
+
+def test_bucket_is_logarithmic():
+    assert TurnaroundAnalytics.bucket(0.2) == 0
+    assert TurnaroundAnalytics.bucket(2) == 4
+    assert TurnaroundAnalytics.bucket(3600) == 47
+    assert 3600 / 1.2 < TurnaroundAnalytics.bucket_seconds(TurnaroundAnalytics.bucket(3600)) < 3600 * 1.2
+
+
+@patch("services.TurnaroundAnalytics.TurnaroundRollup.get_histograms")
+def test_get_turnaround_summarizes_histograms(mock_histograms):
+    hour, day = TurnaroundAnalytics.bucket(3600), TurnaroundAnalytics.bucket(86400)
+    mock_histograms.return_value = [
+        {"dimensionValue": "de", "stage": "TRANSLATION", "bucket": hour, "count": 9, "sumSeconds": 9 * 3600},
+        {"dimensionValue": "de", "stage": "TRANSLATION", "bucket": day, "count": 1, "sumSeconds": 86400},
+    ]
+
+    result = TurnaroundAnalytics.get_turnaround("language", date(2026, 3, 1), date(2026, 3, 31))
+
+    mock_histograms.assert_called_once_with("LANGUAGE", date(2026, 3, 1), date(2026, 3, 31), None)
+    stats = result["groups"][0]["stages"]["TRANSLATION"]
+    assert result["groups"][0]["value"] == "de"
+    assert stats["count"] == 10
+    assert stats["avg_seconds"] == (9 * 3600 + 86400) / 10
+    assert stats["p50_seconds"] == stats["p90_seconds"] == round(TurnaroundAnalytics.bucket_seconds(hour), 1)
+    assert stats["p95_seconds"] == round(TurnaroundAnalytics.bucket_seconds(day), 1)
+
+
+@pytest.mark.parametrize("group_by, day_from, day_to", [
+    ("customer", None, None),
+    ("all", date(2026, 3, 2), date(2026, 3, 1)),
+    ("all", date(2024, 1, 1), date(2026, 1, 1)),
+])
+def test_get_turnaround_rejects_invalid_arguments(group_by, day_from, day_to):
+    with pytest.raises(ValueError):
+        TurnaroundAnalytics.get_turnaround(group_by, day_from, day_to)
+
+
+@patch("services.TurnaroundAnalytics.TurnaroundAnalytics.apply")
+@patch("services.TurnaroundAnalytics.ProjectTransition.get_after")
+@patch("services.TurnaroundAnalytics.TurnaroundRollup.clear")
+@patch("services.TurnaroundAnalytics.AuditLog.flush")
+def test_rebuild_streams_log_in_batches(mock_flush, mock_clear, mock_get_after, mock_apply):
+    def row(i):
+        return {"id": i, "projectId": "p1", "event": "E", "fromState": None, "toState": "CREATED", "actorId": None, "occurredAt": T0, "translatorId": None}
+
+    mock_get_after.side_effect = [[row(1), row(2)], [row(3)], []]
+
+    assert TurnaroundAnalytics.rebuild(batch_size=2) == 3
+
+    mock_clear.assert_called_once()
+    assert [c.args for c in mock_get_after.call_args_list] == [(0, 2), (2, 2), (3, 2)]
+    assert mock_apply.call_count == 2
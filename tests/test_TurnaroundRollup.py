@@ -0,0 +1,51 @@
+import os
+import sys
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.TurnaroundRollup import TurnaroundRollup
+
+
+@patch("models.TurnaroundRollup.db.execute_many", return_value=1)
+def test_add_samples_accumulates_with_upsert(mock_many):
+    TurnaroundRollup.add_samples({("LANGUAGE", "de", "REVIEW", date(2026, 3, 1), 40): [2, 3600]})
+
+    query, rows = mock_many.call_args[0]
+    assert "ON DUPLICATE KEY UPDATE count = count + VALUES(count), sumSeconds = sumSeconds + VALUES(sumSeconds)" in query
+    assert rows == [("LANGUAGE", "de", "REVIEW", date(2026, 3, 1), 40, 2, 3600)]
+
+
+@patch("models.TurnaroundRollup.db.execute_many", return_value=None)
+def test_save_milestones_raises_when_upsert_fails(mock_many):
+    with pytest.raises(ValueError):
+        TurnaroundRollup.save_milestones({"p1": {"createdAt": datetime(2026, 1, 1), "assignedAt": None, "completedAt": None, "translatorId": None}})
+
+
+@patch("models.TurnaroundRollup.db.execute_many", return_value=1)
+@patch("models.TurnaroundRollup.db.execute_query")
+def test_lock_milestones_creates_missing_rows_and_locks_them(mock_query, mock_many):
+    mock_query.return_value = [
+        {"projectId": "p1", "createdAt": None, "assignedAt": datetime(2026, 1, 1), "completedAt": None, "translatorId": "t1"},
+        {"projectId": "p2", "createdAt": None, "assignedAt": None, "completedAt": None, "translatorId": None},
+    ]
+
+    milestones = TurnaroundRollup.lock_milestones(["p1", "p2"])
+
+    assert milestones["p1"] == {"createdAt": None, "assignedAt": datetime(2026, 1, 1), "completedAt": None, "translatorId": "t1"}
+    insert, rows = mock_many.call_args[0]
+    assert insert.startswith("INSERT IGNORE INTO ProjectMilestones") and rows == [("p1",), ("p2",)]
+    query, params = mock_query.call_args[0]
+    assert query.endswith("FOR UPDATE") and params == ("p1", "p2")
+
+
+@patch("models.TurnaroundRollup.db.execute_query", return_value=[])
+def test_get_histograms_filters_dimension_range_and_value(mock_query):
+    TurnaroundRollup.get_histograms("TRANSLATOR", date(2026, 1, 1), date(2026, 1, 31), "t1")
+
+    query, params = mock_query.call_args[0]
+    assert "WHERE dimension = %s AND day BETWEEN %s AND %s AND dimensionValue = %s" in query
+    assert query.endswith("GROUP BY dimensionValue, stage, bucket")
+    assert params == ("TRANSLATOR", date(2026, 1, 1), date(2026, 1, 31), "t1")
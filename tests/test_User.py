@@ -180,6 +180,52 @@ def test_get_all_users(mock_query):
     assert users[1].role == UserRole.TRANSLATOR
 
 
+@patch("models.User.db.execute_query")
+def test_get_all_users_with_role_and_pagination(mock_query):
+    mock_query.return_value = []
+
+    users = User.get_all_users(UserRole.TRANSLATOR, 50, 100)
+
+    assert users == []
+    args, kwargs = mock_query.call_args
+    assert "WHERE role = %s" in args[0]
+    assert "LIMIT %s OFFSET %s" in args[0]
+    assert args[1] == (UserRole.TRANSLATOR.value, 50, 100)
+
+
+# ---------------------------
+# get_languages_for_users tests
+# ---------------------------
+
+@patch("models.User.db.execute_query")
+def test_get_languages_for_users_groups_by_user(mock_query):
+    mock_query.return_value = [
+        {"user_id": "1", "language": "en"},
+        {"user_id": "1", "language": "sk"},
+        {"user_id": "2", "language": "de"},
+    ]
+
+    result = User.get_languages_for_users(["1", "2", "3"])
+
+    assert result == {"1": ["en", "sk"], "2": ["de"]}
+    mock_query.assert_called_once()
+
+
+@patch("models.User.db.execute_query")
+def test_get_languages_for_users_batches_ids(mock_query):
+    mock_query.return_value = []
+
+    User.get_languages_for_users([str(i) for i in range(5)], batch_size=2)
+
+    assert mock_query.call_count == 3
+
+
+@patch("models.User.db.execute_query")
+def test_get_languages_for_users_empty_input_skips_query(mock_query):
+    assert User.get_languages_for_users([]) == {}
+    mock_query.assert_not_called()
+
+
 # ---------------------------
 # get_user_by_id tests
 # ---------------------------
@@ -234,3 +280,109 @@ def test_get_translators_by_language(mock_query):
     assert len(translators) == 1
     assert translators[0].role == UserRole.TRANSLATOR
     mock_query.assert_called_once()
+
+
+# ---------------------------
+# get_translator_languages tests
+# ---------------------------
+
+@patch("models.User.db.execute_query")
+def test_get_translator_languages(mock_query):
+    mock_query.return_value = [
+        {"language": "en", "user_id": "t1"},
+        {"language": "sk", "user_id": "t1"},
+    ]
+
+    rows = User.get_translator_languages()
+
+    assert rows == mock_query.return_value
+    args, kwargs = mock_query.call_args
+    assert "FROM Languages l" in args[0]
+    assert args[1] == (UserRole.TRANSLATOR.value,)
+
+
+@patch("models.User.db.execute_query")
+def test_get_translator_languages_raises_on_failed_query(mock_query):
+    mock_query.return_value = None
+
+    with pytest.raises(ValueError):
+        User.get_translator_languages()
+
+
+# ---------------------------
+# search_users tests
+# ---------------------------
+
+@patch("models.User.db.execute_query")
+def test_search_users_uses_anchored_prefix_on_name_and_email(mock_query):
+    mock_query.return_value = [
+        {"id": "1", "name": "Alice", "email": "alice@test.com", "role": "translator", "created_at": datetime.utcnow()},
+    ]
+
+    users = User.search_users("Al", limit=5)
+
+    assert [u.name for u in users] == ["Alice"]
+    args, kwargs = mock_query.call_args
+    assert args[0].startswith("SELECT")
+    assert "UNION" in args[0]
+    assert args[1] == ("Al%", 5, "Al%", 5, 5)
+
+
+@patch("models.User.db.execute_query")
+def test_search_users_escapes_wildcards_and_filters_role(mock_query):
+    mock_query.return_value = []
+
+    User.search_users("a_b%", UserRole.CUSTOMER, 10)
+
+    args, kwargs = mock_query.call_args
+    assert "AND role = %s" in args[0]
+    assert args[1] == ("a\\_b\\%%", UserRole.CUSTOMER.value, 10, "a\\_b\\%%", UserRole.CUSTOMER.value, 10, 10)
+
+
+# ---------------------------
+# bulk_create tests
+# ---------------------------
+
+@patch("models.User.db.execute_many")
+def test_bulk_create_inserts_users_and_languages_in_two_statements(mock_many):
+    mock_many.return_value = 2
+
+    users = User.bulk_create([
+        ("Ann", "ann@x.com", "h1", UserRole.TRANSLATOR, ["en", "cs"]),
+        ("Bob", "bob@x.com", "h2", UserRole.CUSTOMER, ["de"]),
+    ])
+
+    assert [u.name for u in users] == ["Ann", "Bob"]
+    assert users[0].languages == ["en", "cs"]
+    assert mock_many.call_count == 2
+    user_rows = mock_many.call_args_list[0][0][1]
+    language_rows = mock_many.call_args_list[1][0][1]
+    assert [row[1:5] for row in user_rows] == [
+        ("Ann", "ann@x.com", "h1", "translator"),
+        ("Bob", "bob@x.com", "h2", "customer"),
+    ]
+    assert language_rows == [(str(users[0].id), "en"), (str(users[0].id), "cs")]
+
+
+@patch("models.User.db.execute_many", return_value=None)
+def test_bulk_create_raises_when_insert_fails(mock_many):
+    with pytest.raises(ValueError):
+        User.bulk_create([("Ann", "ann@x.com", "h1", UserRole.CUSTOMER, [])])
+
+
+@patch("models.User.db.execute_query")
+def test_get_project_participant_contacts_uses_single_semi_join(mock_query):
+    mock_query.return_value = [{"id": "t1", "email": "t1@x.com"}]
+
+    contacts = User.get_project_participant_contacts(UserRole.TRANSLATOR, "ASSIGNED", "de")
+
+    assert contacts == [{"id": "t1", "email": "t1@x.com"}]
+    mock_query.assert_called_once()
+    query, params = mock_query.call_args.args
+    assert "IN (SELECT p.translatorId FROM Projects p" in query
+    assert params == ("ASSIGNED", "de")
+
+
+def test_get_project_participant_contacts_rejects_admin_role():
+    with pytest.raises(ValueError):
+        User.get_project_participant_contacts(UserRole.ADMINISTRATOR)
@@ -0,0 +1,110 @@
+import io
+import os
+import sys
+from contextlib import nullcontext
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.User import User, UserRole
+from services.UserImportService import UserImportService
+
+
+@pytest.fixture(autouse=True)
+def fake_hashing_and_transactions():
+    with patch("services.UserImportService.AuthService.hash_passwords", side_effect=lambda pws: [f"H({pw})" for pw in pws]), \
+         patch("services.UserImportService.db.transaction", side_effect=lambda: nullcontext()), \
+         patch("services.UserImportService.TranslatorDirectory.register_translator") as register:
+        yield register
+
+
+def _bulk_create(records):
+    return [User(name, email, role) for name, email, _, role, _ in records]
+
+
+def test_parse_csv_splits_languages_and_reports_extra_fields():
+    stream = io.StringIO(
+        "name,email,password,role,languages\n"
+        "Ann,ann@x.com,pw,TRANSLATOR,en;cs\n"
+        "Bob,bob@x.com,pw,CUSTOMER,,extra\n"
+    )
+
+    rows = list(UserImportService.parse_csv(stream))
+
+    assert rows[0] == (2, {"name": "Ann", "email": "ann@x.com", "password": "pw", "role": "TRANSLATOR", "languages": ["en", "cs"]}, None)
+    assert rows[1][0] == 3 and rows[1][1] is None
+
+
+def test_parse_csv_requires_header_columns():
+    with pytest.raises(ValueError):
+        list(UserImportService.parse_csv(io.StringIO("name,email\nAnn,ann@x.com\n")))
+
+
+def test_parse_ndjson_reports_invalid_lines():
+    stream = io.StringIO('{"name": "Ann"}\n\nnot json\n[1]\n')
+
+    rows = list(UserImportService.parse_ndjson(stream))
+
+    assert rows[0] == (1, {"name": "Ann"}, None)
+    assert [row[0] for row in rows[1:]] == [3, 4]
+    assert all(row[2] for row in rows[1:])
+
+
+@patch("services.UserImportService.User.bulk_create", side_effect=_bulk_create)
+@patch("services.UserImportService.User.get_existing_emails", return_value={"taken@x.com"})
+def test_import_users_reports_row_errors_without_aborting(mock_existing, mock_bulk, fake_hashing_and_transactions):
+    rows = [
+        (1, {"name": "Ann", "email": "ann@x.com", "password": "pw", "role": "TRANSLATOR", "languages": ["en"]}, None),
+        (2, {"name": "Bob", "email": "bob", "password": "pw", "role": "CUSTOMER"}, None),
+        (3, {"name": "Cid", "email": "taken@x.com", "password": "pw", "role": "CUSTOMER"}, None),
+        (4, {"name": "Ann2", "email": "ann@x.com", "password": "pw", "role": "CUSTOMER"}, None),
+        (5, None, "Invalid JSON."),
+        (6, {"name": "Dan", "email": "dan@x.com", "password": "pw", "role": "CUSTOMER"}, None),
+    ]
+
+    summary = UserImportService.import_users(iter(rows), chunk_size=10)
+
+    assert summary["total"] == 6
+    assert summary["created"] == 2
+    assert sorted(f["row"] for f in summary["failed"]) == [2, 3, 4, 5]
+    records = mock_bulk.call_args[0][0]
+    assert [r[:4] for r in records] == [
+        ("Ann", "ann@x.com", "H(pw)", UserRole.TRANSLATOR),
+        ("Dan", "dan@x.com", "H(pw)", UserRole.CUSTOMER),
+    ]
+    fake_hashing_and_transactions.assert_called_once()
+
+
+@patch("services.UserImportService.User.get_existing_emails", return_value=set())
+def test_import_users_falls_back_to_single_rows_when_batch_fails(mock_existing):
+    def bulk_create(records):
+        if len(records) > 1 or records[0][1] == "bad@x.com":
+            raise ValueError("Failed to insert users.")
+        return _bulk_create(records)
+
+    rows = [
+        (1, {"name": "Ann", "email": "ann@x.com", "password": "pw", "role": "CUSTOMER"}, None),
+        (2, {"name": "Bad", "email": "bad@x.com", "password": "pw", "role": "CUSTOMER"}, None),
+        (3, {"name": "Cid", "email": "cid@x.com", "password": "pw", "role": "CUSTOMER"}, None),
+    ]
+
+    with patch("services.UserImportService.User.bulk_create", side_effect=bulk_create):
+        summary = UserImportService.import_users(iter(rows))
+
+    assert summary["created"] == 2
+    assert summary["failed"] == [{"row": 2, "email": "bad@x.com", "error": "Failed to insert users."}]
+
+
+@patch("services.UserImportService.User.bulk_create", side_effect=_bulk_create)
+@patch("services.UserImportService.User.get_existing_emails", return_value=set())
+def test_import_users_writes_one_batch_per_chunk(mock_existing, mock_bulk):
+    rows = [
+        (i, {"name": f"U{i}", "email": f"u{i}@x.com", "password": "pw", "role": "CUSTOMER"}, None)
+        for i in range(5)
+    ]
+
+    summary = UserImportService.import_users(iter(rows), chunk_size=2)
+
+    assert summary["created"] == 5
+    assert [len(call[0][0]) for call in mock_bulk.call_args_list] == [2, 2, 1]
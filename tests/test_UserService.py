@@ -0,0 +1,55 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.User import User, UserRole
+from services.UserService import UserService
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    UserService.contacts.clear()
+    UserService.validated_users.clear()
+    yield
+    UserService.contacts.clear()
+    UserService.validated_users.clear()
+
+
+@patch("services.UserService.User.get_user_by_id")
+def test_get_user_contact_queries_once_per_user(mock_get):
+    mock_get.return_value = User("Alice", "alice@example.com", UserRole.TRANSLATOR)
+
+    first = UserService.get_user_contact("u1")
+    second = UserService.get_user_contact("u1")
+
+    assert first is second
+    assert first.email == "alice@example.com"
+    mock_get.assert_called_once_with("u1")
+    assert UserService.get_cache_stats()["contacts"]["hit_rate"] == 0.5
+
+
+@patch("services.UserService.User.get_user_by_id", return_value=None)
+def test_get_user_contact_does_not_cache_missing_users(mock_get):
+    assert UserService.get_user_contact("missing") is None
+    assert UserService.get_user_contact("missing") is None
+
+    assert mock_get.call_count == 2
+
+
+def test_get_user_contact_invalid_id_raises():
+    with pytest.raises(ValueError):
+        UserService.get_user_contact("")
+
+
+@patch("services.UserService.User.get_user_by_id")
+def test_evict_contact_reloads_contact(mock_get):
+    mock_get.return_value = User("Alice", "alice@example.com", UserRole.CUSTOMER)
+    UserService.get_user_contact("u1")
+
+    UserService.evict_contact("u1")
+    UserService.get_user_contact("u1")
+
+    assert mock_get.call_count == 2
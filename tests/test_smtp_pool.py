@@ -0,0 +1,113 @@
+import os
+import smtplib
+import sys
+from email.message import EmailMessage
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from bin.smtp_pool import CircuitBreaker, CircuitOpenError, SMTPConnectionPool
+
+
+def _msg():
+    msg = EmailMessage()
+    msg["To"] = "a@x.com"
+    msg.set_content("hi")
+    return msg
+
+
+def _fake_smtp_factory(connections):
+    def factory(host, port, timeout=None):
+        smtp = MagicMock()
+        smtp.noop.return_value = (250, b"OK")
+        connections.append((smtp, timeout))
+        return smtp
+    return factory
+
+
+def test_pool_reuses_one_connection_for_many_messages():
+    connections = []
+    with patch("bin.smtp_pool.smtplib.SMTP", side_effect=_fake_smtp_factory(connections)):
+        pool = SMTPConnectionPool("localhost", 1025, size=2, connect_timeout=3, read_timeout=7)
+        for _ in range(5):
+            pool.send(_msg())
+
+    assert len(connections) == 1
+    smtp, timeout = connections[0]
+    assert timeout == 3
+    smtp.sock.settimeout.assert_called_once_with(7)
+    assert smtp.send_message.call_count == 5
+
+
+def test_pool_reconnects_when_pooled_connection_was_dropped():
+    connections = []
+    with patch("bin.smtp_pool.smtplib.SMTP", side_effect=_fake_smtp_factory(connections)):
+        pool = SMTPConnectionPool("localhost", 1025)
+        pool.send(_msg())
+        connections[0][0].send_message.side_effect = smtplib.SMTPServerDisconnected("bye")
+        pool.send(_msg())
+
+    assert len(connections) == 2
+    assert connections[1][0].send_message.call_count == 1
+    assert pool.breaker.state == "closed"
+
+
+def test_pool_health_checks_idle_connections_with_noop():
+    connections = []
+    with patch("bin.smtp_pool.smtplib.SMTP", side_effect=_fake_smtp_factory(connections)):
+        pool = SMTPConnectionPool("localhost", 1025, noop_after=0)
+        pool.send(_msg())
+        connections[0][0].noop.side_effect = smtplib.SMTPServerDisconnected("idle timeout")
+        pool.send(_msg())
+
+    assert len(connections) == 2
+    connections[0][0].noop.assert_called_once()
+
+
+def test_pool_replaces_connection_after_max_messages():
+    connections = []
+    with patch("bin.smtp_pool.smtplib.SMTP", side_effect=_fake_smtp_factory(connections)):
+        pool = SMTPConnectionPool("localhost", 1025, max_messages=2)
+        for _ in range(3):
+            pool.send(_msg())
+
+    assert len(connections) == 2
+    connections[0][0].quit.assert_called_once()
+
+
+def test_recipient_rejection_keeps_connection_and_circuit_closed():
+    connections = []
+    with patch("bin.smtp_pool.smtplib.SMTP", side_effect=_fake_smtp_factory(connections)):
+        pool = SMTPConnectionPool("localhost", 1025)
+        pool.send(_msg())
+        connections[0][0].send_message.side_effect = smtplib.SMTPRecipientsRefused({})
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            pool.send(_msg())
+
+    assert len(connections) == 1
+    assert pool.breaker.state == "closed"
+
+
+def test_connect_failures_open_the_circuit():
+    with patch("bin.smtp_pool.smtplib.SMTP", side_effect=ConnectionRefusedError()) as mock_smtp:
+        pool = SMTPConnectionPool("localhost", 1025, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                pool.send(_msg())
+        with pytest.raises(CircuitOpenError):
+            pool.send(_msg())
+
+    assert mock_smtp.call_count == 2
+    assert pool.breaker.state == "open"
+
+
+def test_circuit_breaker_allows_single_trial_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.state == "half-open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == "closed"
@@ -148,6 +148,125 @@ def test_get_users_success_for_admin(client, monkeypatch):
     assert resp.get_json() == {"users": [{"id": "u1", "name": "a"}, {"id": "u2", "name": "b"}]}
 
 
+def test_get_users_admin_passes_role_and_pagination(client, monkeypatch):
+    from services.UserService import UserService
+
+    _set_session_user(client, role="ADMINISTRATOR")
+    calls = {}
+
+    def fake_get_all_users(**kwargs):
+        calls.update(kwargs)
+        return [{"id": "u1", "name": "a"}]
+
+    monkeypatch.setattr(UserService, "get_all_users", staticmethod(fake_get_all_users))
+
+    resp = client.get(f"{API_PREFIX}/users?role=TRANSLATOR&page=2&per_page=10")
+    assert resp.status_code == 200
+    assert calls == {"role": "TRANSLATOR", "page": 2, "per_page": 10}
+    assert resp.get_json() == {"users": [{"id": "u1", "name": "a"}], "page": 2, "per_page": 10}
+
+
+def test_get_users_admin_invalid_page_returns_400(client):
+    _set_session_user(client, role="ADMINISTRATOR")
+
+    resp = client.get(f"{API_PREFIX}/users?page=abc")
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
+
+
+def test_search_users_admin_returns_matches(client, monkeypatch):
+    from services.UserService import UserService
+
+    _set_session_user(client, role="ADMINISTRATOR")
+    calls = {}
+
+    def fake_search_users(prefix, role=None, limit=20):
+        calls.update(prefix=prefix, role=role, limit=limit)
+        return [{"id": "u1", "name": "alice", "email": "alice@example.com", "role": "translator"}]
+
+    monkeypatch.setattr(UserService, "search_users", staticmethod(fake_search_users))
+
+    resp = client.get(f"{API_PREFIX}/users/search?q=al&role=TRANSLATOR&limit=5")
+    assert resp.status_code == 200
+    assert calls == {"prefix": "al", "role": "TRANSLATOR", "limit": 5}
+    assert resp.get_json()["users"][0]["name"] == "alice"
+
+
+def test_search_users_without_prefix_returns_400(client):
+    _set_session_user(client, role="ADMINISTRATOR")
+
+    resp = client.get(f"{API_PREFIX}/users/search")
+    assert resp.status_code == 400
+
+
+def test_import_users_csv_streams_rows_to_import_service(client, monkeypatch):
+    from services.UserImportService import UserImportService
+
+    _set_session_user(client, role="ADMINISTRATOR")
+    seen = []
+
+    def fake_import_users(rows):
+        seen.extend(rows)
+        return {"total": len(seen), "created": len(seen), "failed": []}
+
+    monkeypatch.setattr(UserImportService, "import_users", staticmethod(fake_import_users))
+
+    resp = client.post(
+        f"{API_PREFIX}/users/import",
+        data="name,email,password,role,languages\nAnn,ann@x.com,pw,TRANSLATOR,en;cs\n",
+        content_type="text/csv",
+    )
+
+    assert resp.status_code == 200
+    assert resp.get_json()["created"] == 1
+    assert seen[0][1]["languages"] == ["en", "cs"]
+
+
+def test_import_users_rejects_unknown_format(client):
+    _set_session_user(client, role="ADMINISTRATOR")
+
+    resp = client.post(f"{API_PREFIX}/users/import", data="x", content_type="text/plain")
+    assert resp.status_code == 400
+
+
+def test_update_notification_preferences_sets_mode_for_session_user(client, monkeypatch):
+    from services.UserService import UserService
+
+    _set_session_user(client, user_id="u42", role="TRANSLATOR")
+    calls = {}
+    monkeypatch.setattr(UserService, "set_notification_mode", staticmethod(lambda user_id, mode: calls.update(user_id=user_id, mode=mode)))
+
+    resp = client.put(f"{API_PREFIX}/users/me/notifications", json={"mode": "digest"})
+
+    assert resp.status_code == 200
+    assert resp.get_json() == {"mode": "DIGEST"}
+    assert calls == {"user_id": "u42", "mode": "digest"}
+
+
+def test_update_notification_preferences_rejects_unknown_mode(client, monkeypatch):
+    from models.User import User
+
+    _set_session_user(client, role="CUSTOMER")
+    monkeypatch.setattr(User, "update_notification_mode", classmethod(lambda cls, *a: None))
+
+    resp = client.put(f"{API_PREFIX}/users/me/notifications", json={"mode": "weekly"})
+    assert resp.status_code == 400
+
+
+def test_update_notification_preferences_sets_locale(client, monkeypatch):
+    from services.UserService import UserService
+
+    _set_session_user(client, user_id="u7", role="CUSTOMER")
+    calls = {}
+    monkeypatch.setattr(UserService, "set_locale", staticmethod(lambda user_id, locale: calls.update(user_id=user_id, locale=locale)))
+
+    resp = client.put(f"{API_PREFIX}/users/me/notifications", json={"locale": "SK"})
+
+    assert resp.status_code == 200
+    assert resp.get_json() == {"locale": "sk"}
+    assert calls == {"user_id": "u7", "locale": "SK"}
+
+
 # -------------------------
 # GET /api/users/<name>  (ADMIN only)
 # -------------------------